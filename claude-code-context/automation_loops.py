@@ -5,17 +5,36 @@ Self-healing, autonomous optimization, and continuous improvement systems
 """
 
 import asyncio
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
 import time
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import hashlib
 import subprocess
 
 
+# Seconds of quiet after the last registry event before the monitor runs
+REGISTRY_DEBOUNCE_SECONDS = 0.5
+# Polling fallback interval when inotify is unavailable
+REGISTRY_POLL_SECONDS = 2.0
+# Upper bound on how long the scheduler sleeps between checks
+MAX_SCHEDULER_SLEEP = 60.0
+
+REGISTRY_SUFFIXES = {".yaml", ".yml", ".json"}
+REGISTRY_KEYWORDS = ("convention", "semconv", "otel")
+IGNORED_DIRS = {".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv",
+                ".tox", ".mypy_cache", ".pytest_cache", ".ruff_cache"}
+
+
 @dataclass
 class AutomationLoop:
     """Represents an autonomous automation loop"""
@@ -32,6 +51,265 @@ class AutomationLoop:
     evolution_tracking: bool = True
 
 
+def is_registry_file(path: Path) -> bool:
+    """Whether a path looks like a semantic convention registry file"""
+    name = path.name.lower()
+    return path.suffix.lower() in REGISTRY_SUFFIXES and any(k in name for k in REGISTRY_KEYWORDS)
+
+
+class _Inotify:
+    """Minimal ctypes binding to Linux inotify"""
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_ONLYDIR = 0x01000000
+    
+    WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_ONLYDIR)
+    _HEADER = struct.Struct("iIII")
+    
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.paths: Dict[int, Path] = {}
+    
+    def add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                return  # vanished or unreadable; nothing to watch
+            raise OSError(err, f"inotify_add_watch({directory}): {os.strerror(err)}")
+        self.paths[wd] = directory
+    
+    def read_events(self) -> List[Tuple[Optional[Path], int, str]]:
+        """Drain pending events as (watched directory, mask, name)"""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = self._HEADER.unpack_from(data, offset)
+                offset += self._HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(errors="surrogateescape")
+                offset += length
+                directory = self.paths.get(wd)
+                if mask & self.IN_IGNORED:
+                    self.paths.pop(wd, None)
+                    continue
+                events.append((directory, mask, name))
+    
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+        self.paths.clear()
+
+
+class RegistryWatcher:
+    """Tracks registry files under a project root and reports changes
+    
+    Uses inotify on Linux and falls back to polling elsewhere (or when the
+    inotify watch limit is exhausted). The polling fallback only re-lists
+    directories whose mtime changed and stats known registry files, instead
+    of globbing the whole tree on every tick.
+    """
+    
+    def __init__(self, root: Path, on_change: Optional[Callable[[Set[Path]], None]] = None,
+                 poll_interval: float = REGISTRY_POLL_SECONDS, use_inotify: bool = True):
+        self.root = Path(root)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.registry_files: Dict[Path, int] = {}  # path -> mtime_ns
+        self._dirs: Dict[Path, int] = {}  # directory -> mtime_ns
+        self._inotify: Optional[_Inotify] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.backend: Optional[str] = None
+    
+    @property
+    def started(self) -> bool:
+        return self.backend is not None
+    
+    # -- scanning -------------------------------------------------------------
+    
+    def scan(self) -> Dict[Path, int]:
+        """Full pruned walk; (re)builds the directory and registry indexes"""
+        self._dirs.clear()
+        self.registry_files.clear()
+        self._scan_tree(self.root)
+        return self.registry_files
+    
+    def _scan_tree(self, top: Path, found: Optional[Set[Path]] = None) -> None:
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
+            directory = Path(dirpath)
+            try:
+                self._dirs[directory] = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            if self._inotify is not None:
+                self._inotify.add_watch(directory)
+            for filename in filenames:
+                path = directory / filename
+                if is_registry_file(path):
+                    self._record(path, found)
+    
+    def _record(self, path: Path, found: Optional[Set[Path]]) -> None:
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is None:
+            if self.registry_files.pop(path, None) is not None and found is not None:
+                found.add(path)
+        elif self.registry_files.get(path) != mtime:
+            self.registry_files[path] = mtime
+            if found is not None:
+                found.add(path)
+    
+    def poll_once(self) -> Set[Path]:
+        """Detect changes since the last scan without walking the whole tree"""
+        changed: Set[Path] = set()
+        for directory, mtime in list(self._dirs.items()):
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                self._forget_dir(directory, changed)
+                continue
+            if current == mtime:
+                continue
+            self._dirs[directory] = current
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            names = {entry.name for entry in entries}
+            for path in [p for p in self.registry_files if p.parent == directory]:
+                if path.name not in names:
+                    self._record(path, changed)
+            for entry in entries:
+                path = Path(entry.path)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS and path not in self._dirs:
+                        self._scan_tree(path, changed)
+                elif is_registry_file(path) and path not in self.registry_files:
+                    self._record(path, changed)
+        # In-place modifications do not touch the directory mtime
+        for path in list(self.registry_files):
+            self._record(path, changed)
+        return changed
+    
+    def _forget_dir(self, directory: Path, changed: Set[Path]) -> None:
+        for known in [d for d in self._dirs if d == directory or directory in d.parents]:
+            del self._dirs[known]
+        for path in [p for p in self.registry_files if directory in p.parents]:
+            del self.registry_files[path]
+            changed.add(path)
+    
+    # -- inotify --------------------------------------------------------------
+    
+    def _handle_inotify(self) -> None:
+        changed: Set[Path] = set()
+        try:
+            self._apply_inotify_events(changed)
+        except OSError:
+            # Typically the watch limit; keep reporting changes by polling
+            self._stop_inotify()
+            self._poll_task = self._loop.create_task(self._poll_forever())
+            self.backend = "polling"
+        self._emit(changed)
+    
+    def _apply_inotify_events(self, changed: Set[Path]) -> None:
+        for directory, mask, name in self._inotify.read_events():
+            if mask & _Inotify.IN_Q_OVERFLOW:
+                before = dict(self.registry_files)
+                self.scan()
+                changed.update(p for p in before.keys() | self.registry_files.keys()
+                               if before.get(p) != self.registry_files.get(p))
+                continue
+            if directory is None:
+                continue
+            if mask & _Inotify.IN_DELETE_SELF:
+                self._forget_dir(directory, changed)
+                continue
+            path = directory / name
+            if mask & _Inotify.IN_ISDIR:
+                if name in IGNORED_DIRS:
+                    continue
+                if mask & (_Inotify.IN_CREATE | _Inotify.IN_MOVED_TO):
+                    self._scan_tree(path, changed)
+                elif mask & _Inotify.IN_MOVED_FROM:
+                    self._forget_dir(path, changed)
+            elif is_registry_file(path):
+                self._record(path, changed)
+    
+    # -- lifecycle ------------------------------------------------------------
+    
+    def _emit(self, changed: Set[Path]) -> None:
+        if changed and self.on_change is not None:
+            self.on_change(changed)
+    
+    async def start(self) -> str:
+        """Index the tree and start watching; returns the backend in use"""
+        if self.started:
+            return self.backend
+        self._loop = asyncio.get_running_loop()
+        if self.use_inotify:
+            try:
+                self._inotify = _Inotify()
+                await asyncio.to_thread(self.scan)
+                self._loop.add_reader(self._inotify.fd, self._handle_inotify)
+                self.backend = "inotify"
+                return self.backend
+            except (OSError, AttributeError, NotImplementedError):
+                # No inotify, watch limit exhausted, or loop without add_reader
+                if self._inotify is not None:
+                    self._inotify.close()
+                    self._inotify = None
+        await asyncio.to_thread(self.scan)
+        self._poll_task = asyncio.create_task(self._poll_forever())
+        self.backend = "polling"
+        return self.backend
+    
+    async def _poll_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            self._emit(await asyncio.to_thread(self.poll_once))
+    
+    def _stop_inotify(self) -> None:
+        if self._inotify is not None:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._inotify = None
+    
+    def stop(self) -> None:
+        self._stop_inotify()
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        self.backend = None
+
+
 class CCCSAutomationEngine:
     """Manages autonomous automation loops for WeaverGen"""
     
@@ -55,12 +333,20 @@ class CCCSAutomationEngine:
         
         self.loops: Dict[str, AutomationLoop] = {}
         self.running = False
+        
+        # Event-driven registry monitoring
+        self.registry_watcher: Optional[RegistryWatcher] = None
+        self._registry_changes: Set[Path] = set()
+        self._last_registry_event = 0.0
+        self._wake: Optional[asyncio.Event] = None
+        
         self.load_loops()
     
-    def register_loop(self, loop: AutomationLoop) -> None:
+    def register_loop(self, loop: AutomationLoop, save: bool = True) -> None:
         """Register new automation loop"""
         self.loops[loop.loop_id] = loop
-        self.save_loops()
+        if save:
+            self.save_loops()
     
     def load_loops(self) -> None:
         """Load automation loops from configuration"""
@@ -101,8 +387,11 @@ class CCCSAutomationEngine:
             'updated_at': time.time()
         }
         
-        with open(self.loops_config, 'w') as f:
+        # Write-then-rename so readers never see a half-written file
+        tmp_path = self.loops_config.with_suffix(".json.tmp")
+        with open(tmp_path, 'w') as f:
             json.dump(loops_data, f, indent=2)
+        os.replace(tmp_path, self.loops_config)
     
     def _register_default_loops(self) -> None:
         """Register default automation loops for WeaverGen"""
@@ -116,7 +405,7 @@ class CCCSAutomationEngine:
             auto_healing=True,
             evolution_tracking=True
         )
-        self.register_loop(registry_loop)
+        self.register_loop(registry_loop, save=False)
         
         # Generation Quality Loop
         quality_loop = AutomationLoop(
@@ -127,7 +416,7 @@ class CCCSAutomationEngine:
             auto_healing=True,
             evolution_tracking=True
         )
-        self.register_loop(quality_loop)
+        self.register_loop(quality_loop, save=False)
         
         # Performance Optimization Loop
         perf_loop = AutomationLoop(
@@ -138,7 +427,7 @@ class CCCSAutomationEngine:
             auto_healing=True,
             evolution_tracking=True
         )
-        self.register_loop(perf_loop)
+        self.register_loop(perf_loop, save=False)
         
         # Session Health Loop
         health_loop = AutomationLoop(
@@ -149,7 +438,7 @@ class CCCSAutomationEngine:
             auto_healing=True,
             evolution_tracking=False
         )
-        self.register_loop(health_loop)
+        self.register_loop(health_loop, save=False)
         
         # Cache Optimization Loop
         cache_loop = AutomationLoop(
@@ -160,7 +449,7 @@ class CCCSAutomationEngine:
             auto_healing=True,
             evolution_tracking=True
         )
-        self.register_loop(cache_loop)
+        self.register_loop(cache_loop, save=False)
         
         # Evolution Tracking Loop
         evolution_loop = AutomationLoop(
@@ -171,7 +460,8 @@ class CCCSAutomationEngine:
             auto_healing=False,
             evolution_tracking=True
         )
-        self.register_loop(evolution_loop)
+        self.register_loop(evolution_loop, save=False)
+        self.save_loops()
     
     async def run_registry_monitor(self, loop: AutomationLoop) -> Dict[str, Any]:
         """Monitor semantic convention registries for updates"""
@@ -179,24 +469,23 @@ class CCCSAutomationEngine:
         results = {'checked_registries': 0, 'updates_found': 0, 'errors': []}
         
         try:
-            # Check for registry files in project
-            registry_files = []
-            for pattern in ["*.yaml", "*.yml", "*.json"]:
-                registry_files.extend(self.project_root.rglob(pattern))
-            
-            registry_files = [
-                f for f in registry_files 
-                if any(keyword in f.name.lower() for keyword in ['convention', 'semconv', 'otel'])
-            ]
-            
-            results['checked_registries'] = len(registry_files)
+            watcher = self.registry_watcher
+            if watcher is not None and watcher.started:
+                # The watcher already knows what changed; no tree walk needed
+                changed = self._registry_changes
+                self._registry_changes = set()
+                results['checked_registries'] = len(watcher.registry_files)
+            else:
+                # One-off run: index once and report recently modified files
+                watcher = RegistryWatcher(self.project_root)
+                registry_files = await asyncio.to_thread(watcher.scan)
+                recent_threshold_ns = (time.time() - loop.interval_seconds) * 1e9
+                changed = {p for p, mtime in registry_files.items() if mtime > recent_threshold_ns}
+                results['checked_registries'] = len(registry_files)
             
-            # Check if any registries have been modified recently
-            recent_threshold = time.time() - loop.interval_seconds
-            for registry in registry_files:
-                if registry.stat().st_mtime > recent_threshold:
-                    results['updates_found'] += 1
-                    self.logger.info(f"Registry update detected: {registry}")
+            results['updates_found'] = len(changed)
+            for registry in sorted(changed):
+                self.logger.info(f"Registry update detected: {registry}")
             
             # Performance metrics
             duration = time.time() - start_time
@@ -224,31 +513,36 @@ class CCCSAutomationEngine:
                 if path.exists() and path.is_dir():
                     generated_dirs.append(path)
             
-            total_files = 0
-            quality_issues = 0
-            
-            for gen_dir in generated_dirs:
-                for file_path in gen_dir.rglob("*"):
-                    if file_path.is_file() and file_path.suffix in ['.py', '.rs', '.go', '.java', '.ts']:
-                        total_files += 1
-                        
-                        # Basic quality checks
-                        try:
-                            content = file_path.read_text()
+            def scan_generated() -> Tuple[int, int]:
+                total_files = 0
+                quality_issues = 0
+                
+                for gen_dir in generated_dirs:
+                    for file_path in gen_dir.rglob("*"):
+                        if file_path.is_file() and file_path.suffix in ['.py', '.rs', '.go', '.java', '.ts']:
+                            total_files += 1
                             
-                            # Check for common quality indicators
-                            if len(content) < 100:  # Very small files might be incomplete
-                                quality_issues += 1
-                                results['issues_found'].append(f"Small file: {file_path}")
+                            # Basic quality checks
+                            try:
+                                content = file_path.read_text()
+                                
+                                # Check for common quality indicators
+                                if len(content) < 100:  # Very small files might be incomplete
+                                    quality_issues += 1
+                                    results['issues_found'].append(f"Small file: {file_path}")
+                                
+                                # Check for basic structure
+                                if file_path.suffix == '.py' and 'def ' not in content and 'class ' not in content:
+                                    quality_issues += 1
+                                    results['issues_found'].append(f"Empty Python module: {file_path}")
                             
-                            # Check for basic structure
-                            if file_path.suffix == '.py' and 'def ' not in content and 'class ' not in content:
+                            except Exception as e:
                                 quality_issues += 1
-                                results['issues_found'].append(f"Empty Python module: {file_path}")
-                        
-                        except Exception as e:
-                            quality_issues += 1
-                            results['issues_found'].append(f"Read error {file_path}: {e}")
+                                results['issues_found'].append(f"Read error {file_path}: {e}")
+                return total_files, quality_issues
+            
+            # File I/O runs off the event loop so other loops keep going
+            total_files, quality_issues = await asyncio.to_thread(scan_generated)
             
             results['validated_files'] = total_files
             results['quality_score'] = max(0.0, 1.0 - (quality_issues / max(1, total_files)))
@@ -327,7 +621,7 @@ class CCCSAutomationEngine:
             from .session_manager import CCCSSessionManager
             
             manager = CCCSSessionManager(self.project_root)
-            validation = manager.validate_session_integrity()
+            validation = await asyncio.to_thread(manager.validate_session_integrity)
             
             if validation['valid']:
                 results['health_status'] = 'healthy'
@@ -338,7 +632,7 @@ class CCCSAutomationEngine:
                 
                 # Attempt auto-repair if enabled
                 if loop.auto_healing:
-                    if manager.auto_repair_session():
+                    if await asyncio.to_thread(manager.auto_repair_session):
                         results['repairs_applied'] = 1
                         results['health_status'] = 'healed'
                         self.logger.info("Auto-repair successful")
@@ -357,7 +651,7 @@ class CCCSAutomationEngine:
             self.logger.error(f"Session health error: {e}")
             return results
     
-    async def run_loop(self, loop: AutomationLoop) -> Dict[str, Any]:
+    async def run_loop(self, loop: AutomationLoop, save: bool = True) -> Dict[str, Any]:
         """Execute a single automation loop"""
         self.logger.info(f"Running loop: {loop.name}")
         
@@ -387,42 +681,109 @@ class CCCSAutomationEngine:
             self.logger.error(f"Loop {loop.name} failed: {e}")
             return {'error': str(e)}
         finally:
-            self.save_loops()
+            if save:
+                self.save_loops()
+    
+    async def run_loops(self, loops: List[AutomationLoop]) -> Dict[str, Dict[str, Any]]:
+        """Run several loops concurrently and persist their state once"""
+        outcomes = await asyncio.gather(
+            *(self.run_loop(loop, save=False) for loop in loops),
+            return_exceptions=True
+        )
+        self.save_loops()
+        
+        results = {}
+        for loop, outcome in zip(loops, outcomes):
+            if isinstance(outcome, BaseException):
+                self.logger.error(f"Failed to run loop {loop.name}: {outcome}")
+                outcome = {'error': str(outcome)}
+            results[loop.loop_id] = outcome
+        return results
+    
+    def _on_registry_change(self, paths: Set[Path]) -> None:
+        """Watcher callback: queue changes and wake the scheduler"""
+        self._registry_changes.update(paths)
+        self._last_registry_event = time.monotonic()
+        if self._wake is not None:
+            self._wake.set()
+    
+    def _registry_change_due(self) -> bool:
+        return bool(self._registry_changes) and (
+            time.monotonic() - self._last_registry_event >= REGISTRY_DEBOUNCE_SECONDS
+        )
+    
+    def _due_loops(self, current_time: float) -> List[AutomationLoop]:
+        due = []
+        for loop in self.loops.values():
+            if not loop.enabled:
+                continue
+            if (loop.last_run is None or
+                    current_time - loop.last_run >= loop.interval_seconds or
+                    (loop.loop_id == 'registry_monitor' and self._registry_change_due())):
+                due.append(loop)
+        return due
+    
+    def _seconds_until_next(self, current_time: float) -> float:
+        waits = [MAX_SCHEDULER_SLEEP]
+        for loop in self.loops.values():
+            if loop.enabled and loop.last_run is not None:
+                waits.append(loop.last_run + loop.interval_seconds - current_time)
+        registry_loop = self.loops.get('registry_monitor')
+        if self._registry_changes and registry_loop is not None and registry_loop.enabled:
+            waits.append(self._last_registry_event + REGISTRY_DEBOUNCE_SECONDS - time.monotonic())
+        return max(0.0, min(waits))
     
     async def start_automation(self) -> None:
-        """Start all automation loops"""
+        """Start all automation loops
+        
+        Due loops run concurrently. Between runs the scheduler sleeps until
+        the next loop is due or a registry change arrives; bursts of registry
+        events are debounced into a single registry monitor run.
+        """
         self.running = True
+        self._wake = asyncio.Event()
         self.logger.info("Starting CCCS automation engine")
         
-        while self.running:
-            current_time = time.time()
-            
-            # Check each loop to see if it needs to run
-            for loop in self.loops.values():
-                if not loop.enabled:
+        registry_loop = self.loops.get('registry_monitor')
+        if registry_loop is not None and registry_loop.enabled:
+            self.registry_watcher = RegistryWatcher(self.project_root, on_change=self._on_registry_change)
+            backend = await self.registry_watcher.start()
+            self.logger.info(f"Registry watcher started ({backend}, "
+                             f"{len(self.registry_watcher.registry_files)} registries)")
+        
+        try:
+            while self.running:
+                due = self._due_loops(time.time())
+                if due:
+                    await self.run_loops(due)
                     continue
                 
-                # Check if it's time to run this loop
-                if (loop.last_run is None or 
-                    current_time - loop.last_run >= loop.interval_seconds):
-                    
-                    try:
-                        await self.run_loop(loop)
-                    except Exception as e:
-                        self.logger.error(f"Failed to run loop {loop.name}: {e}")
-            
-            # Sleep for a short interval before checking again
-            await asyncio.sleep(30)  # Check every 30 seconds
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self._seconds_until_next(time.time()))
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+        finally:
+            if self.registry_watcher is not None:
+                self.registry_watcher.stop()
     
     def stop_automation(self) -> None:
         """Stop automation engine"""
         self.running = False
+        if self._wake is not None:
+            self._wake.set()
         self.logger.info("Stopping CCCS automation engine")
     
     def get_status(self) -> Dict[str, Any]:
         """Get automation engine status"""
+        watcher = self.registry_watcher
         return {
             'running': self.running,
+            'registry_watcher': {
+                'backend': watcher.backend if watcher else None,
+                'registries': len(watcher.registry_files) if watcher else 0,
+                'pending_changes': len(self._registry_changes)
+            },
             'loops': {
                 loop.loop_id: {
                     'name': loop.name,
@@ -0,0 +1,174 @@
+"""
+Async Subprocess Layer
+
+Runs external commands (Weaver, generators) on the event loop instead of
+blocking it with ``subprocess.run``. A per-loop semaphore caps concurrent
+children, timeouts and cancellation terminate the child's whole process
+group, and stdout/stderr are read line by line so callers can parse output
+while the command is still running.
+"""
+
+import asyncio
+import contextvars
+import os
+import signal
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar, Union
+
+LineHandler = Callable[[str], None]
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_KILL_GRACE = 5.0
+STREAM_LIMIT = 1024 * 1024
+
+
+@dataclass
+class ProcessResult:
+    """Outcome of one command run"""
+    command: List[str]
+    return_code: int
+    stdout: str = ""
+    stderr: str = ""
+    duration_seconds: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def success(self) -> bool:
+        return self.return_code == 0 and not self.timed_out
+
+
+async def _pump(stream: asyncio.StreamReader, lines: List[str],
+                handler: Optional[LineHandler]) -> None:
+    """Collect a child's output and hand each line to ``handler`` as it arrives"""
+    while True:
+        raw = await stream.readline()
+        if not raw:
+            return
+        line = raw.decode("utf-8", errors="replace")
+        lines.append(line)
+        if handler:
+            handler(line.rstrip("\r\n"))
+
+
+class AsyncProcessRunner:
+    """Bounded-concurrency async runner for external commands"""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 kill_grace: float = DEFAULT_KILL_GRACE):
+        self.max_concurrency = max_concurrency
+        self.kill_grace = kill_grace
+        # asyncio primitives belong to one loop; sync callers each get a fresh one
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+            weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run(self, command: Sequence[Union[str, Path]],
+                  cwd: Optional[Union[str, Path]] = None,
+                  env: Optional[Dict[str, str]] = None,
+                  timeout: Optional[float] = None,
+                  input: Optional[bytes] = None,
+                  on_stdout: Optional[LineHandler] = None,
+                  on_stderr: Optional[LineHandler] = None) -> ProcessResult:
+        """Run ``command`` and wait for it
+
+        A missing executable raises FileNotFoundError like ``subprocess.run``.
+        On timeout the child is terminated and the result has ``timed_out``
+        set; if the awaiting task is cancelled the child is terminated and
+        the cancellation propagates.
+        """
+        command = [str(part) for part in command]
+        async with self._semaphore():
+            started = time.perf_counter()
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=cwd,
+                env=env,
+                stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+                limit=STREAM_LIMIT,
+            )
+            stdout: List[str] = []
+            stderr: List[str] = []
+            pumps = [
+                asyncio.ensure_future(_pump(process.stdout, stdout, on_stdout)),
+                asyncio.ensure_future(_pump(process.stderr, stderr, on_stderr)),
+            ]
+            timed_out = False
+            try:
+                if input is not None:
+                    process.stdin.write(input)
+                    await process.stdin.drain()
+                    process.stdin.close()
+                await asyncio.wait_for(asyncio.gather(*pumps, process.wait()), timeout)
+            except asyncio.TimeoutError:
+                timed_out = True
+                await self._terminate(process)
+            except BaseException:
+                await asyncio.shield(self._terminate(process))
+                raise
+            finally:
+                for pump in pumps:
+                    pump.cancel()
+
+            return ProcessResult(
+                command=command,
+                return_code=-1 if timed_out else process.returncode,
+                stdout="".join(stdout),
+                stderr="".join(stderr),
+                duration_seconds=time.perf_counter() - started,
+                timed_out=timed_out,
+            )
+
+    async def _terminate(self, process: asyncio.subprocess.Process) -> None:
+        """SIGTERM the child's process group, then SIGKILL after the grace period"""
+        if process.returncode is not None:
+            return
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(process.pid, sig)
+            except (ProcessLookupError, PermissionError):
+                return
+            try:
+                await asyncio.wait_for(process.wait(), self.kill_grace)
+                return
+            except asyncio.TimeoutError:
+                continue
+
+
+_default_runner: Optional[AsyncProcessRunner] = None
+
+
+def get_process_runner() -> AsyncProcessRunner:
+    """Process-wide runner, so every caller shares one concurrency limit"""
+    global _default_runner
+    if _default_runner is None:
+        _default_runner = AsyncProcessRunner()
+    return _default_runner
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """Run a coroutine from synchronous code
+
+    Uses ``asyncio.run`` when no loop is running in this thread; inside a
+    running loop it runs on a helper thread rather than failing.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(awaitable)
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(context.run, asyncio.run, awaitable).result()
@@ -0,0 +1,568 @@
+"""
+Benchmark Suite - Reproducible performance benchmarks for WeaverGen subsystems
+
+Every benchmark runs against seeded synthetic data generated into a scratch
+workspace, so two runs with the same size and seed exercise identical inputs.
+Results are written as JSON and can be compared against a stored baseline to
+catch regressions per subsystem:
+
+    registry_generation  WeaverGen.generate() driving a stub weaver binary
+    span_parsing         streaming span file reader + normalization
+    span_query           SQLite span index build + filtered query
+    xes_export           XESConverter.spans_to_xes()
+    process_mining       BPMNProcessMiner.mine_workflow()
+    dod_validation       DefinitionOfDoneValidator.validate_spans()
+    bpmn_execution       MicroBPMNEngine processes calling a local stand-in model
+"""
+
+import asyncio
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from rich.console import Console
+
+BENCHMARK_SCHEMA_VERSION = 1
+DEFAULT_SIZE = 5_000
+DEFAULT_SEED = 42
+DEFAULT_THRESHOLD = 0.25  # 25% slower than baseline counts as a regression
+
+ATTRIBUTES_PER_GROUP = 10
+
+# Task sequence of each synthetic trace; "lint" and "typecheck" overlap in time
+# so the process miner also has a parallel pattern to find.
+WORKFLOW_TASKS = ["load_registry", "validate_registry", "generate_models", "lint",
+                  "typecheck", "review", "fix", "publish"]
+
+_QUIET = Console(quiet=True)
+
+
+class BenchmarkError(Exception):
+    """Raised for invalid benchmark selections or unreadable result files"""
+    pass
+
+
+# ============================================================================
+# Synthetic datasets
+# ============================================================================
+
+class BenchmarkWorkspace:
+    """Scratch directory holding the synthetic inputs for one suite run"""
+
+    def __init__(self, root: Path, size: int, seed: int):
+        self.root = root
+        self.size = size
+        self.seed = seed
+        self.source_dir = root / "src"
+        self.registry_dir = root / "registry"
+        self.output_dir = root / "output"
+        self.bpmn_file = root / "workflow.bpmn"
+        self.span_file = root / "spans.json"
+        self.stub_weaver = root / "bin" / "weaver"
+        self.spans: List[Dict[str, Any]] = []
+
+    @property
+    def registry_groups(self) -> int:
+        return max(1, self.size // 200)
+
+    def prepare(self) -> "BenchmarkWorkspace":
+        """Generate all datasets; deterministic for a given size and seed"""
+        rng = random.Random(self.seed)
+        sources = self._write_sources()
+        self._write_bpmn()
+        write_synthetic_registry(self.registry_dir, self.registry_groups, rng)
+        write_stub_weaver(self.stub_weaver)
+        self.spans = generate_synthetic_spans(self.size, rng, sources, self.bpmn_file)
+        with open(self.span_file, "w") as f:
+            json.dump(self.spans, f)
+        return self
+
+    def _write_sources(self) -> List[Path]:
+        self.source_dir.mkdir(parents=True, exist_ok=True)
+        sources = []
+        for task in WORKFLOW_TASKS:
+            path = self.source_dir / f"{task}.py"
+            path.write_text(f"def {task}(ctx):\n    return ctx\n")
+            sources.append(path)
+        return sources
+
+    def _write_bpmn(self) -> None:
+        tasks = "\n".join(
+            f'    <bpmn:serviceTask id="Task_{task}" name="{task}"/>' for task in WORKFLOW_TASKS
+        )
+        self.bpmn_file.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<bpmn:definitions xmlns:bpmn="http://www.omg.org/spec/BPMN/20100524/MODEL">\n'
+            '  <bpmn:process id="BenchmarkWorkflow" isExecutable="true">\n'
+            f"{tasks}\n"
+            "  </bpmn:process>\n"
+            "</bpmn:definitions>\n"
+        )
+
+
+def generate_synthetic_spans(count: int, rng: random.Random, sources: List[Path],
+                             bpmn_file: Path) -> List[Dict[str, Any]]:
+    """Generate ``count`` spans grouped into workflow traces
+
+    About 5% of spans carry an error status and about 2% reference a source
+    file that does not exist, so validators see both passing and failing data.
+    """
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    spans: List[Dict[str, Any]] = []
+    trace_index = 0
+
+    while len(spans) < count:
+        trace_id = f"{rng.getrandbits(128):032x}"
+        cursor = base_time + timedelta(seconds=trace_index * 60)
+        parent_id = None
+        trace_index += 1
+
+        for position, task in enumerate(WORKFLOW_TASKS):
+            if len(spans) >= count:
+                break
+            span_id = f"{rng.getrandbits(64):016x}"
+            duration_ms = rng.lognormvariate(3.0, 0.8)
+            start_ns = int(cursor.timestamp() * 1e9)
+            duration_ns = max(1, int(duration_ms * 1e6))
+            failed = rng.random() < 0.05
+            source = sources[position]
+            if rng.random() < 0.02:
+                source = source.with_name(f"missing_{source.name}")
+
+            spans.append({
+                "name": f"weavergen.bpmn.{task}",
+                "task": task,
+                "trace_id": trace_id,
+                "span_id": span_id,
+                "parent_id": parent_id,
+                "timestamp": cursor.isoformat(),
+                "start_time": start_ns,
+                "end_time": start_ns + duration_ns,
+                "duration_ns": duration_ns,
+                "duration_ms": duration_ms,
+                "attributes": {
+                    "code.filepath": str(source),
+                    "code.lineno": 1,
+                    "code.function": task,
+                    "bpmn.workflow.id": "BenchmarkWorkflow",
+                    "bpmn.workflow.file": str(bpmn_file),
+                    "bpmn.task.id": f"Task_{task}",
+                    "bpmn.task.type": "serviceTask",
+                    "benchmark.trace_index": trace_index,
+                },
+                "status": {"status_code": "ERROR" if failed else "OK"},
+            })
+            parent_id = parent_id or span_id
+            # lint and typecheck start together; everything else runs in sequence
+            if task != "lint":
+                cursor += timedelta(milliseconds=duration_ms)
+
+    return spans
+
+
+def write_synthetic_registry(registry_dir: Path, groups: int, rng: random.Random) -> None:
+    """Write a semantic convention registry with ``groups`` attribute groups"""
+    import yaml
+
+    registry_dir.mkdir(parents=True, exist_ok=True)
+    types = ["string", "int", "double", "boolean"]
+    levels = ["required", "recommended", "opt_in"]
+    for index in range(groups):
+        group_id = f"bench.group{index}"
+        attributes = [
+            {
+                "id": f"{group_id}.attr{attr}",
+                "type": rng.choice(types),
+                "brief": f"Synthetic attribute {attr} of group {index}",
+                "requirement_level": rng.choice(levels),
+                "stability": "experimental",
+            }
+            for attr in range(ATTRIBUTES_PER_GROUP)
+        ]
+        document = {"groups": [{
+            "id": group_id,
+            "type": "span",
+            "brief": f"Synthetic group {index}",
+            "stability": "experimental",
+            "attributes": attributes,
+        }]}
+        with open(registry_dir / f"group{index}.yaml", "w") as f:
+            yaml.safe_dump(document, f, sort_keys=False)
+
+
+_STUB_WEAVER = '''#!{python}
+"""Stub weaver: renders one module per registry group, like the python templates"""
+import sys
+from pathlib import Path
+
+import yaml
+
+args = sys.argv[1:]
+if args[:2] != ["registry", "generate"]:
+    sys.exit("stub weaver only supports 'registry generate'")
+registry = Path(args[args.index("--registry") + 1])
+positional = [a for i, a in enumerate(args[2:], 2) if not a.startswith("--") and args[i - 1] != "--registry"]
+output = Path(positional[1])
+output.mkdir(parents=True, exist_ok=True)
+for path in sorted(registry.glob("*.yaml")):
+    for group in yaml.safe_load(path.read_text()).get("groups", []):
+        lines = ['"""' + group.get("brief", "") + '"""', ""]
+        for attr in group.get("attributes", []):
+            constant = attr["id"].upper().replace(".", "_")
+            lines.append(constant + " = " + repr(attr["id"]))
+        name = group["id"].replace(".", "_") + ".py"
+        (output / name).write_text("\\n".join(lines) + "\\n")
+print("generated", len(list(output.glob("*.py"))), "files")
+'''
+
+
+def write_stub_weaver(path: Path) -> None:
+    """Write an executable stand-in for the weaver CLI"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(_STUB_WEAVER.format(python=sys.executable))
+    path.chmod(0o755)
+
+
+# ============================================================================
+# Benchmark cases
+# ============================================================================
+
+@dataclass
+class BenchmarkCase:
+    """A named benchmark
+
+    ``prepare`` runs untimed before every sample and returns the callable to
+    time; that callable returns the number of items it processed.
+    """
+    name: str
+    description: str
+    prepare: Callable[[BenchmarkWorkspace], Callable[[], int]]
+
+
+def _prepare_registry_generation(ws: BenchmarkWorkspace) -> Callable[[], int]:
+    from .core import GenerationConfig, WeaverConfig, WeaverGen
+
+    class StubWeaverGen(WeaverGen):
+        # Point at the stub without touching ~/.weavergen/config.json
+        def _load_config(self) -> WeaverConfig:
+            return WeaverConfig(weaver_path=ws.stub_weaver, cache_dir=ws.root / "cache")
+
+    shutil.rmtree(ws.output_dir, ignore_errors=True)
+    config = GenerationConfig(registry_url=str(ws.registry_dir), output_dir=ws.output_dir)
+
+    def run() -> int:
+        result = StubWeaverGen(config, auto_install=False).generate()
+        if not result.success:
+            raise BenchmarkError(f"registry generation failed: {result.error}")
+        return len(result.files)
+    return run
+
+
+def _prepare_span_parsing(ws: BenchmarkWorkspace) -> Callable[[], int]:
+    from .span_query import iter_span_file, normalize_span
+
+    def run() -> int:
+        count = 0
+        for raw in iter_span_file(ws.span_file):
+            normalize_span(raw)
+            count += 1
+        return count
+    return run
+
+
+def _prepare_span_query(ws: BenchmarkWorkspace) -> Callable[[], int]:
+    from .span_query import SpanIndex
+
+    index_file = ws.root / "spans.idx.sqlite"
+    if index_file.exists():
+        index_file.unlink()
+
+    def run() -> int:
+        with SpanIndex(ws.span_file, index_file=index_file) as index:
+            index.query("status = ERROR and duration > 20ms", sort="duration", descending=True, limit=50)
+            return index.count()
+    return run
+
+
+def _prepare_xes_export(ws: BenchmarkWorkspace) -> Callable[[], int]:
+    from .xes_converter import XESConverter
+
+    converter = XESConverter.__new__(XESConverter)
+    converter.console = _QUIET
+    output = ws.root / "export.xes"
+
+    def run() -> int:
+        converter.spans_to_xes(ws.spans, str(output))
+        return len(ws.spans)
+    return run
+
+
+def _prepare_process_mining(ws: BenchmarkWorkspace) -> Callable[[], int]:
+    from .bpmn_process_miner import BPMNProcessMiner
+
+    miner = BPMNProcessMiner()
+    miner.console = _QUIET
+
+    def run() -> int:
+        miner.mine_workflow(ws.spans, "BenchmarkWorkflow")
+        return len(ws.spans)
+    return run
+
+
+def _prepare_dod_validation(ws: BenchmarkWorkspace) -> Callable[[], int]:
+    from .dod_validator import DefinitionOfDoneValidator
+
+    def run() -> int:
+        # Fresh validator per sample so BPMN and path caches start cold
+        return DefinitionOfDoneValidator().validate_spans(ws.spans).total_spans
+    return run
+
+
+def _prepare_bpmn_execution(ws: BenchmarkWorkspace) -> Callable[[], int]:
+    os.environ.setdefault("PYDANTIC_AI_NO_BANNER", "1")
+    from pydantic_ai import Agent
+    from pydantic_ai.models.test import TestModel
+
+    from .micro_bpmn import MicroBPMNEngine, bpmn_process, exclusive_gateway, service_task
+
+    # TestModel answers locally and deterministically, standing in for an LLM
+    agent = Agent(TestModel(custom_output_text="class GeneratedModel: pass"))
+
+    @bpmn_process("BenchmarkGeneration")
+    class BenchmarkGeneration:
+        @service_task
+        def load_semantics(self, ctx):
+            return {"groups": ctx.get("groups", [])}
+
+        @service_task
+        async def model_generate(self, ctx):
+            result = await agent.run(f"Generate models for {len(ctx.get('groups'))} groups")
+            return {"code": result.output}
+
+        @service_task
+        def validate_code(self, ctx):
+            return {"valid": compile(ctx.get("code"), "<generated>", "exec") is not None}
+
+        @exclusive_gateway
+        def route(self, ctx):
+            return "publish" if ctx.get("valid") else "retry"
+
+    instances = max(1, ws.size // 100)
+    groups = [f"bench.group{index}" for index in range(ws.registry_groups)]
+
+    def run() -> int:
+        engine = MicroBPMNEngine()
+        engine.register_process(BenchmarkGeneration)
+
+        async def execute_all():
+            await asyncio.gather(*(
+                engine.execute_process("BenchmarkGeneration", {"groups": groups})
+                for _ in range(instances)
+            ))
+
+        asyncio.run(execute_all())
+        return instances
+    return run
+
+
+BENCHMARK_CASES: Dict[str, BenchmarkCase] = {case.name: case for case in [
+    BenchmarkCase("registry_generation", "WeaverGen.generate() with a stub weaver binary",
+                  _prepare_registry_generation),
+    BenchmarkCase("span_parsing", "Stream and normalize the span file", _prepare_span_parsing),
+    BenchmarkCase("span_query", "Build the span index and run a filtered query", _prepare_span_query),
+    BenchmarkCase("xes_export", "Convert spans to XES", _prepare_xes_export),
+    BenchmarkCase("process_mining", "Mine a workflow from spans", _prepare_process_mining),
+    BenchmarkCase("dod_validation", "Validate spans against the Definition of Done",
+                  _prepare_dod_validation),
+    BenchmarkCase("bpmn_execution", "Micro BPMN processes with a stand-in model",
+                  _prepare_bpmn_execution),
+]}
+
+
+# ============================================================================
+# Results
+# ============================================================================
+
+@dataclass
+class BenchmarkMeasurement:
+    """Timing samples for one benchmark case"""
+    name: str
+    items: int
+    samples: List[float] = field(default_factory=list)  # seconds
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def throughput(self) -> float:
+        """Items per second at the median sample"""
+        return self.items / self.median if self.median > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "items": self.items,
+            "samples_s": self.samples,
+            "median_s": self.median,
+            "mean_s": statistics.fmean(self.samples),
+            "min_s": min(self.samples),
+            "max_s": max(self.samples),
+            "stdev_s": statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0,
+            "items_per_s": self.throughput,
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    """A complete suite run, serializable to and from JSON"""
+    size: int
+    seed: int
+    repeat: int
+    results: Dict[str, Dict[str, Any]]
+    environment: Dict[str, Any] = field(default_factory=dict)
+    created: str = ""
+    schema_version: int = BENCHMARK_SCHEMA_VERSION
+
+    def save(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(asdict(self), indent=2))
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "BenchmarkReport":
+        try:
+            data = json.loads(Path(path).read_text())
+            return cls(**data)
+        except (OSError, ValueError, TypeError) as e:
+            raise BenchmarkError(f"Cannot read benchmark results {path}: {e}") from e
+
+
+@dataclass
+class BenchmarkComparison:
+    """Current vs baseline median for one case"""
+    name: str
+    current_s: Optional[float]
+    baseline_s: Optional[float]
+    status: str  # "ok", "regression", "improved", "new", "missing"
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if self.current_s is None or not self.baseline_s:
+            return None
+        return self.current_s / self.baseline_s
+
+
+def environment_info() -> Dict[str, Any]:
+    """Describe the machine so results are only compared like for like"""
+    try:
+        from importlib.metadata import version
+        weavergen_version = version("weavergen")
+    except Exception:
+        weavergen_version = "unknown"
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "weavergen": weavergen_version,
+    }
+
+
+def compare_reports(current: BenchmarkReport, baseline: BenchmarkReport,
+                    threshold: float = DEFAULT_THRESHOLD) -> List[BenchmarkComparison]:
+    """Compare median timings; slower than ``baseline * (1 + threshold)`` is a regression"""
+    comparisons = []
+    for name in list(current.results) + [n for n in baseline.results if n not in current.results]:
+        now = current.results.get(name, {}).get("median_s")
+        before = baseline.results.get(name, {}).get("median_s")
+        if before is None:
+            status = "new"
+        elif now is None:
+            status = "missing"
+        elif now > before * (1 + threshold):
+            status = "regression"
+        elif now < before / (1 + threshold):
+            status = "improved"
+        else:
+            status = "ok"
+        comparisons.append(BenchmarkComparison(name, now, before, status))
+    return comparisons
+
+
+def comparable(current: BenchmarkReport, baseline: BenchmarkReport) -> bool:
+    """Whether two reports were produced from the same synthetic inputs"""
+    return (current.size, current.seed, current.schema_version) == \
+        (baseline.size, baseline.seed, baseline.schema_version)
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def select_cases(names: Optional[List[str]] = None) -> List[BenchmarkCase]:
+    if not names:
+        return list(BENCHMARK_CASES.values())
+    unknown = [name for name in names if name not in BENCHMARK_CASES]
+    if unknown:
+        raise BenchmarkError(
+            f"Unknown benchmark(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(BENCHMARK_CASES)}"
+        )
+    return [BENCHMARK_CASES[name] for name in names]
+
+
+def run_benchmarks(size: int = DEFAULT_SIZE, repeat: int = 5, warmup: int = 1,
+                   seed: int = DEFAULT_SEED, cases: Optional[List[str]] = None,
+                   workdir: Optional[Path] = None,
+                   progress: Optional[Callable[[str, int, int], None]] = None) -> BenchmarkReport:
+    """Run the selected benchmarks and return their report
+
+    ``progress(case, sample, total)`` is called before every timed sample.
+    """
+    if size < 1 or repeat < 1 or warmup < 0:
+        raise BenchmarkError("size and repeat must be positive, warmup non-negative")
+    selected = select_cases(cases)
+
+    with tempfile.TemporaryDirectory(prefix="weavergen-bench-", dir=workdir) as tmp:
+        ws = BenchmarkWorkspace(Path(tmp), size, seed).prepare()
+        results: Dict[str, Dict[str, Any]] = {}
+
+        for case in selected:
+            measurement = BenchmarkMeasurement(case.name, 0)
+            for sample in range(warmup + repeat):
+                run = case.prepare(ws)
+                gc.collect()
+                if progress and sample >= warmup:
+                    progress(case.name, sample - warmup + 1, repeat)
+                start = time.perf_counter()
+                items = run()
+                elapsed = time.perf_counter() - start
+                if sample >= warmup:
+                    measurement.samples.append(elapsed)
+                    measurement.items = items
+            results[case.name] = measurement.to_dict()
+
+    return BenchmarkReport(
+        size=size,
+        seed=seed,
+        repeat=repeat,
+        results=results,
+        environment=environment_info(),
+        created=datetime.now(timezone.utc).isoformat(),
+    )
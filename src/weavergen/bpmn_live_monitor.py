@@ -6,9 +6,11 @@ Displays workflow progress in the terminal using Rich.
 """
 
 import asyncio
+import json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, TextIO, Tuple
 from enum import Enum
 
 from rich.console import Console
@@ -52,14 +54,27 @@ class BPMNLiveMonitor:
     Real-time BPMN workflow monitor with 80/20 simplicity.
     
     Shows live execution progress in the terminal without external dependencies.
+    State transitions mark only the panels they affect as dirty, bursts of
+    transitions are coalesced into one redraw per ``update_interval``, and
+    large workflows are shown through a window around the active tasks.
+    In headless mode nothing is drawn; every state change is written to
+    ``stream`` as a JSON line instead.
     """
     
-    def __init__(self, workflow_name: str = "WeaverGen"):
+    PANELS = ("diagram", "tasks", "metrics")
+    
+    def __init__(self, workflow_name: str = "WeaverGen", headless: bool = False,
+                 stream: Optional[TextIO] = None, max_table_rows: int = 20,
+                 max_diagram_tasks: int = 8):
         self.workflow_name = workflow_name
         self.console = Console()
         self.tasks: Dict[str, TaskStatus] = {}
         self.start_time = datetime.now()
         self.is_running = False
+        self.headless = headless
+        self.stream = stream
+        self.max_table_rows = max_table_rows
+        self.max_diagram_tasks = max_diagram_tasks
         self.progress = Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -67,39 +82,139 @@ class BPMNLiveMonitor:
             TimeElapsedColumn(),
         )
         
+        # Incremental aggregates so the metrics panel never scans every task
+        self._order: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._state_counts: Dict[TaskState, int] = {state: 0 for state in TaskState}
+        self._running: Dict[str, None] = {}
+        self._frontier = 0
+        self._total_duration_ms = 0.0
+        self._total_spans = 0
+        
+        self._dirty: Set[str] = set(self.PANELS)
+        self._changed: Optional[asyncio.Event] = None
+        self.redraws: Dict[str, int] = {panel: 0 for panel in self.PANELS}
+        
+    # ========================================================================
+    # State transitions
+    # ========================================================================
+    
     def register_task(self, task_id: str, task_name: str):
         """Register a task for monitoring"""
+        if task_id in self.tasks:
+            self._state_counts[self.tasks[task_id].state] -= 1
+            self._running.pop(task_id, None)
+        else:
+            self._index[task_id] = len(self._order)
+            self._order.append(task_id)
         self.tasks[task_id] = TaskStatus(task_id=task_id, task_name=task_name)
+        self._state_counts[TaskState.PENDING] += 1
+        self._emit("task_registered", self.tasks[task_id])
+        self._mark_dirty(*self.PANELS)
         
     def task_started(self, task_id: str):
         """Mark task as started"""
         if task_id in self.tasks:
-            self.tasks[task_id].state = TaskState.RUNNING
-            self.tasks[task_id].start_time = datetime.now()
+            task = self.tasks[task_id]
+            self._set_state(task, TaskState.RUNNING)
+            task.start_time = datetime.now()
+            self._emit("task_started", task)
+            self._mark_dirty(*self.PANELS)
             
     def task_completed(self, task_id: str, result: Optional[Dict[str, Any]] = None):
         """Mark task as completed"""
         if task_id in self.tasks:
             task = self.tasks[task_id]
-            task.state = TaskState.COMPLETED
+            self._set_state(task, TaskState.COMPLETED)
             task.end_time = datetime.now()
             if task.start_time:
                 task.duration_ms = (task.end_time - task.start_time).total_seconds() * 1000
-            task.result = result
+                self._total_duration_ms += task.duration_ms
+            if result is not None:
+                task.result = result
+            self._emit("task_completed", task)
+            self._mark_dirty(*self.PANELS)
             
     def task_failed(self, task_id: str, error: str):
         """Mark task as failed"""
         if task_id in self.tasks:
             task = self.tasks[task_id]
-            task.state = TaskState.FAILED
+            self._set_state(task, TaskState.FAILED)
             task.end_time = datetime.now()
             task.error = error
+            self._emit("task_failed", task)
+            self._mark_dirty(*self.PANELS)
             
     def add_span(self, task_id: str, span_id: str):
         """Add a span ID to a task"""
         if task_id in self.tasks:
             self.tasks[task_id].spans.append(span_id)
+            self._total_spans += 1
+            self._mark_dirty("tasks", "metrics")
+            
+    def _set_state(self, task: TaskStatus, state: TaskState):
+        self._state_counts[task.state] -= 1
+        self._state_counts[state] += 1
+        task.state = state
+        if state == TaskState.RUNNING:
+            self._running[task.task_id] = None
+        else:
+            self._running.pop(task.task_id, None)
             
+    def _mark_dirty(self, *panels: str):
+        self._dirty.update(panels)
+        if self._changed is not None:
+            self._changed.set()
+            
+    def _emit(self, event: str, task: Optional[TaskStatus] = None, **fields: Any):
+        """Write one state change as a JSON line in headless mode"""
+        if not self.headless:
+            return
+        record: Dict[str, Any] = {
+            "ts": datetime.now().isoformat(),
+            "workflow": self.workflow_name,
+            "event": event,
+        }
+        if task is not None:
+            record.update({
+                "task_id": task.task_id,
+                "task_name": task.task_name,
+                "state": task.state.name,
+                "duration_ms": task.duration_ms,
+                "error": task.error,
+                "spans": len(task.spans),
+            })
+        record.update(fields)
+        stream = self.stream or sys.stdout
+        stream.write(json.dumps(record, default=str) + "\n")
+        stream.flush()
+        
+    @property
+    def is_finished(self) -> bool:
+        """All registered tasks have completed or failed"""
+        done = self._state_counts[TaskState.COMPLETED] + self._state_counts[TaskState.FAILED]
+        return done == len(self.tasks)
+        
+    # ========================================================================
+    # Rendering
+    # ========================================================================
+    
+    def _window(self, size: int) -> Tuple[int, int]:
+        """Slice of the task order centred on the earliest active task"""
+        total = len(self._order)
+        if total <= size:
+            return 0, total
+        if self._running:
+            focus = min(self._index[task_id] for task_id in self._running)
+        else:
+            # Terminal tasks never go back to pending, so the frontier only moves forward
+            while (self._frontier < total and
+                   self.tasks[self._order[self._frontier]].state not in (TaskState.PENDING, TaskState.RUNNING)):
+                self._frontier += 1
+            focus = min(self._frontier, total - 1)
+        start = max(0, min(focus - size // 4, total - size))
+        return start, start + size
+        
     def create_workflow_diagram(self) -> Panel:
         """Create visual workflow diagram"""
         
@@ -114,9 +229,12 @@ class BPMNLiveMonitor:
         ]
         
         # Add tasks in order
-        task_list = list(self.tasks.values())
-        for i, task in enumerate(task_list):
-            is_last = i == len(task_list) - 1
+        start, end = self._window(self.max_diagram_tasks)
+        if start:
+            workflow_lines.extend(["       │", f"       ⋮  {start} earlier tasks"])
+        for i in range(start, end):
+            task = self.tasks[self._order[i]]
+            is_last = i == len(self._order) - 1
             
             # Task box
             state_icon = task.state.value
@@ -138,6 +256,8 @@ class BPMNLiveMonitor:
                 f"│ [{color}]{task_display:^11}[/{color}] │",
                 f"└──────{'─' if is_last else '┬'}──────┘"
             ])
+        if end < len(self._order):
+            workflow_lines.extend(["       │", f"       ⋮  {len(self._order) - end} more tasks"])
             
         workflow_lines.extend([
             "       │",
@@ -154,14 +274,20 @@ class BPMNLiveMonitor:
     def create_task_table(self) -> Table:
         """Create task status table"""
         
-        table = Table(title="Task Execution Details")
+        start, end = self._window(self.max_table_rows)
+        caption = None
+        if end - start < len(self._order):
+            caption = f"Tasks {start + 1}-{end} of {len(self._order)}"
+        
+        table = Table(title="Task Execution Details", caption=caption)
         table.add_column("Task", style="cyan", no_wrap=True)
         table.add_column("Status", style="yellow")
         table.add_column("Duration", style="green")
         table.add_column("Spans", style="blue")
         table.add_column("Result", style="magenta")
         
-        for task in self.tasks.values():
+        for task_id in self._order[start:end]:
+            task = self.tasks[task_id]
             duration = f"{task.duration_ms:.0f}ms" if task.duration_ms else "-"
             spans = str(len(task.spans))
             
@@ -188,12 +314,11 @@ class BPMNLiveMonitor:
         
         elapsed = (datetime.now() - self.start_time).total_seconds()
         
-        completed = sum(1 for t in self.tasks.values() if t.state == TaskState.COMPLETED)
-        failed = sum(1 for t in self.tasks.values() if t.state == TaskState.FAILED)
-        running = sum(1 for t in self.tasks.values() if t.state == TaskState.RUNNING)
+        completed = self._state_counts[TaskState.COMPLETED]
+        failed = self._state_counts[TaskState.FAILED]
+        running = self._state_counts[TaskState.RUNNING]
         
-        total_duration = sum(t.duration_ms or 0 for t in self.tasks.values())
-        avg_duration = total_duration / len(self.tasks) if self.tasks else 0
+        avg_duration = self._total_duration_ms / len(self.tasks) if self.tasks else 0
         
         metrics_text = f"""
 Workflow: {self.workflow_name}
@@ -208,7 +333,7 @@ Tasks:
 
 Performance:
   ⚡ Avg Duration: {avg_duration:.0f}ms
-  📡 Total Spans: {sum(len(t.spans) for t in self.tasks.values())}
+  📡 Total Spans: {self._total_spans}
 """
         
         return Panel(
@@ -223,35 +348,78 @@ Performance:
         layout = Layout()
         
         layout.split_column(
-            Layout(self.create_workflow_diagram(), size=20),
+            Layout(self.create_workflow_diagram(), name="diagram", size=20),
             Layout(name="middle"),
-            Layout(self.create_metrics_panel(), size=15)
+            Layout(self.create_metrics_panel(), name="metrics", size=15)
         )
         
         layout["middle"].split_row(
-            Layout(self.create_task_table())
+            Layout(self.create_task_table(), name="tasks")
         )
         
+        self._dirty.clear()
         return layout
         
+    def refresh_layout(self, layout: Layout) -> bool:
+        """Rebuild only the dirty panels of ``layout``; returns whether anything changed"""
+        
+        builders = {
+            "diagram": self.create_workflow_diagram,
+            "tasks": self.create_task_table,
+            "metrics": self.create_metrics_panel,
+        }
+        dirty, self._dirty = self._dirty, set()
+        for panel in dirty:
+            layout[panel].update(builders[panel]())
+            self.redraws[panel] += 1
+        return bool(dirty)
+        
     async def start_live_monitor(self, update_interval: float = 0.5):
         """Start the live monitoring display"""
         
         self.is_running = True
+        self._changed = asyncio.Event()
+        
+        if self.headless:
+            self._emit("workflow_started", tasks=len(self.tasks))
+            while self.is_running and not self.is_finished:
+                await self._changed.wait()
+                self._changed.clear()
+            self.is_running = False
+            self._emit("workflow_finished",
+                       completed=self._state_counts[TaskState.COMPLETED],
+                       failed=self._state_counts[TaskState.FAILED],
+                       elapsed_seconds=(datetime.now() - self.start_time).total_seconds())
+            return
         
-        with Live(self.create_layout(), refresh_per_second=2, console=self.console) as live:
+        layout = self.create_layout()
+        loop = asyncio.get_running_loop()
+        with Live(layout, auto_refresh=False, console=self.console) as live:
             while self.is_running:
-                live.update(self.create_layout())
-                await asyncio.sleep(update_interval)
-                
+                frame_started = loop.time()
+                if self.refresh_layout(layout):
+                    live.refresh()
+                    
                 # Stop if all tasks are complete
-                if all(t.state in [TaskState.COMPLETED, TaskState.FAILED] 
-                      for t in self.tasks.values()):
+                if self.is_finished:
                     self.is_running = False
+                    break
+                    
+                try:
+                    # Idle monitors only tick once a second to advance the clock
+                    await asyncio.wait_for(self._changed.wait(), max(1.0, update_interval))
+                except asyncio.TimeoutError:
+                    self._dirty.add("metrics")
+                self._changed.clear()
+                
+                # Coalesce bursts of transitions into one frame per interval
+                await asyncio.sleep(max(0.0, frame_started + update_interval - loop.time()))
                     
     def stop(self):
         """Stop the monitor"""
         self.is_running = False
+        if self._changed is not None:
+            self._changed.set()
 
 
 class BPMNMonitorContext:
@@ -397,20 +397,20 @@ def forge_to_agents(
                 llm_model=llm_model
             )
             
-            results = {}
+            step_names = {step_func: step_name for step_name, step_func in generation_steps}
             
-            for step_name, step_func in generation_steps:
-                progress.update(total_task, description=f"[cyan]{step_name}[/cyan]")
-                
-                step_result = getattr(generator, step_func)()
-                results[step_func] = step_result
-                
+            def step_complete(step_func, step_result):
+                progress.update(total_task, description=f"[cyan]{step_names[step_func]}[/cyan]")
+                progress.advance(total_task)
+            
+            # Independent steps run concurrently; unchanged ones come from the manifest
+            results = generator.generate_all(list(step_names), on_step_complete=step_complete)
+            
+            for step_func, step_result in results.items():
                 if not step_result.success:
-                    rprint(f"[red]❌ FAILURE at {step_name}: {step_result.error}[/red]")
+                    rprint(f"[red]❌ FAILURE at {step_names[step_func]}: {step_result.error}[/red]")
                     rprint("[red]🔥 SYSTEM COLLAPSE: Cannot proceed with incomplete generation[/red]")
                     raise typer.Exit(1)
-                
-                progress.advance(total_task)
             
             # Final validation
             if validate:
@@ -432,16 +432,21 @@ def forge_to_agents(
             table.add_column("Status", style="green")
             table.add_column("Files", style="blue")
             table.add_column("Features", style="magenta")
+            table.add_column("Critical Path", style="yellow")
             
             for step_func, result in results.items():
                 table.add_row(
                     step_func.replace("generate_", "").replace("_", " ").title(),
-                    "✅ Generated",
+                    "♻️ Reused" if result.cached else "✅ Generated",
                     str(len(result.files)),
-                    ", ".join(result.features[:3])
+                    ", ".join(result.features[:3]),
+                    f"{result.critical_path_seconds:.2f}s"
                 )
             
             console.print(table)
+            stats = generator.run_stats
+            rprint(f"[dim]Wall time {stats['wall_seconds']:.2f}s, critical path "
+                   f"{stats['critical_path_seconds']:.2f}s, {stats['cached_steps']} steps reused[/dim]")
             
             rprint(f"[bold yellow]🎯 Ready for end-to-end operation:[/bold yellow]")
             rprint(f"[yellow]   weavergen agents communicate --agents 5[/yellow]")
@@ -704,15 +709,16 @@ def full_pipeline(
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
             total_task = progress.add_task("[cyan]Generating system...", total=len(generation_steps))
             
-            for step_name, step_func in generation_steps:
-                progress.update(total_task, description=f"[cyan]Generating {step_name}[/cyan]")
-                result = getattr(generator, step_func)()
-                
+            step_names = {step_func: step_name for step_name, step_func in generation_steps}
+            results = generator.generate_all(
+                list(step_names),
+                on_step_complete=lambda step_func, result: progress.advance(total_task)
+            )
+            
+            for step_func, result in results.items():
                 if not result.success:
-                    rprint(f"[red]❌ GENERATION FAILURE at {step_name}: {result.error}[/red]")
+                    rprint(f"[red]❌ GENERATION FAILURE at {step_names[step_func]}: {result.error}[/red]")
                     raise typer.Exit(1)
-                    
-                progress.advance(total_task)
         
         rprint("[green]✅ Step 1: Complete system generated[/green]")
         
@@ -862,6 +868,124 @@ def ollama(
     rprint("[green]✅ Benchmark completed - 36 tokens/sec average[/green]")
 
 
+def _print_benchmark_comparison(current, baseline, threshold: float) -> bool:
+    """Print current vs baseline medians; returns True when any case regressed"""
+    from .benchmark_suite import compare_reports, comparable
+
+    if not comparable(current, baseline):
+        rprint(f"[yellow]⚠️ Baseline was recorded with size={baseline.size} seed={baseline.seed}; "
+               f"current run uses size={current.size} seed={current.seed}[/yellow]")
+
+    styles = {"ok": "green", "improved": "cyan", "regression": "red", "new": "yellow", "missing": "yellow"}
+    table = Table(title=f"Baseline Comparison (threshold {threshold:.0%})")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Status")
+
+    regressed = False
+    for comparison in compare_reports(current, baseline, threshold):
+        ratio = comparison.ratio
+        style = styles[comparison.status]
+        regressed |= comparison.status == "regression"
+        table.add_row(
+            comparison.name,
+            f"{comparison.baseline_s * 1000:.1f}ms" if comparison.baseline_s is not None else "-",
+            f"{comparison.current_s * 1000:.1f}ms" if comparison.current_s is not None else "-",
+            f"{(ratio - 1):+.1%}" if ratio is not None else "-",
+            f"[{style}]{comparison.status}[/{style}]",
+        )
+    console.print(table)
+    return regressed
+
+
+@benchmark_app.command("suite")
+def benchmark_suite(
+    size: int = typer.Option(5000, "--size", "-s", help="Number of synthetic spans (other datasets scale with it)"),
+    repeat: int = typer.Option(5, "--repeat", "-r", help="Timed samples per benchmark"),
+    warmup: int = typer.Option(1, "--warmup", help="Untimed warmup runs per benchmark"),
+    seed: int = typer.Option(42, "--seed", help="Seed for the synthetic datasets"),
+    cases: Optional[List[str]] = typer.Option(None, "--case", "-c", help="Run only these benchmarks (repeatable)"),
+    output: Path = typer.Option(Path("benchmark_results.json"), "--output", "-o", help="Write JSON results here"),
+    baseline: Optional[Path] = typer.Option(None, "--baseline", "-b", help="Compare against this results file"),
+    save_baseline: Optional[Path] = typer.Option(None, "--save-baseline", help="Also store results as a baseline"),
+    threshold: float = typer.Option(0.25, "--threshold", "-t", help="Slowdown ratio that counts as a regression"),
+    list_cases: bool = typer.Option(False, "--list", help="List available benchmarks and exit"),
+):
+    """Run the reproducible subsystem benchmark suite on synthetic data"""
+    from .benchmark_suite import BENCHMARK_CASES, BenchmarkError, BenchmarkReport, run_benchmarks
+
+    if list_cases:
+        for case in BENCHMARK_CASES.values():
+            rprint(f"[cyan]{case.name:<20}[/cyan] {case.description}")
+        return
+
+    try:
+        baseline_report = BenchmarkReport.load(baseline) if baseline else None
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            transient=True,
+        ) as progress:
+            task = progress.add_task("Preparing synthetic datasets...")
+            report = run_benchmarks(
+                size=size, repeat=repeat, warmup=warmup, seed=seed, cases=cases,
+                progress=lambda name, sample, total: progress.update(
+                    task, description=f"{name} ({sample}/{total})"),
+            )
+    except BenchmarkError as e:
+        rprint(f"[red]❌ {e}[/red]")
+        raise typer.Exit(1)
+
+    table = Table(title=f"Benchmark Results (size={size}, seed={seed}, repeat={repeat})")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Items", justify="right")
+    table.add_column("Median", justify="right", style="green")
+    table.add_column("Min", justify="right")
+    table.add_column("Stdev", justify="right")
+    table.add_column("Items/s", justify="right")
+    for name, result in report.results.items():
+        table.add_row(
+            name,
+            str(result["items"]),
+            f"{result['median_s'] * 1000:.1f}ms",
+            f"{result['min_s'] * 1000:.1f}ms",
+            f"{result['stdev_s'] * 1000:.1f}ms",
+            f"{result['items_per_s']:,.0f}",
+        )
+    console.print(table)
+
+    rprint(f"[green]✅ Results written to {report.save(output)}[/green]")
+    if save_baseline:
+        rprint(f"[green]✅ Baseline stored at {report.save(save_baseline)}[/green]")
+
+    if baseline_report and _print_benchmark_comparison(report, baseline_report, threshold):
+        rprint("[red]❌ Performance regression detected[/red]")
+        raise typer.Exit(1)
+
+
+@benchmark_app.command("compare")
+def benchmark_compare(
+    results: Path = typer.Argument(..., help="Benchmark results JSON"),
+    baseline: Path = typer.Argument(..., help="Baseline results JSON"),
+    threshold: float = typer.Option(0.25, "--threshold", "-t", help="Slowdown ratio that counts as a regression"),
+):
+    """Compare two stored benchmark result files"""
+    from .benchmark_suite import BenchmarkError, BenchmarkReport
+
+    try:
+        current, stored = BenchmarkReport.load(results), BenchmarkReport.load(baseline)
+    except BenchmarkError as e:
+        rprint(f"[red]❌ {e}[/red]")
+        raise typer.Exit(1)
+
+    if _print_benchmark_comparison(current, stored, threshold):
+        rprint("[red]❌ Performance regression detected[/red]")
+        raise typer.Exit(1)
+    rprint("[green]✅ No regressions against baseline[/green]")
+
+
 # ============= Demo Commands =============
 
 @demo_app.command()
@@ -1126,9 +1250,16 @@ def main(
 
 @debug_app.command()
 def spans(
-    span_file: Optional[Path] = typer.Option(None, "--file", "-f", help="Span file to analyze"),
+    span_file: Optional[Path] = typer.Option(None, "--file", "-f", help="Span file or capture directory to analyze"),
     output_dir: Path = typer.Option(Path("generated"), "--output", "-o", help="Generated system directory"),
-    format: str = typer.Option("table", "--format", help="Output format: table, json, mermaid")
+    format: str = typer.Option("table", "--format", help="Output format: table, json, mermaid"),
+    where: Optional[str] = typer.Option(None, "--where", "-w", help='Filter, e.g. \'name ~ bpmn and duration > 10ms\''),
+    limit: int = typer.Option(50, "--limit", "-n", help="Spans per page"),
+    page: int = typer.Option(1, "--page", "-p", help="Page number (1-based)"),
+    top: Optional[int] = typer.Option(None, "--top", help="Show the N slowest matching spans"),
+    sort: str = typer.Option("file", "--sort", help="Sort key: file, start, duration, name"),
+    desc: bool = typer.Option(False, "--desc", help="Sort descending"),
+    reindex: bool = typer.Option(False, "--reindex", help="Rebuild the span index"),
 ):
     """🐛 Debug and analyze OTel spans from generated systems"""
     rprint("[bold cyan]🐛 SPAN DEBUGGING ANALYSIS[/bold cyan]")
@@ -1146,6 +1277,12 @@ def spans(
                 span_file = possible_file
                 break
         
+        if not span_file:
+            # Fall back to the newest persistent capture (.weavergen/spans/*)
+            from .span_ring import find_captures
+            captures = find_captures()
+            span_file = captures[0] if captures else None
+        
         if not span_file:
             rprint("[red]❌ No span files found![/red]")
             rprint("[yellow]   Run a command to generate spans first:[/yellow]")
@@ -1157,14 +1294,29 @@ def spans(
         raise typer.Exit(1)
     
     try:
-        import json
-        from .span_validation import SpanBasedValidator
+        from .span_query import SpanIndex, SpanQueryError, format_duration
+        from .span_ring import SpanRingReader
         
-        # Load and analyze spans
-        with open(span_file) as f:
-            spans = json.load(f)
+        # A capture directory may still be written to; query a snapshot of it
+        if span_file.is_dir() and SpanRingReader.is_capture(span_file):
+            span_file = SpanRingReader(span_file).materialize()
+        
+        # Query the on-disk index instead of loading the whole file
+        index = SpanIndex(span_file)
+        if reindex or not index.is_fresh():
+            rprint(f"[dim]Indexing {span_file}...[/dim]")
+        index.open(rebuild=reindex)
         
-        rprint(f"[green]📊 Analyzing {len(spans)} spans from {span_file}[/green]")
+        if top is not None:
+            result = index.top(top, where=where)
+        else:
+            result = index.query(where, sort=sort, descending=desc,
+                                 limit=limit, offset=max(page - 1, 0) * limit)
+        spans = result.spans
+        
+        first = result.offset + 1 if spans else 0
+        rprint(f"[green]📊 Showing {first}-{result.offset + len(spans)} of {result.total} "
+               f"matching spans from {span_file}[/green]")
         
         if format == "table":
             # Show spans in a table
@@ -1175,17 +1327,9 @@ def spans(
             table.add_column("Key Attributes", style="magenta")
             
             for span in spans:
-                name = span.get("name", "unknown")
-                span_id = span.get("context", {}).get("span_id", "unknown")[-8:]
-                
-                start_time = span.get("start_time", "")
-                end_time = span.get("end_time", "")
-                duration = "N/A"
-                if start_time and end_time:
-                    # Simple duration calculation
-                    duration = "< 1ms"
-                
-                attrs = span.get("attributes", {})
+                name = span.name
+                span_id = (span.span_id or "unknown")[-8:]
+                attrs = span.attributes
                 key_attrs = []
                 
                 # Extract key attributes based on span type
@@ -1205,48 +1349,44 @@ def spans(
                     if "result.messages" in attrs:
                         key_attrs.append(f"Messages: {attrs['result.messages']}")
                 
-                table.add_row(name, span_id, duration, ", ".join(key_attrs))
+                table.add_row(name, span_id, span.duration, ", ".join(key_attrs))
             
             console.print(table)
+            if result.has_more and top is None:
+                rprint(f"[dim]More results: --page {page + 1}[/dim]")
             
         elif format == "json":
             # Pretty print JSON
-            rprint(json.dumps(spans, indent=2))
+            rprint(json.dumps([span.raw for span in spans], indent=2))
             
         elif format == "mermaid":
             # Generate mermaid diagram
             rprint("```mermaid")
             rprint("graph TD")
             
+            node_ids = []
             for i, span in enumerate(spans):
-                name = span.get("name", "unknown").replace(".", "_").replace("-", "_")
-                span_id = span.get("context", {}).get("span_id", "unknown")[-8:]
-                node_id = f"{name}_{i}"
-                span_name = span.get("name", "unknown")
-                rprint(f"    {node_id}[{span_name}<br/>ID: {span_id}]")
-                
+                node_id = f"{span.name.replace('.', '_').replace('-', '_')}_{i}"
+                node_ids.append(node_id)
+                rprint(f"    {node_id}[{span.name}<br/>ID: {(span.span_id or 'unknown')[-8:]}]")
                 if i > 0:
-                    prev_name = spans[i-1].get("name", "unknown").replace(".", "_").replace("-", "_")
-                    prev_node_id = f"{prev_name}_{i-1}"
-                    rprint(f"    {prev_node_id} --> {node_id}")
+                    rprint(f"    {node_ids[i - 1]} --> {node_id}")
             
             rprint("```")
         
-        # Always show validation summary
-        rprint("\n[bold yellow]🔍 SPAN VALIDATION SUMMARY:[/bold yellow]")
-        validator = SpanBasedValidator()
-        results = validator.run_comprehensive_validation(spans)
-        
-        rprint(f"Overall Health Score: {results['overall_health_score']:.2f}")
-        rprint(f"System Reliable: {results['system_reliable']}")
-        
-        for name, val in results['validations'].items():
-            status = '✅' if val.get('valid', False) else '❌'
-            score = val.get('score', 0.0)
-            rprint(f"{name}: {status} (score: {score:.2f})")
-            
-    except ImportError as e:
-        rprint(f"[red]❌ Missing dependencies: {e}[/red]")
+        # Always show the index summary
+        stats = index.stats()
+        rprint("\n[bold yellow]🔍 SPAN INDEX SUMMARY:[/bold yellow]")
+        rprint(f"Total Spans: {stats.get('total_spans', 0)} across {stats.get('traces', 0)} traces")
+        rprint(f"Error Spans: {stats.get('error_spans', 0)}")
+        rprint(f"Duration p50/p95/p99: {format_duration(stats.get('duration_p50_ns'))} / "
+               f"{format_duration(stats.get('duration_p95_ns'))} / "
+               f"{format_duration(stats.get('duration_p99_ns'))} "
+               f"(max {format_duration(stats.get('duration_max_ns'))})")
+        index.close()
+            
+    except SpanQueryError as e:
+        rprint(f"[red]❌ Invalid span query: {e}[/red]")
         raise typer.Exit(1)
     except Exception as e:
         rprint(f"[red]❌ Span analysis failed: {e}[/red]")
@@ -2278,13 +2418,13 @@ def list():
 
 @bpmn_app.command()
 def validate_spans(
-    span_file: Optional[Path] = typer.Option(None, "--file", "-f", help="Span file to validate"),
+    span_file: Optional[Path] = typer.Option(None, "--file", "-f", help="Span file or capture directory to validate"),
     capture: bool = typer.Option(False, "--capture", help="Capture new spans"),
     output_dir: Path = typer.Option(Path("."), "--output", "-o", help="Output directory for reports")
 ):
     """🔍 Validate spans from BPMN executions"""
     import asyncio
-    from .span_validator import SpanCaptureSystem, SpanValidator, SpanReportGenerator
+    from .span_validator import SpanCaptureSystem, SpanValidator, SpanReportGenerator, load_live_spans
     
     rprint("[bold cyan]🔍 SPAN VALIDATION[/bold cyan]")
     
@@ -2317,8 +2457,12 @@ def validate_spans(
         rprint("[red]❌ No span file provided or found[/red]")
         raise typer.Exit(1)
     
-    with open(span_file) as f:
-        spans = json.load(f)
+    if span_file.is_dir():
+        # Persistent capture directory, possibly still being written
+        spans = load_live_spans(span_file)
+    else:
+        with open(span_file) as f:
+            spans = json.load(f)
     
     rprint(f"[cyan]📊 Loaded {len(spans)} spans from {span_file}[/cyan]")
     
@@ -5,36 +5,249 @@ Automatically validates that every CLI command execution meets the
 Definition of Done criteria, especially BPMN attribution.
 """
 
+import atexit
 import functools
 import inspect
+import os
+import queue
+import random
 import sys
 import asyncio
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import typer
 import json
 from datetime import datetime
 
 from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 from rich import print as rprint
 from rich.console import Console
 from rich.panel import Panel
 
 from .dod_validator import DefinitionOfDoneValidator, DoDValidationResult
+from .span_ring import DEFAULT_CAPTURE_ROOT, RingBufferSpanExporter
 
 console = Console()
 
-# Global span exporter for CLI validation
-CLI_MEMORY_EXPORTER = InMemorySpanExporter()
+# Global span exporter for CLI validation; persistent, so `weavergen debug
+# spans` can read a command's spans while it runs or after it crashes
+CLI_CAPTURE_DIR = DEFAULT_CAPTURE_ROOT / "cli"
+CLI_MEMORY_EXPORTER = RingBufferSpanExporter(CLI_CAPTURE_DIR)
 CLI_PROVIDER = TracerProvider()
 CLI_PROVIDER.add_span_processor(BatchSpanProcessor(CLI_MEMORY_EXPORTER))
 
 # Store original provider to restore later
 ORIGINAL_PROVIDER = trace.get_tracer_provider()
 
+# Enforcement modes: "sync" validates on the command's critical path,
+# "async" hands spans to a background validator, "off" skips enforcement
+DOD_MODE_ENV = "WEAVERGEN_DOD_MODE"
+DOD_SAMPLE_RATE_ENV = "WEAVERGEN_DOD_SAMPLE_RATE"
+DOD_LEDGER = Path(".weavergen/validation/ledger.jsonl")
+DOD_BUFFER_CAPACITY = 10_000
+DOD_MAX_PENDING = 32
+DOD_DRAIN_TIMEOUT = 2.0
+
+
+def span_to_dict(span: ReadableSpan) -> Dict[str, Any]:
+    """Convert a finished SDK span to the dict shape the DoD validator reads"""
+    return {
+        "name": span.name,
+        "trace_id": f"0x{span.context.trace_id:032x}",
+        "span_id": f"0x{span.context.span_id:016x}",
+        "parent_id": f"0x{span.parent.span_id:016x}" if span.parent else None,
+        "start_time": span.start_time,
+        "end_time": span.end_time,
+        "duration_ns": span.end_time - span.start_time if span.end_time else 0,
+        "attributes": dict(span.attributes or {}),
+        "status": {
+            "status_code": span.status.status_code.name if span.status else "UNSET",
+            "description": span.status.description if span.status else None
+        }
+    }
+
+
+class SpanRingBuffer(SpanProcessor):
+    """Bounded span buffer; appends are a single deque op, oldest spans drop first"""
+    
+    def __init__(self, capacity: int = DOD_BUFFER_CAPACITY):
+        self._spans: deque = deque(maxlen=capacity)
+        self.dropped = 0
+    
+    def on_start(self, span, parent_context=None) -> None:
+        pass
+    
+    def on_end(self, span: ReadableSpan) -> None:
+        if len(self._spans) == self._spans.maxlen:
+            self.dropped += 1
+        self._spans.append(span)
+    
+    def drain(self) -> List[ReadableSpan]:
+        """Remove and return every buffered span"""
+        spans = []
+        pop = self._spans.popleft
+        try:
+            while True:
+                spans.append(pop())
+        except IndexError:
+            return spans
+    
+    def shutdown(self) -> None:
+        self._spans.clear()
+    
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+# Async mode reads from the ring buffer on the same provider: the global
+# tracer provider can only be installed once per process
+CLI_SPAN_BUFFER = SpanRingBuffer()
+CLI_PROVIDER.add_span_processor(CLI_SPAN_BUFFER)
+
+
+class BackgroundDoDValidator:
+    """Validates command spans off the critical path and appends results to a ledger
+    
+    Jobs go through a bounded queue; when it is full the job is dropped and
+    counted rather than blocking the command. Ledger entries for unsampled
+    commands are queued the same way, so commands never touch the ledger
+    file. Pending jobs get at most ``drain_timeout`` seconds at interpreter
+    exit.
+    """
+    
+    def __init__(self,
+                 ledger_path: Path = DOD_LEDGER,
+                 max_pending: int = DOD_MAX_PENDING,
+                 drain_timeout: float = DOD_DRAIN_TIMEOUT):
+        self.ledger_path = ledger_path
+        self.drain_timeout = drain_timeout
+        self.jobs: queue.Queue = queue.Queue(maxsize=max_pending)
+        self.stats = {
+            "jobs_submitted": 0,
+            "jobs_dropped": 0,
+            "jobs_validated": 0,
+            "jobs_skipped": 0,
+            "inline_ns": 0,
+            "validation_ns": 0,
+        }
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="weavergen-dod-validator", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.drain)
+    
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for key, delta in deltas.items():
+                self.stats[key] += delta
+    
+    def _enqueue(self, job: Tuple) -> bool:
+        self._ensure_started()
+        try:
+            self.jobs.put_nowait(job)
+        except queue.Full:
+            self._count(jobs_dropped=1)
+            return False
+        return True
+    
+    def submit(self, enforcer: "CLIDoDEnforcer", command_name: str,
+               spans: List[ReadableSpan], context: dict, extra: Dict[str, Any]) -> bool:
+        """Queue a validation job; returns False if it had to be dropped"""
+        if not self._enqueue((enforcer, command_name, spans, context, extra)):
+            return False
+        self._count(jobs_submitted=1)
+        return True
+    
+    def record_skip(self, command_name: str, extra: Dict[str, Any]) -> None:
+        """Queue a ledger entry for a command that was not sampled"""
+        self._count(jobs_skipped=1, inline_ns=extra.get("inline_ns", 0))
+        self._enqueue((None, command_name, None, None, extra))
+    
+    def snapshot_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats)
+    
+    def _run(self) -> None:
+        while True:
+            enforcer, command_name, spans, context, extra = self.jobs.get()
+            try:
+                if enforcer is None:
+                    self._append({"command": command_name, "sampled": False, **extra})
+                    continue
+                started = time.perf_counter_ns()
+                span_dicts = [span_to_dict(span) for span in spans]
+                passed, reasons, result = enforcer.evaluate(span_dicts)
+                validation_ns = time.perf_counter_ns() - started
+                self._count(jobs_validated=1, inline_ns=extra.get("inline_ns", 0),
+                            validation_ns=validation_ns)
+                self._append({
+                    "command": command_name,
+                    "sampled": True,
+                    "passed": passed,
+                    "reasons": reasons,
+                    "trust_score": result.trust_score,
+                    "is_done": result.is_done,
+                    "total_spans": result.total_spans,
+                    "violations": len(result.violations),
+                    "lies_detected": len(result.lies_detected),
+                    "validation_ms": validation_ns / 1e6,
+                    "cli.args": context.get("cli.args"),
+                    **extra,
+                })
+            except Exception as e:
+                self._append({"command": command_name, "error": str(e), **extra})
+            finally:
+                self.jobs.task_done()
+    
+    def _append(self, entry: Dict[str, Any]) -> None:
+        entry.setdefault("timestamp", datetime.now().isoformat())
+        if "inline_ns" in entry:
+            entry["inline_ms"] = entry.pop("inline_ns") / 1e6
+        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.ledger_path, "a") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+    
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait (bounded) for queued jobs; returns True if the queue emptied"""
+        deadline = time.monotonic() + (self.drain_timeout if timeout is None else timeout)
+        while self.jobs.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+
+BACKGROUND_VALIDATOR = BackgroundDoDValidator()
+
+
+def get_enforcement_stats() -> Dict[str, Any]:
+    """Counters and cumulative cost of background DoD enforcement"""
+    stats = BACKGROUND_VALIDATOR.snapshot_stats()
+    stats["spans_dropped"] = CLI_SPAN_BUFFER.dropped
+    stats["pending"] = BACKGROUND_VALIDATOR.jobs.qsize()
+    return stats
+
+
+def resolve_dod_mode(mode: Optional[str] = None, sample_rate: Optional[float] = None) -> Tuple[str, float]:
+    """Decorator arguments win over WEAVERGEN_DOD_MODE / WEAVERGEN_DOD_SAMPLE_RATE"""
+    mode = (mode or os.environ.get(DOD_MODE_ENV) or "sync").lower()
+    if mode not in ("sync", "async", "off"):
+        raise ValueError(f"Unknown DoD enforcement mode: {mode}")
+    if sample_rate is None:
+        sample_rate = float(os.environ.get(DOD_SAMPLE_RATE_ENV, "1.0"))
+    return mode, min(max(sample_rate, 0.0), 1.0)
+
 
 class CLIDoDEnforcer:
     """Enforces Definition of Done on CLI commands"""
@@ -62,34 +275,10 @@ class CLIDoDEnforcer:
     def export_spans(self) -> list:
         """Export captured spans"""
         CLI_PROVIDER.force_flush()
-        raw_spans = CLI_MEMORY_EXPORTER.get_finished_spans()
-        
-        spans = []
-        for span in raw_spans:
-            span_dict = {
-                "name": span.name,
-                "trace_id": f"0x{span.context.trace_id:032x}",
-                "span_id": f"0x{span.context.span_id:016x}",
-                "parent_id": f"0x{span.parent.span_id:016x}" if span.parent else None,
-                "start_time": span.start_time,
-                "end_time": span.end_time,
-                "duration_ns": span.end_time - span.start_time if span.end_time else 0,
-                "attributes": dict(span.attributes or {}),
-                "status": {
-                    "status_code": span.status.status_code.name if span.status else "UNSET",
-                    "description": span.status.description if span.status else None
-                }
-            }
-            spans.append(span_dict)
-        
-        return spans
+        return CLI_MEMORY_EXPORTER.get_finished_spans()
     
-    def validate_command_execution(self, 
-                                   command_name: str,
-                                   spans: list,
-                                   context: dict) -> tuple[bool, DoDValidationResult]:
-        """Validate that command execution meets DoD"""
-        # Run validation
+    def evaluate(self, spans: list) -> Tuple[bool, List[str], DoDValidationResult]:
+        """Run DoD validation and apply this command's requirements"""
         result = self.validator.validate_spans(spans)
         
         # Check specific requirements
@@ -107,14 +296,20 @@ class CLIDoDEnforcer:
             reasons.append(f"Detected {len(result.lies_detected)} lies in execution")
         
         # Check BPMN attribution if required
-        if self.require_bpmn:
-            bpmn_spans = [
-                s for s in spans 
-                if s.get("attributes", {}).get("bpmn.workflow.file")
-            ]
-            if not bpmn_spans:
-                passed = False
-                reasons.append("No BPMN attribution found in any spans")
+        if self.require_bpmn and not any(
+            s.get("attributes", {}).get("bpmn.workflow.file") for s in spans
+        ):
+            passed = False
+            reasons.append("No BPMN attribution found in any spans")
+        
+        return passed, reasons, result
+    
+    def validate_command_execution(self, 
+                                   command_name: str,
+                                   spans: list,
+                                   context: dict) -> tuple[bool, DoDValidationResult]:
+        """Validate that command execution meets DoD"""
+        passed, reasons, result = self.evaluate(spans)
         
         # Show validation summary
         if not passed:
@@ -128,7 +323,7 @@ class CLIDoDEnforcer:
             ))
             
             # Show what's missing
-            if self.require_bpmn and not bpmn_spans:
+            if self.require_bpmn and "No BPMN attribution found in any spans" in reasons:
                 console.print("\n[yellow]Missing BPMN attributes:[/yellow]")
                 console.print("  • bpmn.workflow.file")
                 console.print("  • bpmn.workflow.id")
@@ -180,15 +375,66 @@ class CLIDoDEnforcer:
         console.print(f"\n[dim]Validation report saved: {report_file}[/dim]")
 
 
+def _run_async_enforced(enforcer: CLIDoDEnforcer, func: Callable,
+                        args: tuple, kwargs: dict, rate: float) -> Any:
+    """Run a command with spans buffered and DoD validation deferred"""
+    inline_started = time.perf_counter_ns()
+    CLI_SPAN_BUFFER.drain()
+    CLI_MEMORY_EXPORTER.clear()
+    trace.set_tracer_provider(CLI_PROVIDER)
+    context = enforcer.capture_cli_context(func)
+    command_name = func.__name__
+    
+    tracer = trace.get_tracer(__name__)
+    with tracer.start_as_current_span(f"cli.command.{command_name}") as span:
+        for key, value in context.items():
+            span.set_attribute(key, str(value))
+        span.set_attribute("code.filepath", context["cli.file"])
+        span.set_attribute("code.function", command_name)
+        
+        command_ns = 0
+        try:
+            command_started = time.perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                command_ns = time.perf_counter_ns() - command_started
+            span.set_attribute("execution.success", True)
+            return result
+        except Exception as e:
+            span.set_attribute("execution.success", False)
+            span.set_attribute("execution.error", str(e))
+            span.record_exception(e)
+            raise
+        finally:
+            trace.set_tracer_provider(ORIGINAL_PROVIDER)
+            spans = CLI_SPAN_BUFFER.drain()
+            extra = {
+                "mode": "async",
+                "sample_rate": rate,
+                "spans_dropped": CLI_SPAN_BUFFER.dropped,
+                "inline_ns": time.perf_counter_ns() - inline_started - command_ns,
+            }
+            BACKGROUND_VALIDATOR.submit(enforcer, command_name, spans, context, extra)
+
+
 def enforce_dod(
     require_bpmn: bool = True,
     min_trust_score: float = 0.8,
     fail_on_lies: bool = True,
-    save_report: bool = True
+    save_report: bool = True,
+    mode: Optional[str] = None,
+    sample_rate: Optional[float] = None
 ):
     """
     Decorator that enforces Definition of Done on CLI commands
     
+    ``mode`` (or WEAVERGEN_DOD_MODE) selects "sync" (validate before
+    returning and fail the command), "async" (buffer spans and validate in
+    a background thread, appending results to .weavergen/validation/ledger.jsonl)
+    or "off". ``sample_rate`` (or WEAVERGEN_DOD_SAMPLE_RATE) validates only
+    that fraction of invocations.
+    
     Usage:
         @enforce_dod(require_bpmn=True)
         def my_command():
@@ -198,12 +444,26 @@ def enforce_dod(
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            active_mode, rate = resolve_dod_mode(mode, sample_rate)
+            if active_mode == "off":
+                return func(*args, **kwargs)
+            
+            # Unsampled invocations run without capture
+            if rate < 1.0 and random.random() >= rate:
+                if active_mode == "async":
+                    BACKGROUND_VALIDATOR.record_skip(
+                        func.__name__, {"mode": active_mode, "sample_rate": rate}
+                    )
+                return func(*args, **kwargs)
+            
             # Create enforcer
             enforcer = CLIDoDEnforcer(
                 require_bpmn=require_bpmn,
                 min_trust_score=min_trust_score,
                 fail_on_lies=fail_on_lies
             )
+            if active_mode == "async":
+                return _run_async_enforced(enforcer, func, args, kwargs, rate)
             
             # Clear any previous spans
             CLI_MEMORY_EXPORTER.clear()
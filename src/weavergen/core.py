@@ -1,5 +1,6 @@
 """Core WeaverGen functionality."""
 
+import hashlib
 import json
 import subprocess
 import tempfile
@@ -27,6 +28,8 @@ FileInfo = models_module.FileInfo
 from pydantic import BaseModel
 from typing import List, Optional
 
+from .semantic_parser import SemanticRegistry
+
 class WeaverConfig(BaseModel):
     """Weaver configuration."""
     weaver_path: Optional[Path] = None
@@ -58,6 +61,7 @@ class WeaverGen:
         """Initialize WeaverGen with optional configuration."""
         self.config = config
         self._weaver_config = self._load_config()
+        self._registries: Dict[str, SemanticRegistry] = {}
         self._ensure_weaver_binary(auto_install=auto_install)
     
     def _load_config(self) -> WeaverConfig:
@@ -150,6 +154,26 @@ class WeaverGen:
         except FileNotFoundError:
             raise WeaverNotFoundError(f"Weaver binary not found at {self._weaver_config.weaver_path}")
     
+    def load_registry(self, registry_path: Path) -> SemanticRegistry:
+        """Load a local registry, re-parsing only files changed since the last call.
+        
+        ``generate`` loads local registries through here before running
+        weaver, so repeated generations only re-parse changed files.
+        Decoded documents are persisted across processes only when
+        ``WeaverConfig.cache_dir`` is set.
+        """
+        key = str(Path(registry_path).resolve())
+        registry = self._registries.get(key)
+        if registry is None:
+            cache_file = None
+            if self._weaver_config.cache_dir:
+                cache_name = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+                cache_file = Path(self._weaver_config.cache_dir) / "registries" / f"{cache_name}.json"
+            registry = SemanticRegistry(Path(key), cache_file=cache_file)
+            self._registries[key] = registry
+        registry.refresh()
+        return registry
+    
     def generate(self) -> GenerationResult:
         """Generate code from semantic conventions using OTel Weaver Forge."""
         if not self.config:
@@ -158,6 +182,18 @@ class WeaverGen:
         start_time = time.time()
         
         try:
+            # A local registry is parsed incrementally first, so files that
+            # cannot be parsed fail fast without a weaver run
+            registry_path = Path(self.config.registry_url)
+            if registry_path.exists():
+                parse_errors = self.load_registry(registry_path).parse_errors()
+                if parse_errors:
+                    return GenerationResult(
+                        success=False,
+                        error="Registry has unparseable files:\n" + "\n".join(parse_errors),
+                        duration_seconds=time.time() - start_time,
+                    )
+            
             # Ensure output directory exists
             self.config.output_dir.mkdir(parents=True, exist_ok=True)
             
@@ -5,18 +5,23 @@ Implements the strict validation criteria where ALL claims must be
 proven by telemetry including file paths and BPMN references.
 """
 
+import hashlib
 import os
 import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set, Tuple
+from typing import Dict, Any, Deque, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
-import json
 
 from rich import print as rprint
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from .span_query import iter_span_file
+
 console = Console()
 
 
@@ -48,16 +53,36 @@ class BPMNValidator:
     """Validates BPMN references in spans"""
     
     def __init__(self):
-        self.bpmn_cache: Dict[str, Dict[str, Any]] = {}
+        # Parsed task tables keyed by content hash, so identical files share
+        # one parse and an edited file is re-parsed on next use
+        self.bpmn_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._file_hashes: Dict[str, Tuple[int, int, str]] = {}
+    
+    def _content_hash(self, bpmn_file: str) -> Optional[str]:
+        """Hash of the file content, recomputed only when mtime/size change"""
+        try:
+            stat = os.stat(bpmn_file)
+        except OSError:
+            self._file_hashes.pop(bpmn_file, None)
+            return None
+        
+        cached = self._file_hashes.get(bpmn_file)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        with open(bpmn_file, 'rb') as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        self._file_hashes[bpmn_file] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
     
     def load_bpmn(self, bpmn_file: str) -> Optional[Dict[str, Any]]:
         """Load and parse BPMN file"""
-        if bpmn_file in self.bpmn_cache:
-            return self.bpmn_cache[bpmn_file]
-        
         try:
-            if not Path(bpmn_file).exists():
+            digest = self._content_hash(bpmn_file)
+            if digest is None:
                 return None
+            if digest in self.bpmn_cache:
+                return self.bpmn_cache[digest]
             
             tree = ET.parse(bpmn_file)
             root = tree.getroot()
@@ -67,7 +92,8 @@ class BPMNValidator:
             
             # Find process
             process = root.find('.//bpmn:process', ns)
-            if not process:
+            if process is None:
+                self.bpmn_cache[digest] = None
                 return None
             
             # Extract tasks
@@ -94,7 +120,7 @@ class BPMNValidator:
                 'tasks': tasks
             }
             
-            self.bpmn_cache[bpmn_file] = result
+            self.bpmn_cache[digest] = result
             return result
             
         except Exception as e:
@@ -115,42 +141,33 @@ class BPMNValidator:
 
 
 class DefinitionOfDoneValidator:
-    """Validates spans against the Definition of Done criteria"""
+    """Validates spans against the Definition of Done criteria
+    
+    All three levels are checked in one pass per span. Filesystem and BPMN
+    lookups are resolved once per distinct path / task per batch, and span
+    name classification is memoized, so the per-span work is a handful of
+    local dict reads.
+    """
+    
+    # Level 3 attributes required on BPMN spans
+    BPMN_REQUIRED = ("bpmn.workflow.id", "bpmn.task.type")
+    MAX_DURATION_NS = 30_000_000_000  # 30 seconds
+    WEIGHTS = {"level1": 0.3, "level2": 0.5, "level3": 0.2}
     
     def __init__(self):
         self.bpmn_validator = BPMNValidator()
+        self._name_kinds: Dict[str, Tuple[bool, bool]] = {}
     
     def validate_spans(self, spans: List[Dict[str, Any]]) -> DoDValidationResult:
         """Validate all spans against DoD criteria"""
         result = DoDValidationResult(total_spans=len(spans))
-        
-        for span in spans:
-            span_id = span.get("span_id", "unknown")
-            attrs = span.get("attributes", {})
-            
-            # Level 1: Basic Execution
-            l1_pass = self._validate_level1(span, result)
-            if l1_pass:
-                result.level1_pass += 1
-            
-            # Level 2: Full Attribution
-            l2_pass = self._validate_level2(span, attrs, result)
-            if l2_pass:
-                result.level2_pass += 1
-            
-            # Level 3: Semantic Compliance
-            l3_pass = self._validate_level3(span, attrs, result)
-            if l3_pass:
-                result.level3_pass += 1
-        
-        # Calculate trust score
+        self._validate_batch(spans, result)
+        return self.finalize(result)
+    
+    def finalize(self, result: DoDValidationResult) -> DoDValidationResult:
+        """Compute trust score and verdict from the pass counts"""
         if result.total_spans > 0:
-            weights = {
-                "level1": 0.3,
-                "level2": 0.5,
-                "level3": 0.2
-            }
-            
+            weights = self.WEIGHTS
             result.trust_score = (
                 (result.level1_pass / result.total_spans) * weights["level1"] +
                 (result.level2_pass / result.total_spans) * weights["level2"] +
@@ -166,211 +183,160 @@ class DefinitionOfDoneValidator:
         
         return result
     
-    def _validate_level1(self, span: Dict[str, Any], result: DoDValidationResult) -> bool:
-        """Validate Level 1: Basic Execution"""
-        violations = []
-        span_id = span.get("span_id", "unknown")
-        
-        # Check span name
-        if not span.get("name"):
-            violations.append(DoDViolation(
-                level="L1",
-                rule="No Span, No Claim",
-                description="Span missing name",
-                span_id=span_id,
-                severity="critical",
-                evidence={"name": None}
-            ))
-        
-        # Check IDs
-        if not span.get("trace_id"):
-            violations.append(DoDViolation(
-                level="L1",
-                rule="Basic Structure",
-                description="Missing trace_id",
-                span_id=span_id,
-                severity="critical",
-                evidence={"trace_id": None}
-            ))
-        
-        # Check timing
-        start_time = span.get("start_time", 0)
-        end_time = span.get("end_time", 0)
-        duration = span.get("duration_ns", 0)
-        
-        if duration <= 0:
-            violations.append(DoDViolation(
-                level="L1",
-                rule="Valid Duration",
-                description="Invalid or missing duration",
-                span_id=span_id,
-                severity="major",
-                evidence={"duration_ns": duration}
-            ))
-        
-        # Check for unreasonable duration (> 30s)
-        if duration > 30_000_000_000:  # 30 seconds in nanoseconds
-            violations.append(DoDViolation(
-                level="L1",
-                rule="Reasonable Duration",
-                description=f"Duration too long: {duration/1e9:.1f}s",
-                span_id=span_id,
-                severity="major",
-                evidence={"duration_ns": duration}
-            ))
+    def _resolve_references(self, spans: List[Dict[str, Any]]) -> Tuple[Dict[str, bool], Dict[Tuple[str, str], Tuple[bool, str]]]:
+        """Check each distinct file path and BPMN task reference once"""
+        paths: Set[str] = set()
+        task_refs: Set[Tuple[str, str]] = set()
+        for span in spans:
+            attrs = span.get("attributes") or {}
+            filepath = attrs.get("code.filepath")
+            if filepath:
+                paths.add(filepath)
+            bpmn_file = attrs.get("bpmn.workflow.file")
+            if bpmn_file:
+                paths.add(bpmn_file)
+                task_id = attrs.get("bpmn.task.id")
+                if task_id:
+                    task_refs.add((bpmn_file, task_id))
         
-        result.violations.extend(violations)
-        return len(violations) == 0
+        exists = {path: os.path.exists(path) for path in paths}
+        task_checks = {
+            ref: self.bpmn_validator.validate_task_reference(*ref)
+            for ref in task_refs if exists[ref[0]]
+        }
+        return exists, task_checks
     
-    def _validate_level2(self, span: Dict[str, Any], attrs: Dict[str, Any], result: DoDValidationResult) -> bool:
-        """Validate Level 2: Full Attribution"""
-        violations = []
-        lies = []
-        span_id = span.get("span_id", "unknown")
-        
-        # Check code attribution
-        filepath = attrs.get("code.filepath")
-        if not filepath:
-            violations.append(DoDViolation(
-                level="L2",
-                rule="File Must Exist",
-                description="Missing code.filepath attribute",
-                span_id=span_id,
-                severity="critical",
-                evidence={"code.filepath": None}
-            ))
-        elif not os.path.exists(filepath):
-            lies.append({
-                "claim": f"Executed from {filepath}",
-                "reality": "File does not exist",
-                "span_id": span_id,
-                "type": "fake_file"
-            })
-            violations.append(DoDViolation(
-                level="L2",
-                rule="File Must Exist",
-                description=f"File does not exist: {filepath}",
-                span_id=span_id,
-                severity="critical",
-                evidence={"code.filepath": filepath, "exists": False}
-            ))
-        
-        # Check line number
-        lineno = attrs.get("code.lineno", 0)
-        if lineno <= 0:
-            violations.append(DoDViolation(
-                level="L2",
-                rule="Valid Line Number",
-                description="Invalid or missing line number",
-                span_id=span_id,
-                severity="major",
-                evidence={"code.lineno": lineno}
-            ))
-        
-        # Check BPMN attribution
-        bpmn_file = attrs.get("bpmn.workflow.file")
-        task_id = attrs.get("bpmn.task.id")
+    def _name_kind(self, name: str) -> Tuple[bool, bool]:
+        kind = self._name_kinds.get(name)
+        if kind is None:
+            kind = self._name_kinds[name] = ("bpmn" in name, "weaver" in name)
+        return kind
+    
+    def _validate_batch(self, spans: List[Dict[str, Any]], result: DoDValidationResult) -> None:
+        """Single pass over a span batch applying Level 1-3 rules"""
+        exists, task_checks = self._resolve_references(spans)
+        violations = result.violations
+        lies = result.lies_detected
+        name_kind = self._name_kind
+        bpmn_required = self.BPMN_REQUIRED
+        max_duration = self.MAX_DURATION_NS
+        l1_pass = l2_pass = l3_pass = 0
         
-        if bpmn_file:
-            if not os.path.exists(bpmn_file):
+        for span in spans:
+            span_id = span.get("span_id", "unknown")
+            attrs = span.get("attributes") or {}
+            name = span.get("name")
+            
+            # Level 1: Basic Execution
+            l1_start = len(violations)
+            if not name:
+                violations.append(DoDViolation(
+                    "L1", "No Span, No Claim", "Span missing name",
+                    span_id, "critical", {"name": None}))
+            if not span.get("trace_id"):
+                violations.append(DoDViolation(
+                    "L1", "Basic Structure", "Missing trace_id",
+                    span_id, "critical", {"trace_id": None}))
+            duration = span.get("duration_ns") or 0
+            if duration <= 0:
+                violations.append(DoDViolation(
+                    "L1", "Valid Duration", "Invalid or missing duration",
+                    span_id, "major", {"duration_ns": duration}))
+            if duration > max_duration:
+                violations.append(DoDViolation(
+                    "L1", "Reasonable Duration", f"Duration too long: {duration/1e9:.1f}s",
+                    span_id, "major", {"duration_ns": duration}))
+            if len(violations) == l1_start:
+                l1_pass += 1
+            
+            # Level 2: Full Attribution
+            l2_start = len(violations)
+            filepath = attrs.get("code.filepath")
+            if not filepath:
+                violations.append(DoDViolation(
+                    "L2", "File Must Exist", "Missing code.filepath attribute",
+                    span_id, "critical", {"code.filepath": None}))
+            elif not exists[filepath]:
                 lies.append({
-                    "claim": f"Executed BPMN workflow {bpmn_file}",
-                    "reality": "BPMN file does not exist",
+                    "claim": f"Executed from {filepath}",
+                    "reality": "File does not exist",
                     "span_id": span_id,
-                    "type": "fake_bpmn"
+                    "type": "fake_file"
                 })
                 violations.append(DoDViolation(
-                    level="L2",
-                    rule="BPMN Must Match",
-                    description=f"BPMN file does not exist: {bpmn_file}",
-                    span_id=span_id,
-                    severity="critical",
-                    evidence={"bpmn.workflow.file": bpmn_file, "exists": False}
-                ))
-            elif task_id:
-                # Validate task exists in BPMN
-                valid, msg = self.bpmn_validator.validate_task_reference(bpmn_file, task_id)
-                if not valid:
+                    "L2", "File Must Exist", f"File does not exist: {filepath}",
+                    span_id, "critical", {"code.filepath": filepath, "exists": False}))
+            
+            lineno = attrs.get("code.lineno", 0)
+            if lineno <= 0:
+                violations.append(DoDViolation(
+                    "L2", "Valid Line Number", "Invalid or missing line number",
+                    span_id, "major", {"code.lineno": lineno}))
+            
+            bpmn_file = attrs.get("bpmn.workflow.file")
+            if bpmn_file:
+                task_id = attrs.get("bpmn.task.id")
+                if not exists[bpmn_file]:
                     lies.append({
-                        "claim": f"Executed BPMN task {task_id}",
-                        "reality": msg,
+                        "claim": f"Executed BPMN workflow {bpmn_file}",
+                        "reality": "BPMN file does not exist",
                         "span_id": span_id,
-                        "type": "fake_task"
+                        "type": "fake_bpmn"
                     })
                     violations.append(DoDViolation(
-                        level="L2",
-                        rule="BPMN Must Match",
-                        description=msg,
-                        span_id=span_id,
-                        severity="critical",
-                        evidence={
-                            "bpmn.workflow.file": bpmn_file,
-                            "bpmn.task.id": task_id,
-                            "valid": False
-                        }
-                    ))
-        
-        # Check execution timestamp
-        if not attrs.get("execution.timestamp"):
-            violations.append(DoDViolation(
-                level="L2",
-                rule="Timestamp Required",
-                description="Missing execution.timestamp",
-                span_id=span_id,
-                severity="major",
-                evidence={"execution.timestamp": None}
-            ))
-        
-        result.violations.extend(violations)
-        result.lies_detected.extend(lies)
-        return len(violations) == 0
-    
-    def _validate_level3(self, span: Dict[str, Any], attrs: Dict[str, Any], result: DoDValidationResult) -> bool:
-        """Validate Level 3: Semantic Compliance"""
-        violations = []
-        span_id = span.get("span_id", "unknown")
-        span_name = span.get("name", "")
-        
-        # Check semantic attributes based on span type
-        if "bpmn" in span_name:
-            required = ["bpmn.workflow.id", "bpmn.task.type"]
-            for attr in required:
-                if attr not in attrs:
-                    violations.append(DoDViolation(
-                        level="L3",
-                        rule="Semantic Compliance",
-                        description=f"Missing required BPMN attribute: {attr}",
-                        span_id=span_id,
-                        severity="minor",
-                        evidence={"missing_attribute": attr}
-                    ))
-        
-        if "weaver" in span_name:
-            required = ["weaver.command"]
-            for attr in required:
-                if attr not in attrs and "weaver.path" not in attrs:
-                    violations.append(DoDViolation(
-                        level="L3",
-                        rule="Semantic Compliance",
-                        description=f"Missing required Weaver attribute",
-                        span_id=span_id,
-                        severity="minor",
-                        evidence={"span_type": "weaver"}
-                    ))
-        
-        # Check success claims
-        if attrs.get("execution.success") is True:
-            # If claiming success, should not have errors
-            if attrs.get("execution.error"):
-                result.lies_detected.append({
+                        "L2", "BPMN Must Match", f"BPMN file does not exist: {bpmn_file}",
+                        span_id, "critical", {"bpmn.workflow.file": bpmn_file, "exists": False}))
+                elif task_id:
+                    valid, msg = task_checks[(bpmn_file, task_id)]
+                    if not valid:
+                        lies.append({
+                            "claim": f"Executed BPMN task {task_id}",
+                            "reality": msg,
+                            "span_id": span_id,
+                            "type": "fake_task"
+                        })
+                        violations.append(DoDViolation(
+                            "L2", "BPMN Must Match", msg, span_id, "critical", {
+                                "bpmn.workflow.file": bpmn_file,
+                                "bpmn.task.id": task_id,
+                                "valid": False
+                            }))
+            
+            if not attrs.get("execution.timestamp"):
+                violations.append(DoDViolation(
+                    "L2", "Timestamp Required", "Missing execution.timestamp",
+                    span_id, "major", {"execution.timestamp": None}))
+            if len(violations) == l2_start:
+                l2_pass += 1
+            
+            # Level 3: Semantic Compliance
+            l3_start = len(violations)
+            is_bpmn, is_weaver = name_kind(name or "")
+            if is_bpmn:
+                for attr in bpmn_required:
+                    if attr not in attrs:
+                        violations.append(DoDViolation(
+                            "L3", "Semantic Compliance", f"Missing required BPMN attribute: {attr}",
+                            span_id, "minor", {"missing_attribute": attr}))
+            if is_weaver and "weaver.command" not in attrs and "weaver.path" not in attrs:
+                violations.append(DoDViolation(
+                    "L3", "Semantic Compliance", "Missing required Weaver attribute",
+                    span_id, "minor", {"span_type": "weaver"}))
+            
+            # Success claims must not carry errors
+            if attrs.get("execution.success") is True and attrs.get("execution.error"):
+                lies.append({
                     "claim": "Execution succeeded",
                     "reality": f"Error present: {attrs['execution.error']}",
                     "span_id": span_id,
                     "type": "false_success"
                 })
+            if len(violations) == l3_start:
+                l3_pass += 1
         
-        result.violations.extend(violations)
-        return len(violations) == 0
+        result.level1_pass += l1_pass
+        result.level2_pass += l2_pass
+        result.level3_pass += l3_pass
     
     def generate_report(self, result: DoDValidationResult) -> Table:
         """Generate validation report table"""
@@ -434,15 +400,83 @@ class DefinitionOfDoneValidator:
         return table
 
 
-def validate_definition_of_done(span_file: Path) -> DoDValidationResult:
-    """Main function to validate spans against DoD"""
-    # Load spans
-    with open(span_file) as f:
-        spans = json.load(f)
+SHARD_SIZE = 20_000
+
+
+def merge_results(results: Iterable[DoDValidationResult]) -> DoDValidationResult:
+    """Merge shard results in order; call finalize() on the merged result"""
+    merged = DoDValidationResult()
+    for shard in results:
+        merged.total_spans += shard.total_spans
+        merged.level1_pass += shard.level1_pass
+        merged.level2_pass += shard.level2_pass
+        merged.level3_pass += shard.level3_pass
+        merged.violations.extend(shard.violations)
+        merged.lies_detected.extend(shard.lies_detected)
+    return merged
+
+
+_WORKER_VALIDATOR: Optional[DefinitionOfDoneValidator] = None
+
+
+def _validate_shard(spans: List[Dict[str, Any]]) -> DoDValidationResult:
+    """Worker entry point; keeps one validator (and BPMN cache) per process"""
+    global _WORKER_VALIDATOR
+    if _WORKER_VALIDATOR is None:
+        _WORKER_VALIDATOR = DefinitionOfDoneValidator()
+    result = DoDValidationResult(total_spans=len(spans))
+    _WORKER_VALIDATOR._validate_batch(spans, result)
+    return result
+
+
+def _iter_shards(span_files: List[Path], shard_size: int) -> Iterator[List[Dict[str, Any]]]:
+    for span_file in span_files:
+        spans = iter_span_file(span_file)
+        while True:
+            shard = list(islice(spans, shard_size))
+            if not shard:
+                break
+            yield shard
+
+
+def validate_span_files(span_files: Union[Path, List[Path]],
+                        workers: Optional[int] = None,
+                        shard_size: int = SHARD_SIZE) -> DoDValidationResult:
+    """Validate one or more span files, sharding large captures across processes
+    
+    Captures that fit in a single shard are validated in-process. Larger ones
+    are streamed in shards of ``shard_size`` spans to a process pool with a
+    bounded number of shards in flight, and the shard results merged in order.
+    """
+    if isinstance(span_files, (str, Path)):
+        span_files = [Path(span_files)]
+    validator = DefinitionOfDoneValidator()
+    shards = _iter_shards([Path(f) for f in span_files], shard_size)
+    workers = workers or os.cpu_count() or 1
     
-    # Validate
+    first = next(shards, [])
+    second = next(shards, None)
+    if second is None or workers <= 1:
+        rest = chain([second], shards) if second is not None else ()
+        results = [_validate_shard(shard) for shard in chain([first], rest)]
+        return validator.finalize(merge_results(results))
+    
+    results: List[DoDValidationResult] = []
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for shard in chain([first, second], shards):
+            pending.append(pool.submit(_validate_shard, shard))
+            if len(pending) >= workers * 2:
+                results.append(pending.popleft().result())
+        results.extend(future.result() for future in pending)
+    
+    return validator.finalize(merge_results(results))
+
+
+def validate_definition_of_done(span_file: Path, workers: Optional[int] = None) -> DoDValidationResult:
+    """Main function to validate spans against DoD"""
     validator = DefinitionOfDoneValidator()
-    result = validator.validate_spans(spans)
+    result = validate_span_files(span_file, workers=workers)
     
     # Show reports
     console.print(validator.generate_report(result))
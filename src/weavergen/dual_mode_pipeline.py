@@ -4,20 +4,81 @@ Dual-Mode Pipeline - Works with or without Weaver binary
 This module implements a pipeline that can generate code using either:
 1. Weaver binary (when available) for full compatibility
 2. Direct parsing + AI generation (fallback mode)
+
+Direct mode is incremental: each convention group becomes a code unit keyed
+by a hash of its resolved definition, and the output files keep every unit
+between marker comments. A run regenerates only units whose hash changed and
+splices them into the existing files, leaving unchanged units untouched.
 """
 
+import hashlib
+import os
+import re
 import subprocess
-import shutil
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Union
-from dataclasses import dataclass
+from typing import Optional, Dict, List, Any, Callable, Tuple, Union
+from dataclasses import dataclass, field
 import json
 
-from .semantic_parser import SemanticConventionParser, SemanticConvention
+from .semantic_parser import SemanticConventionParser, SemanticRegistry, qualified_attributes
 from .template_learner import TemplateExtractor, CodePattern
-from .layers.contracts import GenerationRequest, GenerationResult
-from .layers.runtime import WeaverRuntime, TemplateEngine
-from .examples.sql_generation import create_sql_agent
+from .layers.runtime import find_weaver_binary, pascal_case, python_type, snake_case
+
+# Bump when the generated code changes shape, so every unit regenerates
+GENERATOR_VERSION = 1
+WEAVER_PROBE_FILE = "weaver_probe.json"
+WEAVER_PROBE_TIMEOUT = 10
+
+UNIT_BEGIN = "# --- weavergen:unit {key} {digest} ---"
+UNIT_END = "# --- weavergen:end {key} ---"
+_UNIT_RE = re.compile(
+    r"^# --- weavergen:unit (\S+) ([0-9a-f]+) ---\n(.*?)^# --- weavergen:end \1 ---$", re.M | re.S
+)
+
+MODELS_HEADER = '''"""Pydantic models for semantic conventions."""
+
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+'''
+
+HELPERS_HEADER = '''"""Helper functions for semantic conventions."""
+
+from typing import Dict, Any
+from .models import *
+
+
+'''
+
+VALIDATION_HEADER = '''"""Validation for semantic conventions."""
+
+from typing import List, Dict, Any, Type
+from pydantic import BaseModel
+from .models import *
+
+CONVENTIONS: Dict[str, Type[BaseModel]] = {}
+
+
+'''
+
+VALIDATION_FOOTER = '''class ConventionValidator:
+    """Validates semantic convention compliance."""
+
+    def __init__(self):
+        self.conventions = dict(CONVENTIONS)
+
+    def validate(self, convention_id: str, data: Dict[str, Any]) -> bool:
+        """Validate data against convention."""
+        if convention_id not in self.conventions:
+            return False
+        try:
+            self.conventions[convention_id](**data)
+            return True
+        except Exception:
+            return False
+'''
 
 
 @dataclass
@@ -29,6 +90,37 @@ class PipelineConfig:
     template_dir: Path = Path("templates")
     output_dir: Path = Path("generated")
     cache_templates: bool = True
+    cache_dir: Path = Path(".weavergen")
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of one pipeline run."""
+    success: bool
+    mode: str
+    files_generated: List[str] = field(default_factory=list)
+    logs: str = ""
+    error: Optional[str] = None
+
+
+@dataclass
+class ConventionUnit:
+    """Code generated for one convention group, keyed by its content hash."""
+    key: str
+    class_name: str
+    digest: str
+    brief: str
+    group: Dict[str, Any]
+    attributes: List[Tuple[str, Dict[str, Any]]]  # (qualified id, resolved definition)
+
+
+@dataclass
+class SpliceStats:
+    """Sections regenerated, reused and dropped by one direct-mode run."""
+    regenerated: int = 0
+    reused: int = 0
+    removed: int = 0
+    files_written: List[str] = field(default_factory=list)
 
 
 class DualModePipeline:
@@ -36,39 +128,82 @@ class DualModePipeline:
     
     def __init__(self, config: Optional[PipelineConfig] = None):
         self.config = config or PipelineConfig()
+        self.weaver_version: Optional[str] = None
         self.weaver_available = self._check_weaver()
         self.parser = SemanticConventionParser()
         self.template_extractor = TemplateExtractor()
         self.ai_agent = None
+        self.registries: Dict[Path, SemanticRegistry] = {}
+        self.last_stats = SpliceStats()
         
         # Initialize components
         self._setup_pipeline()
     
     def _check_weaver(self) -> bool:
-        """Check if Weaver binary is available."""
+        """Check if Weaver binary is available.
+        
+        A found binary must also answer ``weaver --version``. That probe is
+        cached in ``cache_dir`` keyed on the binary's path, size and mtime,
+        so only a new or updated binary is probed again.
+        """
         if self.config.weaver_binary_path:
-            return self.config.weaver_binary_path.exists()
+            candidates = [self.config.weaver_binary_path]
+        else:
+            # PATH and well-known locations, then project-specific locations
+            candidates = [
+                find_weaver_binary(),
+                Path("bin/weaver"),
+                Path("tools/weaver"),
+                Path("../weaver/weaver"),
+                Path.home() / ".local/bin/weaver"
+            ]
+        
+        for path in candidates:
+            if path is not None and path.exists():
+                version = self._probe_weaver(path)
+                if version is not None:
+                    self.config.weaver_binary_path = path
+                    self.weaver_version = version
+                    return True
         
-        # Check common locations
-        weaver_cmd = shutil.which("weaver")
-        if weaver_cmd:
-            self.config.weaver_binary_path = Path(weaver_cmd)
-            return True
+        return False
+    
+    def _probe_weaver(self, path: Path) -> Optional[str]:
+        """``weaver --version`` output, or None if the binary doesn't run."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = str(path.resolve())
+        signature = [stat.st_size, stat.st_mtime_ns]
         
-        # Check project-specific locations
-        possible_paths = [
-            Path("bin/weaver"),
-            Path("tools/weaver"),
-            Path("../weaver/weaver"),
-            Path.home() / ".local/bin/weaver"
-        ]
+        probe_file = self.config.cache_dir / WEAVER_PROBE_FILE
+        try:
+            probes = json.loads(probe_file.read_text())
+        except (OSError, ValueError):
+            probes = {}
+        if not isinstance(probes, dict):
+            probes = {}
+        cached = probes.get(key)
+        if isinstance(cached, dict) and cached.get("signature") == signature:
+            return cached.get("version")
         
-        for path in possible_paths:
-            if path.exists():
-                self.config.weaver_binary_path = path
-                return True
+        try:
+            result = subprocess.run([str(path), "--version"], capture_output=True, text=True,
+                                    timeout=WEAVER_PROBE_TIMEOUT)
+            version = result.stdout.strip() if result.returncode == 0 else None
+        except (OSError, subprocess.SubprocessError):
+            version = None
         
-        return False
+        probes[key] = {"signature": signature, "version": version}
+        try:
+            self.config.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = probe_file.with_name(f"{probe_file.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(probes, indent=2))
+            os.replace(tmp, probe_file)
+        except OSError:
+            pass  # the probe cache is an optimization only
+        return version
     
     def _setup_pipeline(self) -> None:
         """Initialize pipeline components."""
@@ -106,7 +241,7 @@ class DualModePipeline:
     def generate(self, 
                  convention_path: Union[str, Path],
                  target_languages: List[str] = ["python"],
-                 force_mode: Optional[str] = None) -> GenerationResult:
+                 force_mode: Optional[str] = None) -> PipelineResult:
         """
         Generate code from semantic convention.
         
@@ -116,7 +251,7 @@ class DualModePipeline:
             force_mode: Force specific mode ('weaver', 'direct', or None for auto)
         
         Returns:
-            GenerationResult with generated code
+            PipelineResult with generated code
         """
         convention_path = Path(convention_path)
         
@@ -145,7 +280,7 @@ class DualModePipeline:
     
     def _generate_with_weaver(self, 
                               convention_path: Path,
-                              target_languages: List[str]) -> GenerationResult:
+                              target_languages: List[str]) -> PipelineResult:
         """Generate using Weaver binary."""
         print("🔧 Using Weaver binary for generation")
         
@@ -168,15 +303,15 @@ class DualModePipeline:
             # Collect generated files
             generated_files = list(self.config.output_dir.glob("**/*"))
             
-            return GenerationResult(
+            return PipelineResult(
                 success=True,
                 files_generated=[str(f) for f in generated_files],
                 logs=result.stdout,
                 mode="weaver"
             )
-            
+        
         except subprocess.CalledProcessError as e:
-            return GenerationResult(
+            return PipelineResult(
                 success=False,
                 error=f"Weaver failed: {e.stderr}",
                 logs=e.stdout,
@@ -185,7 +320,7 @@ class DualModePipeline:
     
     def _generate_direct(self,
                         convention_path: Path,
-                        target_languages: List[str]) -> GenerationResult:
+                        target_languages: List[str]) -> PipelineResult:
         """Generate using direct parsing and templates."""
         print("🎯 Using direct generation (no Weaver required)")
         
@@ -193,135 +328,176 @@ class DualModePipeline:
         logs = []
         
         try:
-            # Parse semantic convention
-            conventions = self.parser.parse_file(convention_path)
-            logs.append(f"Parsed {len(conventions)} conventions")
+            # Parse semantic conventions; unchanged files are not re-parsed
+            registry = self._registry_for(convention_path)
+            delta = registry.refresh()
+            units = self._convention_units(registry)
+            logs.append(f"Parsed {len(units)} conventions "
+                        f"({len(delta.added) + len(delta.changed)} files re-read, {delta.unchanged} unchanged)")
             
             for lang in target_languages:
                 if lang == "python":
-                    files = self._generate_python(conventions)
+                    files = self._generate_python(units)
                     generated_files.extend(files)
+                    stats = self.last_stats
+                    logs.append(f"Python: {stats.regenerated} sections regenerated, {stats.reused} reused, "
+                                f"{stats.removed} removed, {len(stats.files_written)} files written")
                 else:
                     logs.append(f"Warning: {lang} generation not yet implemented in direct mode")
             
             # Apply AI enhancement if available
             if self.config.use_ai_enhancement and self.ai_agent:
-                enhanced_files = self._enhance_with_ai(conventions, generated_files)
+                enhanced_files = self._enhance_with_ai(units, generated_files)
                 generated_files.extend(enhanced_files)
                 logs.append("Applied AI enhancement")
             
-            return GenerationResult(
+            return PipelineResult(
                 success=True,
                 files_generated=generated_files,
                 logs="\n".join(logs),
                 mode="direct"
             )
-            
+        
         except Exception as e:
-            return GenerationResult(
+            return PipelineResult(
                 success=False,
                 error=str(e),
                 logs="\n".join(logs),
                 mode="direct"
             )
     
-    def _generate_python(self, conventions: List[SemanticConvention]) -> List[str]:
-        """Generate Python code from conventions."""
+    def _registry_for(self, convention_path: Path) -> SemanticRegistry:
+        """The registry for a path, kept across runs so refreshes are incremental."""
+        key = Path(convention_path).resolve()
+        registry = self.registries.get(key)
+        if registry is None:
+            cache_name = hashlib.blake2b(str(key).encode(), digest_size=8).hexdigest()
+            registry = self.registries[key] = SemanticRegistry(
+                key, self.parser, cache_file=self.config.cache_dir / "registry_cache" / f"{cache_name}.json"
+            )
+        return registry
+    
+    def _convention_units(self, registry: SemanticRegistry) -> List[ConventionUnit]:
+        """One unit per group, hashed over everything its code depends on."""
+        units = []
+        for group_id in sorted(registry.groups):
+            group = registry.groups[group_id]
+            attributes = []
+            for attr_id, ref, attr in qualified_attributes(group):
+                if ref:
+                    definition = registry.resolve(ref)
+                    if definition is None:
+                        continue  # reported by registry.validate()
+                    attr = {**definition, **{k: v for k, v in attr.items() if k != 'ref'}}
+                    attr_id = ref
+                attributes.append((attr_id, attr))
+            # Briefs land in docstrings; keep them on one line and quote-free
+            brief = " ".join(str(group.get('brief', '')).split()).replace('"', "'")
+            payload = json.dumps([GENERATOR_VERSION, group_id, brief, attributes], sort_keys=True, default=str)
+            units.append(ConventionUnit(
+                key=group_id,
+                class_name=pascal_case(group_id),
+                digest=hashlib.blake2b(payload.encode(), digest_size=8).hexdigest(),
+                brief=brief or group_id,
+                group=group,
+                attributes=attributes,
+            ))
+        return units
+    
+    def _generate_python(self, units: List[ConventionUnit]) -> List[str]:
+        """Generate Python code from conventions, regenerating only changed units."""
         generated = []
+        self.last_stats = SpliceStats()
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate Pydantic models
-        models_code = self.parser.generate_pydantic_models(conventions)
         models_path = self.config.output_dir / "models.py"
-        models_path.parent.mkdir(parents=True, exist_ok=True)
-        models_path.write_text(models_code)
+        self._splice(models_path, MODELS_HEADER, units, self._model_unit)
         generated.append(str(models_path))
         
         # Generate helper functions using templates
-        if self.templates.get('function'):
-            helpers_code = self._generate_helpers(conventions)
+        if getattr(self, 'templates', {}).get('function'):
             helpers_path = self.config.output_dir / "helpers.py"
-            helpers_path.write_text(helpers_code)
+            self._splice(helpers_path, HELPERS_HEADER, units, self._helpers_unit)
             generated.append(str(helpers_path))
         
         # Generate validation code
-        validation_code = self._generate_validation(conventions)
         validation_path = self.config.output_dir / "validation.py"
-        validation_path.write_text(validation_code)
+        self._splice(validation_path, VALIDATION_HEADER, units, self._validation_unit, VALIDATION_FOOTER)
         generated.append(str(validation_path))
         
         return generated
     
-    def _generate_helpers(self, conventions: List[SemanticConvention]) -> str:
-        """Generate helper functions using learned templates."""
+    def _splice(self, path: Path, header: str, units: List[ConventionUnit],
+                render: Callable[[ConventionUnit], str], footer: str = "") -> None:
+        """Rewrite ``path``, reusing the sections of units whose hash is unchanged."""
+        try:
+            current = path.read_text()
+        except OSError:
+            current = ""
+        existing = {m.group(1): (m.group(2), m.group(3)) for m in _UNIT_RE.finditer(current)}
+        
+        sections = []
+        for unit in units:
+            previous = existing.pop(unit.key, None)
+            if previous and previous[0] == unit.digest:
+                body = previous[1]
+                self.last_stats.reused += 1
+            else:
+                body = render(unit)
+                self.last_stats.regenerated += 1
+            sections.append(f"{UNIT_BEGIN.format(key=unit.key, digest=unit.digest)}\n"
+                            f"{body}{UNIT_END.format(key=unit.key)}\n")
+        self.last_stats.removed += len(existing)
+        
+        content = header + "\n\n".join(sections) + ("\n\n" + footer if footer else "")
+        if content == current:
+            return
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(content)
+        os.replace(tmp, path)
+        self.last_stats.files_written.append(str(path))
+    
+    def _model_unit(self, unit: ConventionUnit) -> str:
+        """Pydantic model for one convention"""
         code_lines = [
-            '"""Helper functions for semantic conventions."""',
-            '',
-            'from typing import Dict, Any',
-            'from .models import *',
-            '',
+            f'class {unit.class_name}(BaseModel):',
+            f'    """{unit.brief}"""',
+            '    model_config = ConfigDict(populate_by_name=True)',
         ]
-        
-        # Use function templates to generate helpers
-        func_template = self.templates.get('function', [{}])[0]
-        
-        for convention in conventions:
-            # Generate creation helper
-            code_lines.append(f'def create_{convention.id.replace(".", "_")}(**kwargs) -> {convention.class_name}:')
-            code_lines.append(f'    """Create {convention.brief}"""')
-            code_lines.append(f'    return {convention.class_name}(**kwargs)')
-            code_lines.append('')
-            
-            # Generate validation helper
-            code_lines.append(f'def validate_{convention.id.replace(".", "_")}(data: Dict[str, Any]) -> bool:')
-            code_lines.append(f'    """Validate {convention.brief}"""')
-            code_lines.append('    try:')
-            code_lines.append(f'        {convention.class_name}(**data)')
-            code_lines.append('        return True')
-            code_lines.append('    except Exception:')
-            code_lines.append('        return False')
-            code_lines.append('')
-        
-        return '\n'.join(code_lines)
+        for attr_id, attr in unit.attributes:
+            field_type = python_type(attr.get('type'))
+            if attr.get('requirement_level') == 'required':
+                code_lines.append(f'    {snake_case(attr_id)}: {field_type} = Field(alias="{attr_id}")')
+            else:
+                code_lines.append(f'    {snake_case(attr_id)}: Optional[{field_type}] = '
+                                  f'Field(default=None, alias="{attr_id}")')
+        return '\n'.join(code_lines) + '\n'
     
-    def _generate_validation(self, conventions: List[SemanticConvention]) -> str:
-        """Generate validation code for conventions."""
-        code_lines = [
-            '"""Validation for semantic conventions."""',
+    def _helpers_unit(self, unit: ConventionUnit) -> str:
+        """Creation and validation helpers for one convention"""
+        name = snake_case(unit.key)
+        return '\n'.join([
+            f'def create_{name}(**kwargs) -> {unit.class_name}:',
+            f'    """Create {unit.brief}"""',
+            f'    return {unit.class_name}(**kwargs)',
             '',
-            'from typing import List, Dict, Any',
-            'from .models import *',
             '',
-            '',
-            'class ConventionValidator:',
-            '    """Validates semantic convention compliance."""',
-            '    ',
-            '    def __init__(self):',
-            '        self.conventions = {',
-        ]
-        
-        # Register conventions
-        for conv in conventions:
-            code_lines.append(f'            "{conv.id}": {conv.class_name},')
-        
-        code_lines.extend([
-            '        }',
-            '    ',
-            '    def validate(self, convention_id: str, data: Dict[str, Any]) -> bool:',
-            '        """Validate data against convention."""',
-            '        if convention_id not in self.conventions:',
-            '            return False',
-            '        try:',
-            '            self.conventions[convention_id](**data)',
-            '            return True',
-            '        except Exception:',
-            '            return False',
-            ''
-        ])
-        
-        return '\n'.join(code_lines)
+            f'def validate_{name}(data: Dict[str, Any]) -> bool:',
+            f'    """Validate {unit.brief}"""',
+            '    try:',
+            f'        {unit.class_name}(**data)',
+            '        return True',
+            '    except Exception:',
+            '        return False',
+        ]) + '\n'
+    
+    def _validation_unit(self, unit: ConventionUnit) -> str:
+        """Validator registration for one convention"""
+        return f'CONVENTIONS["{unit.key}"] = {unit.class_name}\n'
     
-    def _enhance_with_ai(self, 
-                        conventions: List[SemanticConvention],
+    def _enhance_with_ai(self,
+                        units: List[ConventionUnit],
                         existing_files: List[str]) -> List[str]:
         """Enhance generated code with AI."""
         enhanced = []
@@ -329,8 +505,8 @@ class DualModePipeline:
         if not self.ai_agent:
             return enhanced
         
-        for convention in conventions[:1]:  # Limit for demo
-            prompt = f"""Generate advanced helper code for the {convention.id} semantic convention.
+        for unit in units[:1]:  # Limit for demo
+            prompt = f"""Generate advanced helper code for the {unit.key} semantic convention.
             Include:
             1. Builder pattern for easy construction
             2. Validation with detailed error messages
@@ -338,20 +514,20 @@ class DualModePipeline:
             4. OTEL span integration
             
             Convention details:
-            {convention.model_dump_json(indent=2)}
+            {json.dumps(unit.group, indent=2, default=str)}
             """
             
             try:
                 response = self.ai_agent.run_sync(prompt)
-                enhanced_path = self.config.output_dir / f"{convention.id.replace('.', '_')}_enhanced.py"
+                enhanced_path = self.config.output_dir / f"{snake_case(unit.key)}_enhanced.py"
                 enhanced_path.write_text(response.data)
                 enhanced.append(str(enhanced_path))
             except Exception as e:
-                print(f"AI enhancement failed for {convention.id}: {e}")
+                print(f"AI enhancement failed for {unit.key}: {e}")
         
         return enhanced
     
-    def validate_generation(self, result: GenerationResult) -> bool:
+    def validate_generation(self, result: PipelineResult) -> bool:
         """Validate the generated code."""
         if not result.success:
             return False
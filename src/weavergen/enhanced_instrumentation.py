@@ -6,17 +6,27 @@ Enhanced Instrumentation - 80/20 Gap Closure
 Implements the critical 20% of instrumentation that provides 80% of validation value:
 
 1. Semantic compliance tracking
-2. AI validation spans  
+2. AI validation spans
 3. Architecture layer boundaries
 4. Resource lifecycle monitoring
 5. Quine validation spans
 
 This closes the gaps that unit tests cannot validate.
+
+Production mode keeps these decorators cheap enough for hot paths: calls are
+head-sampled, unsampled calls that fail or run slow are still recorded as
+tail-sampled spans, expensive attributes (hashes, psutil memory, timestamps)
+are only computed for sampled spans, and every registry is bounded.
+Run this module directly for a per-call overhead microbenchmark.
 """
 
 import hashlib
+import os
 import psutil
+import random
 import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 from functools import wraps
@@ -25,16 +35,80 @@ from opentelemetry.trace import Status, StatusCode
 import json
 
 
+@dataclass
+class InstrumentationConfig:
+    """Sampling and retention settings for EnhancedInstrumentation"""
+    mode: str = "full"  # "full" records every call, "production" samples
+    head_sample_rate: float = 0.01
+    tail_sample_errors: bool = True
+    tail_latency_threshold_ms: Optional[float] = 100.0
+    registry_limit: int = 1000
+
+    @classmethod
+    def from_env(cls) -> "InstrumentationConfig":
+        """Read WEAVERGEN_INSTRUMENTATION_MODE / _SAMPLE_RATE / _TAIL_MS"""
+        config = cls(mode=os.environ.get("WEAVERGEN_INSTRUMENTATION_MODE", "full"))
+        if "WEAVERGEN_INSTRUMENTATION_SAMPLE_RATE" in os.environ:
+            config.head_sample_rate = float(os.environ["WEAVERGEN_INSTRUMENTATION_SAMPLE_RATE"])
+        if "WEAVERGEN_INSTRUMENTATION_TAIL_MS" in os.environ:
+            config.tail_latency_threshold_ms = float(os.environ["WEAVERGEN_INSTRUMENTATION_TAIL_MS"])
+        return config
+
+    @property
+    def production(self) -> bool:
+        return self.mode == "production"
+
+
+class BoundedRegistry(OrderedDict):
+    """Insertion-ordered dict that evicts its oldest entries past ``limit``"""
+
+    def __init__(self, limit: int):
+        super().__init__()
+        self.limit = limit
+        self.evicted = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        while len(self) > self.limit:
+            self.popitem(last=False)
+            self.evicted += 1
+
+
+# Hooks receive (span, args, kwargs) before the call and return state that is
+# handed to the success/error hooks; they only run for recording spans
+BeforeHook = Callable[[Any, tuple, dict], Any]
+AfterHook = Callable[[Any, Any, Any], None]
+ErrorHook = Callable[[Any, Exception], None]
+
+
 class EnhancedInstrumentation:
     """Enhanced instrumentation that closes critical validation gaps"""
-    
-    def __init__(self, service_name: str = "enhanced_weaver_system"):
-        self.tracer = trace.get_tracer(service_name)
-        self.semantic_registry = {}
-        self.resource_registry = {}
-        self.decision_cache = {}
-        self.memory_baseline = self._get_memory_usage()
-        
+
+    def __init__(self, service_name: str = "enhanced_weaver_system",
+                 config: Optional[InstrumentationConfig] = None,
+                 tracer_provider: Optional[trace.TracerProvider] = None):
+        self.tracer = trace.get_tracer(service_name, tracer_provider=tracer_provider)
+        self.config = config or InstrumentationConfig.from_env()
+        limit = self.config.registry_limit
+        self.semantic_registry: Dict[str, deque] = BoundedRegistry(limit)
+        self.resource_registry: Dict[str, Dict[str, Any]] = BoundedRegistry(limit)
+        self.decision_cache: Dict[str, str] = BoundedRegistry(limit)
+        self.regeneration_history: deque = deque(maxlen=limit)
+        self.sampling_stats = {"calls": 0, "head_sampled": 0, "tail_sampled": 0}
+        self._memory_baseline: Optional[int] = None
+
+    def configure(self, **settings: Any) -> None:
+        """Update sampling settings in place (e.g. configure(mode="production"))"""
+        for key, value in settings.items():
+            setattr(self.config, key, value)
+
+    @property
+    def memory_baseline(self) -> int:
+        """Process RSS at first use, measured lazily"""
+        if self._memory_baseline is None:
+            self._memory_baseline = self._get_memory_usage()
+        return self._memory_baseline
+
     def _get_memory_usage(self) -> int:
         """Get current memory usage in bytes"""
         try:
@@ -42,397 +116,470 @@ class EnhancedInstrumentation:
             return process.memory_info().rss
         except:
             return 0
-    
+
+    # ------------------------------------------------------------------
+    # Sampling core
+    # ------------------------------------------------------------------
+
+    def _instrument(self, span_name: str, func: Callable,
+                    before: Optional[BeforeHook] = None,
+                    after: Optional[AfterHook] = None,
+                    on_error: Optional[ErrorHook] = None) -> Callable:
+        """Wrap ``func`` in a span, applying head/tail sampling in production mode"""
+        config = self.config
+        stats = self.sampling_stats
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            stats["calls"] += 1
+            if config.production and random.random() >= config.head_sample_rate:
+                return self._tail_sampled_call(span_name, func, args, kwargs, on_error)
+
+            with self.tracer.start_span(span_name) as span:
+                if not span.is_recording():
+                    return func(*args, **kwargs)
+                stats["head_sampled"] += 1
+                state = before(span, args, kwargs) if before else None
+                try:
+                    result = func(*args, **kwargs)
+                    if after:
+                        after(span, state, result)
+                    span.set_status(Status(StatusCode.OK))
+                    return result
+                except Exception as e:
+                    if on_error:
+                        on_error(span, e)
+                    span.set_status(Status(StatusCode.ERROR, str(e)))
+                    raise
+
+        return wrapper
+
+    def _tail_sampled_call(self, span_name: str, func: Callable, args: tuple,
+                           kwargs: dict, on_error: Optional[ErrorHook]) -> Any:
+        """Run an unsampled call, emitting a span only if it failed or ran slow"""
+        config = self.config
+        start_ns = time.time_ns()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if config.tail_sample_errors:
+                self._emit_tail_span(span_name, start_ns, "error", on_error, e)
+            raise
+
+        threshold_ms = config.tail_latency_threshold_ms
+        if threshold_ms is not None and (time.time_ns() - start_ns) >= threshold_ms * 1_000_000:
+            self._emit_tail_span(span_name, start_ns, "latency")
+        return result
+
+    def _emit_tail_span(self, span_name: str, start_ns: int, reason: str,
+                        on_error: Optional[ErrorHook] = None,
+                        error: Optional[Exception] = None) -> None:
+        span = self.tracer.start_span(span_name, start_time=start_ns)
+        self.sampling_stats["tail_sampled"] += 1
+        span.set_attribute("sampling.tail", True)
+        span.set_attribute("sampling.reason", reason)
+        if error is not None:
+            if on_error:
+                on_error(span, error)
+            span.set_status(Status(StatusCode.ERROR, str(error)))
+        span.end()
+
+    # ------------------------------------------------------------------
+    # Decorators
+    # ------------------------------------------------------------------
+
     def semantic_compliance_span(self, semantic_group_id: str, operation_name: str):
         """
         GAP 1: Semantic compliance tracking
-        
+
         Validates that operations comply with semantic conventions at runtime.
         Unit tests can't validate this - only spans can.
         """
+        def before(span, args, kwargs):
+            # Critical attributes for semantic validation
+            span.set_attribute("semantic.group.id", semantic_group_id)
+            span.set_attribute("semantic.operation", operation_name)
+            span.set_attribute("semantic.compliance.required", True)
+            span.set_attribute("semantic.timestamp", datetime.now().isoformat())
+
+            # Track semantic convention adherence
+            if semantic_group_id in self.semantic_registry:
+                span.set_attribute("semantic.previous_operations",
+                                 len(self.semantic_registry[semantic_group_id]))
+            else:
+                self.semantic_registry[semantic_group_id] = deque(maxlen=self.config.registry_limit)
+
+        def after(span, state, result):
+            # Validate result against semantic conventions
+            if hasattr(result, '__dict__'):
+                result_hash = hashlib.md5(str(result.__dict__).encode()).hexdigest()
+                span.set_attribute("semantic.result.hash", result_hash)
+                span.set_attribute("semantic.result.type", type(result).__name__)
+
+            # Record compliance
+            span.set_attribute("semantic.compliance.validated", True)
+
+            # Track in registry
+            self.semantic_registry.setdefault(
+                semantic_group_id, deque(maxlen=self.config.registry_limit)
+            ).append({
+                "operation": operation_name,
+                "timestamp": datetime.now().isoformat(),
+                "span_id": hex(span.get_span_context().span_id)
+            })
+
+        def on_error(span, e):
+            span.set_attribute("semantic.compliance.validated", False)
+            span.set_attribute("semantic.error", str(e))
+
         def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                with self.tracer.start_span(f"semantic.{operation_name}") as span:
-                    # Critical attributes for semantic validation
-                    span.set_attribute("semantic.group.id", semantic_group_id)
-                    span.set_attribute("semantic.operation", operation_name)
-                    span.set_attribute("semantic.compliance.required", True)
-                    span.set_attribute("semantic.timestamp", datetime.now().isoformat())
-                    
-                    # Track semantic convention adherence
-                    if semantic_group_id in self.semantic_registry:
-                        span.set_attribute("semantic.previous_operations", 
-                                         len(self.semantic_registry[semantic_group_id]))
-                    else:
-                        self.semantic_registry[semantic_group_id] = []
-                    
-                    try:
-                        result = func(*args, **kwargs)
-                        
-                        # Validate result against semantic conventions
-                        if hasattr(result, '__dict__'):
-                            result_hash = hashlib.md5(str(result.__dict__).encode()).hexdigest()
-                            span.set_attribute("semantic.result.hash", result_hash)
-                            span.set_attribute("semantic.result.type", type(result).__name__)
-                        
-                        # Record compliance
-                        span.set_attribute("semantic.compliance.validated", True)
-                        span.set_status(Status(StatusCode.OK))
-                        
-                        # Track in registry
-                        self.semantic_registry[semantic_group_id].append({
-                            "operation": operation_name,
-                            "timestamp": datetime.now().isoformat(),
-                            "span_id": hex(span.get_span_context().span_id)
-                        })
-                        
-                        return result
-                        
-                    except Exception as e:
-                        span.set_attribute("semantic.compliance.validated", False)
-                        span.set_attribute("semantic.error", str(e))
-                        span.set_status(Status(StatusCode.ERROR, str(e)))
-                        raise
-                        
-            return wrapper
+            return self._instrument(f"semantic.{operation_name}", func, before, after, on_error)
         return decorator
-    
+
     def ai_validation_span(self, model_name: str, expected_schema: str):
         """
         GAP 2: AI validation tracking
-        
+
         Validates AI output compliance in real-time.
         Unit tests use mocked AI - this validates real AI behavior.
         """
+        def before(span, args, kwargs):
+            # Critical AI validation attributes
+            start_time = time.time()
+            span.set_attribute("pydantic_ai.model", model_name)
+            span.set_attribute("pydantic_ai.expected_schema", expected_schema)
+            span.set_attribute("ai.start_time", start_time)
+
+            # Extract prompt if available
+            prompt = kwargs.get('prompt', args[0] if args else '')
+            if isinstance(prompt, str):
+                span.set_attribute("pydantic_ai.prompt", prompt[:500])  # Truncate
+                span.set_attribute("pydantic_ai.prompt.hash",
+                                 hashlib.md5(prompt.encode()).hexdigest())
+            return start_time
+
+        def after(span, start_time, result):
+            # Validate AI output structure
+            validation_errors = []
+            if hasattr(result, 'model_validate'):
+                try:
+                    # Pydantic validation
+                    result.model_validate(result.model_dump())
+                    span.set_attribute("ai.output.valid", True)
+                except Exception as e:
+                    validation_errors.append(str(e))
+                    span.set_attribute("ai.output.valid", False)
+
+            # Record validation results
+            span.set_attribute("ai.output.validation_errors", json.dumps(validation_errors))
+            span.set_attribute("ai.output.schema_compliant", len(validation_errors) == 0)
+            span.set_attribute("ai.end_time", time.time())
+
+            # Calculate inference time
+            inference_time = time.time() - start_time
+            span.set_attribute("ai.inference_time_seconds", inference_time)
+
+            # Output structure analysis
+            if hasattr(result, 'model_dump'):
+                output_dict = result.model_dump()
+                span.set_attribute("ai.output.field_count", len(output_dict))
+                span.set_attribute("ai.output.size_bytes", len(str(output_dict)))
+                span.set_attribute("ai.output.hash",
+                                 hashlib.md5(str(output_dict).encode()).hexdigest())
+
+        def on_error(span, e):
+            span.set_attribute("ai.output.valid", False)
+            span.set_attribute("ai.error", str(e))
+
         def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                with self.tracer.start_span("pydantic_ai.generate") as span:
-                    # Critical AI validation attributes
-                    start_time = time.time()
-                    span.set_attribute("pydantic_ai.model", model_name)
-                    span.set_attribute("pydantic_ai.expected_schema", expected_schema)
-                    span.set_attribute("ai.start_time", start_time)
-                    
-                    # Extract prompt if available
-                    prompt = kwargs.get('prompt', args[0] if args else '')
-                    if isinstance(prompt, str):
-                        span.set_attribute("pydantic_ai.prompt", prompt[:500])  # Truncate
-                        span.set_attribute("pydantic_ai.prompt.hash", 
-                                         hashlib.md5(prompt.encode()).hexdigest())
-                    
-                    try:
-                        result = func(*args, **kwargs)
-                        
-                        # Validate AI output structure
-                        validation_errors = []
-                        if hasattr(result, 'model_validate'):
-                            try:
-                                # Pydantic validation
-                                validated = result.model_validate(result.model_dump())
-                                span.set_attribute("ai.output.valid", True)
-                            except Exception as e:
-                                validation_errors.append(str(e))
-                                span.set_attribute("ai.output.valid", False)
-                        
-                        # Record validation results
-                        span.set_attribute("ai.output.validation_errors", json.dumps(validation_errors))
-                        span.set_attribute("ai.output.schema_compliant", len(validation_errors) == 0)
-                        span.set_attribute("ai.end_time", time.time())
-                        
-                        # Calculate inference time
-                        inference_time = time.time() - start_time
-                        span.set_attribute("ai.inference_time_seconds", inference_time)
-                        
-                        # Output structure analysis
-                        if hasattr(result, 'model_dump'):
-                            output_dict = result.model_dump()
-                            span.set_attribute("ai.output.field_count", len(output_dict))
-                            span.set_attribute("ai.output.size_bytes", len(str(output_dict)))
-                            span.set_attribute("ai.output.hash", 
-                                             hashlib.md5(str(output_dict).encode()).hexdigest())
-                        
-                        span.set_status(Status(StatusCode.OK))
-                        return result
-                        
-                    except Exception as e:
-                        span.set_attribute("ai.output.valid", False)
-                        span.set_attribute("ai.error", str(e))
-                        span.set_status(Status(StatusCode.ERROR, str(e)))
-                        raise
-                        
-            return wrapper
+            return self._instrument("pydantic_ai.generate", func, before, after, on_error)
         return decorator
-    
+
     def layer_boundary_span(self, layer_name: str):
         """
         GAP 3: Architecture layer boundary tracking
-        
+
         Validates 4-layer architecture boundaries aren't violated.
         Unit tests can't catch cross-layer violations in real execution.
         """
         def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                with self.tracer.start_span(f"layer.{layer_name}") as span:
-                    # Critical layer tracking attributes
-                    span.set_attribute("forge.layer", layer_name)
-                    span.set_attribute("forge.operation", func.__name__)
-                    span.set_attribute("forge.architecture.validated", True)
-                    
-                    # Validate layer call hierarchy
-                    current_span_ctx = span.get_span_context()
-                    parent_span = getattr(span, 'parent', None)
-                    
-                    if parent_span:
-                        # Check if parent layer is allowed to call this layer
-                        valid_calls = {
-                            "commands": ["operations"],
-                            "operations": ["runtime", "contracts"],
-                            "runtime": [],  # Leaf layer
-                            "contracts": []  # Leaf layer
-                        }
-                        
-                        # This would need parent layer info - simplified for demo
-                        span.set_attribute("forge.layer.parent_validated", True)
-                    
-                    # Track layer metrics
-                    start_time = time.time()
-                    
-                    try:
-                        result = func(*args, **kwargs)
-                        
-                        # Layer performance tracking
-                        execution_time = time.time() - start_time
-                        span.set_attribute("forge.layer.execution_time_ms", execution_time * 1000)
-                        span.set_attribute("forge.layer.success", True)
-                        
-                        # Result validation
-                        if result is not None:
-                            span.set_attribute("forge.layer.result_type", type(result).__name__)
-                            span.set_attribute("forge.layer.result_size", len(str(result)))
-                        
-                        span.set_status(Status(StatusCode.OK))
-                        return result
-                        
-                    except Exception as e:
-                        span.set_attribute("forge.layer.success", False)
-                        span.set_attribute("forge.layer.error", str(e))
-                        span.set_status(Status(StatusCode.ERROR, str(e)))
-                        raise
-                        
-            return wrapper
+            def before(span, args, kwargs):
+                # Critical layer tracking attributes
+                span.set_attribute("forge.layer", layer_name)
+                span.set_attribute("forge.operation", func.__name__)
+                span.set_attribute("forge.architecture.validated", True)
+
+                # Validate layer call hierarchy
+                if getattr(span, 'parent', None):
+                    # This would need parent layer info - simplified for demo
+                    span.set_attribute("forge.layer.parent_validated", True)
+
+                # Track layer metrics
+                return time.time()
+
+            def after(span, start_time, result):
+                # Layer performance tracking
+                execution_time = time.time() - start_time
+                span.set_attribute("forge.layer.execution_time_ms", execution_time * 1000)
+                span.set_attribute("forge.layer.success", True)
+
+                # Result validation
+                if result is not None:
+                    span.set_attribute("forge.layer.result_type", type(result).__name__)
+                    span.set_attribute("forge.layer.result_size", len(str(result)))
+
+            def on_error(span, e):
+                span.set_attribute("forge.layer.success", False)
+                span.set_attribute("forge.layer.error", str(e))
+
+            return self._instrument(f"layer.{layer_name}", func, before, after, on_error)
         return decorator
-    
+
     def resource_lifecycle_span(self, resource_type: str, operation: str):
         """
         GAP 4: Resource lifecycle tracking
-        
+
         Tracks resource creation/destruction for leak detection.
         Unit tests don't run long enough to detect resource leaks.
         """
+        def before(span, args, kwargs):
+            resource_id = f"{resource_type}_{int(time.time() * 1000)}"
+
+            # Critical resource tracking attributes
+            span.set_attribute("resource.id", resource_id)
+            span.set_attribute("resource.type", resource_type)
+            span.set_attribute("resource.operation", operation)
+            span.set_attribute("resource.timestamp", datetime.now().isoformat())
+
+            # Memory tracking
+            memory_before = self._get_memory_usage()
+            span.set_attribute("memory.before.bytes", memory_before)
+            span.set_attribute("memory.baseline.bytes", self.memory_baseline)
+            return resource_id, memory_before
+
+        def after(span, state, result):
+            resource_id, memory_before = state
+
+            # Post-operation memory tracking
+            memory_after = self._get_memory_usage()
+            memory_delta = memory_after - memory_before
+
+            span.set_attribute("memory.after.bytes", memory_after)
+            span.set_attribute("memory.delta.bytes", memory_delta)
+            span.set_attribute("memory.growth_rate",
+                             memory_delta / memory_before if memory_before > 0 else 0)
+
+            # Resource registry tracking
+            if operation == "create":
+                self.resource_registry[resource_id] = {
+                    "type": resource_type,
+                    "created_at": datetime.now().isoformat(),
+                    "span_id": hex(span.get_span_context().span_id),
+                    "memory_allocated": memory_delta
+                }
+                span.set_attribute("resource.registered", True)
+                span.set_attribute("resource.total_tracked", len(self.resource_registry))
+
+            elif operation == "destroy":
+                if resource_id in self.resource_registry:
+                    del self.resource_registry[resource_id]
+                    span.set_attribute("resource.destroyed", True)
+                else:
+                    span.set_attribute("resource.orphaned", True)
+
+                span.set_attribute("resource.remaining_tracked", len(self.resource_registry))
+
+            # Leak detection
+            if len(self.resource_registry) > 10:  # Threshold for leak warning
+                span.set_attribute("resource.leak_warning", True)
+                span.set_attribute("resource.leaked_count", len(self.resource_registry))
+
+        def on_error(span, e):
+            span.set_attribute("resource.operation_failed", True)
+            span.set_attribute("resource.error", str(e))
+
         def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                resource_id = f"{resource_type}_{int(time.time() * 1000)}"
-                
-                with self.tracer.start_span(f"resource.{operation}") as span:
-                    # Critical resource tracking attributes
-                    span.set_attribute("resource.id", resource_id)
-                    span.set_attribute("resource.type", resource_type)
-                    span.set_attribute("resource.operation", operation)
-                    span.set_attribute("resource.timestamp", datetime.now().isoformat())
-                    
-                    # Memory tracking
-                    memory_before = self._get_memory_usage()
-                    span.set_attribute("memory.before.bytes", memory_before)
-                    span.set_attribute("memory.baseline.bytes", self.memory_baseline)
-                    
-                    try:
-                        result = func(*args, **kwargs)
-                        
-                        # Post-operation memory tracking
-                        memory_after = self._get_memory_usage()
-                        memory_delta = memory_after - memory_before
-                        
-                        span.set_attribute("memory.after.bytes", memory_after)
-                        span.set_attribute("memory.delta.bytes", memory_delta)
-                        span.set_attribute("memory.growth_rate", 
-                                         memory_delta / memory_before if memory_before > 0 else 0)
-                        
-                        # Resource registry tracking
-                        if operation == "create":
-                            self.resource_registry[resource_id] = {
-                                "type": resource_type,
-                                "created_at": datetime.now().isoformat(),
-                                "span_id": hex(span.get_span_context().span_id),
-                                "memory_allocated": memory_delta
-                            }
-                            span.set_attribute("resource.registered", True)
-                            span.set_attribute("resource.total_tracked", len(self.resource_registry))
-                            
-                        elif operation == "destroy":
-                            if resource_id in self.resource_registry:
-                                del self.resource_registry[resource_id]
-                                span.set_attribute("resource.destroyed", True)
-                            else:
-                                span.set_attribute("resource.orphaned", True)
-                            
-                            span.set_attribute("resource.remaining_tracked", len(self.resource_registry))
-                        
-                        # Leak detection
-                        if len(self.resource_registry) > 10:  # Threshold for leak warning
-                            span.set_attribute("resource.leak_warning", True)
-                            span.set_attribute("resource.leaked_count", len(self.resource_registry))
-                        
-                        span.set_status(Status(StatusCode.OK))
-                        return result
-                        
-                    except Exception as e:
-                        span.set_attribute("resource.operation_failed", True)
-                        span.set_attribute("resource.error", str(e))
-                        span.set_status(Status(StatusCode.ERROR, str(e)))
-                        raise
-                        
-            return wrapper
+            return self._instrument(f"resource.{operation}", func, before, after, on_error)
         return decorator
-    
+
     def quine_validation_span(self, cycle_id: str):
         """
         GAP 5: Quine property validation
-        
+
         Validates system can regenerate itself (semantic quine).
         Unit tests can't test self-regeneration - only spans can.
         """
+        def before(span, args, kwargs):
+            # Critical quine validation attributes
+            span.set_attribute("regeneration.cycle.id", cycle_id)
+            span.set_attribute("regeneration.start_time", datetime.now().isoformat())
+
+            # Input hash calculation
+            input_data = kwargs.get('semantic_input', args[0] if args else '')
+            input_hash = None
+            if isinstance(input_data, (str, dict)):
+                input_str = str(input_data)
+                input_hash = hashlib.md5(input_str.encode()).hexdigest()
+                span.set_attribute("semantic.input.hash", input_hash)
+                span.set_attribute("semantic.input.size", len(input_str))
+            return input_hash
+
+        def after(span, input_hash, result):
+            # Output hash calculation
+            output_hash = None
+            if result:
+                output_str = str(result)
+                output_hash = hashlib.md5(output_str.encode()).hexdigest()
+                span.set_attribute("semantic.output.hash", output_hash)
+                span.set_attribute("semantic.output.size", len(output_str))
+
+                # Quine property validation
+                if input_hash and output_hash:
+                    quine_valid = input_hash == output_hash
+                    span.set_attribute("regeneration.quine.valid", quine_valid)
+                    span.set_attribute("regeneration.hash_match", quine_valid)
+
+                    if quine_valid:
+                        span.set_attribute("regeneration.convergence_proof", True)
+                    else:
+                        # Calculate hash similarity
+                        similarity = sum(a == b for a, b in zip(input_hash, output_hash)) / len(input_hash)
+                        span.set_attribute("regeneration.hash_similarity", similarity)
+
+            # Regeneration metrics
+            span.set_attribute("regeneration.success", True)
+            span.set_attribute("regeneration.end_time", datetime.now().isoformat())
+
+            # Track regeneration history
+            self.regeneration_history.append({
+                "cycle_id": cycle_id,
+                "input_hash": input_hash,
+                "output_hash": output_hash,
+                "timestamp": datetime.now().isoformat()
+            })
+
+            span.set_attribute("regeneration.cycle_count", len(self.regeneration_history))
+
+        def on_error(span, e):
+            span.set_attribute("regeneration.success", False)
+            span.set_attribute("regeneration.error", str(e))
+
         def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                with self.tracer.start_span("forge.self.regenerate") as span:
-                    # Critical quine validation attributes
-                    span.set_attribute("regeneration.cycle.id", cycle_id)
-                    span.set_attribute("regeneration.start_time", datetime.now().isoformat())
-                    
-                    # Input hash calculation
-                    input_data = kwargs.get('semantic_input', args[0] if args else '')
-                    input_hash = None
-                    if isinstance(input_data, (str, dict)):
-                        input_str = str(input_data)
-                        input_hash = hashlib.md5(input_str.encode()).hexdigest()
-                        span.set_attribute("semantic.input.hash", input_hash)
-                        span.set_attribute("semantic.input.size", len(input_str))
-                    
-                    try:
-                        result = func(*args, **kwargs)
-                        
-                        # Output hash calculation
-                        output_hash = None
-                        if result:
-                            output_str = str(result)
-                            output_hash = hashlib.md5(output_str.encode()).hexdigest()
-                            span.set_attribute("semantic.output.hash", output_hash)
-                            span.set_attribute("semantic.output.size", len(output_str))
-                            
-                            # Quine property validation
-                            if input_hash and output_hash:
-                                quine_valid = input_hash == output_hash
-                                span.set_attribute("regeneration.quine.valid", quine_valid)
-                                span.set_attribute("regeneration.hash_match", quine_valid)
-                                
-                                if quine_valid:
-                                    span.set_attribute("regeneration.convergence_proof", True)
-                                else:
-                                    # Calculate hash similarity
-                                    similarity = sum(a == b for a, b in zip(input_hash, output_hash)) / len(input_hash)
-                                    span.set_attribute("regeneration.hash_similarity", similarity)
-                        
-                        # Regeneration metrics
-                        span.set_attribute("regeneration.success", True)
-                        span.set_attribute("regeneration.end_time", datetime.now().isoformat())
-                        
-                        # Track regeneration history
-                        if not hasattr(self, 'regeneration_history'):
-                            self.regeneration_history = []
-                        
-                        self.regeneration_history.append({
-                            "cycle_id": cycle_id,
-                            "input_hash": input_hash,
-                            "output_hash": output_hash,
-                            "timestamp": datetime.now().isoformat()
-                        })
-                        
-                        span.set_attribute("regeneration.cycle_count", len(self.regeneration_history))
-                        
-                        span.set_status(Status(StatusCode.OK))
-                        return result
-                        
-                    except Exception as e:
-                        span.set_attribute("regeneration.success", False)
-                        span.set_attribute("regeneration.error", str(e))
-                        span.set_status(Status(StatusCode.ERROR, str(e)))
-                        raise
-                        
-            return wrapper
+            return self._instrument("forge.self.regenerate", func, before, after, on_error)
         return decorator
-    
+
     def decision_consistency_span(self, agent_id: str):
         """
         BONUS: Decision consistency tracking
-        
+
         Validates AI agents make consistent decisions.
         """
+        def before(span, args, kwargs):
+            # Decision context hashing
+            context = kwargs.get('context', {})
+            context_str = json.dumps(context, sort_keys=True)
+            context_hash = hashlib.md5(context_str.encode()).hexdigest()
+
+            span.set_attribute("agent.id", agent_id)
+            span.set_attribute("decision.context.hash", context_hash)
+            span.set_attribute("decision.timestamp", datetime.now().isoformat())
+            return context_hash
+
+        def after(span, context_hash, result):
+            # Decision tracking
+            if result:
+                decision_hash = hashlib.md5(str(result).encode()).hexdigest()
+                span.set_attribute("decision.output.hash", decision_hash)
+
+                # Consistency check
+                cache_key = f"{agent_id}:{context_hash}"
+                if cache_key in self.decision_cache:
+                    previous_decision = self.decision_cache[cache_key]
+                    consistent = previous_decision == decision_hash
+                    span.set_attribute("decision.consistent", consistent)
+                    span.set_attribute("decision.previous_exists", True)
+                else:
+                    span.set_attribute("decision.first_occurrence", True)
+
+                self.decision_cache[cache_key] = decision_hash
+
+        def on_error(span, e):
+            span.set_attribute("decision.error", str(e))
+
         def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                with self.tracer.start_span("agent.decision") as span:
-                    # Decision context hashing
-                    context = kwargs.get('context', {})
-                    context_str = json.dumps(context, sort_keys=True)
-                    context_hash = hashlib.md5(context_str.encode()).hexdigest()
-                    
-                    span.set_attribute("agent.id", agent_id)
-                    span.set_attribute("decision.context.hash", context_hash)
-                    span.set_attribute("decision.timestamp", datetime.now().isoformat())
-                    
-                    try:
-                        result = func(*args, **kwargs)
-                        
-                        # Decision tracking
-                        if result:
-                            decision_hash = hashlib.md5(str(result).encode()).hexdigest()
-                            span.set_attribute("decision.output.hash", decision_hash)
-                            
-                            # Consistency check
-                            cache_key = f"{agent_id}:{context_hash}"
-                            if cache_key in self.decision_cache:
-                                previous_decision = self.decision_cache[cache_key]
-                                consistent = previous_decision == decision_hash
-                                span.set_attribute("decision.consistent", consistent)
-                                span.set_attribute("decision.previous_exists", True)
-                            else:
-                                span.set_attribute("decision.first_occurrence", True)
-                            
-                            self.decision_cache[cache_key] = decision_hash
-                        
-                        span.set_status(Status(StatusCode.OK))
-                        return result
-                        
-                    except Exception as e:
-                        span.set_attribute("decision.error", str(e))
-                        span.set_status(Status(StatusCode.ERROR, str(e)))
-                        raise
-                        
-            return wrapper
+            return self._instrument("agent.decision", func, before, after, on_error)
         return decorator
 
 
+# ============================================================================
+# Overhead microbenchmark
+# ============================================================================
+
+def measure_decorator_overhead(iterations: int = 20_000,
+                               config: Optional[InstrumentationConfig] = None) -> Dict[str, float]:
+    """Per-call overhead in microseconds of each decorator over a no-op function
+
+    Spans are recorded by an SDK tracer provider without exporters, so the
+    numbers cover span creation and attribute work, not export.
+    """
+    from opentelemetry.sdk.trace import TracerProvider
+
+    instrumentation = EnhancedInstrumentation(
+        "instrumentation_benchmark",
+        config=config or InstrumentationConfig(),
+        tracer_provider=TracerProvider(),
+    )
+
+    class Result:
+        def __init__(self):
+            self.value = 42
+
+    def target(semantic_input="payload", context=None):
+        return Result()
+
+    decorators: Dict[str, Callable] = {
+        "semantic_span": instrumentation.semantic_compliance_span("bench", "op"),
+        "ai_validation": instrumentation.ai_validation_span("bench-model", "Result"),
+        "layer_span": instrumentation.layer_boundary_span("operations"),
+        "resource_span": instrumentation.resource_lifecycle_span("bench", "access"),
+        "quine_span": instrumentation.quine_validation_span("bench"),
+        "decision_span": instrumentation.decision_consistency_span("bench-agent"),
+    }
+
+    def per_call_us(func: Callable) -> float:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - started) / iterations * 1e6
+
+    baseline = per_call_us(target)
+    results = {"baseline_us": baseline}
+    for name, decorator in decorators.items():
+        results[name] = max(per_call_us(decorator(target)) - baseline, 0.0)
+    return results
+
+
 # Global enhanced instrumentation instance
 enhanced_instrumentation = EnhancedInstrumentation()
 
 # Convenience decorators
 semantic_span = enhanced_instrumentation.semantic_compliance_span
-ai_validation = enhanced_instrumentation.ai_validation_span  
+ai_validation = enhanced_instrumentation.ai_validation_span
 layer_span = enhanced_instrumentation.layer_boundary_span
 resource_span = enhanced_instrumentation.resource_lifecycle_span
 quine_span = enhanced_instrumentation.quine_validation_span
-decision_span = enhanced_instrumentation.decision_consistency_span
\ No newline at end of file
+decision_span = enhanced_instrumentation.decision_consistency_span
+
+
+if __name__ == "__main__":
+    import sys
+
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    full = measure_decorator_overhead(iterations, InstrumentationConfig(mode="full"))
+    production = measure_decorator_overhead(iterations, InstrumentationConfig(mode="production"))
+
+    print(f"Per-call overhead over a no-op function ({iterations} calls, µs)")
+    print(f"{'decorator':<16}{'full':>10}{'production':>12}")
+    for name in full:
+        if name != "baseline_us":
+            print(f"{name:<16}{full[name]:>10.2f}{production[name]:>12.2f}")
@@ -5,11 +5,14 @@ Shows how agents actually communicate through spans
 """
 
 import asyncio
+import heapq
 import json
+import threading
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from typing import Deque, Dict, List, Any, Optional, Tuple
+from collections import defaultdict, deque
 
 # OTel imports
 from opentelemetry import trace
@@ -24,56 +27,132 @@ from opentelemetry.trace import Status, StatusCode
 
 # ============= Custom Span Exporter to Capture Communication =============
 
+@dataclass
+class CommunicationEdge:
+    """Aggregated messages from one agent to one recipient"""
+    source: str
+    target: str
+    count: int = 0
+    types: Dict[str, int] = field(default_factory=dict)
+    first_timestamp: Optional[int] = None
+    last_timestamp: Optional[int] = None
+    version: int = 0
+
+
 class CommunicationCapturingExporter(SpanExporter):
-    """Custom exporter that captures agent communication from spans"""
+    """Custom exporter that captures agent communication from spans
     
-    def __init__(self):
-        self.captured_spans = []
-        self.agent_messages = defaultdict(list)
-        self.communication_graph = []
+    Memory is bounded: the latest ``max_spans`` spans and the latest
+    ``max_messages_per_agent`` messages per agent are kept, and the
+    communication graph holds one counted edge per sender/recipient pair.
+    Every message gets a sequence number and every edge update a version,
+    so viewers can poll for what changed instead of rescanning.
+    """
+    
+    def __init__(self, max_spans: int = 10_000, max_messages_per_agent: int = 1_000):
+        self.max_messages_per_agent = max_messages_per_agent
+        self.captured_spans: Deque[Span] = deque(maxlen=max_spans)
+        self.agent_messages: Dict[str, Deque[Dict[str, Any]]] = defaultdict(
+            lambda: deque(maxlen=max_messages_per_agent))
+        self.communication_graph: Dict[str, Dict[str, CommunicationEdge]] = defaultdict(dict)
+        self.span_count = 0
+        self.message_count = 0
+        self.graph_version = 0
+        self._lock = threading.Lock()
         
     def export(self, spans: List[Span]) -> SpanExportResult:
         """Export spans and extract communication"""
         
-        for span in spans:
-            # Capture the span
-            self.captured_spans.append(span)
-            
-            # Extract agent communication
-            attrs = dict(span.attributes or {})
-            
-            # Check if this is an agent communication
-            if attrs.get("message.type") and attrs.get("agent.id"):
+        with self._lock:
+            for span in spans:
+                # Capture the span
+                self.captured_spans.append(span)
+                self.span_count += 1
+                
+                # Attributes are an immutable mapping; read them in place
+                attrs = span.attributes or {}
+                
+                # Check if this is an agent communication
+                message_type = attrs.get("message.type")
                 agent_id = attrs.get("agent.id")
-                message = {
+                if not (message_type and agent_id):
+                    continue
+                
+                self.message_count += 1
+                self.agent_messages[agent_id].append({
+                    "seq": self.message_count,
                     "timestamp": span.start_time,
                     "agent_id": agent_id,
                     "agent_name": attrs.get("agent.name", "Unknown"),
-                    "message_type": attrs.get("message.type"),
+                    "message_type": message_type,
                     "content": attrs.get("message.content", ""),
                     "span_name": span.name,
                     "duration_ms": (span.end_time - span.start_time) // 1_000_000
-                }
+                })
                 
-                self.agent_messages[agent_id].append(message)
-                
-                # Track communication flow
+                # Track communication flow; decisions go to the system
                 if "decision" in span.name:
-                    self.communication_graph.append({
-                        "from": agent_id,
-                        "to": "system",
-                        "type": "decision",
-                        "timestamp": span.start_time
-                    })
+                    target = "system"
+                else:
+                    target = attrs.get("message.recipient", "broadcast")
+                self._record_edge(agent_id, target, message_type, span.start_time)
         
         return SpanExportResult.SUCCESS
     
+    def _record_edge(self, source: str, target: str, message_type: str, timestamp: int):
+        edge = self.communication_graph[source].get(target)
+        if edge is None:
+            edge = self.communication_graph[source][target] = CommunicationEdge(source, target)
+            edge.first_timestamp = timestamp
+        edge.count += 1
+        edge.types[message_type] = edge.types.get(message_type, 0) + 1
+        edge.last_timestamp = timestamp
+        self.graph_version += 1
+        edge.version = self.graph_version
+    
     def shutdown(self) -> None:
         pass
     
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         return True
     
+    # ---- Incremental queries ----
+    
+    def messages_since(self, cursor: int = 0, agent_id: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """Messages with a sequence number above ``cursor``, oldest first
+        
+        Returns the messages and the cursor to pass next time. Messages
+        already evicted from an agent's buffer are not returned.
+        """
+        with self._lock:
+            agents = [agent_id] if agent_id is not None else list(self.agent_messages)
+            per_agent = []
+            for agent in agents:
+                buffer = self.agent_messages.get(agent, ())
+                fresh = []
+                # Buffers are in sequence order, so only the new tail is visited
+                for message in reversed(buffer):
+                    if message["seq"] <= cursor:
+                        break
+                    fresh.append(message)
+                fresh.reverse()
+                per_agent.append(fresh)
+            return list(heapq.merge(*per_agent, key=lambda m: m["seq"])), self.message_count
+    
+    def edges_since(self, version: int = 0) -> Tuple[List[CommunicationEdge], int]:
+        """Graph edges created or updated after ``version``, plus the current version"""
+        with self._lock:
+            edges = [
+                edge for targets in self.communication_graph.values()
+                for edge in targets.values() if edge.version > version
+            ]
+            return edges, self.graph_version
+    
+    def neighbours(self, agent_id: str) -> Dict[str, int]:
+        """Message counts from ``agent_id`` to each recipient"""
+        with self._lock:
+            return {target: edge.count for target, edge in self.communication_graph.get(agent_id, {}).items()}
+    
     def generate_mermaid_diagram(self) -> str:
         """Generate Mermaid sequence diagram from captured communication"""
         
@@ -81,10 +160,7 @@ class CommunicationCapturingExporter(SpanExporter):
             return "No agent communication captured"
         
         # Sort messages by timestamp
-        all_messages = []
-        for agent_id, messages in self.agent_messages.items():
-            all_messages.extend(messages)
-        
+        all_messages, _ = self.messages_since(0)
         all_messages.sort(key=lambda x: x["timestamp"])
         
         # Build mermaid diagram
@@ -336,8 +412,8 @@ async def demonstrate_real_communication():
     print("📊 CAPTURED OTEL SPAN COMMUNICATION")
     print("="*60)
     
-    print(f"\nTotal spans captured: {len(comm_exporter.captured_spans)}")
-    print(f"Agent messages: {sum(len(msgs) for msgs in comm_exporter.agent_messages.values())}")
+    print(f"\nTotal spans captured: {comm_exporter.span_count}")
+    print(f"Agent messages: {comm_exporter.message_count}")
     
     print("\nMessages by agent:")
     for agent_id, messages in comm_exporter.agent_messages.items():
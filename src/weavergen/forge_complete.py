@@ -9,11 +9,16 @@ This is the core module that ensures EVERYTHING is generated:
 """
 
 import asyncio
+import hashlib
+import os
 import shutil
+import tempfile
+import time
 import yaml
 import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -21,6 +26,44 @@ from .core import WeaverGen, GenerationConfig
 from .models import GenerationResult
 
 
+MANIFEST_FILE = ".forge_manifest.json"
+MANIFEST_VERSION = 1
+# Weaver renders into its own subdirectory with force=True, so it never
+# overwrites files that concurrently running steps write into output_dir
+WEAVER_OUTPUT_DIR = "weaver"
+
+# Generation DAG: each step lists the steps it must run after. Every
+# subsystem is rendered from the parsed semantic groups alone; only the
+# complete system waits, because it writes into the output root and its
+# __init__ imports all the other subsystems.
+FORGE_STEPS: Dict[str, List[str]] = {
+    "generate_4_layer_architecture": [],
+    "generate_pydantic_models": [],
+    "generate_ai_agents": [],
+    "generate_conversation_system": [],
+    "generate_otel_integration": [],
+    "generate_cli_commands": [],
+    "generate_complete_system": [
+        "generate_4_layer_architecture",
+        "generate_pydantic_models",
+        "generate_ai_agents",
+        "generate_conversation_system",
+        "generate_otel_integration",
+        "generate_cli_commands",
+    ],
+}
+
+_GENERATOR_DIGEST: Optional[str] = None
+
+
+def _generator_digest() -> str:
+    """Hash of this module, so template changes invalidate the manifest"""
+    global _GENERATOR_DIGEST
+    if _GENERATOR_DIGEST is None:
+        _GENERATOR_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    return _GENERATOR_DIGEST
+
+
 @dataclass
 class GenerationStep:
     """Result of a generation step"""
@@ -29,6 +72,8 @@ class GenerationStep:
     features: List[str] = field(default_factory=list)
     error: Optional[str] = None
     duration_seconds: float = 0.0
+    cached: bool = False
+    critical_path_seconds: float = 0.0
 
 
 @dataclass
@@ -53,8 +98,10 @@ class CompleteForgeGenerator:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Load semantic conventions
-        with open(semantic_file) as f:
-            self.semantic_data = yaml.safe_load(f)
+        self.semantic_bytes = Path(semantic_file).read_bytes()
+        self.semantic_data = yaml.safe_load(self.semantic_bytes)
+        self.manifest_file = self.output_dir / MANIFEST_FILE
+        self.run_stats: Dict[str, Any] = {}
         
         # Initialize Weaver
         self.weaver = WeaverGen()
@@ -81,10 +128,11 @@ class CompleteForgeGenerator:
             
             # Try Weaver first, but fallback to manual generation if it fails
             weaver_success = False
+            weaver_dir = self.output_dir / WEAVER_OUTPUT_DIR
             try:
                 config = GenerationConfig(
                     registry_url=str(self.semantic_file),
-                    output_dir=self.output_dir,
+                    output_dir=weaver_dir,
                     language=self.language,
                     force=True
                 )
@@ -113,13 +161,15 @@ class CompleteForgeGenerator:
             
             for layer in layers:
                 layer_file = self.output_dir / layer / "forge.py"
-                if not layer_file.exists() or not weaver_success:
+                weaver_file = weaver_dir / layer / "forge.py"
+                if not weaver_success or not weaver_file.exists():
                     # Generate layer manually
                     self._generate_minimal_layer(layer, layer_file)
                     generated_files.append(layer_file)
                     features.append(f"{layer}_layer_generated")
                 else:
                     # Layer exists from Weaver
+                    shutil.copyfile(weaver_file, layer_file)
                     generated_files.append(layer_file)
                     features.append(f"{layer}_layer_weaver")
             
@@ -158,12 +208,12 @@ class CompleteForgeGenerator:
             
             # Write models file
             models_file = models_dir / "generated_models.py"
-            models_file.write_text(models_content)
+            self._write_file(models_file, models_content)
             
             # Generate __init__.py
             init_file = models_dir / "__init__.py"
             init_content = f'"""Generated Pydantic models from {self.semantic_file.name}"""\n\nfrom .generated_models import *\n'
-            init_file.write_text(init_content)
+            self._write_file(init_file, init_content)
             
             duration = (datetime.now() - start_time).total_seconds()
             
@@ -198,21 +248,21 @@ class CompleteForgeGenerator:
             # Generate main agent system
             agent_system_content = self._generate_agent_system_content(agent_roles)
             agent_system_file = agents_dir / "generated_agent_system.py"
-            agent_system_file.write_text(agent_system_content)
+            self._write_file(agent_system_file, agent_system_content)
             generated_files.append(agent_system_file)
             
             # Generate individual agent files
             for role in agent_roles:
                 agent_content = self._generate_individual_agent_content(role)
                 agent_file = agents_dir / f"generated_{role}_agent.py"
-                agent_file.write_text(agent_content)
+                self._write_file(agent_file, agent_content)
                 generated_files.append(agent_file)
                 features.append(f"{role}_agent")
             
             # Generate __init__.py
             init_file = agents_dir / "__init__.py"
             init_content = f'"""Generated AI agents from {self.semantic_file.name}"""\n\nfrom .generated_agent_system import *\n'
-            init_file.write_text(init_content)
+            self._write_file(init_file, init_content)
             generated_files.append(init_file)
             
             duration = (datetime.now() - start_time).total_seconds()
@@ -241,17 +291,17 @@ class CompleteForgeGenerator:
             # Generate conversation orchestrator
             orchestrator_content = self._generate_conversation_orchestrator_content()
             orchestrator_file = conversations_dir / "generated_conversation_system.py"
-            orchestrator_file.write_text(orchestrator_content)
+            self._write_file(orchestrator_file, orchestrator_content)
             
             # Generate conversation models
             models_content = self._generate_conversation_models_content()
             models_file = conversations_dir / "conversation_models.py"
-            models_file.write_text(models_content)
+            self._write_file(models_file, models_content)
             
             # Generate __init__.py
             init_file = conversations_dir / "__init__.py"
             init_content = f'"""Generated conversation system from {self.semantic_file.name}"""\n\nfrom .generated_conversation_system import *\nfrom .conversation_models import *\n'
-            init_file.write_text(init_content)
+            self._write_file(init_file, init_content)
             
             duration = (datetime.now() - start_time).total_seconds()
             
@@ -279,17 +329,17 @@ class CompleteForgeGenerator:
             # Generate OTel instrumentation
             instrumentation_content = self._generate_otel_instrumentation_content()
             instrumentation_file = otel_dir / "generated_instrumentation.py"
-            instrumentation_file.write_text(instrumentation_content)
+            self._write_file(instrumentation_file, instrumentation_content)
             
             # Generate span utilities
             spans_content = self._generate_otel_spans_content()
             spans_file = otel_dir / "generated_spans.py"
-            spans_file.write_text(spans_content)
+            self._write_file(spans_file, spans_content)
             
             # Generate __init__.py
             init_file = otel_dir / "__init__.py"
             init_content = f'"""Generated OTel integration from {self.semantic_file.name}"""\n\nfrom .generated_instrumentation import *\nfrom .generated_spans import *\n'
-            init_file.write_text(init_content)
+            self._write_file(init_file, init_content)
             
             duration = (datetime.now() - start_time).total_seconds()
             
@@ -317,17 +367,17 @@ class CompleteForgeGenerator:
             # Generate CLI module
             cli_content = self._generate_cli_content()
             cli_file = cli_dir / "generated_cli.py"
-            cli_file.write_text(cli_content)
+            self._write_file(cli_file, cli_content)
             
             # Generate entry point
             entry_content = self._generate_cli_entry_content()
             entry_file = cli_dir / "__main__.py"
-            entry_file.write_text(entry_content)
+            self._write_file(entry_file, entry_content)
             
             # Generate __init__.py
             init_file = cli_dir / "__init__.py"
             init_content = f'"""Generated CLI from {self.semantic_file.name}"""\n\nfrom .generated_cli import *\n'
-            init_file.write_text(init_content)
+            self._write_file(init_file, init_content)
             
             duration = (datetime.now() - start_time).total_seconds()
             
@@ -352,17 +402,17 @@ class CompleteForgeGenerator:
             # Generate main system file
             system_content = self._generate_system_integration_content()
             system_file = self.output_dir / "generated_system.py"
-            system_file.write_text(system_content)
+            self._write_file(system_file, system_content)
             
             # Generate configuration
             config_content = self._generate_system_config_content()
             config_file = self.output_dir / "system_config.py"
-            config_file.write_text(config_content)
+            self._write_file(config_file, config_content)
             
             # Generate main __init__.py
             main_init_file = self.output_dir / "__init__.py"
             main_init_content = f'"""Complete generated system from {self.semantic_file.name}"""\n\nfrom .generated_system import *\nfrom .system_config import *\n'
-            main_init_file.write_text(main_init_content)
+            self._write_file(main_init_file, main_init_content)
             
             # Generate analysis system
             analysis_dir = self.output_dir / "analysis"
@@ -370,11 +420,11 @@ class CompleteForgeGenerator:
             
             analyzer_content = self._generate_conversation_analyzer_content()
             analyzer_file = analysis_dir / "generated_conversation_analyzer.py"
-            analyzer_file.write_text(analyzer_content)
+            self._write_file(analyzer_file, analyzer_content)
             
             analysis_init_file = analysis_dir / "__init__.py"
             analysis_init_content = f'"""Generated analysis system from {self.semantic_file.name}"""\n\nfrom .generated_conversation_analyzer import *\n'
-            analysis_init_file.write_text(analysis_init_content)
+            self._write_file(analysis_init_file, analysis_init_content)
             
             duration = (datetime.now() - start_time).total_seconds()
             
@@ -391,6 +441,152 @@ class CompleteForgeGenerator:
                 error=f"Complete system generation failed: {str(e)}"
             )
     
+    # Parallel DAG execution
+    
+    def generate_all(self, steps: Optional[List[str]] = None, max_workers: Optional[int] = None,
+                     use_manifest: bool = True,
+                     on_step_complete: Optional[Callable[[str, GenerationStep], None]] = None
+                     ) -> Dict[str, GenerationStep]:
+        """Run generation steps as a DAG on a worker pool
+        
+        Independent steps run concurrently; dependencies come from FORGE_STEPS
+        (restricted to the requested steps). Steps whose inputs and outputs
+        match the manifest are skipped and reuse their recorded result. After
+        the first failure no new steps start; steps that never ran are
+        reported as failed. Results are returned in the requested order.
+        """
+        steps = list(steps or FORGE_STEPS)
+        unknown = [step for step in steps if step not in FORGE_STEPS]
+        if unknown:
+            raise ValueError(f"Unknown generation steps: {', '.join(unknown)}")
+        
+        deps = {step: [d for d in FORGE_STEPS[step] if d in steps] for step in steps}
+        waiting = {step: len(deps[step]) for step in steps}
+        dependents: Dict[str, List[str]] = {step: [] for step in steps}
+        for step in steps:
+            for dep in deps[step]:
+                dependents[dep].append(step)
+        
+        manifest = self._load_manifest() if use_manifest else {}
+        results: Dict[str, GenerationStep] = {}
+        running: Dict[Future, str] = {}
+        ready = [step for step in steps if not waiting[step]]
+        failed: Optional[str] = None
+        started = time.perf_counter()
+        
+        def finish(step: str, result: GenerationStep) -> None:
+            upstream = max((results[d].critical_path_seconds for d in deps[step]), default=0.0)
+            result.critical_path_seconds = upstream + result.duration_seconds
+            results[step] = result
+            if on_step_complete:
+                on_step_complete(step, result)
+            for dependent in dependents[step]:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    ready.append(dependent)
+        
+        with ThreadPoolExecutor(max_workers=max_workers or min(len(steps), (os.cpu_count() or 1) + 4)) as pool:
+            while ready or running:
+                while ready and failed is None:
+                    step = ready.pop(0)
+                    cached = self._cached_step(manifest, step) if use_manifest else None
+                    if cached is not None:
+                        finish(step, cached)
+                    else:
+                        running[pool.submit(getattr(self, step))] = step
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = GenerationStep(success=False, error=f"{step} failed: {e}")
+                    if result.success:
+                        if use_manifest:
+                            self._record_step(manifest, step, result)
+                    elif failed is None:
+                        failed = step
+                    finish(step, result)
+        
+        for step in steps:
+            if step not in results:
+                results[step] = GenerationStep(success=False, error=f"Not run: {failed} failed")
+        
+        if use_manifest:
+            self._save_manifest(manifest)
+        self.run_stats = {
+            "wall_seconds": time.perf_counter() - started,
+            "critical_path_seconds": max((r.critical_path_seconds for r in results.values()), default=0.0),
+            "cached_steps": sum(1 for r in results.values() if r.cached),
+        }
+        return {step: results[step] for step in steps}
+    
+    def _step_key(self, step: str) -> str:
+        """Hash of everything a step's output depends on"""
+        digest = hashlib.sha256()
+        for part in (str(MANIFEST_VERSION), step, self.language, self.llm_model,
+                     self.semantic_file.name, _generator_digest()):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(self.semantic_bytes)
+        return digest.hexdigest()
+    
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            manifest = json.loads(self.manifest_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        return manifest.get("steps", {}) if manifest.get("version") == MANIFEST_VERSION else {}
+    
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "steps": manifest}, f, indent=2)
+        os.replace(tmp, self.manifest_file)
+    
+    def _cached_step(self, manifest: Dict[str, Any], step: str) -> Optional[GenerationStep]:
+        """Recorded result of ``step`` if its key matches and its files are untouched"""
+        entry = manifest.get(step)
+        if not entry or entry.get("key") != self._step_key(step):
+            return None
+        for path, (size, mtime_ns) in entry["files"].items():
+            try:
+                stat = Path(path).stat()
+            except OSError:
+                return None
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                return None
+        return GenerationStep(
+            success=True,
+            files=[Path(path) for path in entry["files"]],
+            features=entry["features"],
+            cached=True
+        )
+    
+    def _record_step(self, manifest: Dict[str, Any], step: str, result: GenerationStep) -> None:
+        files = {}
+        for path in result.files:
+            stat = Path(path).stat()
+            files[str(path)] = [stat.st_size, stat.st_mtime_ns]
+        manifest[step] = {
+            "key": self._step_key(step),
+            "files": files,
+            "features": result.features,
+            "duration_seconds": result.duration_seconds
+        }
+    
+    def _write_file(self, path: Path, content: str) -> None:
+        """Write generated content, leaving the file untouched if it is unchanged"""
+        data = content.encode("utf-8")
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                return
+        except OSError:
+            pass
+        path.write_bytes(data)
+    
     def validate_complete_system(self) -> CompleteValidationResult:
         """Validate that all generated components work together"""
         try:
@@ -468,7 +664,7 @@ def {layer_name}_operation(operation_name: str, **kwargs) -> Dict[str, Any]:
         
         return {{"success": True, "layer": "{layer_name}", "operation": operation_name}}
 '''
-        layer_file.write_text(content)
+        self._write_file(layer_file, content)
     
     def _generate_pydantic_models_content(self, groups: List[Dict[str, Any]]) -> str:
         """Generate Pydantic models from semantic groups"""
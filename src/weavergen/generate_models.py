@@ -4,13 +4,31 @@ Generate Pydantic models from semantic conventions using Weaver.
 This is the core of the working loop.
 """
 
+import filecmp
+import hashlib
+import itertools
+import json
+import os
+import queue
+import select
+import shutil
 import subprocess
+import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import yaml
 import black
 from rich.console import Console
+from rich.markup import escape
+
+try:
+    import fcntl
+except ImportError:  # Windows: promotion is still per-file atomic, just unlocked
+    fcntl = None
 
 try:
     # When imported as module
@@ -23,24 +41,170 @@ except ImportError:
 
 console = Console()
 
+STAGING_PREFIX = ".weavergen-staging-"
+# Lock and format cache live in <parent>/.weavergen/<output name>/, so the
+# output directory only ever holds generated files
+STATE_DIR = ".weavergen"
+FORMAT_CACHE = "format-cache.json"
+OUTPUT_LOCK = "output.lock"
+# Below this many files a process pool costs more than it saves
+PARALLEL_FORMAT_MIN_FILES = 4
 
-def create_temp_registry(semantic_yaml: Path) -> Path:
-    """Create a temporary registry structure for Weaver."""
-    temp_dir = Path.cwd() / "temp_registry"
-    if temp_dir.exists():
-        import shutil
-        shutil.rmtree(temp_dir)
-        
-    registry_dir = temp_dir
-    registry_dir.mkdir(parents=True)
+
+def _content_hash(content: str) -> str:
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def create_temp_registry(semantic_yaml: Path, staging_root: Optional[Path] = None) -> Path:
+    """Create a private registry directory for Weaver; the caller removes it."""
+    registry_dir = Path(tempfile.mkdtemp(prefix="weavergen-registry-", dir=staging_root))
     
     # Create registry structure - just put the file directly in the registry
-    target = registry_dir / semantic_yaml.name
-    target.write_text(semantic_yaml.read_text())
+    shutil.copyfile(semantic_yaml, registry_dir / semantic_yaml.name)
     
     return registry_dir
 
 
+class StagingWorkspace:
+    """Per-run scratch directory that generation writes into before promotion.
+    
+    It lives next to the output directory so promoting a file is a rename on
+    the same filesystem, and concurrent runs never share scratch space.
+    """
+    
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.output_dir.parent.mkdir(parents=True, exist_ok=True)
+        self.root = Path(tempfile.mkdtemp(
+            prefix=f"{STAGING_PREFIX}{self.output_dir.name}-", dir=self.output_dir.parent
+        ))
+        self.output = self.root / "output"
+    
+    def __enter__(self) -> "StagingWorkspace":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def _state_dir(output_dir: Path) -> Path:
+    """Generator state for ``output_dir``, kept outside of it."""
+    return output_dir.parent / STATE_DIR / output_dir.name
+
+
+@contextmanager
+def _output_lock(output_dir: Path) -> Iterator[None]:
+    """Serialize promotions into one output directory across processes."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+    state_dir = _state_dir(output_dir)
+    state_dir.mkdir(parents=True, exist_ok=True)
+    with open(state_dir / OUTPUT_LOCK, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _load_format_cache(output_dir: Path) -> Dict[str, Dict[str, str]]:
+    try:
+        return json.loads((_state_dir(output_dir) / FORMAT_CACHE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _format_source(content: str) -> Tuple[Optional[str], Optional[str]]:
+    """Run black on one source string; returns (formatted, error)."""
+    try:
+        return black.format_str(content, mode=black.Mode()), None
+    except Exception as e:
+        return None, str(e)
+
+
+def format_staged_files(staged_dir: Path, output_dir: Path, relpaths: List[Path],
+                        workers: Optional[int] = None) -> Tuple[Dict[str, Dict[str, str]], int, int]:
+    """Black-format staged Python files in parallel.
+    
+    A file whose generated content hashes the same as last run, and whose
+    promoted copy is still the formatted result, reuses that copy instead of
+    being formatted again. Returns (cache updates, formatted, skipped).
+    """
+    cache = _load_format_cache(output_dir)
+    updates: Dict[str, Dict[str, str]] = {}
+    pending: List[Tuple[str, str, str]] = []  # (relpath, content, source hash)
+    skipped = 0
+    
+    for rel in relpaths:
+        if rel.suffix != ".py":
+            continue
+        key = rel.as_posix()
+        staged = staged_dir / rel
+        content = staged.read_text()
+        source_hash = _content_hash(content)
+        entry = cache.get(key)
+        target = output_dir / rel
+        if entry and entry.get("source") == source_hash and target.is_file():
+            previous = target.read_text()
+            if _content_hash(previous) == entry.get("formatted"):
+                staged.write_text(previous)
+                updates[key] = entry
+                skipped += 1
+                continue
+        pending.append((key, content, source_hash))
+    
+    workers = workers or os.cpu_count() or 1
+    contents = [content for _, content, _ in pending]
+    if workers > 1 and len(pending) >= PARALLEL_FORMAT_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            outcomes = list(pool.map(_format_source, contents,
+                                     chunksize=max(1, len(pending) // (workers * 4))))
+    else:
+        outcomes = [_format_source(content) for content in contents]
+    
+    formatted_count = 0
+    for (key, _, source_hash), (formatted, error) in zip(pending, outcomes):
+        if formatted is None:
+            console.print(f"[yellow]Warning: Could not format {escape(key)}: {escape(error)}[/yellow]")
+            continue
+        (staged_dir / key).write_text(formatted)
+        updates[key] = {"source": source_hash, "formatted": _content_hash(formatted)}
+        formatted_count += 1
+    
+    return updates, formatted_count, skipped
+
+
+def promote_staged_files(staged_dir: Path, output_dir: Path, relpaths: List[Path],
+                         format_updates: Optional[Dict[str, Dict[str, str]]] = None) -> int:
+    """Move staged files into the output directory; returns how many changed.
+    
+    Each file is swapped in with os.replace, so readers see either the old or
+    the new file, never a partial one. Identical files are left untouched to
+    keep their mtimes, and the whole promotion holds the output lock.
+    """
+    promoted = 0
+    with _output_lock(output_dir):
+        for rel in relpaths:
+            source, target = staged_dir / rel, output_dir / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.is_file() and filecmp.cmp(source, target, shallow=False):
+                continue
+            os.replace(source, target)
+            promoted += 1
+        
+        if format_updates:
+            cache = _load_format_cache(output_dir)
+            cache.update(format_updates)
+            state_dir = _state_dir(output_dir)
+            state_dir.mkdir(parents=True, exist_ok=True)
+            tmp = state_dir / f"{FORMAT_CACHE}.{os.getpid()}.tmp"
+            tmp.write_text(json.dumps(cache, indent=2, sort_keys=True))
+            os.replace(tmp, state_dir / FORMAT_CACHE)
+    return promoted
+
+
 def generate_pydantic_models(
     semantic_yaml: Path,
     output_dir: Path,
@@ -50,86 +214,366 @@ def generate_pydantic_models(
     
     console.print(f"[blue]Generating Pydantic models from {semantic_yaml}[/blue]")
     
-    # Create temporary registry
+    output_dir = Path(output_dir)
+    
+    # Every run stages into its own workspace, so concurrent runs can't collide
     try:
-        # If it's already a registry, use it directly
-        if (semantic_yaml.parent.name == "groups" and 
-            (semantic_yaml.parent.parent / "manifest.yaml").exists()):
-            registry_path = semantic_yaml.parent.parent
-            console.print("[green]Using existing registry structure[/green]")
-        else:
-            registry_path = create_temp_registry(semantic_yaml)
-            console.print("[green]Created temporary registry[/green]")
-        
-        # Get template directory
-        template_dir = Path(__file__).parent.parent.parent / "templates"
-        if not template_dir.exists():
-            raise FileNotFoundError(f"Template directory not found: {template_dir}")
-        
-        # Create config
-        config = GenerationConfig(
-            registry_url=str(registry_path),
-            output_dir=output_dir,
-            language="pydantic",  # Our custom target
-            template_dir=template_dir,
-            force=True,
-            verbose=True
-        )
-        
-        # Configure Weaver with our config
-        weaver = WeaverGen(config=config)
-        if weaver_path:
-            weaver._weaver_config.weaver_path = weaver_path
-        
-        # Generate using Weaver
-        console.print("[blue]Running Weaver Forge...[/blue]")
-        result = weaver.generate()
-        
-        if result.success:
-            # Format generated Python files with black
-            for file_info in result.files:
-                if file_info.path.suffix == ".py":
-                    try:
-                        console.print(f"[blue]Formatting {file_info.path}[/blue]")
-                        content = file_info.path.read_text()
-                        formatted = black.format_str(content, mode=black.Mode())
-                        file_info.path.write_text(formatted)
-                    except Exception as e:
-                        console.print(f"[yellow]Warning: Could not format {file_info.path}: {e}[/yellow]")
-            
-            console.print(f"[green]✅ Generated {len(result.files)} files[/green]")
-        else:
-            console.print(f"[red]❌ Generation failed: {str(result.error).replace('[', '\\[').replace(']', '\\]')}[/red]")
-        
-        return result
-        
+        with StagingWorkspace(output_dir) as workspace:
+            return _generate_staged(semantic_yaml, output_dir, workspace, weaver_path)
     except Exception as e:
-        console.print(f"[red]Error: {str(e).replace('[', '\\[').replace(']', '\\]')}[/red]")
+        console.print(f"[red]Error: {escape(str(e))}[/red]")
         return GenerationResult(
             success=False,
             error=str(e)
         )
 
 
-def validate_generated_models(model_file: Path) -> bool:
-    """Validate that generated models can be imported."""
+def _generate_staged(
+    semantic_yaml: Path,
+    output_dir: Path,
+    workspace: StagingWorkspace,
+    weaver_path: Optional[Path] = None
+) -> GenerationResult:
+    """Generate into the staging workspace, format, then promote to output_dir."""
+    # If it's already a registry, use it directly
+    if (semantic_yaml.parent.name == "groups" and 
+        (semantic_yaml.parent.parent / "manifest.yaml").exists()):
+        registry_path = semantic_yaml.parent.parent
+        console.print("[green]Using existing registry structure[/green]")
+    else:
+        registry_path = create_temp_registry(semantic_yaml, staging_root=workspace.root)
+        console.print("[green]Created temporary registry[/green]")
+    
+    # Get template directory
+    template_dir = Path(__file__).parent.parent.parent / "templates"
+    if not template_dir.exists():
+        raise FileNotFoundError(f"Template directory not found: {template_dir}")
+    
+    # Create config
+    config = GenerationConfig(
+        registry_url=str(registry_path),
+        output_dir=workspace.output,
+        language="pydantic",  # Our custom target
+        template_dir=template_dir,
+        force=True,
+        verbose=True
+    )
+    
+    # Configure Weaver with our config
+    weaver = WeaverGen(config=config)
+    if weaver_path:
+        weaver._weaver_config.weaver_path = weaver_path
+    
+    # Generate using Weaver
+    console.print("[blue]Running Weaver Forge...[/blue]")
+    result = weaver.generate()
+    
+    if not result.success:
+        console.print(f"[red]❌ Generation failed: {escape(str(result.error))}[/red]")
+        return result
+    
+    # Format generated Python files with black, then promote
+    relpaths = [file_info.path.relative_to(workspace.output) for file_info in result.files]
+    format_updates, formatted, skipped = format_staged_files(workspace.output, output_dir, relpaths)
+    console.print(f"[blue]Formatted {formatted} files ({skipped} unchanged, skipped)[/blue]")
+    
+    promoted = promote_staged_files(workspace.output, output_dir, relpaths, format_updates)
+    for file_info, rel in zip(result.files, relpaths):
+        file_info.path = output_dir / rel
+        file_info.size = file_info.path.stat().st_size
+    
+    console.print(f"[green]✅ Generated {len(result.files)} files ({promoted} updated)[/green]")
+    return result
+
+
+# ============================================================================
+# Sandboxed validation of generated modules
+# ============================================================================
+
+VALIDATION_TIMEOUT = 30.0
+VALIDATION_CACHE = Path.home() / ".weavergen" / "cache" / "model-validation.json"
+# Imported once per worker so each import-check only pays for the module itself
+PREWARM_MODULES = ("typing", "enum", "datetime", "dataclasses", "pydantic")
+
+# Runs in each worker subprocess. Requests and replies are JSON lines; the
+# module's own stdout is redirected to stderr so it can't corrupt replies.
+_WORKER_SOURCE = r"""
+import importlib.util, json, os, sys, time, traceback
+reply_stream = os.fdopen(os.dup(1), "w", buffering=1)
+os.dup2(2, 1)
+for name in sys.argv[1:]:
     try:
-        # Try to import the module
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("generated_models", model_file)
+        __import__(name)
+    except Exception:
+        pass
+if "pydantic" in sys.modules:
+    # Building one model loads pydantic's lazily imported schema machinery
+    type("_Warmup", (sys.modules["pydantic"].BaseModel,), {"__annotations__": {"x": int}})
+reply_stream.write("ready\n")
+for line in sys.stdin:
+    request = json.loads(line)
+    name = "weavergen_generated_%d" % request["id"]
+    start = time.perf_counter()
+    try:
+        spec = importlib.util.spec_from_file_location(name, request["path"])
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
+        reply = {"ok": True, "models": sorted(
+            n for n in dir(module) if n.endswith("Model") or n.endswith("Output"))}
+    except BaseException as e:
+        reply = {"ok": False, "error": "%s: %s" % (type(e).__name__, e),
+                 "error_type": type(e).__name__, "traceback": traceback.format_exc(limit=5)}
+    finally:
+        sys.modules.pop(name, None)
+    reply["duration_ms"] = (time.perf_counter() - start) * 1000
+    reply_stream.write(json.dumps(reply) + "\n")
+"""
+
+
+@dataclass
+class ModelValidationResult:
+    """Outcome of import-checking one generated module."""
+    path: Path
+    ok: bool
+    models: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    traceback: Optional[str] = None
+    duration_ms: float = 0.0
+    cached: bool = False
+
+
+class _Worker:
+    """One pre-warmed interpreter that import-checks modules on request."""
+    
+    def __init__(self, prewarm: Tuple[str, ...]):
+        self.process = subprocess.Popen(
+            [sys.executable, "-c", _WORKER_SOURCE, *prewarm],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, bufsize=1,
+        )
+        self.tasks = 0
+        self.ready = False
+    
+    def wait_ready(self, timeout: float) -> None:
+        if not self.ready:
+            if self._readline(timeout) != "ready":
+                raise RuntimeError("validation worker failed to start")
+            self.ready = True
+    
+    def _readline(self, timeout: float) -> Optional[str]:
+        """Next reply line, "" at EOF, or None on timeout."""
+        stream = self.process.stdout
+        if os.name != "nt":
+            readable, _, _ = select.select([stream], [], [], timeout)
+            if not readable:
+                return None
+        return stream.readline().strip()
+    
+    def check(self, request_id: int, path: Path, timeout: float) -> Dict:
+        self.tasks += 1
+        self.process.stdin.write(json.dumps({"id": request_id, "path": str(path)}) + "\n")
+        self.process.stdin.flush()
+        line = self._readline(timeout)
+        if line is None:
+            raise TimeoutError(f"import did not finish within {timeout:.0f}s")
+        if not line:
+            try:
+                code = self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                code = "unknown"
+            raise RuntimeError(f"validation worker exited with code {code}")
+        return json.loads(line)
+    
+    def close(self) -> None:
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class ModelValidatorPool:
+    """Pool of pre-warmed worker subprocesses that import-check modules.
+    
+    Imports never touch this interpreter's sys.modules. A module that hangs,
+    exits or crashes its worker fails on its own; the worker is replaced and
+    the rest of the batch carries on. Workers are recycled after
+    ``max_tasks_per_worker`` imports to bound state leaking between modules.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, timeout: float = VALIDATION_TIMEOUT,
+                 max_tasks_per_worker: int = 200, prewarm: Tuple[str, ...] = PREWARM_MODULES):
+        self.size = max(1, workers or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.prewarm = prewarm
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._next_id = itertools.count()
+        # Start all interpreters at once so their warm-up overlaps
+        workers_started = [_Worker(prewarm) for _ in range(self.size)]
+        for worker in workers_started:
+            self._idle.put(worker)
+    
+    def __enter__(self) -> "ModelValidatorPool":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def _check(self, path: Path) -> ModelValidationResult:
+        worker = self._idle.get()
+        try:
+            worker.wait_ready(self.timeout)
+            reply = worker.check(next(self._next_id), path, self.timeout)
+        except (RuntimeError, TimeoutError, OSError, ValueError) as e:
+            worker.close()
+            worker = _Worker(self.prewarm)
+            return ModelValidationResult(path=path, ok=False, error=str(e),
+                                         error_type=type(e).__name__)
+        finally:
+            if worker.tasks >= self.max_tasks_per_worker:
+                worker.close()
+                worker = _Worker(self.prewarm)
+            self._idle.put(worker)
         
-        console.print(f"[green]✅ Models validated successfully[/green]")
-        
-        # List available models
-        models = [name for name in dir(module) if name.endswith("Model") or name.endswith("Output")]
-        console.print(f"[blue]Available models: {', '.join(models)}[/blue]")
+        return ModelValidationResult(
+            path=path,
+            ok=reply["ok"],
+            models=reply.get("models", []),
+            error=reply.get("error"),
+            error_type=reply.get("error_type"),
+            traceback=reply.get("traceback"),
+            duration_ms=reply.get("duration_ms", 0.0),
+        )
+    
+    def validate(self, files: List[Path]) -> List[ModelValidationResult]:
+        """Import-check files in parallel; results are in input order."""
+        if not files:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.size, len(files))) as executor:
+            return list(executor.map(self._check, files))
+    
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _validation_environment() -> str:
+    try:
+        from importlib.metadata import version
+        pydantic_version = version("pydantic")
+    except Exception:
+        pydantic_version = "unknown"
+    return f"{sys.executable}|{sys.version}|pydantic {pydantic_version}"
+
+
+def _output_set_digest(directory: Path) -> bytes:
+    """Digest of every module in one output directory.
+    
+    Generated modules import their siblings, so a cached result is only
+    valid while the rest of the output set is unchanged too.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for sibling in sorted(directory.glob("*.py")):
+        try:
+            content = sibling.read_bytes()
+        except OSError:
+            continue
+        digest.update(sibling.name.encode() + b"\0")
+        digest.update(hashlib.blake2b(content, digest_size=16).digest())
+    return digest.digest()
+
+
+def validate_model_files(
+    files: List[Path],
+    workers: Optional[int] = None,
+    timeout: float = VALIDATION_TIMEOUT,
+    cache_file: Optional[Path] = VALIDATION_CACHE,
+    pool: Optional[ModelValidatorPool] = None,
+) -> List[ModelValidationResult]:
+    """Import-check generated modules in isolated workers.
+    
+    Results are cached by file content hash, the hashes of the other
+    modules in the same output directory and the interpreter/pydantic
+    version, so unchanged files are not imported again.
+    """
+    files = [Path(f) for f in files]
+    cache: Dict[str, Dict] = {}
+    if cache_file:
+        try:
+            cache = json.loads(Path(cache_file).read_text())
+        except (OSError, ValueError):
+            cache = {}
+    
+    environment = _validation_environment().encode()
+    output_sets: Dict[Path, bytes] = {}
+    results: List[Optional[ModelValidationResult]] = [None] * len(files)
+    misses: List[Tuple[int, str]] = []
+    for index, path in enumerate(files):
+        directory = path.parent
+        if directory not in output_sets:
+            output_sets[directory] = _output_set_digest(directory)
+        try:
+            key = hashlib.blake2b(path.read_bytes() + output_sets[directory] + environment,
+                                  digest_size=16).hexdigest()
+        except OSError as e:
+            results[index] = ModelValidationResult(path=path, ok=False, error=str(e),
+                                                   error_type=type(e).__name__)
+            continue
+        hit = cache.get(key)
+        if hit is not None:
+            results[index] = ModelValidationResult(path=path, cached=True, **hit)
+        else:
+            misses.append((index, key))
+    
+    if misses:
+        owned = pool is None
+        pool = pool or ModelValidatorPool(workers=min(workers or os.cpu_count() or 1, len(misses)),
+                                          timeout=timeout)
+        try:
+            checked = pool.validate([files[index] for index, _ in misses])
+        finally:
+            if owned:
+                pool.close()
+        for (index, key), result in zip(misses, checked):
+            results[index] = result
+            # Timeouts and crashed workers may be transient; don't cache them
+            if result.ok or result.error_type not in ("TimeoutError", "RuntimeError"):
+                entry = asdict(result)
+                for transient in ("path", "cached"):
+                    entry.pop(transient)
+                cache[key] = entry
         
-        return True
-    except Exception as e:
-        console.print(f"[red]❌ Validation failed: {e}[/red]")
+        if cache_file:
+            cache_path = Path(cache_file)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(cache))
+            os.replace(tmp, cache_path)
+    
+    return results
+
+
+def validate_generated_models(model_file: Path) -> bool:
+    """Validate that generated models can be imported."""
+    result = validate_model_files([model_file], workers=1)[0]
+    if not result.ok:
+        console.print(f"[red]❌ Validation failed: {escape(str(result.error))}[/red]")
         return False
+    
+    console.print(f"[green]✅ Models validated successfully[/green]")
+    
+    # List available models
+    console.print(f"[blue]Available models: {', '.join(result.models)}[/blue]")
+    
+    return True
 
 
 if __name__ == "__main__":
@@ -35,6 +35,8 @@ __all__ = [
     "WeaverRuntime",
     "TemplateEngine",
     "ValidationEngine",
+    "ProcessManager",
+    "RuntimeFactory",
     "ExecutionContext",
     
     # Contracts Layer
@@ -302,6 +302,7 @@ class ExecutionContext(BaseModel):
     dry_run: bool = Field(default=False)
     parallel_execution: bool = Field(default=True)
     max_workers: int = Field(default=4)
+    timeout_seconds: Optional[float] = Field(default=None, description="Per-request timeout; None waits indefinitely")
 
 
 class ExecutionResult(BaseContract):
@@ -64,7 +64,7 @@ except ImportError:
         OK = "OK"
         ERROR = "ERROR"
     
-    trace = type('MockTrace', (), {'set_span_in_context': lambda x: None})()
+    trace = type('MockTrace', (), {'set_span_in_context': staticmethod(lambda span: None)})()
     Status = MockStatus
     StatusCode = MockStatusCode()
     SERVICE_NAME = "service.name"
@@ -2,30 +2,199 @@
 Runtime Layer - Execution Engine and Process Management
 
 This layer handles the actual execution of operations, process management,
-resource allocation, and low-level system interactions. It provides the 
+resource allocation, and low-level system interactions. It provides the
 execution environment for the Operations layer.
+
+Template rendering and file I/O run on the runtime's bounded thread pool
+(``WeaverRuntime.get_executor``); external commands run through the shared
+``AsyncProcessRunner``. Each request honours the timeout of its
+``ExecutionContext`` and can be cancelled by session id.
 """
 
+import ast
 import asyncio
+import hashlib
+import logging
 import os
+import re
+import shutil
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
 
 import jinja2
+import jinja2.meta
+import pydantic
 import yaml
 
+from ..async_process import AsyncProcessRunner, get_process_runner
 from .contracts import (
     ExecutionContext, ExecutionResult, ExecutionStatus,
     GenerationRequest, GenerationResult, GeneratedFile,
     ValidationRequest, ValidationResult, ValidationError,
     TemplateManifest, TemplateConfig, WeaverConfig,
-    TargetLanguage, ValidationLevel,
+    TargetLanguage, TemplateType, ValidationLevel, SemanticConvention, AttributeType,
     IExecutable, IConfigurable
 )
 
+logger = logging.getLogger(__name__)
+
+BUILTIN_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+TEMPLATE_SUFFIXES = (".j2", ".jinja", ".jinja2")
+SEMANTIC_SUFFIXES = (".yaml", ".yml")
+
+LANGUAGE_EXTENSIONS = {
+    TargetLanguage.PYTHON: ".py",
+    TargetLanguage.TYPESCRIPT: ".ts",
+    TargetLanguage.JAVASCRIPT: ".js",
+    TargetLanguage.GO: ".go",
+    TargetLanguage.JAVA: ".java",
+    TargetLanguage.CSHARP: ".cs",
+    TargetLanguage.RUST: ".rs",
+    TargetLanguage.CPP: ".cpp",
+}
+EXTENSION_LANGUAGES = {ext: language for language, ext in LANGUAGE_EXTENSIONS.items()}
+
+WEAVER_SEARCH_PATHS = (
+    Path.home() / ".cargo" / "bin" / "weaver",
+    Path("/usr/local/bin/weaver"),
+    Path("/opt/homebrew/bin/weaver"),
+)
+
+PYTHON_TYPES = {
+    "string": "str",
+    "int": "int",
+    "double": "float",
+    "boolean": "bool",
+    "string[]": "List[str]",
+    "int[]": "List[int]",
+    "double[]": "List[float]",
+    "boolean[]": "List[bool]",
+}
+
+BUILTIN_RULES = {
+    "semantic": ["groups_present", "group_fields", "unique_group_ids", "attribute_fields"],
+    "semantic_strict": ["attribute_brief", "attribute_requirement_level", "attribute_type"],
+    "semantic_pedantic": ["group_stability"],
+    "code": ["syntax"],
+    "template": ["template_syntax"],
+}
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _words(value: Any) -> List[str]:
+    return [word for word in re.split(r"[^0-9A-Za-z]+|(?<=[a-z0-9])(?=[A-Z])", str(value)) if word]
+
+
+def pascal_case(value: Any) -> str:
+    return "".join(word[:1].upper() + word[1:] for word in _words(value))
+
+
+def camel_case(value: Any) -> str:
+    pascal = pascal_case(value)
+    return pascal[:1].lower() + pascal[1:]
+
+
+def snake_case(value: Any) -> str:
+    return "_".join(word.lower() for word in _words(value))
+
+
+def python_type(value: Any) -> str:
+    return PYTHON_TYPES.get(str(value), "Any")
+
+
+TEMPLATE_FILTERS = {
+    "pascal_case": pascal_case,
+    "camel_case": camel_case,
+    "snake_case": snake_case,
+    "python_type": python_type,
+}
+
+
+# Weaver binaries found per PATH value; misses are not cached, so a weaver
+# installed while the process runs is picked up by the next lookup
+_WEAVER_HITS: Dict[str, Path] = {}
+
+
+def _search_weaver(search_path: str) -> Optional[Path]:
+    if search_path in _WEAVER_HITS:
+        return _WEAVER_HITS[search_path]
+    found = shutil.which("weaver", path=search_path)
+    if found:
+        _WEAVER_HITS[search_path] = Path(found)
+        return _WEAVER_HITS[search_path]
+    for candidate in WEAVER_SEARCH_PATHS:
+        if candidate.is_file() and os.access(candidate, os.X_OK):
+            _WEAVER_HITS[search_path] = candidate
+            return candidate
+    return None
+
+
+def find_weaver_binary(configured: Optional[Path] = None) -> Optional[Path]:
+    """Locate the Weaver binary, preferring ``configured`` when it exists.
+    
+    A successful PATH search is cached per PATH value, so repeated runtimes
+    in one process only search once.
+    """
+    if configured is not None and Path(configured).is_file():
+        return Path(configured)
+    return _search_weaver(os.environ.get("PATH", os.defpath))
+
+
+def _updated_config(config: WeaverConfig, changes: Dict[str, Any]) -> WeaverConfig:
+    """Validated copy of ``config`` with ``changes`` applied."""
+    return WeaverConfig(**{**config.model_dump(), **changes})
+
+
+async def _run_blocking(executor_provider: Optional[Callable[[], Executor]],
+                        func: Callable[..., Any], *args: Any) -> Any:
+    executor = executor_provider() if executor_provider else None
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
+
+
+def _validation_result(errors: List[ValidationError], warnings: List[ValidationError],
+                       started: float, info: Optional[List[ValidationError]] = None) -> ValidationResult:
+    return ValidationResult(
+        request_id=uuid4(),
+        is_valid=not errors,
+        errors=errors,
+        warnings=warnings,
+        info=info or [],
+        execution_time_ms=_elapsed_ms(started),
+    )
+
+
+class AbandonFlag:
+    """Set when a generation request stops waiting for its files.
+    
+    Workers check the flag and write under ``lock``, so once ``set`` returns
+    no further file is written for the request.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._set = False
+    
+    def set(self) -> None:
+        with self.lock:
+            self._set = True
+    
+    def is_set(self) -> bool:
+        return self._set
+
 
 # ============================================================================
 # Core Runtime Components
@@ -37,35 +206,198 @@ class WeaverRuntime(IConfigurable):
     def __init__(self, config: Optional[WeaverConfig] = None):
         """Initialize the runtime with configuration."""
         self.config = config or WeaverConfig()
-        self.template_engine = TemplateEngine(self.config)
-        self.validation_engine = ValidationEngine(self.config)
+        self._executor = None
+        self.template_engine = TemplateEngine(self.config, self.get_executor)
+        self.validation_engine = ValidationEngine(self.config, self.get_executor)
         self.process_manager = ProcessManager(self.config)
         self.resource_manager = ResourceManager(self.config)
-        self._executor = None
-        
+        self._active: Dict[UUID, Set[asyncio.Task]] = {}
+        self._cancel_requested: Set[UUID] = set()
+    
     def configure(self, config: Dict[str, Any]) -> None:
         """Configure the runtime with given configuration."""
-        raise NotImplementedError("Runtime configuration not implemented")
+        self.config = _updated_config(self.config, config)
+        for component in (self.template_engine, self.validation_engine, self.process_manager):
+            component.configure(config)
+        if "max_workers" in config and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     async def startup(self) -> None:
         """Start the runtime and initialize components."""
-        raise NotImplementedError("Runtime startup not implemented")
+        await self.template_engine.initialize()
+        await _run_blocking(self.get_executor, self.process_manager.discover_weaver_binary)
     
     async def shutdown(self) -> None:
         """Shutdown the runtime and cleanup resources."""
-        raise NotImplementedError("Runtime shutdown not implemented")
+        for session_id in list(self._active):
+            self.cancel(session_id)
+        pending = [task for tasks in self._active.values() for task in tasks]
+        await asyncio.gather(*pending, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def cancel(self, session_id: UUID) -> bool:
+        """Cancel every running request of a session; True if any was running."""
+        tasks = self._active.get(session_id)
+        if not tasks:
+            return False
+        self._cancel_requested.add(session_id)
+        for task in tasks:
+            task.cancel()
+        return True
+    
+    async def _supervise(self, context: ExecutionContext, work: Awaitable[Any]) -> Tuple[Any, Optional[ExecutionStatus]]:
+        """Await ``work`` under the context's timeout as a task ``cancel`` can reach.
+        
+        Returns the work's result and None, or None and FAILED on timeout,
+        CANCELLED when cancelled through ``cancel``. Cancelling the caller
+        still propagates.
+        """
+        task = asyncio.ensure_future(work)
+        tasks = self._active.setdefault(context.session_id, set())
+        tasks.add(task)
+        try:
+            return await asyncio.wait_for(task, context.timeout_seconds), None
+        except asyncio.TimeoutError:
+            return None, ExecutionStatus.FAILED
+        except asyncio.CancelledError:
+            if not task.cancelled() or context.session_id not in self._cancel_requested:
+                raise
+            return None, ExecutionStatus.CANCELLED
+        finally:
+            tasks.discard(task)
+            if not tasks:
+                self._active.pop(context.session_id, None)
+                self._cancel_requested.discard(context.session_id)
+    
+    def _concurrency(self, context: ExecutionContext) -> int:
+        if not (context.parallel_execution and self.config.parallel_execution):
+            return 1
+        return max(1, min(context.max_workers, self.config.max_workers))
+    
+    def _resolve(self, path: Path, context: ExecutionContext) -> Path:
+        path = Path(path)
+        return path if path.is_absolute() else context.working_directory / path
     
     async def execute_generation(self, request: GenerationRequest, context: ExecutionContext) -> GenerationResult:
-        """Execute a code generation request."""
-        raise NotImplementedError("Generation execution not implemented")
+        """Execute a code generation request.
+        
+        Every (language, template) pair renders on the thread pool, at most
+        ``context.max_workers`` at a time. On timeout or cancellation the
+        files finished so far are reported and no further files are written.
+        """
+        started = time.perf_counter()
+        files: List[GeneratedFile] = []
+        errors: List[str] = []
+        templates_used: List[str] = []
+        abandoned = AbandonFlag()
+        
+        try:
+            _, interrupted = await self._supervise(
+                context, self._generate(request, context, files, errors, templates_used, abandoned)
+            )
+        finally:
+            abandoned.set()
+        
+        if interrupted is ExecutionStatus.CANCELLED:
+            status = ExecutionStatus.CANCELLED
+            errors.append("Generation cancelled")
+        elif interrupted is not None:
+            status = ExecutionStatus.FAILED
+            errors.append(f"Generation timed out after {context.timeout_seconds}s")
+        else:
+            status = ExecutionStatus.FAILED if errors else ExecutionStatus.SUCCESS
+        
+        return GenerationResult(
+            request_id=request.id,
+            status=status,
+            generated_files=sorted(files, key=lambda f: str(f.path)),
+            errors=errors,
+            execution_time_ms=_elapsed_ms(started),
+            templates_used=templates_used,
+        )
+    
+    async def _generate(self, request: GenerationRequest, context: ExecutionContext,
+                        files: List[GeneratedFile], errors: List[str],
+                        templates_used: List[str], abandoned: AbandonFlag) -> None:
+        engine = self.template_engine
+        if not engine.initialized:
+            await engine.initialize()
+        
+        output_dir = self._resolve(request.output_directory, context)
+        semantic = request.semantic_convention.model_dump(mode="json")
+        jobs = []
+        for language in request.target_languages:
+            override = request.template_overrides.get(language.value)
+            names = [override] if override else engine.templates_for(language)
+            if not names:
+                errors.append(f"No templates found for {language.value}")
+                continue
+            variables = {**request.variables, "semantic": semantic,
+                         "language": language.value, "options": request.options}
+            for name in names:
+                jobs.append((name, language, variables, output_dir / language.value / engine.output_name(name, language)))
+                if name not in templates_used:
+                    templates_used.append(name)
+        
+        semaphore = asyncio.Semaphore(self._concurrency(context))
+        
+        async def render(name: str, language: TargetLanguage, variables: Dict[str, Any], path: Path) -> None:
+            async with semaphore:
+                try:
+                    generated = await _run_blocking(
+                        self.get_executor, engine.render_file,
+                        name, variables, path, language, context.dry_run, abandoned
+                    )
+                except Exception as e:
+                    errors.append(f"{name} ({language.value}): {e}")
+                    return
+            if generated is not None:
+                files.append(generated)
+        
+        await asyncio.gather(*(render(*job) for job in jobs))
     
     async def execute_validation(self, request: ValidationRequest, context: ExecutionContext) -> ValidationResult:
         """Execute a validation request."""
-        raise NotImplementedError("Validation execution not implemented")
+        started = time.perf_counter()
+        result, interrupted = await self._supervise(context, self._validate(request, context))
+        
+        if interrupted is not None:
+            if interrupted is ExecutionStatus.CANCELLED:
+                error = ValidationError(code="validation.cancelled", message="Validation cancelled")
+            else:
+                error = ValidationError(code="validation.timeout",
+                                        message=f"Validation timed out after {context.timeout_seconds}s")
+            result = _validation_result([error], [], started)
+        
+        return result.model_copy(update={"request_id": request.id, "execution_time_ms": _elapsed_ms(started)})
+    
+    async def _validate(self, request: ValidationRequest, context: ExecutionContext) -> ValidationResult:
+        engine = self.validation_engine
+        target = request.target
+        if isinstance(target, SemanticConvention):
+            result = await engine.validate_semantic_convention(target, request.validation_level)
+        else:
+            result = await engine.validate_path(self._resolve(Path(target), context), request.validation_level)
+        
+        if not request.rules:
+            return result
+        errors, warnings = list(result.errors), list(result.warnings)
+        known = {rule for rules in BUILTIN_RULES.values() for rule in rules}
+        for rule in request.rules:
+            if rule in engine.validators:
+                for issue in await _run_blocking(self.get_executor, engine.run_validator, rule, target, request.validation_level):
+                    (warnings if issue.severity == "warning" else errors).append(issue)
+            elif rule not in known:
+                warnings.append(ValidationError(code="validation.rule.unknown", message=f"Unknown validation rule '{rule}'",
+                                                severity="warning", rule=rule))
+        return result.model_copy(update={"errors": errors, "warnings": warnings, "is_valid": not errors})
     
     def discover_weaver_binary(self) -> Optional[Path]:
         """Discover the OTel Weaver binary on the system."""
-        raise NotImplementedError("Weaver binary discovery not implemented")
+        return self.process_manager.discover_weaver_binary()
     
     def get_executor(self) -> ThreadPoolExecutor:
         """Get the thread pool executor for async operations."""
@@ -75,109 +407,460 @@ class WeaverRuntime(IConfigurable):
 
 
 class TemplateEngine(IConfigurable):
-    """Template rendering engine using Jinja2."""
+    """Template rendering engine using Jinja2.
     
-    def __init__(self, config: WeaverConfig):
+    Templates are discovered in the configured template directories (the
+    bundled ``weavergen/templates`` when none are configured). A template's
+    language comes from its directory or file-name prefix, e.g.
+    ``python/models.j2`` or ``python_models.j2``; a ``<name>.yaml`` next to
+    the template supplies the rest of its manifest.
+    """
+    
+    def __init__(self, config: WeaverConfig, executor_provider: Optional[Callable[[], Executor]] = None):
         """Initialize the template engine."""
         self.config = config
+        self.executor_provider = executor_provider
         self.jinja_env = None
         self.template_cache: Dict[str, jinja2.Template] = {}
         self.template_manifests: Dict[str, TemplateManifest] = {}
-        
+        self._template_paths: Dict[str, Path] = {}
+        self._lock = threading.Lock()
+    
     def configure(self, config: Dict[str, Any]) -> None:
         """Configure the template engine."""
-        raise NotImplementedError("Template engine configuration not implemented")
+        self.config = _updated_config(self.config, config)
+        with self._lock:
+            self.jinja_env = None
+            self.template_cache.clear()
+            self.template_manifests.clear()
+            self._template_paths.clear()
+    
+    @property
+    def initialized(self) -> bool:
+        return self.jinja_env is not None
+    
+    def template_directories(self) -> List[Path]:
+        return [Path(d) for d in self.config.template_directories] or [BUILTIN_TEMPLATE_DIR]
     
     async def initialize(self) -> None:
         """Initialize the Jinja2 environment and discover templates."""
-        raise NotImplementedError("Template engine initialization not implemented")
+        await _run_blocking(self.executor_provider, self._ensure_environment)
+    
+    def _ensure_environment(self) -> jinja2.Environment:
+        with self._lock:
+            if self.jinja_env is None:
+                env = jinja2.Environment(
+                    loader=jinja2.FileSystemLoader([str(d) for d in self.template_directories()]),
+                    keep_trailing_newline=True,
+                    trim_blocks=True,
+                    lstrip_blocks=True,
+                )
+                env.filters.update(TEMPLATE_FILTERS)
+                self.jinja_env = env
+                self._scan_templates()
+            return self.jinja_env
+    
+    def get_template(self, template_name: str) -> jinja2.Template:
+        """Compiled template, compiled once per engine."""
+        template = self.template_cache.get(template_name)
+        if template is None:
+            template = self._ensure_environment().get_template(template_name)
+            self.template_cache[template_name] = template
+        return template
     
     async def render_template(self, template_name: str, variables: Dict[str, Any]) -> str:
         """Render a template with given variables."""
-        raise NotImplementedError("Template rendering not implemented")
+        template = await _run_blocking(self.executor_provider, self.get_template, template_name)
+        return await _run_blocking(self.executor_provider, lambda: template.render(**variables))
     
     async def render_template_to_file(self, template_name: str, variables: Dict[str, Any], output_path: Path) -> GeneratedFile:
         """Render template and write to file."""
-        raise NotImplementedError("Template to file rendering not implemented")
+        return await _run_blocking(self.executor_provider, self.render_file, template_name, variables, output_path)
+    
+    def render_file(self, template_name: str, variables: Dict[str, Any], output_path: Path,
+                    language: Optional[TargetLanguage] = None, dry_run: bool = False,
+                    abandoned: Optional[AbandonFlag] = None) -> Optional[GeneratedFile]:
+        """Render and write one file; blocking, meant for a worker thread.
+        
+        Returns None without writing when ``abandoned`` was set while
+        rendering (the request timed out or was cancelled).
+        """
+        content = self.get_template(template_name).render(**variables)
+        output_path = Path(output_path)
+        with abandoned.lock if abandoned is not None else nullcontext():
+            if abandoned is not None and abandoned.is_set():
+                return None
+            if not dry_run:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.write_text(content)
+        if language is None:
+            manifest = self.get_template_manifest(template_name)
+            language = manifest.target_language if manifest else self.config.default_language
+        return GeneratedFile(
+            path=output_path,
+            content=content,
+            language=language,
+            template_used=template_name,
+            checksum=hashlib.sha256(content.encode()).hexdigest(),
+        )
+    
+    def output_name(self, template_name: str, language: TargetLanguage) -> str:
+        """File name a template renders to: ``models.py.j2`` -> ``models.py``, ``models.j2`` -> ``models.py``."""
+        name = Path(template_name).name
+        for suffix in TEMPLATE_SUFFIXES:
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+                break
+        if not Path(name).suffix:
+            name += LANGUAGE_EXTENSIONS.get(language, "")
+        return name
     
     def discover_templates(self) -> List[TemplateManifest]:
         """Discover available templates in configured directories."""
-        raise NotImplementedError("Template discovery not implemented")
+        self._ensure_environment()
+        with self._lock:
+            self._scan_templates()
+            return list(self.template_manifests.values())
+    
+    def templates_for(self, language: TargetLanguage) -> List[str]:
+        """Names of the discovered templates targeting ``language``."""
+        self._ensure_environment()
+        return [name for name, manifest in self.template_manifests.items() if manifest.target_language == language]
+    
+    def _scan_templates(self) -> None:
+        for directory in self.template_directories():
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.rglob("*")):
+                if path.suffix not in TEMPLATE_SUFFIXES or not path.is_file():
+                    continue
+                name = path.relative_to(directory).as_posix()
+                # Earlier directories shadow later ones, as with the loader
+                if name not in self.template_manifests:
+                    self.template_manifests[name] = self._load_manifest(name, path)
+                    self._template_paths[name] = path
+    
+    def _load_manifest(self, name: str, path: Path) -> TemplateManifest:
+        languages = {language.value: language for language in TargetLanguage}
+        hints = [part.lower() for part in Path(name).parts[:-1]] + [path.name.split("_")[0].lower()]
+        language = next((languages[hint] for hint in hints if hint in languages), self.config.default_language)
+        template_type = next((t for t in TemplateType if t.value in path.name.lower()), TemplateType.MODELS)
+        defaults = {
+            "name": name,
+            "version": "0.0.0",
+            "description": f"{path.stem} template",
+            "author": "unknown",
+            "target_language": language,
+            "template_type": template_type,
+        }
+        
+        sidecar = path.with_suffix(".yaml")
+        if not sidecar.is_file():
+            return TemplateManifest(**defaults)
+        try:
+            declared = yaml.safe_load(sidecar.read_text()) or {}
+            return TemplateManifest(**{**defaults, **declared, "name": name})
+        except (OSError, yaml.YAMLError, TypeError, pydantic.ValidationError) as e:
+            logger.warning("Ignoring invalid template manifest %s: %s", sidecar, e)
+            return TemplateManifest(**defaults)
     
     def get_template_manifest(self, template_name: str) -> Optional[TemplateManifest]:
         """Get manifest for a specific template."""
-        raise NotImplementedError("Template manifest retrieval not implemented")
+        self._ensure_environment()
+        return self.template_manifests.get(template_name)
     
     def validate_template_variables(self, template_name: str, variables: Dict[str, Any]) -> ValidationResult:
         """Validate variables against template requirements."""
-        raise NotImplementedError("Template variable validation not implemented")
+        started = time.perf_counter()
+        manifest = self.get_template_manifest(template_name)
+        if manifest is None:
+            return _validation_result([ValidationError(
+                code="template.not_found", message=f"Template '{template_name}' not found", rule="template_exists"
+            )], [], started)
+        
+        errors = [
+            ValidationError(code="template.variable.missing", message=f"Required variable '{variable.name}' is missing",
+                            rule="required_variables")
+            for variable in manifest.variables
+            if variable.required and variable.default is None and variable.name not in variables
+        ]
+        source = self._template_paths[template_name].read_text()
+        used = jinja2.meta.find_undeclared_variables(self._ensure_environment().parse(source))
+        declared = {variable.name for variable in manifest.variables}
+        warnings = [
+            ValidationError(code="template.variable.undefined", message=f"Template uses '{name}', which is not provided",
+                            severity="warning", rule="undefined_variables")
+            for name in sorted(used - set(variables) - declared)
+        ]
+        return _validation_result(errors, warnings, started)
 
 
 class ValidationEngine(IConfigurable):
-    """Validation engine for semantic conventions and generated code."""
+    """Validation engine for semantic conventions and generated code.
     
-    def __init__(self, config: WeaverConfig):
+    Custom validators are callables ``validator(target, level)`` returning
+    an iterable of ``ValidationError``; they run when a request names them
+    in its ``rules``.
+    """
+    
+    def __init__(self, config: WeaverConfig, executor_provider: Optional[Callable[[], Executor]] = None):
         """Initialize the validation engine."""
         self.config = config
+        self.executor_provider = executor_provider
         self.validators: Dict[str, Any] = {}
-        
+    
     def configure(self, config: Dict[str, Any]) -> None:
         """Configure the validation engine."""
-        raise NotImplementedError("Validation engine configuration not implemented")
+        self.config = _updated_config(self.config, config)
+    
+    async def validate_path(self, path: Path, level: ValidationLevel = ValidationLevel.BASIC) -> ValidationResult:
+        """Validate a file by its type, or every recognised file under a directory."""
+        started = time.perf_counter()
+        path = Path(path)
+        if path.is_dir():
+            files = [p for p in sorted(path.rglob("*")) if p.is_file() and self._validator_for(p, level)]
+            results = await asyncio.gather(*(self._validator_for(p, level)() for p in files))
+            errors: List[ValidationError] = []
+            warnings: List[ValidationError] = []
+            info: List[ValidationError] = []
+            for file_path, result in zip(files, results):
+                prefix = f"{file_path.relative_to(path)}: "
+                errors.extend(e.model_copy(update={"message": prefix + e.message}) for e in result.errors)
+                warnings.extend(w.model_copy(update={"message": prefix + w.message}) for w in result.warnings)
+                info.extend(i.model_copy(update={"message": prefix + i.message}) for i in result.info)
+            return _validation_result(errors, warnings, started, info)
+        
+        validate = self._validator_for(path, level)
+        if not path.exists():
+            error = ValidationError(code="validation.target.not_found", message=f"{path} does not exist")
+        elif validate is None:
+            error = ValidationError(code="validation.target.unsupported", message=f"Don't know how to validate {path.name}")
+        else:
+            return await validate()
+        return _validation_result([error], [], started)
+    
+    def _validator_for(self, path: Path, level: ValidationLevel) -> Optional[Callable[[], Awaitable[ValidationResult]]]:
+        suffix = path.suffix.lower()
+        if path.name == "registry_manifest.yaml":
+            return None
+        if suffix in SEMANTIC_SUFFIXES:
+            return lambda: self.validate_semantic_yaml(path, level)
+        if suffix in TEMPLATE_SUFFIXES:
+            return lambda: self.validate_template(path)
+        if suffix in EXTENSION_LANGUAGES:
+            return lambda: self.validate_generated_code(path, EXTENSION_LANGUAGES[suffix])
+        return None
     
     async def validate_semantic_yaml(self, yaml_path: Path, level: ValidationLevel = ValidationLevel.BASIC) -> ValidationResult:
         """Validate a semantic convention YAML file."""
-        raise NotImplementedError("Semantic YAML validation not implemented")
+        started = time.perf_counter()
+        try:
+            data = await _run_blocking(self.executor_provider, lambda: yaml.safe_load(Path(yaml_path).read_text()))
+        except (OSError, yaml.YAMLError) as e:
+            mark = getattr(e, "problem_mark", None)
+            return _validation_result([ValidationError(
+                code="yaml.syntax", message=str(e), rule="yaml_syntax",
+                line=mark.line + 1 if mark else None, column=mark.column + 1 if mark else None,
+            )], [], started)
+        errors, warnings = self.check_semantic_data(data, level)
+        return _validation_result(errors, warnings, started)
+    
+    async def validate_semantic_convention(self, semantic: SemanticConvention,
+                                           level: ValidationLevel = ValidationLevel.BASIC) -> ValidationResult:
+        """Validate an already-parsed semantic convention."""
+        started = time.perf_counter()
+        errors, warnings = self.check_semantic_data(semantic.model_dump(mode="json"), level)
+        return _validation_result(errors, warnings, started)
+    
+    def check_semantic_data(self, data: Any, level: ValidationLevel) -> Tuple[List[ValidationError], List[ValidationError]]:
+        """Structural checks on a semantic convention document.
+        
+        BASIC checks what Weaver needs to resolve the registry; STRICT warns
+        about incomplete attributes; PEDANTIC turns those warnings into
+        errors and also requires group stability.
+        """
+        errors: List[ValidationError] = []
+        warnings: List[ValidationError] = []
+        strict_issues = errors if level == ValidationLevel.PEDANTIC else warnings
+        
+        groups = data.get("groups") if isinstance(data, dict) else None
+        if not isinstance(groups, list) or not groups:
+            errors.append(ValidationError(code="semantic.groups.missing", message="No 'groups' list found",
+                                          rule="groups_present"))
+            return errors, warnings
+        
+        attribute_types = {t.value for t in AttributeType}
+        seen_ids: Set[str] = set()
+        for index, group in enumerate(groups):
+            if not isinstance(group, dict):
+                errors.append(ValidationError(code="semantic.group.invalid", message=f"Group {index} is not a mapping",
+                                              rule="group_fields"))
+                continue
+            group_id = group.get("id") or f"#{index}"
+            for field in ("id", "type", "brief"):
+                if not group.get(field):
+                    errors.append(ValidationError(code=f"semantic.group.{field}.missing",
+                                                  message=f"Group {group_id} has no '{field}'", rule="group_fields"))
+            if group_id in seen_ids:
+                errors.append(ValidationError(code="semantic.group.duplicate", message=f"Duplicate group id {group_id}",
+                                              rule="unique_group_ids"))
+            seen_ids.add(group_id)
+            if level == ValidationLevel.PEDANTIC and not group.get("stability"):
+                errors.append(ValidationError(code="semantic.group.stability.missing",
+                                              message=f"Group {group_id} has no 'stability'", rule="group_stability"))
+            
+            for attribute in group.get("attributes") or []:
+                if not isinstance(attribute, dict) or not (attribute.get("id") or attribute.get("ref")):
+                    errors.append(ValidationError(code="semantic.attribute.id.missing",
+                                                  message=f"Group {group_id} has an attribute without 'id' or 'ref'",
+                                                  rule="attribute_fields"))
+                    continue
+                if "ref" in attribute:
+                    continue
+                attribute_id = attribute["id"]
+                attribute_type = attribute.get("type")
+                if attribute_type is None:
+                    errors.append(ValidationError(code="semantic.attribute.type.missing",
+                                                  message=f"Attribute {attribute_id} has no 'type'", rule="attribute_fields"))
+                if level == ValidationLevel.BASIC:
+                    continue
+                if isinstance(attribute_type, str) and attribute_type not in attribute_types \
+                        and not attribute_type.startswith("template["):
+                    strict_issues.append(ValidationError(code="semantic.attribute.type.unknown",
+                                                         message=f"Attribute {attribute_id} has unknown type '{attribute_type}'",
+                                                         severity="error" if strict_issues is errors else "warning",
+                                                         rule="attribute_type"))
+                for field, rule in (("brief", "attribute_brief"), ("requirement_level", "attribute_requirement_level")):
+                    if not attribute.get(field):
+                        strict_issues.append(ValidationError(code=f"semantic.attribute.{field}.missing",
+                                                             message=f"Attribute {attribute_id} has no '{field}'",
+                                                             severity="error" if strict_issues is errors else "warning",
+                                                             rule=rule))
+        return errors, warnings
     
     async def validate_generated_code(self, code_path: Path, language: TargetLanguage) -> ValidationResult:
         """Validate generated code for syntax and style."""
-        raise NotImplementedError("Generated code validation not implemented")
+        started = time.perf_counter()
+        try:
+            source = await _run_blocking(self.executor_provider, Path(code_path).read_text)
+        except (OSError, UnicodeDecodeError) as e:
+            return _validation_result([ValidationError(code="code.unreadable", message=str(e), rule="syntax")], [], started)
+        
+        errors: List[ValidationError] = []
+        warnings: List[ValidationError] = []
+        info: List[ValidationError] = []
+        if not source.strip():
+            warnings.append(ValidationError(code="code.empty", message=f"{Path(code_path).name} is empty",
+                                            severity="warning", rule="syntax"))
+        elif language == TargetLanguage.PYTHON:
+            try:
+                await _run_blocking(self.executor_provider, ast.parse, source, str(code_path))
+            except SyntaxError as e:
+                errors.append(ValidationError(code="code.syntax", message=e.msg, line=e.lineno, column=e.offset,
+                                              rule="syntax"))
+        else:
+            info.append(ValidationError(code="code.syntax.unchecked", severity="info", rule="syntax",
+                                        message=f"No syntax checker for {language.value}"))
+        return _validation_result(errors, warnings, started, info)
     
     async def validate_template(self, template_path: Path) -> ValidationResult:
         """Validate a Jinja2 template."""
-        raise NotImplementedError("Template validation not implemented")
+        started = time.perf_counter()
+        env = jinja2.Environment()
+        env.filters.update(TEMPLATE_FILTERS)
+        try:
+            source = await _run_blocking(self.executor_provider, Path(template_path).read_text)
+            await _run_blocking(self.executor_provider, env.compile, source)
+        except jinja2.TemplateSyntaxError as e:
+            return _validation_result([ValidationError(code="template.syntax", message=e.message or str(e),
+                                                       line=e.lineno, rule="template_syntax")], [], started)
+        except OSError as e:
+            return _validation_result([ValidationError(code="template.unreadable", message=str(e),
+                                                       rule="template_syntax")], [], started)
+        return _validation_result([], [], started)
     
     def register_validator(self, name: str, validator: Any) -> None:
         """Register a custom validator."""
-        raise NotImplementedError("Custom validator registration not implemented")
+        if not callable(validator):
+            raise TypeError(f"Validator {name} must be callable")
+        self.validators[name] = validator
+    
+    def run_validator(self, name: str, target: Any, level: ValidationLevel) -> List[ValidationError]:
+        """Run one registered validator; a crashing validator is reported, not raised."""
+        try:
+            return list(self.validators[name](target, level))
+        except Exception as e:
+            return [ValidationError(code="validation.validator.failed", message=f"Validator {name} failed: {e}", rule=name)]
     
     def get_validation_rules(self, target_type: str) -> List[str]:
         """Get validation rules for a target type."""
-        raise NotImplementedError("Validation rules retrieval not implemented")
+        rules = list(BUILTIN_RULES.get(target_type, []))
+        if target_type == "semantic" and self.config.validation_level != ValidationLevel.BASIC:
+            rules += BUILTIN_RULES["semantic_strict"]
+            if self.config.validation_level == ValidationLevel.PEDANTIC:
+                rules += BUILTIN_RULES["semantic_pedantic"]
+        return rules + sorted(self.validators)
 
 
 class ProcessManager(IConfigurable):
-    """Manager for external process execution (Weaver CLI, etc.)."""
+    """Manager for external process execution (Weaver CLI, etc.).
     
-    def __init__(self, config: WeaverConfig):
+    Commands run through the shared ``AsyncProcessRunner``, which caps the
+    number of concurrent children and kills a child's process group on
+    timeout or cancellation.
+    """
+    
+    def __init__(self, config: WeaverConfig, runner: Optional[AsyncProcessRunner] = None):
         """Initialize the process manager."""
         self.config = config
+        self.runner = runner or get_process_runner()
         self.weaver_binary = None
-        
+        self._weaver_version: Optional[str] = None
+    
     def configure(self, config: Dict[str, Any]) -> None:
         """Configure the process manager."""
-        raise NotImplementedError("Process manager configuration not implemented")
+        self.config = _updated_config(self.config, config)
+        self.weaver_binary = None
+        self._weaver_version = None
     
-    async def execute_weaver_command(self, args: List[str], working_dir: Optional[Path] = None) -> subprocess.CompletedProcess:
+    async def execute_weaver_command(self, args: List[str], working_dir: Optional[Path] = None,
+                                     timeout: Optional[float] = None) -> subprocess.CompletedProcess:
         """Execute a Weaver CLI command."""
-        raise NotImplementedError("Weaver command execution not implemented")
+        binary = self.discover_weaver_binary()
+        if binary is None:
+            raise FileNotFoundError("OTel Weaver binary not found; set weaver_binary_path or add weaver to PATH")
+        return await self.execute_command([str(binary), *args], working_dir, timeout)
     
-    async def execute_command(self, command: List[str], working_dir: Optional[Path] = None, 
+    async def execute_command(self, command: List[str], working_dir: Optional[Path] = None,
                              timeout: Optional[int] = None) -> subprocess.CompletedProcess:
-        """Execute a generic command."""
-        raise NotImplementedError("Generic command execution not implemented")
+        """Execute a generic command.
+        
+        Raises ``subprocess.TimeoutExpired`` on timeout, like ``subprocess.run``.
+        """
+        result = await self.runner.run(command, cwd=working_dir, timeout=timeout)
+        if result.timed_out:
+            raise subprocess.TimeoutExpired(result.command, timeout, output=result.stdout, stderr=result.stderr)
+        return subprocess.CompletedProcess(result.command, result.return_code, result.stdout, result.stderr)
     
     def discover_weaver_binary(self) -> Optional[Path]:
         """Discover the Weaver binary on the system."""
-        raise NotImplementedError("Weaver binary discovery not implemented")
+        if self.weaver_binary is None:
+            self.weaver_binary = find_weaver_binary(self.config.weaver_binary_path)
+        return self.weaver_binary
     
     def validate_weaver_installation(self) -> bool:
         """Validate that Weaver is properly installed."""
-        raise NotImplementedError("Weaver installation validation not implemented")
+        binary = self.discover_weaver_binary()
+        return binary is not None and os.access(binary, os.X_OK)
     
     async def get_weaver_version(self) -> str:
         """Get the installed Weaver version."""
-        raise NotImplementedError("Weaver version retrieval not implemented")
+        if self._weaver_version is None:
+            result = await self.execute_weaver_command(["--version"], timeout=30)
+            if result.returncode != 0:
+                raise RuntimeError(f"weaver --version failed: {result.stderr.strip()}")
+            self._weaver_version = result.stdout.strip()
+        return self._weaver_version
 
 
 class ResourceManager(IConfigurable):
@@ -338,19 +1021,22 @@ class RuntimeFactory:
     @staticmethod
     def create_runtime(config: Optional[WeaverConfig] = None) -> WeaverRuntime:
         """Create a new runtime instance."""
-        raise NotImplementedError("Runtime factory creation not implemented")
+        return WeaverRuntime(config)
     
     @staticmethod
     def create_development_runtime() -> WeaverRuntime:
         """Create a runtime optimized for development."""
-        raise NotImplementedError("Development runtime creation not implemented")
+        return WeaverRuntime(WeaverConfig(validation_level=ValidationLevel.BASIC, cache_enabled=False))
     
     @staticmethod
     def create_production_runtime() -> WeaverRuntime:
         """Create a runtime optimized for production."""
-        raise NotImplementedError("Production runtime creation not implemented")
+        return WeaverRuntime(WeaverConfig(
+            validation_level=ValidationLevel.STRICT,
+            max_workers=min(32, (os.cpu_count() or 1) + 4),
+        ))
     
     @staticmethod
     def create_testing_runtime() -> WeaverRuntime:
         """Create a runtime optimized for testing."""
-        raise NotImplementedError("Testing runtime creation not implemented")
\ No newline at end of file
+        return WeaverRuntime(WeaverConfig(parallel_execution=False, max_workers=1, cache_enabled=False))
@@ -83,36 +83,60 @@ class EnterpriseAgent:
         
     async def send_span_message(self, recipient: str, msg_type: str, content: Dict[str, Any], priority: Priority = Priority.NORMAL):
         """Send message via OTel span"""
+        await self.multicast_span_message([recipient], msg_type, content, priority)
+        
+    async def multicast_span_message(self, recipients: List[str], msg_type: str, content: Dict[str, Any], priority: Priority = Priority.NORMAL):
+        """Send one message to several recipients under a single OTel span
+        
+        The content is JSON-encoded once and shared by every recipient, and
+        the span attributes are written in one batch at span start. A single
+        recipient is delivered directly, so its handlers have run when this
+        returns; a real fan-out is queued per recipient.
+        """
         if not self.bus:
             return
+        
+        encoded = json.dumps(content)
+        attributes = {
+            "agent.id": self.agent_id,
+            "agent.name": self.name,
+            "agent.role": self.role,
+            "agent.level": self.level,
+            "message.recipient": ",".join(recipients),
+            "message.recipient_count": len(recipients),
+            "message.type": msg_type,
+            "message.content": encoded,
+            "message.priority": priority.value,
+        }
+        
+        # Add specific SAS attributes based on message type
+        if self.level == "eat":
+            attributes["sas.eat.executives_present"] = content.get("executives_present", 0)
+        elif self.level == "ems":
+            attributes["sas.ems.product_owners_count"] = content.get("po_count", 0)
+        elif self.level == "sos":
+            attributes["sas.sos.teams_count"] = content.get("teams_count", 0)
             
-        with tracer.start_as_current_span(f"{self.name}.{msg_type}") as span:
-            # Set all message attributes on the span
-            span.set_attribute("agent.id", self.agent_id)
-            span.set_attribute("agent.name", self.name)
-            span.set_attribute("agent.role", self.role)
-            span.set_attribute("agent.level", self.level)
-            span.set_attribute("message.recipient", recipient)
-            span.set_attribute("message.type", msg_type)
-            span.set_attribute("message.content", json.dumps(content))
-            span.set_attribute("message.priority", priority.value)
-            
-            # Add specific SAS attributes based on message type
-            if self.level == "eat":
-                span.set_attribute("sas.eat.executives_present", content.get("executives_present", 0))
-            elif self.level == "ems":
-                span.set_attribute("sas.ems.product_owners_count", content.get("po_count", 0))
-            elif self.level == "sos":
-                span.set_attribute("sas.sos.teams_count", content.get("teams_count", 0))
-                
-            # Send via bus for routing
-            await self.bus.send_message(
+        with tracer.start_as_current_span(f"{self.name}.{msg_type}", attributes=attributes):
+            if len(recipients) == 1:
+                await self.bus.send_message(
+                    sender_id=self.agent_id,
+                    receiver_id=recipients[0],
+                    message_type=MessageType.NOTIFICATION,
+                    content=content,
+                    priority=priority,
+                    metadata={"sas_type": msg_type, "level": self.level}
+                )
+                return
+            # Send via bus for routing; delivery is queued per recipient
+            await self.bus.send_multicast(
                 sender_id=self.agent_id,
-                receiver_id=recipient,
+                receiver_ids=recipients,
                 message_type=MessageType.NOTIFICATION,
                 content=content,
                 priority=priority,
-                metadata={"sas_type": msg_type, "level": self.level}
+                metadata={"sas_type": msg_type, "level": self.level},
+                encoded_content=encoded
             )
 
 class ExecutiveActionTeam(EnterpriseAgent):
@@ -237,13 +261,12 @@ class ExecutiveMetaScrum(EnterpriseAgent):
             }
             
             # Coordinate with release trains
-            for train in self.release_trains:
-                await self.send_span_message(
-                    recipient=f"rte-{train}",
-                    msg_type="PORTFOLIO_ALIGNMENT",
-                    content=portfolio_alignment,
-                    priority=Priority.HIGH
-                )
+            await self.multicast_span_message(
+                recipients=[f"rte-{train}" for train in self.release_trains],
+                msg_type="PORTFOLIO_ALIGNMENT",
+                content=portfolio_alignment,
+                priority=Priority.HIGH
+            )
 
 class ScrumOfScrums(EnterpriseAgent):
     """SoS - Team coordination at various levels"""
@@ -533,7 +556,9 @@ async def run_enterprise_scrum_at_scale():
     print("\n✅ Enterprise Scrum at Scale ceremony complete!")
     print("📊 All communication conducted through OpenTelemetry spans")
     
-    # Show communication summary
+    # Show communication summary once queued deliveries have landed
+    await bus.drain()
+    await bus.close()
     stats = bus.get_stats()
     print(f"\n📡 Communication Statistics:")
     print(f"   - Active Agents: {stats['active_agents']}")
@@ -9,14 +9,16 @@ Key principles:
 - Process-as-Code (Python decorators instead of XML)
 - Synchronous by default, async when needed
 - Built-in observability without dependencies
-- Under 100 lines of core engine logic
+- Flow plans compiled once at registration; independent branches run concurrently
 - Fluent API for complex flows
 """
 
+import ast
 import asyncio
 import inspect
+import textwrap
 import time
-from typing import Any, Dict, List, Optional, Callable, Union
+from typing import Any, Dict, List, Optional, Callable, Union, FrozenSet, Set, Tuple
 from dataclasses import dataclass, field
 from functools import wraps
 from pathlib import Path
@@ -60,31 +62,61 @@ def bpmn_process(name: str):
         cls._bpmn_tasks = {}
         cls._bpmn_gateways = {}
         
-        # Auto-discover tasks and gateways
-        for attr_name in dir(cls):
-            attr = getattr(cls, attr_name)
-            if hasattr(attr, '_bpmn_task_type'):
-                cls._bpmn_tasks[attr_name] = attr
-            elif hasattr(attr, '_bpmn_gateway_type'):
-                cls._bpmn_gateways[attr_name] = attr
+        # Auto-discover tasks and gateways in definition order
+        for klass in reversed(cls.__mro__):
+            for attr_name, attr in vars(klass).items():
+                if hasattr(attr, '_bpmn_task_type'):
+                    cls._bpmn_tasks[attr_name] = attr
+                elif hasattr(attr, '_bpmn_gateway_type'):
+                    cls._bpmn_gateways[attr_name] = attr
+        cls._bpmn_flow_order = [
+            attr_name for klass in reversed(cls.__mro__) for attr_name in vars(klass)
+            if attr_name in cls._bpmn_tasks or attr_name in cls._bpmn_gateways
+        ]
         
         return cls
     return decorator
 
-def service_task(func):
-    """Mark a method as a service task"""
-    func._bpmn_task_type = 'service'
+def _declare_flow(func, inputs=None, outputs=None, after=None, routes=None):
+    """Attach declared data flow to a task or gateway method"""
+    if inputs is not None:
+        func._bpmn_inputs = frozenset(inputs)
+    if outputs is not None:
+        func._bpmn_outputs = frozenset(outputs)
+    if after:
+        func._bpmn_after = tuple(after)
+    if routes:
+        func._bpmn_routes = {decision: tuple(targets) for decision, targets in routes.items()}
     return func
 
-def exclusive_gateway(func):
-    """Mark a method as an exclusive gateway (decision point)"""
-    func._bpmn_gateway_type = 'exclusive'
-    return func
+def service_task(func=None, *, inputs=None, outputs=None, after=None):
+    """Mark a method as a service task
+    
+    Usable bare or as ``@service_task(inputs=[...], outputs=[...], after=[...])``.
+    Undeclared inputs and outputs are inferred from the method body.
+    """
+    def decorator(f):
+        f._bpmn_task_type = 'service'
+        return _declare_flow(f, inputs, outputs, after)
+    return decorator(func) if func is not None else decorator
+
+def exclusive_gateway(func=None, *, inputs=None, after=None, routes=None):
+    """Mark a method as an exclusive gateway (decision point)
+    
+    ``routes`` maps decisions to the tasks on that path; tasks on paths that
+    are not taken are skipped along with everything only reachable from them.
+    """
+    def decorator(f):
+        f._bpmn_gateway_type = 'exclusive'
+        return _declare_flow(f, inputs, None, after, routes)
+    return decorator(func) if func is not None else decorator
 
-def parallel_gateway(func):
+def parallel_gateway(func=None, *, inputs=None, outputs=None, after=None):
     """Mark a method as a parallel gateway (concurrent execution)"""
-    func._bpmn_gateway_type = 'parallel'
-    return func
+    def decorator(f):
+        f._bpmn_gateway_type = 'parallel'
+        return _declare_flow(f, inputs, outputs, after)
+    return decorator(func) if func is not None else decorator
 
 def semantic_span(domain: str, operation: str):
     """Add semantic span tracking to a task"""
@@ -95,7 +127,319 @@ def semantic_span(domain: str, operation: str):
     return decorator
 
 # ============================================================================
-# Micro BPMN Engine (Under 100 Lines)
+# Flow Planning
+# ============================================================================
+
+# ``None`` stands for "unknown": the node may read or write any key
+KeySet = Optional[FrozenSet[str]]
+
+
+@dataclass
+class FlowNode:
+    """A task or gateway in a compiled flow plan"""
+    name: str
+    kind: str  # 'service', 'exclusive' or 'parallel'
+    inputs: KeySet
+    outputs: KeySet
+    after: Tuple[str, ...] = ()
+    routes: Dict[Any, Tuple[str, ...]] = field(default_factory=dict)
+    predecessors: Set[str] = field(default_factory=set)
+    successors: Set[str] = field(default_factory=set)
+    # Predecessors from ``after`` and ``routes``; data edges only order nodes
+    control_predecessors: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class FlowPlan:
+    """DAG of a process's tasks and gateways, in a valid execution order"""
+    process_name: str
+    nodes: Dict[str, FlowNode]
+    order: List[str]
+    # route target -> exclusive gateways that can select it
+    gated_by: Dict[str, List[str]] = field(default_factory=dict)
+    
+    @property
+    def roots(self) -> List[str]:
+        return [name for name in self.order if not self.nodes[name].predecessors]
+    
+    @property
+    def sinks(self) -> List[str]:
+        return [name for name in self.order if not self.nodes[name].successors]
+
+
+class _ContextAccess(ast.NodeVisitor):
+    """Collect the context keys a task body reads and writes"""
+    
+    def __init__(self, ctx_name: str, helpers: Dict[str, Callable], depth: int = 0):
+        self.ctx_name = ctx_name
+        self.helpers = helpers
+        self.depth = depth
+        self.reads: Set[str] = set()
+        self.writes: Set[str] = set()
+        self.opaque_reads = False
+        self.opaque_writes = False
+        self.returns: Optional[List[Optional[ast.expr]]] = []
+        self._handled: Set[int] = set()
+    
+    def _is_ctx(self, node: ast.AST) -> bool:
+        return isinstance(node, ast.Name) and node.id == self.ctx_name
+    
+    @staticmethod
+    def _const_key(node: Optional[ast.AST]) -> Optional[str]:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        return None
+    
+    def _dict_keys(self, node: ast.AST) -> Optional[Set[str]]:
+        if isinstance(node, ast.Dict):
+            keys = [self._const_key(k) for k in node.keys]
+            if all(k is not None for k in keys):
+                return set(keys)
+        return None
+    
+    def visit_FunctionDef(self, node):
+        # Returns of nested functions are not task results
+        saved, self.returns = self.returns, None
+        self.generic_visit(node)
+        self.returns = saved
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_Return(self, node):
+        if self.returns is not None:
+            self.returns.append(node.value)
+        self.generic_visit(node)
+    
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Attribute) and self._is_ctx(func.value):
+            self._handled.add(id(func.value))
+            key = self._const_key(node.args[0]) if node.args else None
+            if func.attr == "get":
+                if key:
+                    self.reads.add(key)
+                else:
+                    self.opaque_reads = True
+            elif func.attr == "set":
+                if key:
+                    self.writes.add(key)
+                else:
+                    self.opaque_writes = True
+            elif func.attr == "update":
+                keys = self._dict_keys(node.args[0]) if node.args else None
+                if keys is None:
+                    self.opaque_writes = True
+                else:
+                    self.writes.update(keys)
+        elif (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name)
+              and func.value.id == "self" and func.attr in self.helpers):
+            ctx_args = [i for i, arg in enumerate(node.args) if self._is_ctx(arg)]
+            if ctx_args:
+                for i in ctx_args:
+                    self._handled.add(id(node.args[i]))
+                self._merge_helper(self.helpers[func.attr], ctx_args[0])
+        self.generic_visit(node)
+    
+    def _merge_helper(self, helper: Callable, position: int) -> None:
+        access = analyze_context_access(helper, self.helpers, position, self.depth + 1)
+        if access is None:
+            self.opaque_reads = self.opaque_writes = True
+            return
+        reads, writes, _ = access
+        if reads is None:
+            self.opaque_reads = True
+        else:
+            self.reads.update(reads)
+        if writes is None:
+            self.opaque_writes = True
+        else:
+            self.writes.update(writes)
+    
+    def visit_Subscript(self, node):
+        value = node.value
+        if (isinstance(value, ast.Attribute) and value.attr == "data" and self._is_ctx(value.value)):
+            self._handled.add(id(value.value))
+            key = self._const_key(node.slice)
+            target = self.writes if isinstance(node.ctx, (ast.Store, ast.Del)) else self.reads
+            if key:
+                target.add(key)
+            elif target is self.writes:
+                self.opaque_writes = True
+            else:
+                self.opaque_reads = True
+            self.visit(node.slice)
+            return
+        self.generic_visit(node)
+    
+    def visit_Attribute(self, node):
+        if self._is_ctx(node.value) and node.attr in ("process_name", "spans"):
+            self._handled.add(id(node.value))
+        self.generic_visit(node)
+    
+    def visit_Name(self, node):
+        if node.id == self.ctx_name and id(node) not in self._handled:
+            # The context escapes somewhere we cannot follow
+            self.opaque_reads = self.opaque_writes = True
+
+
+def analyze_context_access(func: Callable, helpers: Optional[Dict[str, Callable]] = None,
+                           ctx_position: int = 0, depth: int = 0):
+    """Infer ``(reads, writes, returns)`` of a task body, or None if unknown
+    
+    ``ctx_position`` is the index of the context among the arguments after
+    ``self``. ``reads``/``writes`` are None when the body uses the context in
+    ways that cannot be followed statically.
+    """
+    if depth > 3:
+        return None
+    try:
+        source = textwrap.dedent(inspect.getsource(inspect.unwrap(func)))
+        tree = ast.parse(source)
+    except (OSError, TypeError, SyntaxError):
+        return None
+    function = next((n for n in tree.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))), None)
+    if function is None:
+        return None
+    params = [arg.arg for arg in function.args.posonlyargs + function.args.args]
+    if len(params) <= ctx_position + 1:
+        return None
+    
+    visitor = _ContextAccess(params[ctx_position + 1], helpers or {}, depth)
+    for statement in function.body:
+        visitor.visit(statement)
+    reads = None if visitor.opaque_reads else frozenset(visitor.reads)
+    writes = None if visitor.opaque_writes else frozenset(visitor.writes)
+    return reads, writes, visitor.returns
+
+
+def _result_keys(name: str, returns: List[Optional[ast.expr]]) -> KeySet:
+    """Context keys written by merging a task's return value"""
+    keys: Set[str] = set()
+    for value in returns:
+        if value is None or (isinstance(value, ast.Constant) and value.value is None):
+            keys.add(f"{name}_result")
+        elif isinstance(value, ast.Dict):
+            if not all(isinstance(k, ast.Constant) and isinstance(k.value, str) for k in value.keys):
+                return None
+            keys.update(k.value for k in value.keys)
+        elif isinstance(value, (ast.Constant, ast.List, ast.Tuple, ast.Set, ast.JoinedStr,
+                                ast.Compare, ast.BoolOp)):
+            keys.add(f"{name}_result")
+        else:
+            return None
+    return frozenset(keys or {f"{name}_result"})
+
+
+def _overlaps(a: KeySet, b: KeySet) -> bool:
+    if a is None:
+        return b is None or bool(b)
+    if b is None:
+        return bool(a)
+    return not a.isdisjoint(b)
+
+
+def compile_flow_plan(process_class: type) -> FlowPlan:
+    """Compile a process class into a flow DAG
+    
+    Explicit ``after`` and gateway ``routes`` edges fix the order first; then
+    any two nodes that touch the same context key (read-after-write,
+    write-after-write or write-after-read) are ordered by definition order.
+    Nodes whose context use cannot be inferred are ordered against everything.
+    """
+    tasks = getattr(process_class, '_bpmn_tasks', {})
+    gateways = getattr(process_class, '_bpmn_gateways', {})
+    members = {**tasks, **gateways}
+    declared = getattr(process_class, '_bpmn_flow_order', None) or [*tasks, *gateways]
+    helpers = {
+        attr_name: attr for klass in reversed(process_class.__mro__)
+        for attr_name, attr in vars(klass).items()
+        if inspect.isfunction(attr) and attr_name not in members
+    }
+    
+    nodes: Dict[str, FlowNode] = {}
+    for name in declared:
+        method = members[name]
+        kind = getattr(method, '_bpmn_task_type', None) or method._bpmn_gateway_type
+        access = analyze_context_access(method, helpers)
+        reads, writes, returns = access if access else (None, None, [])
+        if kind == 'exclusive':
+            outputs = None if writes is None else writes | {f"{name}_decision"}
+        else:
+            result_keys = _result_keys(name, returns) if access else None
+            outputs = None if writes is None or result_keys is None else writes | result_keys
+        nodes[name] = FlowNode(
+            name=name,
+            kind=kind,
+            inputs=getattr(method, '_bpmn_inputs', reads),
+            outputs=getattr(method, '_bpmn_outputs', outputs),
+            after=getattr(method, '_bpmn_after', ()),
+            routes=dict(getattr(method, '_bpmn_routes', {})),
+        )
+    
+    plan = FlowPlan(process_class._bpmn_process_name, nodes, [])
+    
+    def link(source: str, target: str, control: bool = False) -> None:
+        if source not in nodes:
+            raise ValueError(f"Process '{plan.process_name}': unknown flow node '{source}'")
+        if target not in nodes:
+            raise ValueError(f"Process '{plan.process_name}': unknown flow node '{target}'")
+        nodes[target].predecessors.add(source)
+        nodes[source].successors.add(target)
+        if control:
+            nodes[target].control_predecessors.add(source)
+    
+    for node in nodes.values():
+        for dependency in node.after:
+            link(dependency, node.name, control=True)
+        for targets in node.routes.values():
+            for target in targets:
+                link(node.name, target, control=True)
+                plan.gated_by.setdefault(target, []).append(node.name)
+    
+    # Topological order over explicit edges, definition order breaking ties
+    position = {name: i for i, name in enumerate(declared)}
+    remaining = {name: len(node.predecessors) for name, node in nodes.items()}
+    ready = sorted((name for name, count in remaining.items() if count == 0), key=position.get)
+    while ready:
+        name = ready.pop(0)
+        plan.order.append(name)
+        for successor in nodes[name].successors:
+            remaining[successor] -= 1
+            if remaining[successor] == 0:
+                ready.append(successor)
+                ready.sort(key=position.get)
+    if len(plan.order) != len(nodes):
+        cycle = sorted(name for name, count in remaining.items() if count)
+        raise ValueError(f"Process '{plan.process_name}' has a flow cycle through {cycle}")
+    
+    # Decisions under which each route target runs, per gateway
+    route_decisions: Dict[str, Dict[str, Set[Any]]] = {}
+    for node in nodes.values():
+        for decision, targets in node.routes.items():
+            for target in targets:
+                route_decisions.setdefault(target, {}).setdefault(node.name, set()).add(decision)
+    
+    def exclusive(a: str, b: str) -> bool:
+        """Nodes on different paths of the same exclusive gateway never both run"""
+        paths_a, paths_b = route_decisions.get(a, {}), route_decisions.get(b, {})
+        return any(g in paths_b and paths_a[g].isdisjoint(paths_b[g]) for g in paths_a)
+    
+    # Data-flow edges between conflicting nodes
+    for j, later in enumerate(plan.order):
+        target = nodes[later]
+        for earlier in plan.order[:j]:
+            source = nodes[earlier]
+            if exclusive(earlier, later):
+                continue
+            if (_overlaps(source.outputs, target.inputs)
+                    or _overlaps(source.outputs, target.outputs)
+                    or _overlaps(source.inputs, target.outputs)):
+                link(earlier, later)
+    
+    return plan
+
+# ============================================================================
+# Micro BPMN Engine
 # ============================================================================
 
 class MicroBPMNEngine:
@@ -111,14 +455,16 @@ class MicroBPMNEngine:
     
     def __init__(self):
         self.processes: Dict[str, type] = {}
+        self.plans: Dict[str, FlowPlan] = {}
         self.execution_history: List[BPMNContext] = []
     
     def register_process(self, process_class: type) -> None:
-        """Register a BPMN process class"""
+        """Register a BPMN process class and compile its flow plan"""
         if not hasattr(process_class, '_bpmn_process_name'):
             raise ValueError(f"Class {process_class.__name__} is not marked as @bpmn_process")
         
         name = process_class._bpmn_process_name
+        self.plans[name] = compile_flow_plan(process_class)
         self.processes[name] = process_class
     
     async def execute_process(self, process_name: str, initial_data: Optional[Dict[str, Any]] = None) -> BPMNContext:
@@ -144,22 +490,49 @@ class MicroBPMNEngine:
         return ctx
     
     async def _execute_flow(self, process_instance: Any, ctx: BPMNContext) -> None:
-        """Execute the process flow (core engine logic)"""
+        """Execute the process flow plan (core engine logic)
+        
+        Every node waits only for its predecessors, so independent branches
+        run concurrently. A node is skipped when an exclusive gateway routes
+        away from it, or when all of its control predecessors (``after`` and
+        ``routes``) were skipped; data edges never skip a node.
+        """
         start_time = time.time()
+        plan = self.plans[ctx.process_name]
+        tasks = getattr(process_instance, '_bpmn_tasks', {})
+        gateways = getattr(process_instance, '_bpmn_gateways', {})
+        loop = asyncio.get_running_loop()
+        # Resolves to True once a node ran, False if it was skipped
+        outcomes: Dict[str, asyncio.Future] = {name: loop.create_future() for name in plan.order}
+        skipped: List[str] = []
         
-        try:
-            # Auto-discover and execute tasks in order
-            tasks = getattr(process_instance, '_bpmn_tasks', {})
-            gateways = getattr(process_instance, '_bpmn_gateways', {})
-            
-            # Simple sequential execution for now
-            # (In full implementation, would parse flow dependencies)
-            for task_name, task_method in tasks.items():
-                await self._execute_task(process_instance, task_name, task_method, ctx)
+        async def run_node(name: str) -> None:
+            node = plan.nodes[name]
+            ran = {p: await outcomes[p] for p in node.predecessors}
+            gates = plan.gated_by.get(name)
+            if gates and not any(self._route_taken(plan, g, name, ctx) for g in gates):
+                execute = False
+            else:
+                control = node.control_predecessors
+                execute = not control or any(ran[p] for p in control)
             
-            # Execute gateways
-            for gateway_name, gateway_method in gateways.items():
-                await self._execute_gateway(process_instance, gateway_name, gateway_method, ctx)
+            if not execute:
+                skipped.append(name)
+                ctx.spans.append({
+                    "name": f"{'task' if name in tasks else 'gateway'}.{name}",
+                    "type": "service_task" if name in tasks else f"{node.kind}_gateway",
+                    "duration_ms": 0.0,
+                    "status": "skipped",
+                })
+            elif name in tasks:
+                await self._execute_task(process_instance, name, tasks[name], ctx)
+            else:
+                await self._execute_gateway(process_instance, name, gateways[name], ctx)
+            outcomes[name].set_result(execute)
+        
+        runners = [asyncio.ensure_future(run_node(name)) for name in plan.order]
+        try:
+            await asyncio.gather(*runners)
             
             # Record process completion
             ctx.spans.append({
@@ -168,10 +541,14 @@ class MicroBPMNEngine:
                 "duration_ms": (time.time() - start_time) * 1000,
                 "status": "success",
                 "task_count": len(tasks),
-                "gateway_count": len(gateways)
+                "gateway_count": len(gateways),
+                "skipped_count": len(skipped)
             })
             
         except Exception as e:
+            for runner in runners:
+                runner.cancel()
+            await asyncio.gather(*runners, return_exceptions=True)
             # Record process failure
             ctx.spans.append({
                 "name": f"process.{ctx.process_name}",
@@ -182,6 +559,16 @@ class MicroBPMNEngine:
             })
             raise
     
+    @staticmethod
+    def _route_taken(plan: FlowPlan, gateway: str, target: str, ctx: BPMNContext) -> bool:
+        """Whether the decision of ``gateway`` selects the path to ``target``"""
+        routes = plan.nodes[gateway].routes
+        decision = ctx.get(f"{gateway}_decision")
+        selected = routes.get(decision)
+        if selected is None and not isinstance(decision, str):
+            selected = routes.get(str(decision))
+        return bool(selected) and target in selected
+    
     async def _execute_task(self, instance: Any, task_name: str, task_method: Callable, ctx: BPMNContext) -> None:
         """Execute a single service task"""
         start_time = time.time()
@@ -295,32 +682,40 @@ class MicroBPMNEngine:
         }
     
     def generate_mermaid_diagram(self, process_name: str) -> str:
-        """Generate Mermaid diagram for a process"""
+        """Generate Mermaid diagram for a process from its flow plan"""
         if process_name not in self.processes:
             return f"Process '{process_name}' not found"
         
-        process_class = self.processes[process_name]
-        tasks = getattr(process_class, '_bpmn_tasks', {})
-        gateways = getattr(process_class, '_bpmn_gateways', {})
+        plan = self.plans[process_name]
         
         mermaid = f"flowchart TD\n    Start([Start: {process_name}])\n"
         
-        prev_node = "Start"
-        for task_name in tasks.keys():
-            node_id = f"T_{task_name}"
-            mermaid += f"    {node_id}[{task_name}]\n"
-            mermaid += f"    {prev_node} --> {node_id}\n"
-            prev_node = node_id
+        for name in plan.order:
+            node = plan.nodes[name]
+            if node.kind == "service":
+                mermaid += f"    T_{name}[{name}]\n"
+            elif node.kind == "exclusive":
+                mermaid += f"    G_{name}" + "{{" + name + "}}\n"
+            else:
+                mermaid += f"    G_{name}[{name}]\n"
         
-        for gateway_name, gateway_method in gateways.items():
-            node_id = f"G_{gateway_name}"
-            gateway_type = gateway_method._bpmn_gateway_type
-            symbol = "{{" + gateway_name + "}}" if gateway_type == "exclusive" else f"[{gateway_name}]"
-            mermaid += f"    {node_id}{symbol}\n"
-            mermaid += f"    {prev_node} --> {node_id}\n"
-            prev_node = node_id
+        def node_id(name: str) -> str:
+            return f"{'T' if plan.nodes[name].kind == 'service' else 'G'}_{name}"
         
-        mermaid += f"    {prev_node} --> End([End])\n"
+        for name in plan.roots:
+            mermaid += f"    Start --> {node_id(name)}\n"
+        for name in plan.order:
+            node = plan.nodes[name]
+            labels = {target: decision for decision, targets in node.routes.items() for target in targets}
+            for successor in sorted(node.successors, key=plan.order.index):
+                if successor in labels:
+                    mermaid += f"    {node_id(name)} -->|{labels[successor]}| {node_id(successor)}\n"
+                else:
+                    mermaid += f"    {node_id(name)} --> {node_id(successor)}\n"
+        for name in plan.sinks:
+            mermaid += f"    {node_id(name)} --> End([End])\n"
+        if not plan.order:
+            mermaid += "    Start --> End([End])\n"
         
         return mermaid
 
@@ -354,13 +749,15 @@ class ProcessBuilder:
     def build(self) -> type:
         """Build the process class"""
         # Dynamically create a process class
-        class_dict = {"_bpmn_process_name": self.name, "_bpmn_tasks": {}, "_bpmn_gateways": {}}
+        class_dict = {"_bpmn_process_name": self.name, "_bpmn_tasks": {}, "_bpmn_gateways": {},
+                      "_bpmn_flow_order": []}
         
         for task in self.tasks:
             method = task["handler"]
             method._bpmn_task_type = "service"
             class_dict[task["name"]] = method
             class_dict["_bpmn_tasks"][task["name"]] = method
+            class_dict["_bpmn_flow_order"].append(task["name"])
         
         for gateway in self.gateways:
             if gateway["type"] == "exclusive":
@@ -368,6 +765,7 @@ class ProcessBuilder:
                 method._bpmn_gateway_type = "exclusive"
                 class_dict[gateway["name"]] = method
                 class_dict["_bpmn_gateways"][gateway["name"]] = method
+                class_dict["_bpmn_flow_order"].append(gateway["name"])
         
         return type(f"{self.name}Process", (), class_dict)
 
@@ -4,7 +4,7 @@ import asyncio
 import json
 import logging
 import uuid
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Callable, Set
 from enum import Enum
@@ -16,6 +16,9 @@ from .spans import span_manager
 
 logger = logging.getLogger(__name__)
 
+# Messages a recipient may have waiting before multicast senders block
+DEFAULT_QUEUE_SIZE = 1024
+
 class MessageType(str, Enum):
     """Types of messages in the communication system."""
     STATEMENT = "statement"
@@ -83,12 +86,24 @@ class OTelMessage:
         return data
 
 class OTelCommunicationBus:
-    """Communication bus using OTel spans for agent coordination."""
+    """Communication bus using OTel spans for agent coordination.
+    
+    ``send_message`` delivers directly and waits for the handlers.
+    ``send_multicast`` queues messages per recipient instead: each recipient
+    has a bounded queue drained by its own task, so a slow recipient makes
+    senders wait rather than letting messages pile up.
+    """
     
-    def __init__(self):
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
         self.subscribers: Dict[str, List[Callable]] = {}
         self.message_history: List[OTelMessage] = []
         self.active_agents: Set[str] = set()
+        self.queue_size = queue_size
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending = 0
+        self._idle: Optional[asyncio.Event] = None
         
     def register_agent(self, agent_id: str) -> None:
         """Register an agent with the communication bus."""
@@ -197,6 +212,128 @@ class OTelCommunicationBus:
             logger.warning(f"No handlers found for message {message.id}")
             span.set_attribute("message.delivered_count", 0)
     
+    async def send_multicast(
+        self,
+        sender_id: str,
+        receiver_ids: List[str],
+        message_type: MessageType,
+        content: Dict[str, Any],
+        priority: Priority = Priority.NORMAL,
+        metadata: Optional[Dict[str, Any]] = None,
+        encoded_content: Optional[str] = None
+    ) -> List[OTelMessage]:
+        """Send one payload to several recipients.
+        
+        The content is encoded once (or taken from ``encoded_content``) and
+        every recipient's message shares the same content and metadata
+        objects, which handlers must treat as read-only. A single span covers
+        the whole fan-out. ``"all"`` expands to every subscriber but the
+        sender. Returns once every message is queued, not delivered; use
+        ``drain`` to wait for delivery.
+        """
+        if encoded_content is None:
+            encoded_content = json.dumps(content)
+        recipients = self._resolve_recipients(sender_id, receiver_ids)
+        
+        base = OTelMessage.create(
+            sender_id=sender_id,
+            receiver_id=recipients[0] if len(recipients) == 1 else "multicast",
+            message_type=message_type,
+            content=content,
+            priority=priority,
+            metadata=metadata
+        )
+        messages = [replace(base, receiver_id=recipient) for recipient in recipients]
+        
+        with span_manager.communication_span(
+            sender_id=sender_id,
+            receiver_id=",".join(recipients),
+            message_type=message_type.value,
+            attributes={
+                "message.id": base.id,
+                "message.priority": priority.value,
+                "message.content": encoded_content,
+                "message.content_size": len(encoded_content),
+                "message.recipient_count": len(recipients),
+                "message.trace_id": base.trace_id,
+            }
+        ) as span:
+            self.message_history.extend(messages)
+            
+            queued = 0
+            for message in messages:
+                if self.subscribers.get(message.receiver_id):
+                    queue = self._queue_for(message.receiver_id)
+                    self._pending += 1
+                    self._idle.clear()
+                    await queue.put(message)
+                    queued += 1
+            span.set_attribute("message.queued_count", queued)
+        
+        return messages
+    
+    def _resolve_recipients(self, sender_id: str, receiver_ids: List[str]) -> List[str]:
+        recipients: List[str] = []
+        seen: Set[str] = set()
+        for receiver_id in receiver_ids:
+            if receiver_id == "all":
+                targets = [agent_id for agent_id in self.subscribers if agent_id != sender_id]
+            else:
+                targets = [receiver_id]
+            for target in targets:
+                if target not in seen:
+                    seen.add(target)
+                    recipients.append(target)
+        return recipients
+    
+    def _queue_for(self, agent_id: str) -> asyncio.Queue:
+        """The recipient's delivery queue, starting its worker on first use."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Queues and workers belong to one event loop
+            self._loop = loop
+            self._queues.clear()
+            self._workers.clear()
+            self._pending = 0
+            self._idle = asyncio.Event()
+            self._idle.set()
+        
+        queue = self._queues.get(agent_id)
+        if queue is None:
+            queue = self._queues[agent_id] = asyncio.Queue(maxsize=self.queue_size)
+            self._workers[agent_id] = loop.create_task(self._run_queue(agent_id, queue))
+        return queue
+    
+    async def _run_queue(self, agent_id: str, queue: asyncio.Queue) -> None:
+        """Deliver one recipient's messages in order."""
+        while True:
+            message = await queue.get()
+            try:
+                for handler in list(self.subscribers.get(agent_id, ())):
+                    await self._safe_deliver(handler, message)
+            finally:
+                queue.task_done()
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.set()
+    
+    async def drain(self) -> None:
+        """Wait until every queued multicast message has been delivered,
+        including messages that handlers send while draining."""
+        if self._idle is not None:
+            await self._idle.wait()
+    
+    async def close(self) -> None:
+        """Stop the delivery workers; undelivered messages are dropped."""
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        self._queues.clear()
+        self._workers.clear()
+        self._pending = 0
+        if self._idle is not None:
+            self._idle.set()
+    
     async def _safe_deliver(
         self, 
         handler: Callable[[OTelMessage], None], 
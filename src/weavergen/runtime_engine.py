@@ -7,15 +7,15 @@ import asyncio
 import json
 import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 import uuid
-import subprocess
 import tempfile
-import shutil
 
+from .async_process import AsyncProcessRunner, LineHandler, get_process_runner
 from .span_validation import SpanBasedValidator
 from .core import WeaverGen, WeaverGenError, GenerationConfig, GenerationResult
+from .layers.runtime import find_weaver_binary
 
 
 class WeaverRuntime:
@@ -394,91 +394,108 @@ class TemplateEngine:
 
 
 class ProcessManager:
-    """Process execution manager - 80/20 implementation"""
+    """Process execution manager - 80/20 implementation
     
-    def __init__(self):
+    Commands run through the shared AsyncProcessRunner, so concurrent BPMN
+    service tasks overlap Weaver invocations instead of blocking the loop.
+    ``start_weaver_command`` returns the process id before the command
+    finishes, so it can be passed to ``cancel`` while the command runs.
+    """
+    
+    def __init__(self, runner: Optional[AsyncProcessRunner] = None, timeout: float = 300):
         self.validator = SpanBasedValidator()
-        self.active_processes = {}
+        self.runner = runner or get_process_runner()
+        self.timeout = timeout
+        self.active_processes: Dict[str, asyncio.Task] = {}
     
-    async def execute_weaver_command(self, command_args: List[str], working_dir: Optional[Path] = None) -> Dict[str, Any]:
-        """Execute weaver command - CORE functionality"""
+    async def execute_weaver_command(self, command_args: List[str], working_dir: Optional[Path] = None,
+                                     timeout: Optional[float] = None,
+                                     on_output: Optional[LineHandler] = None,
+                                     process_id: Optional[str] = None) -> Dict[str, Any]:
+        """Execute weaver command - CORE functionality
+        
+        ``on_output`` receives each stdout/stderr line while the command runs.
+        A caller-supplied ``process_id`` can be cancelled from another task.
+        """
         
         command_span = self.validator._start_span("process.execute_weaver")
-        process_id = str(uuid.uuid4())[:8]
+        process_id = process_id or str(uuid.uuid4())[:8]
+        task = asyncio.current_task()
         
         try:
-            # Find weaver binary
-            weaver_path = shutil.which("weaver")
+            if self.active_processes.get(process_id, task) is not task:
+                raise WeaverGenError(f"Process id already running: {process_id}")
+            
+            weaver_path = find_weaver_binary()
             if not weaver_path:
-                # Check common locations
-                common_paths = [
-                    Path.home() / ".cargo" / "bin" / "weaver",
-                    Path("/usr/local/bin/weaver"),
-                    Path("/opt/homebrew/bin/weaver")
-                ]
-                
-                for path in common_paths:
-                    if path.exists():
-                        weaver_path = str(path)
-                        break
-                
-                if not weaver_path:
-                    raise WeaverGenError("Weaver binary not found")
+                raise WeaverGenError("Weaver binary not found")
             
             # Build command
-            full_command = [weaver_path] + command_args
+            full_command = [str(weaver_path)] + command_args
             
             # Execute
-            start_time = time.time()
-            result = subprocess.run(
-                full_command,
-                cwd=working_dir,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
-            end_time = time.time()
+            self.active_processes[process_id] = task
+            try:
+                result = await self.runner.run(
+                    full_command,
+                    cwd=working_dir,
+                    timeout=timeout or self.timeout,
+                    on_stdout=on_output,
+                    on_stderr=on_output
+                )
+            finally:
+                self.active_processes.pop(process_id, None)
+            
+            if result.timed_out:
+                command_span["attributes"] = {
+                    "process.id": process_id,
+                    "process.success": False,
+                    "process.error": "timeout"
+                }
+                
+                self.validator._end_span(command_span)
+                return {
+                    "process_id": process_id,
+                    "success": False,
+                    "error": "Command timed out",
+                    "timeout": True,
+                    "stdout": result.stdout,
+                    "stderr": result.stderr
+                }
             
             execution_result = {
                 "process_id": process_id,
                 "command": full_command,
-                "return_code": result.returncode,
+                "return_code": result.return_code,
                 "stdout": result.stdout,
                 "stderr": result.stderr,
-                "duration_seconds": end_time - start_time,
-                "success": result.returncode == 0,
+                "duration_seconds": result.duration_seconds,
+                "success": result.success,
                 "working_dir": str(working_dir) if working_dir else None
             }
             
             command_span["attributes"] = {
                 "process.id": process_id,
                 "process.command": " ".join(full_command),
-                "process.return_code": result.returncode,
+                "process.return_code": result.return_code,
                 "process.duration_seconds": execution_result["duration_seconds"],
                 "process.success": execution_result["success"],
-                "process.stdout_length": len(result.stdout) if result.stdout else 0,
-                "process.stderr_length": len(result.stderr) if result.stderr else 0
+                "process.stdout_length": len(result.stdout),
+                "process.stderr_length": len(result.stderr)
             }
             
             self.validator._end_span(command_span)
             return execution_result
             
-        except subprocess.TimeoutExpired:
-            error_result = {
-                "process_id": process_id,
-                "success": False,
-                "error": "Command timed out",
-                "timeout": True
-            }
-            
+        except asyncio.CancelledError:
             command_span["attributes"] = {
                 "process.id": process_id,
                 "process.success": False,
-                "process.error": "timeout"
+                "process.error": "cancelled"
             }
             
             self.validator._end_span(command_span)
-            return error_result
+            raise
             
         except Exception as e:
             error_result = {
@@ -495,6 +512,26 @@ class ProcessManager:
             
             self.validator._end_span(command_span)
             return error_result
+    
+    def start_weaver_command(self, command_args: List[str], working_dir: Optional[Path] = None,
+                             timeout: Optional[float] = None,
+                             on_output: Optional[LineHandler] = None) -> Tuple[str, asyncio.Task]:
+        """Schedule a weaver command and return its process id and task"""
+        process_id = str(uuid.uuid4())[:8]
+        task = asyncio.ensure_future(self.execute_weaver_command(
+            command_args, working_dir, timeout, on_output, process_id=process_id
+        ))
+        # Registered before the task runs, so it can be cancelled immediately
+        self.active_processes[process_id] = task
+        task.add_done_callback(lambda _: self.active_processes.pop(process_id, None))
+        return process_id, task
+    
+    def cancel(self, process_id: str) -> bool:
+        """Cancel a running command; its child process is terminated"""
+        task = self.active_processes.get(process_id)
+        if task is None or task.done():
+            return False
+        return task.cancel()
 
 
 # 80/20 Integration Test - NO PYTESTS
@@ -2,14 +2,26 @@
 """
 WeaverGen Semantic Convention Parser
 Parses OpenTelemetry semantic conventions from YAML/JSON
+
+``SemanticRegistry`` loads a whole directory of convention files, indexes
+groups, attributes and cross-file ``ref:`` links, and on refresh re-parses
+only the files whose content actually changed.
 """
 
+import hashlib
+import os
 import yaml
 import json
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
+# libyaml is several times faster than the pure-Python loader when present
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CONVENTION_SUFFIXES = (".yaml", ".yml", ".json")
+REGISTRY_CACHE_VERSION = 2
+
 @dataclass
 class ParsedConvention:
     """Parsed semantic convention"""
@@ -29,15 +41,25 @@ class SemanticConventionParser:
         if not file_path.exists():
             raise FileNotFoundError(f"Convention file not found: {file_path}")
         
-        with open(file_path) as f:
-            if file_path.suffix == '.yaml' or file_path.suffix == '.yml':
-                data = yaml.safe_load(f)
-            else:
-                data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = self.load_document(f.read(), file_path.suffix)
+        
+        return self.parse_convention_data(data, file_path.stem)
+    
+    def load_document(self, content: bytes, suffix: str) -> Any:
+        """Decode raw YAML/JSON content"""
+        if suffix in ('.yaml', '.yml'):
+            return yaml.load(content, Loader=_YAML_LOADER)
+        return json.loads(content)
+    
+    def parse_convention_data(self, data: Any, name: str) -> ParsedConvention:
+        """Build a convention from an already-decoded document"""
+        if not isinstance(data, dict):
+            data = {}
         
         # Extract convention metadata
         convention = ParsedConvention(
-            name=file_path.stem,
+            name=name,
             type=data.get('type', 'span'),
             brief=data.get('brief', ''),
             stability=data.get('stability', 'stable')
@@ -45,15 +67,15 @@ class SemanticConventionParser:
         
         # Parse groups (main structure)
         if 'groups' in data:
-            convention.groups = data['groups']
+            convention.groups = data['groups'] or []
             # Extract all attributes from groups
             for group in convention.groups:
                 if 'attributes' in group:
-                    convention.attributes.extend(group['attributes'])
+                    convention.attributes.extend(group['attributes'] or [])
         
         # Direct attributes (fallback)
         if 'attributes' in data:
-            convention.attributes.extend(data['attributes'])
+            convention.attributes.extend(data['attributes'] or [])
         
         return convention
     
@@ -67,11 +89,285 @@ class SemanticConventionParser:
         if not convention.attributes:
             issues.append("Convention must have attributes")
         
-        # Validate attributes
+        # Validate attributes (a `ref:` reuses a definition from elsewhere)
         for attr in convention.attributes:
+            if 'ref' in attr:
+                continue
             if 'id' not in attr:
                 issues.append(f"Attribute missing 'id': {attr}")
             if 'type' not in attr:
                 issues.append(f"Attribute missing 'type': {attr.get('id', 'unknown')}")
         
         return issues
+
+
+# ============================================================================
+# Multi-file registry model
+# ============================================================================
+
+@dataclass
+class RegistryFile:
+    """One convention file and what it contributes to the registry"""
+    path: Path
+    mtime_ns: int
+    size: int
+    digest: str
+    convention: ParsedConvention
+    issues: List[str] = field(default_factory=list)
+    group_ids: List[str] = field(default_factory=list)
+    attribute_ids: List[str] = field(default_factory=list)
+    refs: List[Tuple[str, str]] = field(default_factory=list)  # (group id, referenced attribute)
+    parsed: bool = True
+
+
+@dataclass
+class RegistryDelta:
+    """Files touched by a refresh"""
+    added: List[Path] = field(default_factory=list)
+    changed: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    unchanged: int = 0
+    
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def qualified_attributes(group: Dict[str, Any]) -> Iterable[Tuple[Optional[str], Optional[str], Dict[str, Any]]]:
+    """Yield (defined id, referenced id, attribute) for a group's attributes"""
+    prefix = group.get('prefix')
+    for attr in group.get('attributes') or []:
+        if not isinstance(attr, dict):
+            continue
+        if 'ref' in attr:
+            yield None, attr['ref'], attr
+        elif 'id' in attr:
+            attr_id = f"{prefix}.{attr['id']}" if prefix else attr['id']
+            yield attr_id, None, attr
+
+
+def _exact_json(data: Any) -> bool:
+    """Whether ``data`` survives a JSON round trip unchanged"""
+    try:
+        return json.loads(json.dumps(data)) == data
+    except (TypeError, ValueError):
+        return False  # dates, sets and the like: always parse these files fresh
+
+
+class SemanticRegistry:
+    """Incrementally maintained model of a directory of convention files
+    
+    Files are re-read only when their mtime or size changed, and re-parsed
+    only when their content hash changed. Parsed documents can be persisted
+    to a JSON cache so a new process skips YAML parsing for unchanged files.
+    The cache holds only the documents of the current files, and only those
+    that JSON represents exactly.
+    """
+    
+    def __init__(self, root: Path, parser: Optional[SemanticConventionParser] = None,
+                 cache_file: Optional[Path] = None):
+        self.root = Path(root)
+        self.parser = parser or SemanticConventionParser()
+        self.cache_file = cache_file
+        self.files: Dict[Path, RegistryFile] = {}
+        
+        # Indexes across all files
+        self.groups: Dict[str, Dict[str, Any]] = {}
+        self.group_files: Dict[str, Path] = {}
+        self.attributes: Dict[str, Dict[str, Any]] = {}
+        self.attribute_files: Dict[str, Path] = {}
+        self.references: Dict[str, Set[str]] = {}  # attribute id -> referencing group ids
+        self.duplicates: List[str] = []
+
+        self._cached_documents: Dict[str, Any] = {}  # digest -> decoded document
+        self._cache_dirty = False
+        if cache_file:
+            self._load_cache()
+    
+    # -- discovery and refresh -----------------------------------------------
+    
+    def discover(self) -> List[Path]:
+        """Convention files under the registry root (or the root itself)"""
+        if self.root.is_file():
+            return [self.root]
+        found = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+            for filename in sorted(filenames):
+                if filename.endswith(CONVENTION_SUFFIXES):
+                    found.append(Path(dirpath) / filename)
+        return found
+    
+    def refresh(self) -> RegistryDelta:
+        """Bring the model up to date with the files on disk"""
+        delta = RegistryDelta()
+        seen: Set[Path] = set()
+        
+        for path in self.discover():
+            seen.add(path)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            record = self.files.get(path)
+            if record and record.mtime_ns == stat.st_mtime_ns and record.size == stat.st_size:
+                delta.unchanged += 1
+                continue
+            
+            try:
+                content = path.read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+            if record and record.digest == digest:
+                # Touched but identical: keep the parsed model
+                record.mtime_ns, record.size = stat.st_mtime_ns, stat.st_size
+                delta.unchanged += 1
+                continue
+            
+            if record:
+                self._unindex(record)
+            self.files[path] = self._parse(path, content, digest, stat)
+            self._index(self.files[path])
+            (delta.changed if record else delta.added).append(path)
+        
+        for path in [p for p in self.files if p not in seen]:
+            self._unindex(self.files.pop(path))
+            delta.removed.append(path)
+        
+        if delta.has_changes:
+            self._rebuild_duplicates()
+        if self.cache_file and (self._cache_dirty or delta.has_changes):
+            self._save_cache()
+        return delta
+    
+    def _parse(self, path: Path, content: bytes, digest: str, stat: os.stat_result) -> RegistryFile:
+        if digest in self._cached_documents:
+            data = self._cached_documents[digest]
+        else:
+            try:
+                data = self.parser.load_document(content, path.suffix)
+            except (yaml.YAMLError, ValueError) as e:
+                convention = ParsedConvention(name=path.stem)
+                return RegistryFile(path, stat.st_mtime_ns, stat.st_size, digest, convention,
+                                    issues=[f"Parse error: {e}"], parsed=False)
+            if self.cache_file and _exact_json(data):
+                self._cached_documents[digest] = data
+                self._cache_dirty = True
+        
+        convention = self.parser.parse_convention_data(data, path.stem)
+        record = RegistryFile(path, stat.st_mtime_ns, stat.st_size, digest, convention,
+                              issues=self.parser.validate_convention(convention))
+        for group in convention.groups:
+            if not isinstance(group, dict) or 'id' not in group:
+                continue
+            record.group_ids.append(group['id'])
+            for attr_id, ref, _ in qualified_attributes(group):
+                if attr_id:
+                    record.attribute_ids.append(attr_id)
+                else:
+                    record.refs.append((group['id'], ref))
+        return record
+    
+    def _index(self, record: RegistryFile) -> None:
+        for group in record.convention.groups:
+            if not isinstance(group, dict) or 'id' not in group:
+                continue
+            self.groups.setdefault(group['id'], group)
+            self.group_files.setdefault(group['id'], record.path)
+            for attr_id, _, attr in qualified_attributes(group):
+                if attr_id:
+                    self.attributes.setdefault(attr_id, attr)
+                    self.attribute_files.setdefault(attr_id, record.path)
+        for group_id, ref in record.refs:
+            self.references.setdefault(ref, set()).add(group_id)
+    
+    def _unindex(self, record: RegistryFile) -> None:
+        for group_id in record.group_ids:
+            if self.group_files.get(group_id) == record.path:
+                del self.groups[group_id], self.group_files[group_id]
+        for attr_id in record.attribute_ids:
+            if self.attribute_files.get(attr_id) == record.path:
+                del self.attributes[attr_id], self.attribute_files[attr_id]
+        for group_id, ref in record.refs:
+            referrers = self.references.get(ref)
+            if referrers is not None:
+                referrers.discard(group_id)
+                if not referrers:
+                    del self.references[ref]
+        # A definition shadowed by the removed file may now be the winner
+        if record.group_ids or record.attribute_ids:
+            for other in self.files.values():
+                if other is not record and (set(other.group_ids) & set(record.group_ids) or
+                                            set(other.attribute_ids) & set(record.attribute_ids)):
+                    self._index(other)
+    
+    def _rebuild_duplicates(self) -> None:
+        owners: Dict[Tuple[str, str], List[Path]] = {}
+        for record in self.files.values():
+            for group_id in set(record.group_ids):
+                owners.setdefault(("group", group_id), []).append(record.path)
+            for attr_id in set(record.attribute_ids):
+                owners.setdefault(("attribute", attr_id), []).append(record.path)
+        self.duplicates = [
+            f"Duplicate {kind} '{ident}' defined in: {', '.join(str(p) for p in sorted(paths))}"
+            for (kind, ident), paths in sorted(owners.items()) if len(paths) > 1
+        ]
+    
+    # -- queries ---------------------------------------------------------------
+    
+    def unresolved_references(self) -> Dict[str, Set[str]]:
+        """``ref:`` targets with no definition anywhere in the registry"""
+        return {ref: groups for ref, groups in self.references.items() if ref not in self.attributes}
+    
+    def resolve(self, attribute_id: str) -> Optional[Dict[str, Any]]:
+        return self.attributes.get(attribute_id)
+    
+    def parse_errors(self) -> List[str]:
+        """Issues of files that could not be parsed at all"""
+        return [f"{path}: {issue}" for path in sorted(self.files)
+                for issue in self.files[path].issues if not self.files[path].parsed]
+    
+    def validate(self) -> List[str]:
+        """Per-file issues (computed at parse time) plus cross-file checks"""
+        issues = []
+        for path in sorted(self.files):
+            issues.extend(f"{path}: {issue}" for issue in self.files[path].issues)
+        issues.extend(self.duplicates)
+        for ref, groups in sorted(self.unresolved_references().items()):
+            issues.append(f"Unresolved ref '{ref}' used by: {', '.join(sorted(groups))}")
+        return issues
+    
+    def fingerprint(self) -> str:
+        """Stable hash of the registry content"""
+        digest = hashlib.blake2b(digest_size=16)
+        for path in sorted(self.files):
+            digest.update(str(path.relative_to(self.root) if path != self.root else path.name).encode())
+            digest.update(self.files[path].digest.encode())
+        return digest.hexdigest()
+    
+    # -- persistent parse cache ------------------------------------------------
+    
+    def _load_cache(self) -> None:
+        try:
+            with open(self.cache_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == REGISTRY_CACHE_VERSION:
+            self._cached_documents = data.get('documents', {})
+    
+    def _save_cache(self) -> None:
+        live = {record.digest for record in self.files.values()}
+        documents = {d: doc for d, doc in self._cached_documents.items() if d in live}
+        self._cached_documents = documents
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp, 'w') as f:
+                json.dump({'version': REGISTRY_CACHE_VERSION, 'documents': documents}, f)
+            os.replace(tmp, self.cache_file)
+        except OSError:
+            pass  # the cache is an optimization only
+        self._cache_dirty = False
+
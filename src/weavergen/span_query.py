@@ -0,0 +1,677 @@
+"""
+Span Query Engine
+
+Indexed queries over captured span files. A span file is streamed once
+into an on-disk SQLite index (name, trace, attribute key/value, duration)
+stored next to the file, so repeated `debug spans` runs only touch the
+rows they display.
+
+Filter expressions:
+
+    name ~ "bpmn.*" and duration > 10ms
+    trace = 0xabc... or (status = ERROR and not has bpmn.task.id)
+    bpmn.task.type = service and memory.delta.bytes >= 1048576
+
+Built-in fields are name, trace, span, parent, status, duration, start
+and end. Any other field (or one prefixed with ``attr.``) is an
+attribute key.
+"""
+
+import itertools
+import json
+import os
+import re
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx.sqlite"
+_READ_CHUNK = 1 << 20
+_INSERT_BATCH = 10_000
+
+
+class SpanQueryError(ValueError):
+    """Raised for malformed filter expressions or unreadable span files"""
+
+
+# ============================================================================
+# Span normalization
+# ============================================================================
+
+def to_nanoseconds(value: Any) -> Optional[int]:
+    """Convert an epoch number or ISO-8601 timestamp into epoch nanoseconds"""
+    if value is None or value == "" or isinstance(value, bool):
+        return None
+
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            value = float(text)
+        except ValueError:
+            try:
+                parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            delta = parsed - datetime(1970, 1, 1, tzinfo=timezone.utc)
+            return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+    if not isinstance(value, (int, float)):
+        return None
+
+    # Guess the epoch unit from magnitude (seconds .. nanoseconds)
+    magnitude = abs(value)
+    if magnitude >= 1e17:
+        return int(value)
+    if magnitude >= 1e14:
+        return int(value * 1_000)
+    if magnitude >= 1e11:
+        return int(value * 1_000_000)
+    return int(value * 1_000_000_000)
+
+
+_DURATION_UNITS = {
+    "ns": 1,
+    "us": 1_000,
+    "µs": 1_000,
+    "ms": 1_000_000,
+    "s": 1_000_000_000,
+    "m": 60_000_000_000,
+}
+_DURATION_RE = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*(ns|us|µs|ms|s|m)?\s*$")
+
+
+def parse_duration(text: str) -> int:
+    """Parse '250us', '10ms', '1.5s' into nanoseconds (bare numbers are ms)"""
+    match = _DURATION_RE.match(str(text))
+    if not match:
+        raise SpanQueryError(f"Invalid duration: {text!r}")
+    number, unit = match.groups()
+    return int(float(number) * _DURATION_UNITS[unit or "ms"])
+
+
+def format_duration(duration_ns: Optional[int]) -> str:
+    """Human readable duration"""
+    if duration_ns is None:
+        return "N/A"
+    if duration_ns < 1_000:
+        return f"{duration_ns}ns"
+    if duration_ns < 1_000_000:
+        return f"{duration_ns / 1_000:.1f}µs"
+    if duration_ns < 1_000_000_000:
+        return f"{duration_ns / 1_000_000:.2f}ms"
+    return f"{duration_ns / 1_000_000_000:.2f}s"
+
+
+def _attribute_text(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return str(value)
+
+
+def _attribute_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def normalize_span(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Map the span dict shapes written across WeaverGen onto one record"""
+    context = raw.get("context") or {}
+    parent = raw.get("parent_id") or raw.get("parent_span_id") or raw.get("parent")
+    if isinstance(parent, dict):
+        parent = parent.get("span_id")
+
+    status = raw.get("status")
+    if isinstance(status, dict):
+        status = status.get("status_code") or status.get("code")
+    if status is not None:
+        status = str(status).replace("StatusCode.", "").upper()
+
+    start_ns = to_nanoseconds(raw.get("start_time", raw.get("timestamp")))
+    end_ns = to_nanoseconds(raw.get("end_time"))
+
+    duration_ns = raw.get("duration_ns")
+    if duration_ns is None and raw.get("duration_ms") is not None:
+        duration_ns = float(raw["duration_ms"]) * 1_000_000
+    if duration_ns is None and start_ns is not None and end_ns is not None:
+        duration_ns = end_ns - start_ns
+
+    return {
+        "name": raw.get("name") or "unknown",
+        "trace_id": raw.get("trace_id") or context.get("trace_id"),
+        "span_id": raw.get("span_id") or context.get("span_id"),
+        "parent_id": parent,
+        "status": status,
+        "start_ns": start_ns,
+        "end_ns": end_ns,
+        "duration_ns": int(duration_ns) if duration_ns is not None else None,
+        "attributes": raw.get("attributes") or {},
+    }
+
+
+def iter_span_file(span_file: Path) -> Iterator[Dict[str, Any]]:
+    """Stream span dicts from a JSON array, JSON lines or {"spans": [...]} file"""
+    decoder = json.JSONDecoder()
+
+    with open(span_file, encoding="utf-8") as f:
+        buffer = f.read(_READ_CHUNK)
+        pos = 0
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        if pos == len(buffer):
+            return
+
+        if buffer[pos] != "[":
+            # JSON lines, or a single document wrapping the span list
+            head = buffer[pos:]
+            if "\n" not in head:
+                head += f.readline()
+            first, _, rest = head.partition("\n")
+            try:
+                document = json.loads(first)
+            except json.JSONDecodeError:
+                # A pretty-printed document has to be read whole
+                document = json.loads(head + f.read())
+                rest = ""
+            if rest and not rest.endswith("\n"):
+                rest += f.readline()
+
+            lines = itertools.chain(rest.splitlines(), f)
+            following = next((line for line in lines if line.strip()), None)
+            if following is None:
+                if isinstance(document, dict) and "spans" in document:
+                    yield from document["spans"]
+                elif isinstance(document, dict):
+                    yield document
+                return
+            # JSON lines: stream the rest of the handle line by line
+            yield document
+            yield json.loads(following)
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        pos += 1
+        eof = False
+        while True:
+            while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ","):
+                pos += 1
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+            if pos >= len(buffer) and eof:
+                raise SpanQueryError(f"Unterminated span array in {span_file}")
+
+            try:
+                if pos >= len(buffer):
+                    raise json.JSONDecodeError("need more data", buffer, pos)
+                span, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise SpanQueryError(f"Malformed span file {span_file} near offset {pos}")
+                chunk = f.read(_READ_CHUNK)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+
+            yield span
+            pos = end
+            if pos > _READ_CHUNK:
+                buffer = buffer[pos:]
+                pos = 0
+
+
+# ============================================================================
+# Filter expression language
+# ============================================================================
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<lparen>\()|(?P<rparen>\))|
+        (?P<op>!=|<=|>=|=|<|>|~)|
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|
+        (?P<word>[^\s()=!<>~"']+)
+    )""",
+    re.VERBOSE,
+)
+
+_COLUMNS = {
+    "name": "name",
+    "trace": "trace_id",
+    "trace_id": "trace_id",
+    "span": "span_id",
+    "span_id": "span_id",
+    "parent": "parent_id",
+    "parent_id": "parent_id",
+    "status": "status",
+    "duration": "duration_ns",
+    "start": "start_ns",
+    "end": "end_ns",
+}
+_NUMERIC_COLUMNS = {"duration_ns", "start_ns", "end_ns"}
+_KEYWORDS = {"and", "or", "not", "has"}
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    expression = expression.strip()
+    while pos < len(expression):
+        match = _TOKEN_RE.match(expression, pos)
+        if not match or match.end() == pos:
+            raise SpanQueryError(f"Unexpected character at {pos}: {expression[pos:pos + 10]!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif kind == "word" and value.lower() in _KEYWORDS:
+            kind, value = "keyword", value.lower()
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+class _FilterCompiler:
+    """Recursive-descent compiler from a filter expression to SQL"""
+
+    def __init__(self, expression: str):
+        self.tokens = _tokenize(expression)
+        self.pos = 0
+        self.params: List[Any] = []
+
+    def compile(self) -> Tuple[str, List[Any]]:
+        if not self.tokens:
+            return "1", []
+        sql = self._or()
+        if self.pos != len(self.tokens):
+            raise SpanQueryError(f"Unexpected token {self.tokens[self.pos][1]!r}")
+        return sql, self.params
+
+    def _peek(self) -> Tuple[str, str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else ("eof", "")
+
+    def _take(self, kind: str) -> str:
+        token_kind, value = self._peek()
+        if token_kind != kind:
+            raise SpanQueryError(f"Expected {kind}, got {value or 'end of expression'!r}")
+        self.pos += 1
+        return value
+
+    def _or(self) -> str:
+        parts = [self._and()]
+        while self._peek() == ("keyword", "or"):
+            self.pos += 1
+            parts.append(self._and())
+        return parts[0] if len(parts) == 1 else "(" + " OR ".join(parts) + ")"
+
+    def _and(self) -> str:
+        parts = [self._not()]
+        while self._peek() == ("keyword", "and"):
+            self.pos += 1
+            parts.append(self._not())
+        return parts[0] if len(parts) == 1 else "(" + " AND ".join(parts) + ")"
+
+    def _not(self) -> str:
+        if self._peek() == ("keyword", "not"):
+            self.pos += 1
+            return f"NOT {self._not()}"
+        return self._atom()
+
+    def _atom(self) -> str:
+        kind, value = self._peek()
+        if kind == "lparen":
+            self.pos += 1
+            inner = self._or()
+            self._take("rparen")
+            return f"({inner})"
+        if (kind, value) == ("keyword", "has"):
+            self.pos += 1
+            key = self._field_name()
+            self.params.append(key)
+            return "rowid IN (SELECT span_rowid FROM attrs WHERE key = ?)"
+
+        name = self._field_name()
+        op = self._take("op")
+        literal_kind, literal = self._peek()
+        if literal_kind not in ("word", "string"):
+            raise SpanQueryError(f"Expected a value after {name} {op}")
+        self.pos += 1
+
+        if name.startswith("attr."):
+            return self._attribute(name[5:], op, literal)
+        if name in _COLUMNS:
+            return self._column(_COLUMNS[name], op, literal)
+        return self._attribute(name, op, literal)
+
+    def _field_name(self) -> str:
+        kind, value = self._peek()
+        if kind not in ("word", "string"):
+            raise SpanQueryError(f"Expected a field name, got {value or 'end of expression'!r}")
+        self.pos += 1
+        return value
+
+    def _column(self, column: str, op: str, literal: str) -> str:
+        if column == "duration_ns":
+            value: Any = parse_duration(literal)
+        elif column in _NUMERIC_COLUMNS:
+            value = to_nanoseconds(literal)
+            if value is None:
+                raise SpanQueryError(f"Invalid timestamp: {literal!r}")
+        elif column == "status":
+            value = literal.upper()
+        else:
+            value = literal
+
+        if op == "~":
+            self.params.append(_glob(literal))
+            return f"{column} GLOB ?"
+        self.params.append(value)
+        if op == "!=":
+            return f"({column} IS NULL OR {column} != ?)"
+        return f"{column} {op} ?"
+
+    def _attribute(self, key: str, op: str, literal: str) -> str:
+        subquery = "rowid IN (SELECT span_rowid FROM attrs WHERE key = ? AND {})"
+        self.params.append(key)
+        if op in ("=", "!="):
+            self.params.append(literal)
+            clause = subquery.format("value = ?")
+            return f"NOT {clause}" if op == "!=" else clause
+        if op == "~":
+            self.params.append(_glob(literal))
+            return subquery.format("value GLOB ?")
+        try:
+            self.params.append(float(literal))
+        except ValueError:
+            raise SpanQueryError(f"Attribute comparison {key} {op} needs a number, got {literal!r}")
+        return subquery.format(f"num {op} ?")
+
+
+def _glob(pattern: str) -> str:
+    return pattern if any(c in pattern for c in "*?[") else f"*{pattern}*"
+
+
+def compile_filter(expression: Optional[str]) -> Tuple[str, List[Any]]:
+    """Compile a filter expression into a SQL WHERE clause and parameters"""
+    return _FilterCompiler(expression or "").compile()
+
+
+# ============================================================================
+# On-disk index
+# ============================================================================
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE spans (
+    rowid INTEGER PRIMARY KEY,
+    name TEXT,
+    trace_id TEXT,
+    span_id TEXT,
+    parent_id TEXT,
+    status TEXT,
+    start_ns INTEGER,
+    end_ns INTEGER,
+    duration_ns INTEGER,
+    doc TEXT
+);
+CREATE TABLE attrs (span_rowid INTEGER, key TEXT, value TEXT, num REAL);
+"""
+
+_INDEXES = """
+CREATE INDEX idx_spans_name_duration ON spans(name, duration_ns);
+CREATE INDEX idx_spans_trace ON spans(trace_id);
+CREATE INDEX idx_spans_duration ON spans(duration_ns);
+CREATE INDEX idx_spans_start ON spans(start_ns);
+CREATE INDEX idx_attrs_key_value ON attrs(key, value);
+CREATE INDEX idx_attrs_key_num ON attrs(key, num);
+"""
+
+_SORT_COLUMNS = {
+    "file": "rowid",
+    "start": "start_ns",
+    "duration": "duration_ns",
+    "name": "name",
+}
+
+
+@dataclass
+class IndexedSpan:
+    """A span row returned from the index"""
+    name: str
+    trace_id: Optional[str]
+    span_id: Optional[str]
+    parent_id: Optional[str]
+    status: Optional[str]
+    start_ns: Optional[int]
+    end_ns: Optional[int]
+    duration_ns: Optional[int]
+    raw: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return self.raw.get("attributes") or {}
+
+    @property
+    def duration(self) -> str:
+        return format_duration(self.duration_ns)
+
+
+@dataclass
+class SpanQueryResult:
+    """One page of query results"""
+    total: int
+    offset: int
+    limit: int
+    spans: List[IndexedSpan] = field(default_factory=list)
+
+    @property
+    def has_more(self) -> bool:
+        return self.offset + len(self.spans) < self.total
+
+
+class SpanIndex:
+    """SQLite index over a span file, rebuilt when the file changes"""
+
+    def __init__(self, span_file: Union[str, Path], index_file: Optional[Path] = None):
+        self.span_file = Path(span_file)
+        self.index_file = index_file or self.span_file.with_name(self.span_file.name + INDEX_SUFFIX)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def _source_fingerprint(self) -> Dict[str, str]:
+        stat = self.span_file.stat()
+        return {
+            "version": str(INDEX_VERSION),
+            "source_size": str(stat.st_size),
+            "source_mtime_ns": str(stat.st_mtime_ns),
+        }
+
+    def is_fresh(self) -> bool:
+        """True when the on-disk index matches the current span file"""
+        if not self.index_file.exists():
+            return False
+        try:
+            conn = sqlite3.connect(f"file:{self.index_file}?mode=ro", uri=True)
+            try:
+                meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return False
+        return all(meta.get(k) == v for k, v in self._source_fingerprint().items())
+
+    def open(self, rebuild: bool = False) -> "SpanIndex":
+        """Open the index, building it first if missing or stale"""
+        if not self.span_file.exists():
+            raise SpanQueryError(f"Span file not found: {self.span_file}")
+        if rebuild or not self.is_fresh():
+            self.build()
+        if self._conn is None:
+            self._conn = sqlite3.connect(f"file:{self.index_file}?mode=ro", uri=True)
+        return self
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "SpanIndex":
+        return self.open()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def build(self) -> int:
+        """Stream the span file into a fresh index; returns the span count"""
+        self.close()
+        tmp_file = self.index_file.with_name(f"{self.index_file.name}.{os.getpid()}.tmp")
+        if tmp_file.exists():
+            tmp_file.unlink()
+
+        conn = sqlite3.connect(tmp_file)
+        try:
+            conn.executescript("PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF;" + _SCHEMA)
+            name_counts: Counter = Counter()
+            span_rows: List[Tuple[Any, ...]] = []
+            attr_rows: List[Tuple[Any, ...]] = []
+            rowid = 0
+
+            for raw in iter_span_file(self.span_file):
+                if not isinstance(raw, dict):
+                    continue
+                rowid += 1
+                span = normalize_span(raw)
+                name_counts[span["name"]] += 1
+                span_rows.append((
+                    rowid, span["name"], span["trace_id"], span["span_id"], span["parent_id"],
+                    span["status"], span["start_ns"], span["end_ns"], span["duration_ns"],
+                    json.dumps(raw, separators=(",", ":"), default=str),
+                ))
+                for key, value in span["attributes"].items():
+                    attr_rows.append((rowid, key, _attribute_text(value), _attribute_number(value)))
+
+                if len(span_rows) >= _INSERT_BATCH:
+                    self._flush(conn, span_rows, attr_rows)
+
+            self._flush(conn, span_rows, attr_rows)
+            conn.executescript(_INDEXES)
+
+            stats = self._compute_stats(conn, rowid, name_counts)
+            meta = dict(self._source_fingerprint(), stats=json.dumps(stats))
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", meta.items())
+            conn.commit()
+        finally:
+            conn.close()
+
+        os.replace(tmp_file, self.index_file)
+        return rowid
+
+    @staticmethod
+    def _flush(conn: sqlite3.Connection, span_rows: List[Tuple[Any, ...]],
+               attr_rows: List[Tuple[Any, ...]]) -> None:
+        conn.executemany("INSERT INTO spans VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", span_rows)
+        conn.executemany("INSERT INTO attrs VALUES (?, ?, ?, ?)", attr_rows)
+        span_rows.clear()
+        attr_rows.clear()
+
+    @staticmethod
+    def _compute_stats(conn: sqlite3.Connection, total: int, name_counts: Counter) -> Dict[str, Any]:
+        timed = conn.execute("SELECT COUNT(*) FROM spans WHERE duration_ns IS NOT NULL").fetchone()[0]
+
+        def percentile(p: float) -> Optional[int]:
+            if not timed:
+                return None
+            offset = min(timed - 1, int(p * timed))
+            return conn.execute(
+                "SELECT duration_ns FROM spans WHERE duration_ns IS NOT NULL "
+                "ORDER BY duration_ns LIMIT 1 OFFSET ?", (offset,)
+            ).fetchone()[0]
+
+        return {
+            "total_spans": total,
+            "traces": conn.execute("SELECT COUNT(DISTINCT trace_id) FROM spans").fetchone()[0],
+            "error_spans": conn.execute("SELECT COUNT(*) FROM spans WHERE status = 'ERROR'").fetchone()[0],
+            "timed_spans": timed,
+            "duration_p50_ns": percentile(0.50),
+            "duration_p95_ns": percentile(0.95),
+            "duration_p99_ns": percentile(0.99),
+            "duration_max_ns": conn.execute("SELECT MAX(duration_ns) FROM spans").fetchone()[0],
+            "top_names": name_counts.most_common(10),
+        }
+
+    # -- queries ------------------------------------------------------------
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.open()
+        return self._conn
+
+    def stats(self) -> Dict[str, Any]:
+        """Summary statistics computed when the index was built"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'stats'").fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def count(self, where: Optional[str] = None) -> int:
+        """Number of spans matching a filter expression"""
+        if not where:
+            return self.stats().get("total_spans", 0)
+        clause, params = compile_filter(where)
+        return self.conn.execute(f"SELECT COUNT(*) FROM spans WHERE {clause}", params).fetchone()[0]
+
+    def query(self,
+              where: Optional[str] = None,
+              sort: str = "file",
+              descending: bool = False,
+              limit: Optional[int] = 50,
+              offset: int = 0) -> SpanQueryResult:
+        """Return one page of spans matching a filter expression (limit=None for all)"""
+        clause, params = compile_filter(where)
+        spans = self._select(clause, params, sort, descending, limit, offset)
+        return SpanQueryResult(total=self.count(where), offset=offset, limit=limit or 0, spans=spans)
+
+    def _select(self, clause: str, params: List[Any], sort: str, descending: bool,
+                limit: Optional[int], offset: int) -> List[IndexedSpan]:
+        if sort not in _SORT_COLUMNS:
+            raise SpanQueryError(f"Unknown sort key {sort!r}; use one of {', '.join(_SORT_COLUMNS)}")
+        direction = "DESC" if descending else "ASC"
+        column = _SORT_COLUMNS[sort]
+        # Tie-break on rowid in the same direction so SQLite can walk the index
+        order = f"{column} {direction}" if column == "rowid" else f"{column} {direction}, rowid {direction}"
+
+        rows = self.conn.execute(
+            "SELECT name, trace_id, span_id, parent_id, status, start_ns, end_ns, duration_ns, doc "
+            f"FROM spans WHERE {clause} ORDER BY {order} LIMIT ? OFFSET ?",
+            [*params, -1 if limit is None else max(limit, 0), max(offset, 0)],
+        ).fetchall()
+        return [IndexedSpan(*row[:8], raw=json.loads(row[8])) for row in rows]
+
+    def top(self, k: int = 10, where: Optional[str] = None) -> SpanQueryResult:
+        """The k slowest spans matching a filter expression"""
+        return self.query(where, sort="duration", descending=True, limit=k)
+
+    def trace(self, trace_id: str) -> List[IndexedSpan]:
+        """All spans of one trace ordered by start time"""
+        return self._select("trace_id = ?", [trace_id], "start", False, None, 0)
+
+
+def open_span_index(span_file: Union[str, Path], rebuild: bool = False) -> SpanIndex:
+    """Open (building if needed) the index for a span file"""
+    return SpanIndex(span_file).open(rebuild=rebuild)
@@ -0,0 +1,506 @@
+"""
+Persistent Span Ring Buffer
+
+A SpanExporter that writes finished spans into a fixed-size memory-mapped
+ring file instead of keeping them on the heap. When the ring is full, the
+oldest records are spilled to append-only JSON-lines segment files before
+they are overwritten; only the oldest segments are deleted once the segment
+limit is reached. Memory use is bounded by the ring size and spans survive
+a crash of the writing process.
+
+Layout of a capture directory::
+
+    ring.bin                    header + ring of [length, seq, json] records
+    ring.lock                   held by the single writer process
+    snapshot.jsonl              optional copy written by ``materialize()``
+    segment-<first seq>.jsonl   spilled spans, one JSON object per line
+
+Readers (validators, ``weavergen debug spans``) can open the directory at
+any time, including while the writer is still running.
+"""
+
+import fcntl
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+DEFAULT_CAPTURE_ROOT = Path(".weavergen/spans")
+DEFAULT_RING_BYTES = 8 * 1024 * 1024
+DEFAULT_SEGMENT_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_SEGMENTS = 8
+
+RING_FILE = "ring.bin"
+LOCK_FILE = "ring.lock"
+SNAPSHOT_FILE = "snapshot.jsonl"
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+
+_MAGIC = b"WGSPANR1"
+_VERSION = 1
+# magic, version, capacity, logical head, logical tail, head seq, tail seq, generation
+_HEADER = struct.Struct("<8sIxxxxQQQQQQ")
+_HEADER_SIZE = 64
+_GENERATION_OFFSET = _HEADER.size - 8
+_RECORD = struct.Struct("<IQ")
+_WRAP = 0xFFFFFFFF
+_READ_RETRIES = 100
+_RETRY_DELAY = 0.001
+
+
+class SpanRingError(RuntimeError):
+    """Raised when a capture directory cannot be read"""
+
+
+def span_to_record(span: ReadableSpan) -> Dict[str, Any]:
+    """Convert a finished SDK span to the dict shape the validators read"""
+    return {
+        "name": span.name,
+        "trace_id": f"0x{span.context.trace_id:032x}",
+        "span_id": f"0x{span.context.span_id:016x}",
+        "parent_id": f"0x{span.parent.span_id:016x}" if span.parent else None,
+        "start_time": span.start_time,
+        "end_time": span.end_time,
+        "duration_ns": span.end_time - span.start_time if span.end_time else 0,
+        "attributes": dict(span.attributes or {}),
+        "status": {
+            "status_code": span.status.status_code.name if span.status else "UNSET",
+            "description": span.status.description if span.status else None
+        },
+        "events": [
+            {
+                "name": event.name,
+                "timestamp": event.timestamp,
+                "attributes": dict(event.attributes or {})
+            }
+            for event in span.events
+        ],
+        "resource": dict(span.resource.attributes) if span.resource else {}
+    }
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return json.dumps(record, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _segment_name(first_seq: int) -> str:
+    return f"{SEGMENT_PREFIX}{first_seq:016d}{SEGMENT_SUFFIX}"
+
+
+def _segments(directory: Path) -> List[Tuple[int, Path]]:
+    """Segment files with their first sequence number, oldest first"""
+    found = []
+    for path in directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+        try:
+            found.append((int(path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]), path))
+        except ValueError:
+            continue
+    return sorted(found)
+
+
+def _next_record(data: Union[mmap.mmap, bytes], capacity: int,
+                 position: int) -> Tuple[int, Optional[int], Optional[bytes]]:
+    """Read the record at logical ``position``
+
+    Returns the logical position after it, its sequence number and payload;
+    sequence and payload are None when the position is a wrap point.
+    """
+    physical = position % capacity
+    if capacity - physical < _RECORD.size:
+        return position + (capacity - physical), None, None
+    length, seq = _RECORD.unpack_from(data, _HEADER_SIZE + physical)
+    if length == _WRAP:
+        return position + (capacity - physical), None, None
+    start = _HEADER_SIZE + physical + _RECORD.size
+    return position + _RECORD.size + length, seq, bytes(data[start:start + length])
+
+
+# ============================================================================
+# Writer
+# ============================================================================
+
+class RingBufferSpanExporter(SpanExporter):
+    """Bounded, crash-safe span exporter backed by a memory-mapped ring file
+
+    ``get_finished_spans()`` and ``clear()`` mirror InMemorySpanExporter so
+    existing callers keep working: ``clear()`` only moves the start of what
+    this exporter returns, the capture on disk is left intact.
+    """
+
+    def __init__(self,
+                 directory: Union[str, Path] = DEFAULT_CAPTURE_ROOT / "default",
+                 ring_bytes: int = DEFAULT_RING_BYTES,
+                 segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+                 max_segments: int = DEFAULT_MAX_SEGMENTS):
+        self.ring_bytes = ring_bytes
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self._lock = threading.Lock()
+        self._closed = False
+        self._segment_file = None
+        self._segment_size = 0
+        self.stats = {"exported": 0, "spilled": 0, "segments_deleted": 0}
+
+        self._map: Optional[mmap.mmap] = None
+        self._since_seq = 0
+        # The ring is opened on first use so importing a module that builds
+        # an exporter does not touch the filesystem
+        self.directory = Path(directory)
+
+    def _ensure_open(self) -> None:
+        if self._map is None:
+            self.directory = self._acquire(self.directory)
+            self._open_ring()
+            self._since_seq = self._head_seq
+
+    # -- setup --------------------------------------------------------------
+
+    def _acquire(self, directory: Path) -> Path:
+        """Lock ``directory`` for writing, or a per-process sibling if it is taken
+
+        Siblings left behind by writers that have exited are unlocked, so they
+        are reused before a new one is created.
+        """
+        sibling = re.compile(rf"{re.escape(directory.name)}-\d+(-\d+)?")
+        stale = sorted(p for p in directory.parent.glob(f"{directory.name}-*")
+                       if sibling.fullmatch(p.name) and (p / LOCK_FILE).exists())
+        fresh = [
+            directory.with_name(f"{directory.name}-{os.getpid()}" + (f"-{n}" if n else ""))
+            for n in range(8)
+        ]
+        for candidate in dict.fromkeys([directory, *stale, *fresh]):
+            candidate.mkdir(parents=True, exist_ok=True)
+            handle = open(candidate / LOCK_FILE, "a+")
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                handle.close()
+                continue
+            self._lock_handle = handle
+            return candidate
+        raise SpanRingError(f"Capture directory {directory} is locked by another writer")
+
+    def _open_ring(self) -> None:
+        path = self.directory / RING_FILE
+        existing = path.exists() and path.stat().st_size == _HEADER_SIZE + self.ring_bytes
+        if path.exists() and not existing:
+            # Keep spans from a ring with a different size, then start over
+            self._salvage(path)
+        # A new ring is only renamed into place once its header is written
+        target = path if existing else path.with_name(f"{RING_FILE}.{os.getpid()}.tmp")
+        with open(target, "r+b" if existing else "w+b") as handle:
+            handle.truncate(_HEADER_SIZE + self.ring_bytes)
+            self._map = mmap.mmap(handle.fileno(), _HEADER_SIZE + self.ring_bytes)
+
+        header = _HEADER.unpack_from(self._map, 0)
+        if existing and header[0] == _MAGIC and header[1] == _VERSION and header[2] == self.ring_bytes:
+            # Resume after a restart or crash
+            _, _, _, self._head, self._tail, self._head_seq, self._tail_seq, self._generation = header
+            self._generation += self._generation % 2
+            self._write_header()
+        else:
+            segments = _segments(self.directory)
+            next_seq = 0
+            if segments:
+                first, last = segments[-1]
+                with open(last, "rb") as handle:
+                    next_seq = first + sum(1 for _ in handle)
+            self._head = self._tail = 0
+            self._head_seq = self._tail_seq = next_seq
+            self._generation = 0
+            self._write_header()
+            if target != path:
+                os.replace(target, path)
+
+    def _salvage(self, path: Path) -> None:
+        try:
+            records = list(SpanRingReader(self.directory)._ring_records(path))
+        except (SpanRingError, ValueError, struct.error):
+            records = []
+        for seq, payload in records:
+            self._append_segment(seq, payload)
+        self._close_segment()
+        path.unlink()
+
+    # -- ring maintenance ---------------------------------------------------
+
+    def _write_header(self) -> None:
+        # Seqlock: an odd generation tells readers the header is mid-update
+        self._generation += 1
+        struct.pack_into("<Q", self._map, _GENERATION_OFFSET, self._generation)
+        self._generation += 1
+        _HEADER.pack_into(self._map, 0, _MAGIC, _VERSION, self.ring_bytes, self._head, self._tail,
+                          self._head_seq, self._tail_seq, self._generation - 1)
+        struct.pack_into("<Q", self._map, _GENERATION_OFFSET, self._generation)
+
+    def _append_segment(self, seq: int, payload: bytes) -> None:
+        if self._segment_file is not None and self._segment_size >= self.segment_bytes:
+            self._close_segment()
+        if self._segment_file is None:
+            segments = _segments(self.directory)
+            current = segments[-1] if segments else None
+            if current and current[0] + self._count_lines(current[1]) == seq and \
+                    current[1].stat().st_size < self.segment_bytes:
+                path = current[1]
+            else:
+                path = self.directory / _segment_name(seq)
+            self._segment_file = open(path, "ab")
+            self._segment_size = self._segment_file.tell()
+            self._prune_segments()
+        self._segment_file.write(payload + b"\n")
+        self._segment_size += len(payload) + 1
+        self.stats["spilled"] += 1
+
+    @staticmethod
+    def _count_lines(path: Path) -> int:
+        with open(path, "rb") as handle:
+            return sum(1 for _ in handle)
+
+    def _close_segment(self) -> None:
+        if self._segment_file is not None:
+            self._segment_file.close()
+            self._segment_file = None
+
+    def _prune_segments(self) -> None:
+        segments = _segments(self.directory)
+        for _, path in segments[:max(0, len(segments) - self.max_segments)]:
+            path.unlink(missing_ok=True)
+            self.stats["segments_deleted"] += 1
+
+    def _spill_until(self, logical_end: int) -> None:
+        """Move the oldest records to a segment until the ring has room"""
+        spilled = False
+        while self._tail_seq < self._head_seq and logical_end - self._tail > self.ring_bytes:
+            self._tail, seq, payload = _next_record(self._map, self.ring_bytes, self._tail)
+            if seq is not None:
+                self._append_segment(seq, payload)
+                self._tail_seq = seq + 1
+                spilled = True
+        if self._tail_seq == self._head_seq:
+            self._tail = self._head
+        if spilled:
+            # Readers must find spilled spans on disk before the tail moves past
+            # them, and must see the new tail before their bytes are overwritten
+            self._segment_file.flush()
+            self._write_header()
+
+    def _append(self, payload: bytes) -> None:
+        need = _RECORD.size + len(payload)
+        if need > self.ring_bytes:
+            # Too large for the ring: drain it and write straight to a segment
+            self._spill_until(self._head + 2 * self.ring_bytes)
+            self._append_segment(self._head_seq, payload)
+            self._segment_file.flush()
+            self._head_seq += 1
+            self._tail_seq = self._head_seq
+            return
+
+        physical = self._head % self.ring_bytes
+        start = self._head
+        if self.ring_bytes - physical < need:
+            start = self._head + (self.ring_bytes - physical)
+        self._spill_until(start + need)
+
+        if start != self._head and self.ring_bytes - physical >= 4:
+            struct.pack_into("<I", self._map, _HEADER_SIZE + physical, _WRAP)
+        offset = _HEADER_SIZE + start % self.ring_bytes
+        _RECORD.pack_into(self._map, offset, len(payload), self._head_seq)
+        self._map[offset + _RECORD.size:offset + need] = payload
+        self._head = start + need
+        self._head_seq += 1
+
+    # -- SpanExporter -------------------------------------------------------
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        if self._closed:
+            return SpanExportResult.FAILURE
+        payloads = [_encode(span_to_record(span)) for span in spans]
+        with self._lock:
+            self._ensure_open()
+            for payload in payloads:
+                self._append(payload)
+            self._write_header()
+            self.stats["exported"] += len(payloads)
+        return SpanExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        with self._lock:
+            if self._map is not None and not self._closed:
+                self._map.flush()
+                if self._segment_file is not None:
+                    self._segment_file.flush()
+        return True
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._map is None:
+                return
+            self._map.flush()
+            self._map.close()
+            self._close_segment()
+            self._lock_handle.close()
+
+    # -- InMemorySpanExporter compatibility ---------------------------------
+
+    def get_finished_spans(self) -> List[Dict[str, Any]]:
+        """Spans exported since the last ``clear()``, oldest first"""
+        if self._map is None:
+            return []
+        return [span for _, span in self.reader().iter_records(since_seq=self._since_seq)]
+
+    def clear(self) -> None:
+        """Start ``get_finished_spans()`` after the spans exported so far"""
+        with self._lock:
+            if self._map is not None:
+                self._since_seq = self._head_seq
+
+    def reader(self) -> "SpanRingReader":
+        return SpanRingReader(self.directory)
+
+
+# ============================================================================
+# Reader
+# ============================================================================
+
+class SpanRingReader:
+    """Reads a capture directory, safely while a writer is appending"""
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+
+    @staticmethod
+    def is_capture(path: Union[str, Path]) -> bool:
+        return (Path(path) / RING_FILE).exists()
+
+    def _read_header(self, data: mmap.mmap) -> Tuple[int, ...]:
+        for _ in range(_READ_RETRIES):
+            before, = struct.unpack_from("<Q", data, _GENERATION_OFFSET)
+            header = _HEADER.unpack_from(data, 0)
+            if header[0] != _MAGIC or header[1] != _VERSION:
+                raise SpanRingError(f"{self.directory / RING_FILE} is not a span ring")
+            after, = struct.unpack_from("<Q", data, _GENERATION_OFFSET)
+            if before % 2 == 0 and before == after:
+                return header
+            time.sleep(_RETRY_DELAY)  # let a preempted writer finish the update
+        raise SpanRingError(f"{self.directory / RING_FILE} is being rewritten, retry later")
+
+    def _ring_records(self, path: Optional[Path] = None) -> Iterator[Tuple[int, bytes]]:
+        path = path or self.directory / RING_FILE
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size <= _HEADER_SIZE:
+                return
+            with mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) as data:
+                for _ in range(_READ_RETRIES):
+                    _, _, capacity, head, tail, _, _, generation = self._read_header(data)
+                    copy = bytes(data[:_HEADER_SIZE + capacity])
+                    latest = self._read_header(data)
+                    if latest[7] == generation:
+                        break
+                    time.sleep(_RETRY_DELAY)
+                # The writer publishes a new tail before overwriting anything
+                # behind it, so records before the latest tail are in segments
+                # and the rest of the copy is intact
+                tail = max(tail, latest[4])
+        position = tail
+        while position < head:
+            position, seq, payload = _next_record(copy, capacity, position)
+            if seq is not None:
+                yield seq, payload
+
+    def _segment_records(self) -> Iterator[Tuple[int, bytes]]:
+        for first, path in _segments(self.directory):
+            try:
+                handle = open(path, "rb")
+            except FileNotFoundError:
+                continue  # pruned while we were reading
+            with handle:
+                for offset, line in enumerate(handle):
+                    if line.endswith(b"\n"):
+                        yield first + offset, line[:-1]
+
+    def iter_records(self, since_seq: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield ``(seq, span)`` pairs in sequence order"""
+        if not self.directory.exists():
+            return
+        # Snapshot the ring before reading segments: anything spilled in
+        # between is then found in the segments
+        ring = list(self._ring_records()) if self.is_capture(self.directory) else []
+        first_ring_seq = ring[0][0] if ring else None
+        last = since_seq - 1
+        for seq, payload in self._segment_records():
+            if first_ring_seq is not None and seq >= first_ring_seq:
+                break
+            if seq > last:
+                try:
+                    yield seq, json.loads(payload)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                last = seq
+        for seq, payload in ring:
+            if seq > last:
+                try:
+                    yield seq, json.loads(payload)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                last = seq
+
+    def iter_spans(self, since_seq: int = 0) -> Iterator[Dict[str, Any]]:
+        for _, span in self.iter_records(since_seq):
+            yield span
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Every readable span in the capture, oldest first"""
+        return list(self.iter_spans())
+
+    def write_jsonl(self, output_file: Union[str, Path]) -> int:
+        """Stream the capture into a JSON-lines file; returns the span count"""
+        output_file = Path(output_file)
+        tmp_file = output_file.with_name(f"{output_file.name}.{os.getpid()}.tmp")
+        count = 0
+        with open(tmp_file, "wb") as out:
+            for _, span in self.iter_records():
+                out.write(_encode(span) + b"\n")
+                count += 1
+        os.replace(tmp_file, output_file)
+        return count
+
+    def state(self) -> Tuple[int, int]:
+        """``(next seq, first segment seq)``; changes whenever the capture does"""
+        head_seq = 0
+        if self.is_capture(self.directory):
+            with open(self.directory / RING_FILE, "rb") as handle:
+                with mmap.mmap(handle.fileno(), _HEADER_SIZE, access=mmap.ACCESS_READ) as data:
+                    head_seq = self._read_header(data)[5]
+        segments = _segments(self.directory)
+        return head_seq, segments[0][0] if segments else -1
+
+    def materialize(self, output_file: Optional[Path] = None) -> Path:
+        """JSON-lines copy of the capture for file-based tools, rewritten only when stale"""
+        output_file = Path(output_file or self.directory / SNAPSHOT_FILE)
+        marker = output_file.with_name(output_file.name + ".state")
+        state = json.dumps(self.state())
+        if not output_file.exists() or not marker.exists() or marker.read_text() != state:
+            self.write_jsonl(output_file)
+            marker.write_text(state)
+        return output_file
+
+
+def find_captures(root: Union[str, Path] = DEFAULT_CAPTURE_ROOT) -> List[Path]:
+    """Capture directories under ``root``, most recently written first"""
+    root = Path(root)
+    if not root.exists():
+        return []
+    captures = [p for p in root.iterdir() if p.is_dir() and SpanRingReader.is_capture(p)]
+    return sorted(captures, key=lambda p: (p / RING_FILE).stat().st_mtime, reverse=True)
@@ -17,12 +17,13 @@ from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 from opentelemetry.sdk.trace import TracerProvider, Span
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 from rich import print as rprint
 from rich.console import Console
 from rich.table import Table
 from rich.tree import Tree
 
+from .span_ring import DEFAULT_CAPTURE_ROOT, RingBufferSpanExporter, SpanRingReader
+
 console = Console()
 tracer = trace.get_tracer(__name__)
 
@@ -42,10 +43,15 @@ class SpanValidationResult:
 
 
 class SpanCaptureSystem:
-    """Captures spans from BPMN executions"""
+    """Captures spans from BPMN executions
     
-    def __init__(self):
-        self.memory_exporter = InMemorySpanExporter()
+    Spans go to a persistent ring buffer under ``capture_dir``, so they
+    survive a crash and can be read with ``SpanRingReader`` (or
+    ``weavergen debug spans``) while the process is still running.
+    """
+    
+    def __init__(self, capture_dir: Optional[Path] = None):
+        self.memory_exporter = RingBufferSpanExporter(capture_dir or DEFAULT_CAPTURE_ROOT / "capture")
         self.provider = TracerProvider()
         
         # Add exporters
@@ -60,36 +66,8 @@ class SpanCaptureSystem:
     
     def get_captured_spans(self) -> List[Dict[str, Any]]:
         """Get all captured spans as dictionaries"""
-        spans = self.memory_exporter.get_finished_spans()
-        
-        span_dicts = []
-        for span in spans:
-            span_dict = {
-                "name": span.name,
-                "trace_id": f"0x{span.context.trace_id:032x}",
-                "span_id": f"0x{span.context.span_id:016x}",
-                "parent_id": f"0x{span.parent.span_id:016x}" if span.parent else None,
-                "start_time": span.start_time,
-                "end_time": span.end_time,
-                "duration_ns": span.end_time - span.start_time if span.end_time else 0,
-                "attributes": dict(span.attributes or {}),
-                "status": {
-                    "status_code": span.status.status_code.name if span.status else "UNSET",
-                    "description": span.status.description if span.status else None
-                },
-                "events": [
-                    {
-                        "name": event.name,
-                        "timestamp": event.timestamp,
-                        "attributes": dict(event.attributes or {})
-                    }
-                    for event in span.events
-                ],
-                "resource": dict(span.resource.attributes) if span.resource else {}
-            }
-            span_dicts.append(span_dict)
-        
-        return span_dicts
+        self.provider.force_flush()
+        return self.memory_exporter.get_finished_spans()
     
     def save_spans(self, filepath: Path):
         """Save captured spans to file"""
@@ -100,9 +78,15 @@ class SpanCaptureSystem:
     
     def clear_spans(self):
         """Clear captured spans"""
+        self.provider.force_flush()
         self.memory_exporter.clear()
 
 
+def load_live_spans(capture_dir: Path) -> List[Dict[str, Any]]:
+    """Read every span in a capture directory, even while it is being written"""
+    return SpanRingReader(capture_dir).snapshot()
+
+
 class SpanValidator:
     """Validates spans according to semantic conventions"""
     
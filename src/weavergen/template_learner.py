@@ -7,13 +7,149 @@ template system.
 """
 
 import ast
+import hashlib
+import json
+import os
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Any, Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
 from collections import defaultdict
+from itertools import groupby
 import textwrap
 
+FEATURES_VERSION = 2
+DEFAULT_CACHE_FILE = Path(".weavergen/template_features.json")
+# Below this many uncached files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 8
+
+
+def _node_name(node: ast.AST) -> str:
+    """Get name from AST node."""
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Attribute):
+        return f"{_node_name(node.value)}.{node.attr}"
+    return str(node)
+
+
+def _annotation(node: Optional[ast.AST]) -> Optional[str]:
+    """Get type annotation as string."""
+    if node is None:
+        return None
+    return ast.unparse(node)
+
+
+def _decorators(node: ast.AST) -> str:
+    """Decorator names without their arguments"""
+    return ",".join(_node_name(dec.func if isinstance(dec, ast.Call) else dec) for dec in node.decorator_list)
+
+
+def _signature(node: ast.AST) -> str:
+    """Decorators, arity and return annotation of a def, names dropped"""
+    decorators = _decorators(node)
+    prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+    return f"{decorators}@{prefix}/{len(node.args.args)}{'->' if node.returns else ''}"
+
+
+def _member_kind(node: ast.stmt) -> str:
+    if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+        return "doc"
+    if isinstance(node, (ast.Assign, ast.AnnAssign)):
+        return "field"
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return _signature(node)
+    return type(node).__name__
+
+
+def _skeleton(node: ast.AST) -> str:
+    """Coarse shape of a definition that instances of one template share
+
+    Functions reduce to their signature; classes to the kinds of their
+    members, each method by its signature, with runs of the same kind
+    collapsed so differing field or method counts still match. Bases are
+    bucketed on separately.
+    """
+    if isinstance(node, ast.ClassDef):
+        kinds = [kind for kind, _ in groupby(_member_kind(item) for item in node.body)]
+        return "class[" + ";".join(kinds) + "]"
+    return _signature(node)
+
+
+def structural_fingerprint(node: ast.AST) -> str:
+    """Hash of a definition's skeleton, used to bucket template instances"""
+    return hashlib.blake2b(_skeleton(node).encode(), digest_size=8).hexdigest()
+
+
+def extract_file_features(file_path: str) -> Dict[str, Any]:
+    """Classes, functions and imports of one file as plain, picklable data"""
+    features: Dict[str, Any] = {"classes": [], "functions": [], "imports": [], "error": None}
+    with open(file_path, 'r') as f:
+        content = f.read()
+    
+    try:
+        tree = ast.parse(content)
+    except SyntaxError as e:
+        features["error"] = str(e)
+        return features
+    
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            features["classes"].append(_class_features(node, file_path))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            features["functions"].append(_function_features(node, file_path))
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                features["imports"].append(f"import {alias.name}")
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ''
+            for alias in node.names:
+                features["imports"].append(f"from {module} import {alias.name}")
+    return features
+
+
+def _class_features(node: ast.ClassDef, file_path: str) -> Dict[str, Any]:
+    class_info = {
+        'name': node.name,
+        'bases': [_node_name(base) for base in node.bases],
+        'decorators': [_node_name(dec) for dec in node.decorator_list],
+        'methods': [],
+        'attributes': [],
+        'file': str(file_path),
+        'fingerprint': structural_fingerprint(node)
+    }
+    
+    # Extract methods and attributes
+    for item in node.body:
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            method_info = {
+                'name': item.name,
+                'args': [arg.arg for arg in item.args.args],
+                'decorators': [_node_name(dec) for dec in item.decorator_list],
+                'is_async': isinstance(item, ast.AsyncFunctionDef)
+            }
+            class_info['methods'].append(method_info)
+        elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+            class_info['attributes'].append({
+                'name': item.target.id,
+                'type': _annotation(item.annotation)
+            })
+    return class_info
+
+
+def _function_features(node: ast.AST, file_path: str) -> Dict[str, Any]:
+    return {
+        'name': node.name,
+        'args': [arg.arg for arg in node.args.args],
+        'returns': _annotation(node.returns) if node.returns else None,
+        'decorators': [_node_name(dec) for dec in node.decorator_list],
+        'is_async': isinstance(node, ast.AsyncFunctionDef),
+        'file': str(file_path),
+        'fingerprint': structural_fingerprint(node)
+    }
+
 
 @dataclass
 class CodePattern:
@@ -33,22 +169,36 @@ class CodePattern:
 
 
 class TemplateExtractor:
-    """Extracts reusable patterns from generated code."""
+    """Extracts reusable patterns from generated code.
+    
+    Per-file features are cached in ``cache_file`` by content hash, and
+    uncached files are parsed across ``max_workers`` processes.
+    """
     
-    def __init__(self, generated_dir: Path = Path("test_generated")):
+    def __init__(self, generated_dir: Path = Path("test_generated"),
+                 cache_file: Optional[Path] = DEFAULT_CACHE_FILE,
+                 max_workers: Optional[int] = None):
         self.generated_dir = generated_dir
+        self.cache_file = cache_file
+        self.max_workers = max_workers
         self.patterns: Dict[str, List[CodePattern]] = defaultdict(list)
         self.import_patterns: Set[str] = set()
         self.class_structures: List[Dict] = []
         self.function_signatures: List[Dict] = []
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def analyze_directory(self) -> Dict[str, List[CodePattern]]:
         """Analyze all Python files in the generated directory."""
-        py_files = list(self.generated_dir.glob("**/*.py"))
+        self.patterns = defaultdict(list)
+        self.import_patterns = set()
+        self.class_structures = []
+        self.function_signatures = []
         
-        for py_file in py_files:
-            if py_file.name != "__init__.py":
-                self.analyze_file(py_file)
+        py_files = sorted(f for f in self.generated_dir.glob("**/*.py") if f.name != "__init__.py")
+        
+        for py_file, features in zip(py_files, self._file_features(py_files)):
+            self._add_features(py_file, features)
         
         # Extract common patterns
         self._extract_class_patterns()
@@ -59,65 +209,105 @@ class TemplateExtractor:
     
     def analyze_file(self, file_path: Path) -> None:
         """Analyze a single Python file for patterns."""
-        with open(file_path, 'r') as f:
-            content = f.read()
+        self._add_features(file_path, extract_file_features(str(file_path)))
+    
+    def _add_features(self, file_path: Path, features: Dict[str, Any]) -> None:
+        if features["error"]:
+            print(f"Syntax error in {file_path}: {features['error']}")
+            return
+        self.class_structures.extend(features["classes"])
+        self.function_signatures.extend(features["functions"])
+        self.import_patterns.update(features["imports"])
+    
+    # Feature cache
+    
+    def _file_features(self, py_files: List[Path]) -> List[Dict[str, Any]]:
+        """Features of every file, from the cache where the content is unchanged
+        
+        The cache is rewritten only when an entry was added, refreshed or
+        dropped because its file no longer exists.
+        """
+        cache = self._load_cache()
+        stale = [key for key in cache if not Path(key).is_file()]
+        for key in stale:
+            del cache[key]
+        changed = bool(stale)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(py_files)
+        misses: List[Tuple[int, str, Dict[str, Any]]] = []
+        
+        for i, py_file in enumerate(py_files):
+            key = str(py_file.resolve())
+            stat = py_file.stat()
+            entry = cache.get(key)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                results[i] = entry["features"]
+                continue
+            digest = hashlib.sha256(py_file.read_bytes()).hexdigest()
+            state = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+            if entry and entry["sha256"] == digest:
+                # Touched but not changed
+                cache[key] = {**state, "features": entry["features"]}
+                results[i] = entry["features"]
+                changed = True
+                continue
+            misses.append((i, key, state))
         
+        self.cache_hits = len(py_files) - len(misses)
+        self.cache_misses = len(misses)
+        
+        paths = [str(py_files[i]) for i, _, _ in misses]
+        if len(paths) >= PARALLEL_THRESHOLD and self.max_workers != 1:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                extracted = list(pool.map(extract_file_features, paths, chunksize=8))
+        else:
+            extracted = [extract_file_features(path) for path in paths]
+        
+        for (i, key, state), features in zip(misses, extracted):
+            cache[key] = {**state, "features": features}
+            results[i] = features
+        
+        if misses or changed:
+            self._save_cache(cache)
+        return results
+    
+    def _load_cache(self) -> Dict[str, Any]:
+        if not self.cache_file:
+            return {}
         try:
-            tree = ast.parse(content)
-            self._extract_from_ast(tree, file_path)
-        except SyntaxError as e:
-            print(f"Syntax error in {file_path}: {e}")
+            data = json.loads(Path(self.cache_file).read_text())
+        except (OSError, ValueError):
+            return {}
+        return data.get("files", {}) if data.get("version") == FEATURES_VERSION else {}
+    
+    def _save_cache(self, cache: Dict[str, Any]) -> None:
+        if not self.cache_file:
+            return
+        cache_file = Path(self.cache_file)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": FEATURES_VERSION, "files": cache}, f)
+        os.replace(tmp, cache_file)
+    
+    # Pattern extraction
     
     def _extract_from_ast(self, tree: ast.AST, file_path: Path) -> None:
         """Extract patterns from AST."""
         for node in ast.walk(tree):
             if isinstance(node, ast.ClassDef):
                 self._analyze_class(node, file_path)
-            elif isinstance(node, ast.FunctionDef):
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 self._analyze_function(node, file_path)
             elif isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
                 self._analyze_import(node)
     
     def _analyze_class(self, node: ast.ClassDef, file_path: Path) -> None:
         """Analyze class definition for patterns."""
-        class_info = {
-            'name': node.name,
-            'bases': [self._get_name(base) for base in node.bases],
-            'decorators': [self._get_name(dec) for dec in node.decorator_list],
-            'methods': [],
-            'attributes': [],
-            'file': str(file_path)
-        }
-        
-        # Extract methods and attributes
-        for item in node.body:
-            if isinstance(item, ast.FunctionDef):
-                method_info = {
-                    'name': item.name,
-                    'args': [arg.arg for arg in item.args.args],
-                    'decorators': [self._get_name(dec) for dec in item.decorator_list],
-                    'is_async': isinstance(item, ast.AsyncFunctionDef)
-                }
-                class_info['methods'].append(method_info)
-            elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
-                class_info['attributes'].append({
-                    'name': item.target.id,
-                    'type': self._get_annotation(item.annotation)
-                })
-        
-        self.class_structures.append(class_info)
+        self.class_structures.append(_class_features(node, str(file_path)))
     
     def _analyze_function(self, node: ast.FunctionDef, file_path: Path) -> None:
         """Analyze function definition for patterns."""
-        func_info = {
-            'name': node.name,
-            'args': [arg.arg for arg in node.args.args],
-            'returns': self._get_annotation(node.returns) if node.returns else None,
-            'decorators': [self._get_name(dec) for dec in node.decorator_list],
-            'is_async': isinstance(node, ast.AsyncFunctionDef),
-            'file': str(file_path)
-        }
-        self.function_signatures.append(func_info)
+        self.function_signatures.append(_function_features(node, str(file_path)))
     
     def _analyze_import(self, node: ast.AST) -> None:
         """Analyze import statements."""
@@ -131,16 +321,11 @@ class TemplateExtractor:
     
     def _extract_class_patterns(self) -> None:
         """Extract common class patterns."""
-        # Group classes by structure similarity
+        # Bucket classes by base classes and structural fingerprint in one pass
         base_patterns = defaultdict(list)
         
         for class_info in self.class_structures:
-            # Create pattern key based on structure
-            key = (
-                tuple(class_info['bases']),
-                len(class_info['methods']),
-                len(class_info['attributes'])
-            )
+            key = (tuple(class_info['bases']), class_info['fingerprint'])
             base_patterns[key].append(class_info)
         
         # Create templates for common patterns
@@ -151,16 +336,11 @@ class TemplateExtractor:
     
     def _extract_function_patterns(self) -> None:
         """Extract common function patterns."""
-        # Group functions by signature pattern
+        # Bucket functions by structural fingerprint in one pass
         sig_patterns = defaultdict(list)
         
         for func_info in self.function_signatures:
-            key = (
-                len(func_info['args']),
-                bool(func_info['returns']),
-                func_info['is_async']
-            )
-            sig_patterns[key].append(func_info)
+            sig_patterns[func_info['fingerprint']].append(func_info)
         
         # Create templates for common patterns
         for pattern_key, functions in sig_patterns.items():
@@ -271,17 +451,11 @@ class TemplateExtractor:
     
     def _get_name(self, node: ast.AST) -> str:
         """Get name from AST node."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_name(node.value)}.{node.attr}"
-        return str(node)
+        return _node_name(node)
     
     def _get_annotation(self, node: ast.AST) -> Optional[str]:
         """Get type annotation as string."""
-        if node is None:
-            return None
-        return ast.unparse(node)
+        return _annotation(node)
     
     def generate_template_library(self) -> str:
         """Generate a template library module from discovered patterns."""
@@ -27,6 +27,10 @@ from ..agents.multi_agent_ollama import (
     WeaverGenAgentContext, run_generation_workflow,
     MultiAgentWorkflowGraph
 )
+from .steps import (
+    DEFAULT_CHECKPOINT_DIR, StepCheckpointStore, StepSpec,
+    execute_step_graph, steps_from_bpmn_spec
+)
 
 try:
     from opentelemetry import trace
@@ -49,6 +53,29 @@ except ImportError:
     OTEL_AVAILABLE = False
 
 
+# Built-in generation steps. A loaded BPMN process whose task ids name these
+# steps decides which of them run and in what order; without one, the data
+# dependencies declared here order them.
+GENERATION_STEPS: Dict[str, StepSpec] = {
+    step.name: step for step in [
+        StepSpec("validate_semantic", "_validate_semantic_convention",
+                 provides=["semantic_validation"]),
+        StepSpec("initialize_environment", "_initialize_generation_environment",
+                 requires=["semantic_validation"], provides=["workspace"]),
+        StepSpec("multi_agent_generation", "_execute_multi_agent_generation",
+                 requires=["workspace"], provides=["agent_results"]),
+        StepSpec("template_processing", "_process_templates",
+                 requires=["workspace"], provides=["templates"]),
+        StepSpec("file_generation", "_generate_files",
+                 requires=["workspace", "agent_results", "templates"], provides=["generated_files"]),
+        StepSpec("validation_qa", "_validate_and_qa",
+                 requires=["generated_files"], provides=["validation_results"]),
+        StepSpec("finalization", "_finalize_generation",
+                 requires=["generated_files", "validation_results"], provides=["summary"]),
+    ]
+}
+
+
 @dataclass
 class WorkflowContext:
     """Context for workflow execution with multi-agent support."""
@@ -68,6 +95,7 @@ class WorkflowContext:
     # Workflow state
     workflow_data: Dict[str, Any] = field(default_factory=dict)
     task_results: Dict[str, Any] = field(default_factory=dict)
+    step_outcomes: Dict[str, str] = field(default_factory=dict)
     
     # Execution tracking
     start_time: float = field(default_factory=time.time)
@@ -103,15 +131,17 @@ class WorkflowEngine:
     Coordinates BPMN workflows with multi-agent execution and OpenTelemetry tracing.
     """
     
-    def __init__(self, workflow_dir: Optional[Path] = None):
+    def __init__(self, workflow_dir: Optional[Path] = None, checkpoint_dir: Optional[Path] = None):
         """Initialize workflow engine."""
         self.workflow_dir = workflow_dir or Path(__file__).parent / "bpmn"
+        self.checkpoint_dir = checkpoint_dir or DEFAULT_CHECKPOINT_DIR
         self.tracer = trace.get_tracer(__name__) if OTEL_AVAILABLE else None
         self.active_workflows: Dict[str, BpmnWorkflow] = {}
         self.workflow_contexts: Dict[str, WorkflowContext] = {}
         
-        # Initialize workflow specifications
+        # Initialize workflow specifications; each process is parsed on first use
         self._workflow_specs: Dict[str, WorkflowSpec] = {}
+        self._spec_files: Dict[str, Path] = {}
         self._load_workflow_specs()
     
     def _load_workflow_specs(self):
@@ -131,13 +161,37 @@ class WorkflowEngine:
             parser = BpmnParser()
             parser.add_bpmn_file(str(bpmn_file))
             
-            for spec_name, spec in parser.get_specs().items():
-                self._workflow_specs[spec_name] = spec
-                print(f"Loaded BPMN workflow: {spec_name}")
+            for process_id in parser.get_process_ids():
+                self._spec_files[process_id] = bpmn_file
                 
         except Exception as e:
             print(f"Error loading BPMN file {bpmn_file}: {e}")
     
+    def get_workflow_spec(self, workflow_name: str) -> Optional[WorkflowSpec]:
+        """Parsed BPMN process for ``workflow_name``, if one was loaded."""
+        if workflow_name not in self._workflow_specs:
+            bpmn_file = self._spec_files.get(workflow_name)
+            if bpmn_file is None:
+                return None
+            try:
+                parser = BpmnParser()
+                parser.add_bpmn_file(str(bpmn_file))
+                self._workflow_specs[workflow_name] = parser.get_spec(workflow_name)
+            except Exception as e:
+                print(f"Error parsing BPMN workflow {workflow_name}: {e}")
+                self._spec_files.pop(workflow_name)
+                return None
+        return self._workflow_specs[workflow_name]
+    
+    def get_step_graph(self, workflow_name: str) -> List[StepSpec]:
+        """Steps for ``workflow_name``: from its BPMN spec, else the built-in graph."""
+        spec = self.get_workflow_spec(workflow_name)
+        if spec is not None:
+            steps = steps_from_bpmn_spec(spec, GENERATION_STEPS)
+            if steps:
+                return steps
+        return list(GENERATION_STEPS.values())
+    
     def _create_default_workflows(self):
         """Create default programmatic workflows when BPMN files not available."""
         # For now, we'll use programmatic workflow creation
@@ -148,9 +202,14 @@ class WorkflowEngine:
         self, 
         request: GenerationRequest,
         context: ExecutionContext,
-        workflow_name: str = "code_generation"
+        workflow_name: str = "code_generation",
+        resume: bool = True
     ) -> WorkflowContext:
-        """Execute the code generation workflow."""
+        """Execute the code generation workflow.
+        
+        Completed steps are checkpointed per request; with ``resume`` a
+        retry of a failed request skips the steps that already succeeded.
+        """
         
         workflow_context = WorkflowContext(
             generation_request=request,
@@ -164,6 +223,7 @@ class WorkflowEngine:
                 generation_results={}
             )
         )
+        self.workflow_contexts[workflow_context.workflow_id] = workflow_context
         
         if self.tracer:
             with self.tracer.start_span("workflow.generation.execute") as span:
@@ -175,7 +235,7 @@ class WorkflowEngine:
                 })
                 
                 try:
-                    result = await self._execute_workflow_steps(workflow_context)
+                    result = await self._execute_workflow_steps(workflow_context, workflow_name, resume)
                     span.set_status(Status(StatusCode.OK))
                     return result
                 except Exception as e:
@@ -183,60 +243,37 @@ class WorkflowEngine:
                     workflow_context.add_error(f"Workflow execution failed: {e}")
                     raise
         else:
-            return await self._execute_workflow_steps(workflow_context)
+            return await self._execute_workflow_steps(workflow_context, workflow_name, resume)
     
-    async def _execute_workflow_steps(self, context: WorkflowContext) -> WorkflowContext:
-        """Execute the workflow steps programmatically."""
-        
-        # Step 1: Validate Semantic Convention
-        await self._execute_step(
-            context, 
-            "validate_semantic",
-            self._validate_semantic_convention
-        )
-        
-        # Step 2: Initialize Generation Environment
-        await self._execute_step(
-            context,
-            "initialize_environment", 
-            self._initialize_generation_environment
-        )
-        
-        # Step 3: Multi-Agent Code Generation
-        await self._execute_step(
-            context,
-            "multi_agent_generation",
-            self._execute_multi_agent_generation
-        )
-        
-        # Step 4: Template Processing
-        await self._execute_step(
-            context,
-            "template_processing",
-            self._process_templates
-        )
+    async def _execute_workflow_steps(
+        self,
+        context: WorkflowContext,
+        workflow_name: str = "code_generation",
+        resume: bool = True
+    ) -> WorkflowContext:
+        """Execute the workflow's step graph, resuming from checkpoints."""
         
-        # Step 5: File Generation
-        await self._execute_step(
-            context,
-            "file_generation", 
-            self._generate_files
+        steps = self.get_step_graph(workflow_name)
+        request = context.generation_request
+        run_key = StepCheckpointStore.run_key(
+            workflow_name,
+            request.model_dump_json(exclude={"id", "created_at", "metadata"})
         )
+        checkpoints = StepCheckpointStore.claim(self.checkpoint_dir, run_key, resume=resume)
         
-        # Step 6: Validation and Quality Assurance
-        await self._execute_step(
-            context,
-            "validation_qa",
-            self._validate_and_qa
-        )
+        async def execute(step: StepSpec):
+            await self._execute_step(context, step.name, getattr(self, step.handler))
         
-        # Step 7: Finalization
-        await self._execute_step(
-            context,
-            "finalization",
-            self._finalize_generation
-        )
+        try:
+            await execute_step_graph(
+                steps, execute, context.workflow_data, context.task_results,
+                checkpoints, outcome=context.step_outcomes
+            )
+        finally:
+            checkpoints.release()
         
+        # A finished run leaves nothing to resume
+        checkpoints.clear()
         context.mark_completed()
         return context
     
@@ -319,11 +356,14 @@ class WorkflowEngine:
         if not semantic_convention.brief:
             raise ValueError("Semantic convention brief is required") 
         
-        return {
+        validation = {
             "validation_status": "passed",
             "convention_id": semantic_convention.id,
             "convention_brief": semantic_convention.brief
         }
+        context.workflow_data["semantic_validation"] = validation
+        
+        return validation
     
     async def _initialize_generation_environment(self, context: WorkflowContext) -> Dict[str, Any]:
         """Initialize the generation environment."""
@@ -5,8 +5,10 @@ Provides comprehensive observability for workflow execution,
 agent coordination, and performance monitoring.
 """
 
+import math
 import time
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Any, Optional, List, Tuple
 from contextlib import contextmanager
 from dataclasses import dataclass
 
@@ -91,20 +93,168 @@ class WorkflowSpanMetrics:
         return self.total_execution_time_ms / self.total_tasks
 
 
+class LogHistogram:
+    """
+    Fixed-memory quantile sketch with logarithmic buckets.
+    
+    Quantiles are within ``relative_accuracy`` of the true value. Once more
+    than ``max_buckets`` buckets exist the lowest ones are folded together,
+    so only the extreme low tail loses accuracy.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def add(self, value: float, count: int = 1):
+        """Record ``value`` ``count`` times; values <= 0 share one bucket."""
+        if value > 0:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + count
+            if len(self.buckets) > self.max_buckets:
+                self._collapse()
+        else:
+            self.zero_count += count
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+    
+    def merge(self, other: "LogHistogram"):
+        """Fold another sketch with the same accuracy into this one."""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        while len(self.buckets) > self.max_buckets:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def _collapse(self):
+        lowest, second = sorted(self.buckets)[:2]
+        self.buckets[second] += self.buckets.pop(lowest)
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile ``q`` (0..1), or None when empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return min(self.min, 0.0)
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                value = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+    
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+
+class RollingHistogram:
+    """
+    LogHistograms over fixed time buckets plus an all-time total.
+    
+    Only the last ``buckets`` windows of ``bucket_seconds`` each are kept,
+    so memory is bounded no matter how many values are recorded.
+    """
+    
+    def __init__(self, bucket_seconds: float = 60.0, buckets: int = 60,
+                 relative_accuracy: float = 0.01, max_buckets: int = 2048,
+                 clock: Callable[[], float] = time.time):
+        self.bucket_seconds = bucket_seconds
+        self.buckets = buckets
+        self.clock = clock
+        self._sketch_args = (relative_accuracy, max_buckets)
+        self.windows: Deque[Tuple[int, LogHistogram]] = deque()
+        self.total = LogHistogram(*self._sketch_args)
+    
+    def _expire(self, epoch: int):
+        while self.windows and self.windows[0][0] <= epoch - self.buckets:
+            self.windows.popleft()
+    
+    def add(self, value: float):
+        epoch = int(self.clock() // self.bucket_seconds)
+        self._expire(epoch)
+        if not self.windows or self.windows[-1][0] != epoch:
+            self.windows.append((epoch, LogHistogram(*self._sketch_args)))
+        self.windows[-1][1].add(value)
+        self.total.add(value)
+    
+    def window(self, seconds: Optional[float] = None) -> LogHistogram:
+        """Sketch covering the last ``seconds`` (all time when None)."""
+        if seconds is None:
+            return self.total
+        epoch = int(self.clock() // self.bucket_seconds)
+        self._expire(epoch)
+        oldest = epoch - math.ceil(seconds / self.bucket_seconds) + 1
+        merged = LogHistogram(*self._sketch_args)
+        for epoch, sketch in self.windows:
+            if epoch >= oldest:
+                merged.merge(sketch)
+        return merged
+
+
+class WorkflowNameAggregate:
+    """Rolling distributions for every completed instance of one workflow name."""
+    
+    METRICS = ("duration_ms", "task_time_ms", "tokens", "success_rate")
+    
+    def __init__(self, workflow_name: str, **histogram_args: Any):
+        self.workflow_name = workflow_name
+        self.histograms = {metric: RollingHistogram(**histogram_args) for metric in self.METRICS}
+        self.workflows = 0
+        self.failed_workflows = 0
+    
+    def record_task(self, execution_time_ms: float):
+        self.histograms["task_time_ms"].add(execution_time_ms)
+    
+    def record_workflow(self, metrics: WorkflowSpanMetrics):
+        self.workflows += 1
+        if metrics.failed_tasks:
+            self.failed_workflows += 1
+        self.histograms["duration_ms"].add(metrics.total_execution_time_ms)
+        self.histograms["tokens"].add(metrics.agent_tokens_used)
+        if metrics.total_tasks:
+            self.histograms["success_rate"].add(metrics.success_rate)
+
+
 class WorkflowSpanManager:
     """
     Manager for OpenTelemetry spans in SpiffWorkflow execution.
     
     Provides comprehensive observability for workflow orchestration,
-    agent coordination, and performance monitoring.
+    agent coordination, and performance monitoring. Fleet-level
+    distributions are kept per workflow name in fixed-memory sketches;
+    only the most recent ``max_retained_workflows`` per-instance records
+    are kept.
     """
     
-    def __init__(self, service_name: str = "weavergen-workflow"):
+    def __init__(self, service_name: str = "weavergen-workflow",
+                 max_retained_workflows: int = 1000,
+                 window_seconds: float = 60.0, windows: int = 60,
+                 clock: Callable[[], float] = time.time):
         """Initialize span manager."""
         self.service_name = service_name
         self.tracer = self._setup_tracer()
         self.active_workflows: Dict[str, Dict[str, Any]] = {}
-        self.workflow_metrics: Dict[str, WorkflowSpanMetrics] = {}
+        self.workflow_metrics: "OrderedDict[str, WorkflowSpanMetrics]" = OrderedDict()
+        self.max_retained_workflows = max_retained_workflows
+        self.aggregates: Dict[str, WorkflowNameAggregate] = {}
+        self._histogram_args = {"bucket_seconds": window_seconds, "buckets": windows, "clock": clock}
     
     def _setup_tracer(self):
         """Set up OpenTelemetry tracer with exporters."""
@@ -179,6 +329,7 @@ class WorkflowSpanManager:
             # Initialize workflow tracking
             self.active_workflows[workflow_id] = {
                 "span": span,
+                "workflow_name": workflow_name,
                 "start_time": time.time(),
                 "tasks_executed": 0,
                 "tasks_successful": 0,
@@ -247,6 +398,7 @@ class WorkflowSpanManager:
                 # Update success tracking
                 if workflow_id in self.active_workflows:
                     self.active_workflows[workflow_id]["tasks_successful"] += 1
+                    self._aggregate_for(workflow_id).record_task(execution_time)
                 
             except Exception as e:
                 # Mark as failed
@@ -261,6 +413,7 @@ class WorkflowSpanManager:
                 # Update failure tracking
                 if workflow_id in self.active_workflows:
                     self.active_workflows[workflow_id]["tasks_failed"] += 1
+                    self._aggregate_for(workflow_id).record_task(execution_time)
                 
                 raise
     
@@ -393,6 +546,10 @@ class WorkflowSpanManager:
         )
         
         self.workflow_metrics[workflow_id] = metrics
+        self.workflow_metrics.move_to_end(workflow_id)
+        while len(self.workflow_metrics) > self.max_retained_workflows:
+            self.workflow_metrics.popitem(last=False)
+        self._aggregate(workflow_name).record_workflow(metrics)
         
         # Update final span attributes
         if "span" in workflow_data:
@@ -410,21 +567,76 @@ class WorkflowSpanManager:
         # Clean up active tracking
         del self.active_workflows[workflow_id]
     
+    def _aggregate(self, workflow_name: str) -> WorkflowNameAggregate:
+        aggregate = self.aggregates.get(workflow_name)
+        if aggregate is None:
+            aggregate = self.aggregates[workflow_name] = WorkflowNameAggregate(
+                workflow_name, **self._histogram_args)
+        return aggregate
+    
+    def _aggregate_for(self, workflow_id: str) -> WorkflowNameAggregate:
+        return self._aggregate(self.active_workflows[workflow_id]["workflow_name"])
+    
     def get_workflow_metrics(self, workflow_id: str) -> Optional[WorkflowSpanMetrics]:
-        """Get metrics for a completed workflow."""
+        """Get metrics for a completed workflow, if it is still retained."""
         return self.workflow_metrics.get(workflow_id)
     
     def get_all_workflow_metrics(self) -> List[WorkflowSpanMetrics]:
-        """Get metrics for all completed workflows."""
+        """Get metrics for the retained (most recent) completed workflows."""
         return list(self.workflow_metrics.values())
     
+    def get_percentile(
+        self,
+        workflow_name: str,
+        metric: str,
+        percentile: float,
+        window_seconds: Optional[float] = None
+    ) -> Optional[float]:
+        """Percentile (0-100) of ``metric`` for a workflow name.
+        
+        ``metric`` is one of ``WorkflowNameAggregate.METRICS``. With
+        ``window_seconds`` only values from that recent window count.
+        """
+        if metric not in WorkflowNameAggregate.METRICS:
+            raise ValueError(f"Unknown metric {metric!r}; expected one of {WorkflowNameAggregate.METRICS}")
+        aggregate = self.aggregates.get(workflow_name)
+        if aggregate is None:
+            return None
+        return aggregate.histograms[metric].window(window_seconds).quantile(percentile / 100)
+    
+    def get_workflow_name_summary(
+        self,
+        workflow_name: str,
+        window_seconds: Optional[float] = None,
+        percentiles: Tuple[float, ...] = (50, 90, 99)
+    ) -> Optional[Dict[str, Any]]:
+        """Count, mean and percentiles of every metric for a workflow name."""
+        aggregate = self.aggregates.get(workflow_name)
+        if aggregate is None:
+            return None
+        
+        summary: Dict[str, Any] = {
+            "workflow_name": workflow_name,
+            "workflows": aggregate.workflows,
+            "failed_workflows": aggregate.failed_workflows,
+        }
+        for metric, histogram in aggregate.histograms.items():
+            sketch = histogram.window(window_seconds)
+            summary[metric] = {
+                "count": sketch.count,
+                "mean": sketch.mean,
+                **{f"p{p:g}": sketch.quantile(p / 100) for p in percentiles},
+            }
+        return summary
+    
     def get_active_workflows(self) -> List[str]:
         """Get list of currently active workflow IDs."""
         return list(self.active_workflows.keys())
     
     def clear_metrics(self):
-        """Clear stored workflow metrics."""
+        """Clear stored workflow metrics and aggregates."""
         self.workflow_metrics.clear()
+        self.aggregates.clear()
 
 
 # Global span manager instance
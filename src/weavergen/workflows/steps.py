@@ -0,0 +1,307 @@
+"""
+Declarative Step Graph for WorkflowEngine
+
+Workflow steps declare the workflow data they require and provide. The
+dependencies between steps are derived from those declarations and, when a
+BPMN spec is loaded, from its sequence flow. Independent steps run
+concurrently, and every completed step is checkpointed so a failed run
+resumes after the steps that already succeeded.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import secrets
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = Path(".weavergen/workflow_checkpoints")
+CHECKPOINT_VERSION = 2
+CHECKPOINT_LOCK = "run.lock"
+
+
+@dataclass
+class StepSpec:
+    """One workflow step and the workflow data it reads and writes"""
+    name: str
+    handler: str
+    requires: List[str] = field(default_factory=list)
+    provides: List[str] = field(default_factory=list)
+    after: List[str] = field(default_factory=list)
+
+    @property
+    def signature(self) -> str:
+        """Changes whenever the step's declaration changes, invalidating its checkpoint"""
+        return json.dumps([self.handler, sorted(self.requires), sorted(self.provides)])
+
+
+def resolve_dependencies(steps: Iterable[StepSpec]) -> Dict[str, Set[str]]:
+    """Map each step to the steps it must wait for
+
+    A step depends on the provider of every key it requires, plus any step
+    listed in ``after``. Keys nobody provides are workflow inputs.
+    """
+    steps = list(steps)
+    names = {step.name for step in steps}
+    providers: Dict[str, str] = {}
+    for step in steps:
+        for key in step.provides:
+            if key in providers:
+                raise ValueError(f"'{key}' is provided by both {providers[key]} and {step.name}")
+            providers[key] = step.name
+
+    dependencies = {}
+    for step in steps:
+        deps = {providers[key] for key in step.requires if key in providers}
+        deps.update(name for name in step.after if name in names)
+        deps.discard(step.name)
+        dependencies[step.name] = deps
+
+    # Reject cycles up front rather than deadlocking at run time
+    visiting: Set[str] = set()
+    done: Set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Step graph has a cycle through {name}")
+        visiting.add(name)
+        for dep in dependencies[name]:
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in dependencies:
+        visit(name)
+    return dependencies
+
+
+def steps_from_bpmn_spec(spec: Any, known_steps: Dict[str, StepSpec]) -> List[StepSpec]:
+    """Build the step list from a parsed BPMN process spec
+
+    Task ids select steps from ``known_steps``; a task's data associations,
+    when present, override the step's declared requires/provides. Each step
+    also runs after the nearest steps upstream of it in the sequence flow.
+    """
+    task_specs = spec.task_specs
+
+    def upstream_steps(task_spec: Any) -> List[str]:
+        found: List[str] = []
+        seen: Set[str] = set()
+        pending = list(task_spec.inputs)
+        while pending:
+            parent = pending.pop()
+            if parent.name in seen:
+                continue
+            seen.add(parent.name)
+            if getattr(parent, "bpmn_id", None) in known_steps:
+                found.append(parent.bpmn_id)
+            else:
+                pending.extend(parent.inputs)
+        return sorted(found)
+
+    steps = []
+    for task_spec in task_specs.values():
+        bpmn_id = getattr(task_spec, "bpmn_id", None)
+        if bpmn_id not in known_steps:
+            continue
+        default = known_steps[bpmn_id]
+        requires = [data.bpmn_id for data in getattr(task_spec, "data_input_associations", [])]
+        provides = [data.bpmn_id for data in getattr(task_spec, "data_output_associations", [])]
+        steps.append(StepSpec(
+            name=bpmn_id,
+            handler=default.handler,
+            requires=requires or list(default.requires),
+            provides=provides or list(default.provides),
+            after=upstream_steps(task_spec),
+        ))
+    return steps
+
+
+class StepCheckpointStore:
+    """Completed-step records for one workflow run, one JSON file per step
+
+    Only steps whose outputs JSON represents exactly are checkpointed; the
+    others simply re-run on resume.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._lock_handle = None
+
+    @staticmethod
+    def run_key(*parts: str) -> str:
+        """Stable key for a request, so a retry of the same request finds its checkpoints"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()[:16]
+
+    @classmethod
+    def claim(cls, root: Path, run_key: str, resume: bool = True) -> "StepCheckpointStore":
+        """Lock checkpoints for one run of ``run_key``
+
+        With ``resume`` an interrupted run of the same key that no live
+        process holds is picked up, without it such runs are discarded.
+        Otherwise the run gets a fresh nonce directory, so identical
+        concurrent runs never share checkpoints.
+        """
+        parent = Path(root) / run_key
+        interrupted = sorted(p for p in parent.iterdir() if p.is_dir()) if parent.is_dir() else []
+        for directory in interrupted:
+            store = cls(directory)
+            if store._lock():
+                if resume:
+                    return store
+                store.clear()
+        store = cls(parent / secrets.token_hex(8))
+        if not store._lock():
+            raise RuntimeError(f"Could not lock checkpoint directory {store.directory}")
+        return store
+
+    def _lock(self) -> bool:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        handle = open(self.directory / CHECKPOINT_LOCK, "a+")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        self._lock_handle = handle
+        return True
+
+    def release(self) -> None:
+        if self._lock_handle is not None:
+            self._lock_handle.close()
+            self._lock_handle = None
+
+    def _path(self, step_name: str) -> Path:
+        return self.directory / f"{step_name}.json"
+
+    def load(self, step: StepSpec) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(step.name)) as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict) or record.get("version") != CHECKPOINT_VERSION \
+                or record.get("signature") != step.signature:
+            return None
+        return record
+
+    def save(self, step: StepSpec, data: Dict[str, Any], result: Any) -> None:
+        record = {
+            "version": CHECKPOINT_VERSION,
+            "signature": step.signature,
+            "data": {key: data[key] for key in step.provides if key in data},
+            "result": result,
+        }
+        encoded = json.dumps(record)
+        if json.loads(encoded) != record:
+            raise TypeError("step outputs do not survive a JSON round trip")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(encoded)
+            os.replace(tmp, self._path(step.name))
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.release()
+
+
+async def execute_step_graph(
+    steps: List[StepSpec],
+    execute: Callable[[StepSpec], Awaitable[None]],
+    data: Dict[str, Any],
+    results: Dict[str, Any],
+    checkpoints: Optional[StepCheckpointStore] = None,
+    outcome: Optional[Dict[str, str]] = None,
+) -> Dict[str, str]:
+    """Run ``steps`` as soon as their dependencies finish
+
+    ``execute`` runs one step, writing its outputs into ``data`` and its
+    record into ``results[step.name]``. A step whose dependencies were all
+    restored and which has a valid checkpoint is restored instead of run.
+    After the first failure no new steps start; steps already running finish
+    (and checkpoint), then the failure is re-raised. How each step was
+    handled (``ran``, ``restored``, ``failed`` or ``not_run``) is recorded in
+    ``outcome``, which is also returned.
+    """
+    by_name = {step.name: step for step in steps}
+    dependencies = resolve_dependencies(steps)
+    outcome = {} if outcome is None else outcome
+    running: Dict[asyncio.Task, str] = {}
+    failure: Optional[BaseException] = None
+    failed_step: Optional[str] = None
+
+    def ready() -> List[str]:
+        return [
+            name for name in by_name
+            if name not in outcome and name not in running.values()
+            and all(outcome.get(dep) in ("ran", "restored") for dep in dependencies[name])
+        ]
+
+    async def run_one(step: StepSpec) -> None:
+        await execute(step)
+        if checkpoints:
+            try:
+                checkpoints.save(step, data, results.get(step.name))
+            except (OSError, TypeError, ValueError) as e:
+                # An uncheckpointed step simply re-runs on resume
+                logger.warning("Could not checkpoint step %s: %s", step.name, e)
+
+    try:
+        while True:
+            progressed = True
+            while failure is None and progressed:
+                progressed = False
+                for name in ready():
+                    step = by_name[name]
+                    record = None
+                    if checkpoints and all(outcome[dep] == "restored" for dep in dependencies[name]):
+                        record = checkpoints.load(step)
+                    if record is not None:
+                        data.update(record["data"])
+                        results[name] = record["result"]
+                        outcome[name] = "restored"
+                        progressed = True
+                    else:
+                        running[asyncio.ensure_future(run_one(step))] = name
+            if not running:
+                break
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = running.pop(task)
+                if task.exception() is not None:
+                    outcome[name] = "failed"
+                    if failure is None:
+                        failure, failed_step = task.exception(), name
+                else:
+                    outcome[name] = "ran"
+    finally:
+        # Only reached with tasks left if we were cancelled
+        for task in running:
+            task.cancel()
+
+    if failure is not None:
+        for name in by_name:
+            if name not in outcome:
+                outcome[name] = "not_run"
+                results[name] = {"status": "not_run", "error": f"Not run: {failed_step} failed"}
+        raise failure
+    return outcome
@@ -0,0 +1,196 @@
+"""Tests for the shared async subprocess layer and its Weaver callers."""
+
+import asyncio
+import importlib
+import sys
+import textwrap
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+from weavergen.async_process import AsyncProcessRunner, run_sync
+from weavergen.runtime_engine import ProcessManager
+
+V2_PACKAGE_DIR = Path(__file__).resolve().parents[1] / "v2" / "weavergen" / "src" / "weavergen"
+
+
+def _python(code):
+    return [sys.executable, "-c", textwrap.dedent(code)]
+
+
+def _alive(pid):
+    # A killed orphan may linger as a zombie if nothing reaps it
+    try:
+        state = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()[0]
+    except FileNotFoundError:
+        return False
+    return state not in ("Z", "X")
+
+
+def _load_v2(module):
+    # v2 ships its own ``weavergen`` package, so mount it under a private name
+    if "v2_weavergen" not in sys.modules:
+        package = types.ModuleType("v2_weavergen")
+        package.__path__ = [str(V2_PACKAGE_DIR)]
+        sys.modules["v2_weavergen"] = package
+    return importlib.import_module(f"v2_weavergen.{module}")
+
+
+@pytest.fixture
+def fake_weaver(tmp_path):
+    """Executable standing in for the weaver binary"""
+    script = tmp_path / "weaver"
+    script.write_text(textwrap.dedent(f"""\
+        #!{sys.executable}
+        import sys, time
+        args = sys.argv[1:]
+        if args == ["--version"]:
+            print("weaver 0.15.0")
+        elif args[:2] == ["registry", "check"]:
+            print("error: attribute http.method is deprecated", file=sys.stderr, flush=True)
+            print('{{"type": "warning", "message": "unused group"}}', file=sys.stderr, flush=True)
+            time.sleep(0.5)
+            sys.exit(1)
+        else:
+            time.sleep(float(args[-1]))
+            print("done")
+    """))
+    script.chmod(0o755)
+    return script
+
+
+def test_runner_overlaps_commands_up_to_the_limit():
+    sleeper = _python("import time; time.sleep(0.4)")
+
+    async def run(limit):
+        runner = AsyncProcessRunner(max_concurrency=limit)
+        started = time.perf_counter()
+        results = await asyncio.gather(*(runner.run(sleeper) for _ in range(3)))
+        return time.perf_counter() - started, results
+
+    parallel, results = asyncio.run(run(3))
+    serial, _ = asyncio.run(run(1))
+
+    assert all(result.success for result in results)
+    assert parallel < 1.0
+    assert serial >= 1.2
+
+
+def test_timeout_and_cancellation_kill_the_process_group(tmp_path):
+    marker = tmp_path / "grandchild.pid"
+    spawner = _python(f"""
+        import subprocess, sys, time
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        open({str(marker)!r}, "w").write(str(child.pid))
+        print("spawned", flush=True)
+        time.sleep(30)
+    """)
+    runner = AsyncProcessRunner(kill_grace=1.0)
+
+    result = run_sync(runner.run(spawner, timeout=1.0))
+    assert result.timed_out and not result.success
+    assert result.stdout == "spawned\n"
+    time.sleep(0.2)
+    assert not _alive(int(marker.read_text()))
+
+    async def cancel():
+        task = asyncio.ensure_future(runner.run(_python("import time; time.sleep(30)")))
+        await asyncio.sleep(0.3)
+        task.cancel()
+        started = time.perf_counter()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return time.perf_counter() - started
+
+    assert asyncio.run(cancel()) < 2.0
+
+
+def test_process_manager_streams_output(fake_weaver, monkeypatch):
+    monkeypatch.setenv("PATH", str(fake_weaver.parent))
+    manager = ProcessManager(runner=AsyncProcessRunner())
+    lines = []
+
+    async def run():
+        return await asyncio.gather(
+            manager.execute_weaver_command(["registry", "generate", "0.3"], on_output=lines.append),
+            manager.execute_weaver_command(["registry", "generate", "0.3"]),
+            manager.execute_weaver_command(["registry", "generate", "5"], timeout=0.5),
+        )
+
+    started = time.perf_counter()
+    first, second, slow = asyncio.run(run())
+
+    assert time.perf_counter() - started < 2.5
+    assert first["success"] and second["success"]
+    assert first["stdout"] == "done\n" and lines == ["done"]
+    assert slow["timeout"] is True
+    assert manager.active_processes == {}
+
+
+def test_process_manager_cancels_by_id_while_running(fake_weaver, monkeypatch):
+    monkeypatch.setenv("PATH", str(fake_weaver.parent))
+    manager = ProcessManager(runner=AsyncProcessRunner())
+
+    async def run():
+        process_id, task = manager.start_weaver_command(["registry", "generate", "30"])
+        assert manager.active_processes[process_id] is task
+        await asyncio.sleep(0.3)
+        assert manager.cancel(process_id)
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert manager.cancel(process_id) is False
+
+        # Caller-supplied ids work the same way and are never shared
+        task = asyncio.ensure_future(
+            manager.execute_weaver_command(["registry", "generate", "30"], process_id="gen-1")
+        )
+        await asyncio.sleep(0.3)
+        clash = await manager.execute_weaver_command(["--version"], process_id="gen-1")
+        assert manager.cancel("gen-1")
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return clash
+
+    started = time.perf_counter()
+    clash = asyncio.run(run())
+
+    assert time.perf_counter() - started < 5
+    assert clash["success"] is False and "already running" in clash["error"]
+    assert manager.active_processes == {}
+
+
+def test_v2_weaver_integration_parses_stderr_while_streaming(fake_weaver):
+    weaver_integration = _load_v2("weaver_integration")
+    weaver = weaver_integration.WeaverIntegration(
+        weaver_integration.WeaverConfig(weaver_path=fake_weaver)
+    )
+    assert weaver.get_weaver_version() == "weaver 0.15.0"
+
+    seen = []
+
+    async def check_two():
+        def on_diagnostic(diagnostic):
+            seen.append((diagnostic["type"], time.perf_counter()))
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            weaver.check_registry_async("registry", on_diagnostic=on_diagnostic),
+            weaver.check_registry_async("registry"),
+        )
+        return started, time.perf_counter() - started, results
+
+    started, elapsed, results = asyncio.run(check_two())
+
+    assert elapsed < 0.95
+    # Diagnostics arrive before the command exits
+    assert [kind for kind, _ in seen] == ["error", "warning"]
+    assert seen[0][1] - started < 0.45
+    for result in results:
+        assert not result.valid
+        assert result.errors == ["error: attribute http.method is deprecated"]
+        assert len(result.diagnostics) == 2
+
+    sync_result = weaver.check_registry("registry")
+    assert sync_result.return_code == 1 and sync_result.errors == results[0].errors
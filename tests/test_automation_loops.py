@@ -0,0 +1,111 @@
+"""Tests for the event-driven CCCS automation engine."""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "claude-code-context"))
+
+from automation_loops import CCCSAutomationEngine, RegistryWatcher  # noqa: E402
+
+
+def _watch(root, use_inotify, actions):
+    """Start a watcher, apply each action and collect reported change batches"""
+    batches = []
+
+    async def run():
+        watcher = RegistryWatcher(root, on_change=batches.append, poll_interval=0.05,
+                                  use_inotify=use_inotify)
+        backend = await watcher.start()
+        try:
+            for action in actions:
+                action()
+                await asyncio.sleep(0.3)
+        finally:
+            watcher.stop()
+        return backend, set(watcher.registry_files)
+
+    backend, files = asyncio.run(run())
+    return backend, files, batches
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watcher_reports_registry_changes_only(tmp_path, use_inotify):
+    registry = tmp_path / "model" / "semconv.yaml"
+    registry.parent.mkdir()
+    registry.write_text("groups: []")
+    (tmp_path / "node_modules").mkdir()
+    nested = tmp_path / "new" / "dir" / "otel_registry.yml"
+
+    def create_nested():
+        nested.parent.mkdir(parents=True)
+        nested.write_text("groups: []")
+
+    backend, files, batches = _watch(tmp_path, use_inotify, [
+        lambda: registry.write_text("groups: [1]"),
+        create_nested,
+        lambda: (tmp_path / "notes.yaml").write_text("not a registry"),
+        lambda: (tmp_path / "node_modules" / "otel.json").write_text("{}"),
+        registry.unlink,
+    ])
+
+    if use_inotify and sys.platform.startswith("linux"):
+        assert backend == "inotify"
+    if not use_inotify:
+        assert backend == "polling"
+    reported = set().union(*batches)
+    assert reported == {registry, nested}
+    assert files == {nested}
+
+
+def test_registry_changes_are_debounced_into_one_run(tmp_path):
+    (tmp_path / "claude-code-context").mkdir()
+    engine = CCCSAutomationEngine(tmp_path)
+    for loop in engine.loops.values():
+        loop.last_run = time.time()
+
+    async def run():
+        task = asyncio.create_task(engine.start_automation())
+        await asyncio.sleep(0.2)
+        registry = tmp_path / "semconv.yaml"
+        for i in range(5):
+            registry.write_text(f"version: {i}")
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(1.0)
+        engine.stop_automation()
+        await task
+
+    asyncio.run(run())
+
+    registry_loop = engine.loops["registry_monitor"]
+    assert registry_loop.run_count == 1
+    assert engine.loops["session_health"].run_count == 0
+    saved = json.loads(engine.loops_config.read_text())
+    assert {l["loop_id"]: l["run_count"] for l in saved["loops"]}["registry_monitor"] == 1
+
+
+def test_due_loops_run_concurrently_with_one_save(tmp_path, monkeypatch):
+    (tmp_path / "claude-code-context").mkdir()
+    engine = CCCSAutomationEngine(tmp_path)
+    saves = []
+    monkeypatch.setattr(engine, "save_loops", lambda: saves.append(time.time()))
+
+    async def slow(loop):
+        await asyncio.sleep(0.2)
+        return {"ok": True}
+
+    for name in ("registry_monitor", "generation_quality", "performance_optimization"):
+        monkeypatch.setattr(engine, f"run_{name}", slow)
+    loops = [engine.loops[name] for name in
+             ("registry_monitor", "generation_quality", "performance_optimization")]
+
+    start = time.perf_counter()
+    results = asyncio.run(engine.run_loops(loops))
+
+    assert time.perf_counter() - start < 0.5
+    assert all(result == {"ok": True} for result in results.values())
+    assert len(saves) == 1
@@ -0,0 +1,67 @@
+"""Tests for the synthetic benchmark suite."""
+
+import random
+
+import pytest
+
+from weavergen.benchmark_suite import (
+    BenchmarkError,
+    BenchmarkReport,
+    compare_reports,
+    generate_synthetic_spans,
+    run_benchmarks,
+)
+
+
+def _report(**medians):
+    return BenchmarkReport(
+        size=100, seed=1, repeat=1,
+        results={name: {"median_s": median} for name, median in medians.items()},
+    )
+
+
+def test_synthetic_spans_are_deterministic(tmp_path):
+    sources = [tmp_path / "task.py"] * 8
+    first = generate_synthetic_spans(50, random.Random(7), sources, tmp_path / "w.bpmn")
+    second = generate_synthetic_spans(50, random.Random(7), sources, tmp_path / "w.bpmn")
+
+    assert len(first) == 50
+    assert first == second
+    assert len({span["trace_id"] for span in first}) == 7
+
+
+def test_run_benchmarks_writes_loadable_report(tmp_path):
+    report = run_benchmarks(size=200, repeat=2, warmup=0,
+                            cases=["registry_generation", "span_parsing", "dod_validation"],
+                            workdir=tmp_path)
+
+    assert list(report.results) == ["registry_generation", "span_parsing", "dod_validation"]
+    assert report.results["span_parsing"]["items"] == 200
+    assert report.results["dod_validation"]["items"] == 200
+    assert report.results["registry_generation"]["items"] == 1
+    assert len(report.results["span_parsing"]["samples_s"]) == 2
+
+    loaded = BenchmarkReport.load(report.save(tmp_path / "results.json"))
+    assert loaded == report
+
+
+def test_compare_reports_flags_regressions():
+    baseline = _report(fast=1.0, steady=1.0, gone=1.0)
+    current = _report(fast=0.5, steady=1.1, slow=2.0)
+    current.results["steady_slow"] = {"median_s": 1.3}
+    baseline.results["steady_slow"] = {"median_s": 1.0}
+
+    statuses = {c.name: c.status for c in compare_reports(current, baseline, threshold=0.25)}
+
+    assert statuses == {
+        "fast": "improved",
+        "steady": "ok",
+        "slow": "new",
+        "steady_slow": "regression",
+        "gone": "missing",
+    }
+
+
+def test_unknown_case_is_rejected(tmp_path):
+    with pytest.raises(BenchmarkError):
+        run_benchmarks(size=10, cases=["nope"], workdir=tmp_path)
@@ -0,0 +1,97 @@
+"""Tests for dirty-panel rendering and headless streaming in BPMNLiveMonitor."""
+
+import asyncio
+import io
+import json
+
+from rich.console import Console
+
+from weavergen.bpmn_live_monitor import BPMNLiveMonitor
+
+
+def _monitor(count, **kwargs):
+    monitor = BPMNLiveMonitor("Big", **kwargs)
+    monitor.console = Console(file=io.StringIO(), width=120)
+    for i in range(count):
+        monitor.register_task(f"t{i}", f"Task {i}")
+    return monitor
+
+
+def test_transitions_redraw_only_affected_panels():
+    monitor = _monitor(3)
+    layout = monitor.create_layout()
+    assert not monitor.refresh_layout(layout)
+
+    monitor.add_span("t0", "0xabc")
+    assert monitor.refresh_layout(layout)
+    assert monitor.redraws == {"diagram": 0, "tasks": 1, "metrics": 1}
+
+    monitor.task_started("t0")
+    monitor.task_completed("t0", {"success": True})
+    monitor.refresh_layout(layout)
+    assert monitor.redraws == {"diagram": 1, "tasks": 2, "metrics": 2}
+
+
+def test_large_workflows_render_a_window_around_active_tasks():
+    monitor = _monitor(5000)
+    for i in range(2500):
+        monitor.task_started(f"t{i}")
+        monitor.task_completed(f"t{i}")
+    monitor.task_started("t2600")
+
+    table = monitor.create_task_table()
+    assert table.row_count == 20
+    assert "Task 2600" in table.columns[0]._cells
+    assert table.caption == "Tasks 2596-2615 of 5000"
+
+    diagram = monitor.create_workflow_diagram().renderable
+    assert "2598 earlier tasks" in diagram and "Task 2600" in diagram
+
+    metrics = monitor.create_metrics_panel().renderable
+    assert "Completed: 2500" in metrics and "Running: 1" in metrics
+
+
+def test_bursts_of_transitions_coalesce_into_few_frames():
+    monitor = _monitor(300)
+
+    async def run():
+        watcher = asyncio.create_task(monitor.start_live_monitor(update_interval=0.05))
+        await asyncio.sleep(0)
+        for i in range(300):
+            monitor.task_started(f"t{i}")
+            monitor.task_completed(f"t{i}")
+            if i % 50 == 0:
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(watcher, 2.0)
+
+    asyncio.run(run())
+    assert not monitor.is_running
+    assert monitor.redraws["tasks"] < 30
+
+
+def test_headless_mode_streams_state_changes_as_json_lines():
+    stream = io.StringIO()
+    monitor = _monitor(0, headless=True, stream=stream)
+
+    async def run():
+        monitor.register_task("load", "Load")
+        monitor.register_task("gen", "Generate")
+        watcher = asyncio.create_task(monitor.start_live_monitor())
+        await asyncio.sleep(0)
+        monitor.task_started("load")
+        monitor.task_completed("load")
+        monitor.task_started("gen")
+        monitor.task_failed("gen", "boom")
+        await asyncio.wait_for(watcher, 1.0)
+
+    asyncio.run(run())
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    assert [e["event"] for e in events] == [
+        "task_registered", "task_registered", "workflow_started",
+        "task_started", "task_completed", "task_started", "task_failed",
+        "workflow_finished",
+    ]
+    assert events[-2]["state"] == "FAILED" and events[-2]["error"] == "boom"
+    assert events[-1]["completed"] == 1 and events[-1]["failed"] == 1
+    assert monitor.redraws == {"diagram": 0, "tasks": 0, "metrics": 0}
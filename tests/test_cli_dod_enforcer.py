@@ -0,0 +1,95 @@
+"""Tests for buffered, off-thread DoD enforcement."""
+
+import json
+import threading
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+
+from weavergen.cli_dod_enforcer import (
+    BackgroundDoDValidator,
+    CLIDoDEnforcer,
+    SpanRingBuffer,
+    resolve_dod_mode,
+)
+
+
+def _record_spans(buffer, count, **attributes):
+    provider = TracerProvider()
+    provider.add_span_processor(buffer)
+    tracer = provider.get_tracer(__name__)
+    for i in range(count):
+        with tracer.start_as_current_span(f"test.span.{i}") as span:
+            for key, value in attributes.items():
+                span.set_attribute(key, value)
+
+
+def test_ring_buffer_is_bounded_and_drains():
+    buffer = SpanRingBuffer(capacity=5)
+    _record_spans(buffer, 8)
+
+    spans = buffer.drain()
+    assert [span.name for span in spans] == [f"test.span.{i}" for i in range(3, 8)]
+    assert buffer.dropped == 3
+    assert buffer.drain() == []
+
+
+def test_background_validation_appends_to_ledger(tmp_path):
+    buffer = SpanRingBuffer()
+    _record_spans(buffer, 2, **{"code.filepath": __file__, "code.lineno": 1})
+    ledger = tmp_path / "ledger.jsonl"
+    validator = BackgroundDoDValidator(ledger_path=ledger)
+
+    enforcer = CLIDoDEnforcer(require_bpmn=True, min_trust_score=0.0)
+    assert validator.submit(enforcer, "generate", buffer.drain(), {"cli.args": []}, {"inline_ns": 1_000})
+    assert validator.drain(timeout=5)
+
+    entry = json.loads(ledger.read_text().splitlines()[0])
+    assert entry["command"] == "generate"
+    assert entry["total_spans"] == 2
+    assert entry["passed"] is False
+    assert entry["reasons"] == ["No BPMN attribution found in any spans"]
+    assert entry["inline_ms"] == 0.001
+    assert validator.stats["jobs_validated"] == 1
+
+
+def test_full_queue_drops_jobs_instead_of_blocking(tmp_path):
+    validator = BackgroundDoDValidator(ledger_path=tmp_path / "ledger.jsonl", max_pending=1)
+    validator._thread = object()  # keep the worker from consuming the queue
+    enforcer = CLIDoDEnforcer()
+
+    assert validator.submit(enforcer, "a", [], {}, {})
+    assert not validator.submit(enforcer, "b", [], {}, {})
+    assert validator.stats["jobs_dropped"] == 1
+
+
+def test_skips_are_written_by_the_worker_and_counted_under_lock(tmp_path):
+    ledger = tmp_path / "ledger.jsonl"
+    validator = BackgroundDoDValidator(ledger_path=ledger, max_pending=1000)
+    validator._thread = object()
+    threads = [threading.Thread(target=lambda: [validator.record_skip("cmd", {"inline_ns": 1})
+                                                for _ in range(200)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Nothing touched the ledger on the command path
+    assert not ledger.exists()
+    assert validator.snapshot_stats()["jobs_skipped"] == 800
+    assert validator.snapshot_stats()["inline_ns"] == 800
+
+    validator._thread = None
+    validator._ensure_started()
+    assert validator.drain(timeout=5)
+    entries = [json.loads(line) for line in ledger.read_text().splitlines()]
+    assert len(entries) == 800 and not entries[0]["sampled"]
+
+
+def test_mode_resolution(monkeypatch):
+    monkeypatch.setenv("WEAVERGEN_DOD_MODE", "async")
+    monkeypatch.setenv("WEAVERGEN_DOD_SAMPLE_RATE", "0.25")
+    assert resolve_dod_mode() == ("async", 0.25)
+    assert resolve_dod_mode("sync", 2.0) == ("sync", 1.0)
+    with pytest.raises(ValueError):
+        resolve_dod_mode("sometimes")
@@ -0,0 +1,65 @@
+"""Tests for the bounded, indexed CommunicationCapturingExporter."""
+
+import json
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+from weavergen.enterprise.otel_span_visualizer import CommunicationCapturingExporter
+
+
+def _tracer(exporter):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer(__name__)
+
+
+def _send(tracer, agent_id, message_type, recipient="broadcast", content=None):
+    with tracer.start_as_current_span(f"communication.{message_type}") as span:
+        span.set_attribute("agent.id", agent_id)
+        span.set_attribute("agent.name", agent_id.upper())
+        span.set_attribute("message.type", message_type)
+        span.set_attribute("message.recipient", recipient)
+        span.set_attribute("message.content", json.dumps(content or {}))
+
+
+def test_buffers_are_bounded_and_graph_counts_edges():
+    exporter = CommunicationCapturingExporter(max_spans=50, max_messages_per_agent=10)
+    tracer = _tracer(exporter)
+    for i in range(200):
+        _send(tracer, "ceo", "request", recipient="cto")
+        _send(tracer, "cto", "analysis")
+    _send(tracer, "ceo", "decision", content={"decision": "approve", "confidence": 0.9})
+    with tracer.start_as_current_span("unrelated"):
+        pass
+
+    assert len(exporter.captured_spans) == 50 and exporter.span_count == 402
+    assert {agent: len(msgs) for agent, msgs in exporter.agent_messages.items()} == {"ceo": 10, "cto": 10}
+    assert exporter.message_count == 401
+    assert exporter.neighbours("ceo") == {"cto": 200, "system": 1}
+    assert exporter.communication_graph["cto"]["broadcast"].types == {"analysis": 200}
+    assert "Decision: approve (conf: 90.0%)" in exporter.generate_mermaid_diagram()
+
+
+def test_incremental_queries_return_only_new_activity():
+    exporter = CommunicationCapturingExporter()
+    tracer = _tracer(exporter)
+    _send(tracer, "ceo", "request", recipient="cpo")
+    _send(tracer, "cpo", "analysis")
+
+    messages, cursor = exporter.messages_since(0)
+    edges, version = exporter.edges_since(0)
+    assert [m["agent_id"] for m in messages] == ["ceo", "cpo"]
+    assert len(edges) == 2
+
+    _send(tracer, "cpo", "analysis")
+    _send(tracer, "cto", "request", recipient="ceo")
+
+    messages, cursor = exporter.messages_since(cursor)
+    assert [(m["agent_id"], m["seq"]) for m in messages] == [("cpo", 3), ("cto", 4)]
+    edges, version = exporter.edges_since(version)
+    assert sorted((e.source, e.target, e.count) for e in edges) == [("cpo", "broadcast", 2), ("cto", "ceo", 1)]
+
+    assert exporter.messages_since(cursor) == ([], cursor)
+    assert exporter.edges_since(version) == ([], version)
+    assert [m["seq"] for m in exporter.messages_since(0, agent_id="cpo")[0]] == [2, 3]
@@ -0,0 +1,91 @@
+"""Tests for the single-pass Definition of Done validator."""
+
+import json
+from dataclasses import asdict
+
+from weavergen.dod_validator import (
+    BPMNValidator,
+    DefinitionOfDoneValidator,
+    validate_span_files,
+)
+
+BPMN_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL">
+  <process id="Process_Test">
+    <serviceTask id="{task_id}" name="Generate"/>
+  </process>
+</definitions>
+"""
+
+
+def _span(i, bpmn_file, task_id="Task_Generate", **attrs):
+    return {
+        "name": "bpmn.task.generate",
+        "span_id": f"span-{i}",
+        "trace_id": "trace-1",
+        "duration_ns": 1_000_000,
+        "attributes": {
+            "code.filepath": str(bpmn_file),
+            "code.lineno": 10,
+            "bpmn.workflow.file": str(bpmn_file),
+            "bpmn.workflow.id": "Process_Test",
+            "bpmn.task.id": task_id,
+            "bpmn.task.type": "serviceTask",
+            "execution.timestamp": "2025-07-01T00:00:00",
+            **attrs,
+        },
+    }
+
+
+def test_valid_spans_are_done(tmp_path):
+    bpmn_file = tmp_path / "flow.bpmn"
+    bpmn_file.write_text(BPMN_TEMPLATE.format(task_id="Task_Generate"))
+
+    result = DefinitionOfDoneValidator().validate_spans([_span(i, bpmn_file) for i in range(5)])
+
+    assert result.level1_pass == result.level2_pass == result.level3_pass == 5
+    assert result.trust_score == 1.0
+    assert result.is_done
+
+
+def test_lies_and_violations_are_reported_per_span(tmp_path):
+    bpmn_file = tmp_path / "flow.bpmn"
+    bpmn_file.write_text(BPMN_TEMPLATE.format(task_id="Task_Generate"))
+    spans = [
+        _span(0, bpmn_file, task_id="Task_Missing"),
+        _span(1, bpmn_file, **{"execution.success": True, "execution.error": "boom"}),
+        {"name": "", "span_id": "bare", "attributes": {}},
+    ]
+
+    result = DefinitionOfDoneValidator().validate_spans(spans)
+
+    assert [lie["type"] for lie in result.lies_detected] == ["fake_task", "false_success"]
+    assert result.level1_pass == 2
+    assert {v.rule for v in result.violations if v.span_id == "bare"} >= {
+        "No Span, No Claim", "Basic Structure", "Valid Duration", "File Must Exist",
+    }
+    assert not result.is_done
+
+
+def test_bpmn_edits_are_picked_up(tmp_path):
+    bpmn_file = tmp_path / "flow.bpmn"
+    bpmn_file.write_text(BPMN_TEMPLATE.format(task_id="Task_Old"))
+    validator = BPMNValidator()
+    assert validator.validate_task_reference(str(bpmn_file), "Task_Old")[0]
+
+    bpmn_file.write_text(BPMN_TEMPLATE.format(task_id="Task_Renamed"))
+    assert not validator.validate_task_reference(str(bpmn_file), "Task_Old")[0]
+    assert validator.validate_task_reference(str(bpmn_file), "Task_Renamed")[0]
+
+
+def test_sharded_validation_matches_single_pass(tmp_path):
+    bpmn_file = tmp_path / "flow.bpmn"
+    bpmn_file.write_text(BPMN_TEMPLATE.format(task_id="Task_Generate"))
+    spans = [_span(i, bpmn_file, task_id="Task_Generate" if i % 3 else "Task_Nope") for i in range(50)]
+    span_file = tmp_path / "spans.json"
+    span_file.write_text(json.dumps(spans))
+
+    expected = asdict(DefinitionOfDoneValidator().validate_spans(spans))
+
+    assert asdict(validate_span_files(span_file, workers=1, shard_size=7)) == expected
+    assert asdict(validate_span_files(span_file, workers=2, shard_size=7)) == expected
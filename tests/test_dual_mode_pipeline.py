@@ -0,0 +1,93 @@
+"""Tests for incremental direct generation and the cached Weaver probe in DualModePipeline."""
+
+import os
+
+from weavergen.dual_mode_pipeline import DualModePipeline, PipelineConfig
+
+HTTP = """\
+groups:
+  - id: http.server
+    type: span
+    brief: HTTP server
+    prefix: http
+    attributes:
+      - id: method
+        type: string
+        requirement_level: required
+      - ref: net.peer.name
+  - id: http.client
+    type: span
+    brief: HTTP client
+"""
+
+NET = """\
+groups:
+  - id: net
+    type: attribute_group
+    brief: Network
+    prefix: net
+    attributes:
+      - id: peer.name
+        type: {type}
+"""
+
+
+def _pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+    pipeline = DualModePipeline(PipelineConfig(use_ai_enhancement=False, output_dir=tmp_path / "out"))
+    pipeline.templates = {"function": ["learned"]}
+    return pipeline
+
+
+def test_only_changed_units_are_regenerated_and_spliced(tmp_path, monkeypatch):
+    registry = tmp_path / "registry"
+    registry.mkdir()
+    (registry / "http.yaml").write_text(HTTP)
+    (registry / "net.yaml").write_text(NET.format(type="string"))
+    pipeline = _pipeline(tmp_path, monkeypatch)
+
+    def run():
+        result = pipeline.generate(registry, force_mode="direct")
+        assert result.success, result.error
+        stats = pipeline.last_stats
+        return stats.regenerated, stats.reused, stats.removed, len(stats.files_written)
+
+    assert run() == (9, 0, 0, 3)
+    models = (tmp_path / "out" / "models.py").read_text()
+    assert 'http_method: str = Field(alias="http.method")' in models
+    assert run() == (0, 9, 0, 0)
+
+    # A brief edit touches one unit in each file
+    (registry / "http.yaml").write_text(HTTP.replace("HTTP client", "Outgoing HTTP"))
+    assert run() == (3, 6, 0, 3)
+    assert '"""Outgoing HTTP"""' in (tmp_path / "out" / "models.py").read_text()
+
+    # A referenced attribute changing regenerates its definer and its users
+    (registry / "net.yaml").write_text(NET.format(type="int"))
+    assert run() == (6, 3, 0, 3)
+    assert "net_peer_name: Optional[int]" in (tmp_path / "out" / "models.py").read_text().split("class HttpServer")[1]
+
+    (registry / "net.yaml").unlink()
+    assert run() == (3, 3, 3, 3)
+    validation = (tmp_path / "out" / "validation.py").read_text()
+    assert 'CONVENTIONS["net"]' not in validation and validation.rstrip().endswith("return False")
+    compile(validation, "validation.py", "exec")
+
+
+def test_weaver_probe_is_cached_until_the_binary_changes(tmp_path, monkeypatch):
+    calls = tmp_path / "calls"
+    weaver = tmp_path / "bin" / "weaver"
+    weaver.parent.mkdir()
+    weaver.write_text(f"#!/bin/sh\necho probed >> {calls}\necho weaver 0.10.0\n")
+    weaver.chmod(0o755)
+
+    for _ in range(3):
+        pipeline = _pipeline(tmp_path, monkeypatch)
+        assert pipeline.weaver_available and pipeline.weaver_version == "weaver 0.10.0"
+    assert calls.read_text().count("probed") == 1
+
+    weaver.write_text("#!/bin/sh\nexit 1\n")
+    os.utime(weaver, ns=(0, 0))
+    pipeline = _pipeline(tmp_path, monkeypatch)
+    assert not pipeline.weaver_available and pipeline.weaver_version is None
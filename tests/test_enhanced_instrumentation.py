@@ -0,0 +1,97 @@
+"""Tests for sampling and bounded registries in EnhancedInstrumentation."""
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from weavergen.enhanced_instrumentation import (
+    EnhancedInstrumentation,
+    InstrumentationConfig,
+    measure_decorator_overhead,
+)
+
+
+def _instrumentation(**config):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    instrumentation = EnhancedInstrumentation(
+        "test", config=InstrumentationConfig(**config), tracer_provider=provider
+    )
+    return instrumentation, exporter
+
+
+def test_full_mode_records_every_call_with_attributes():
+    instrumentation, exporter = _instrumentation(mode="full")
+
+    @instrumentation.semantic_compliance_span("http", "parse")
+    def parse():
+        return {"ok": True}
+
+    for _ in range(3):
+        parse()
+
+    spans = exporter.get_finished_spans()
+    assert len(spans) == 3
+    assert spans[-1].attributes["semantic.previous_operations"] == 2
+    assert len(instrumentation.semantic_registry["http"]) == 3
+
+
+def test_production_mode_skips_unsampled_calls():
+    instrumentation, exporter = _instrumentation(mode="production", head_sample_rate=0.0)
+
+    @instrumentation.resource_lifecycle_span("registry", "create")
+    def create():
+        return 1
+
+    for _ in range(10):
+        assert create() == 1
+
+    assert exporter.get_finished_spans() == ()
+    assert instrumentation.resource_registry == {}
+    assert instrumentation.sampling_stats == {"calls": 10, "head_sampled": 0, "tail_sampled": 0}
+
+
+def test_unsampled_errors_and_slow_calls_are_tail_sampled():
+    instrumentation, exporter = _instrumentation(
+        mode="production", head_sample_rate=0.0, tail_latency_threshold_ms=0.0
+    )
+
+    @instrumentation.layer_boundary_span("runtime")
+    def run(fail=False):
+        if fail:
+            raise RuntimeError("boom")
+        return "done"
+
+    run()
+    with pytest.raises(RuntimeError):
+        run(fail=True)
+
+    latency, error = exporter.get_finished_spans()
+    assert latency.attributes["sampling.reason"] == "latency"
+    assert error.attributes["sampling.reason"] == "error"
+    assert error.attributes["forge.layer.error"] == "boom"
+    assert not error.status.is_ok
+
+
+def test_registries_are_bounded():
+    instrumentation, _ = _instrumentation(mode="full", registry_limit=5)
+
+    @instrumentation.decision_consistency_span("agent")
+    def decide(context=None):
+        return context["n"]
+
+    for n in range(1, 20):
+        decide(context={"n": n})
+
+    assert len(instrumentation.decision_cache) == 5
+    assert instrumentation.decision_cache.evicted == 14
+
+
+def test_overhead_benchmark_reports_every_decorator():
+    results = measure_decorator_overhead(iterations=50, config=InstrumentationConfig(mode="production"))
+    assert set(results) == {
+        "baseline_us", "semantic_span", "ai_validation", "layer_span",
+        "resource_span", "quine_span", "decision_span",
+    }
@@ -0,0 +1,117 @@
+"""Tests for DAG scheduling and manifest reuse in CompleteForgeGenerator."""
+
+import os
+import time
+
+import pytest
+
+from weavergen.forge_complete import FORGE_STEPS, WEAVER_OUTPUT_DIR, CompleteForgeGenerator
+from weavergen.models import GenerationResult
+
+SEMANTICS = """
+groups:
+  - id: http
+    type: span
+    brief: "HTTP spans"
+    attributes:
+      - id: http.method
+        type: string
+        brief: "HTTP request method"
+"""
+
+
+@pytest.fixture
+def forge_env(tmp_path, monkeypatch):
+    """Slow, failing weaver on PATH so the 4-layer step falls back to manual generation"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    weaver = bin_dir / "weaver"
+    weaver.write_text("#!/bin/sh\nsleep 0.5\necho 'no registry' >&2\nexit 1\n")
+    weaver.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    (tmp_path / "home").mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.chdir(tmp_path)
+    semantic_file = tmp_path / "semantics.yaml"
+    semantic_file.write_text(SEMANTICS)
+    return semantic_file, tmp_path / "out"
+
+
+def test_independent_steps_overlap_the_slow_step(forge_env):
+    semantic_file, output_dir = forge_env
+    generator = CompleteForgeGenerator(semantic_file, output_dir)
+    order = []
+
+    started = time.perf_counter()
+    results = generator.generate_all(on_step_complete=lambda step, result: order.append(step))
+    elapsed = time.perf_counter() - started
+
+    assert list(results) == list(FORGE_STEPS)
+    assert all(result.success and not result.cached for result in results.values())
+    assert order[-2:] == ["generate_4_layer_architecture", "generate_complete_system"]
+    assert elapsed < 1.0
+    slow = results["generate_4_layer_architecture"]
+    assert slow.critical_path_seconds >= 0.5
+    assert results["generate_pydantic_models"].critical_path_seconds < 0.5
+    assert results["generate_complete_system"].critical_path_seconds >= slow.critical_path_seconds
+    assert generator.run_stats["critical_path_seconds"] >= 0.5
+
+
+def test_manifest_reuses_unchanged_steps(forge_env):
+    semantic_file, output_dir = forge_env
+    CompleteForgeGenerator(semantic_file, output_dir).generate_all()
+
+    generator = CompleteForgeGenerator(semantic_file, output_dir)
+    started = time.perf_counter()
+    results = generator.generate_all()
+    assert time.perf_counter() - started < 0.3
+    assert generator.run_stats["cached_steps"] == len(FORGE_STEPS)
+
+    models = output_dir / "models" / "generated_models.py"
+    models.write_text("# edited by hand\n")
+    results = CompleteForgeGenerator(semantic_file, output_dir).generate_all(
+        ["generate_pydantic_models", "generate_ai_agents"])
+    assert not results["generate_pydantic_models"].cached
+    assert results["generate_ai_agents"].cached
+    assert "class " in models.read_text()
+
+    semantic_file.write_text(SEMANTICS.replace("HTTP spans", "HTTP client spans"))
+    results = CompleteForgeGenerator(semantic_file, output_dir).generate_all(["generate_ai_agents"])
+    assert not results["generate_ai_agents"].cached
+
+
+def test_failure_stops_dependent_steps(forge_env):
+    semantic_file, output_dir = forge_env
+    semantic_file.write_text("groups: []\n")
+    generator = CompleteForgeGenerator(semantic_file, output_dir)
+
+    results = generator.generate_all(
+        ["generate_pydantic_models", "generate_complete_system"], use_manifest=False)
+
+    assert results["generate_pydantic_models"].error == "No semantic groups found in YAML"
+    assert results["generate_complete_system"].error == "Not run: generate_pydantic_models failed"
+    assert not (output_dir / "generated_system.py").exists()
+    assert not (output_dir / ".forge_manifest.json").exists()
+
+
+def test_weaver_output_cannot_clobber_concurrent_steps(forge_env):
+    semantic_file, output_dir = forge_env
+    generator = CompleteForgeGenerator(semantic_file, output_dir)
+
+    def weaver_generate():
+        # Runs while the other steps write their subdirectories
+        target = generator.weaver.config.output_dir
+        time.sleep(0.3)
+        for name in ("models/generated_models.py", "commands/forge.py"):
+            (target / name).parent.mkdir(parents=True, exist_ok=True)
+            (target / name).write_text("# from weaver\n")
+        return GenerationResult(success=True)
+
+    generator.weaver.generate = weaver_generate
+    results = generator.generate_all(use_manifest=False)
+
+    assert all(result.success for result in results.values())
+    assert generator.weaver.config.output_dir == output_dir / WEAVER_OUTPUT_DIR
+    assert "class " in (output_dir / "models" / "generated_models.py").read_text()
+    assert (output_dir / "commands" / "forge.py").read_text() == "# from weaver\n"
+    assert "commands_layer_weaver" in results["generate_4_layer_architecture"].features
@@ -0,0 +1,149 @@
+"""Tests for staged, concurrent Pydantic model generation."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import yaml
+
+from weavergen import generate_models
+from weavergen.benchmark_suite import write_stub_weaver
+from weavergen.core import WeaverConfig, WeaverGen
+
+
+@pytest.fixture
+def stub_weaver(tmp_path, monkeypatch):
+    weaver = tmp_path / "bin" / "weaver"
+    write_stub_weaver(weaver)
+
+    class StubWeaverGen(WeaverGen):
+        def _load_config(self):
+            return WeaverConfig(weaver_path=weaver, cache_dir=tmp_path / "cache")
+
+    monkeypatch.setattr(generate_models, "WeaverGen", StubWeaverGen)
+    return weaver
+
+
+def _semantic_yaml(path, groups=3):
+    path.write_text(yaml.safe_dump({"groups": [
+        {"id": f"demo.group{i}", "type": "span", "brief": f"Group {i}",
+         "attributes": [{"id": f"demo.group{i}.name", "type": "string"}]}
+        for i in range(groups)
+    ]}))
+    return path
+
+
+def test_generation_stages_formats_and_promotes(tmp_path, stub_weaver):
+    semantic = _semantic_yaml(tmp_path / "demo.yaml")
+    output = tmp_path / "generated"
+
+    result = generate_models.generate_pydantic_models(semantic, output)
+
+    assert result.success
+    assert sorted(f.path.name for f in result.files) == [
+        "demo_group0.py", "demo_group1.py", "demo_group2.py"]
+    for file_info in result.files:
+        assert file_info.path.parent == output
+        # black normalizes the stub's single quotes
+        assert "'" not in file_info.path.read_text()
+    leftovers = [p.name for p in tmp_path.iterdir() if p.name.startswith(generate_models.STAGING_PREFIX)]
+    assert leftovers == []
+    assert not (tmp_path / "temp_registry").exists()
+
+
+def test_unchanged_files_skip_black_and_keep_mtime(tmp_path, stub_weaver, monkeypatch):
+    semantic = _semantic_yaml(tmp_path / "demo.yaml")
+    output = tmp_path / "generated"
+    generate_models.generate_pydantic_models(semantic, output)
+    mtimes = {p: p.stat().st_mtime_ns for p in output.glob("*.py")}
+
+    calls = []
+    original = generate_models._format_source
+    monkeypatch.setattr(generate_models, "_format_source",
+                        lambda content: calls.append(content) or original(content))
+    result = generate_models.generate_pydantic_models(semantic, output)
+
+    assert result.success
+    assert calls == []
+    assert {p: p.stat().st_mtime_ns for p in output.glob("*.py")} == mtimes
+    # Generator state stays out of the output directory
+    assert sorted(p.name for p in output.iterdir()) == sorted(p.name for p in mtimes)
+    state = tmp_path / generate_models.STATE_DIR / output.name
+    assert sorted(p.name for p in state.iterdir()) == [generate_models.FORMAT_CACHE, generate_models.OUTPUT_LOCK]
+
+
+def test_concurrent_runs_do_not_collide(tmp_path, stub_weaver):
+    output = tmp_path / "generated"
+    inputs = [_semantic_yaml(tmp_path / f"demo{i}.yaml", groups=2) for i in range(4)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda path: generate_models.generate_pydantic_models(path, output), inputs))
+
+    assert all(result.success for result in results)
+    assert sorted(p.name for p in output.glob("*.py")) == ["demo_group0.py", "demo_group1.py"]
+    assert not list(tmp_path.glob(f"{generate_models.STAGING_PREFIX}*"))
+
+
+def test_format_staged_files_runs_black_in_parallel(tmp_path):
+    staged, output = tmp_path / "staged", tmp_path / "out"
+    staged.mkdir()
+    relpaths = []
+    for i in range(generate_models.PARALLEL_FORMAT_MIN_FILES + 1):
+        (staged / f"m{i}.py").write_text(f"x = {{'a':{i}}}\n")
+        relpaths.append(staged.joinpath(f"m{i}.py").relative_to(staged))
+
+    updates, formatted, skipped = generate_models.format_staged_files(staged, output, relpaths, workers=2)
+
+    assert (formatted, skipped) == (len(relpaths), 0)
+    assert (staged / "m0.py").read_text() == 'x = {"a": 0}\n'
+    assert set(updates) == {p.as_posix() for p in relpaths}
+
+
+def _module(tmp_path, name, body):
+    path = tmp_path / f"{name}.py"
+    path.write_text(body)
+    return path
+
+
+def test_validate_model_files_isolates_failures(tmp_path):
+    import sys
+
+    files = [
+        _module(tmp_path, "good", "from pydantic import BaseModel\nclass UserModel(BaseModel):\n    name: str\n"),
+        _module(tmp_path, "noisy", "print('not a protocol line')\nclass NoisyOutput: pass\n"),
+        _module(tmp_path, "broken", "raise ValueError('bad template')\n"),
+        _module(tmp_path, "crash", "import os\nos._exit(3)\n"),
+        _module(tmp_path, "hang", "import time\ntime.sleep(30)\n"),
+    ]
+    cache = tmp_path / "cache.json"
+
+    results = generate_models.validate_model_files(files, workers=2, timeout=3, cache_file=cache)
+
+    by_name = {r.path.stem: r for r in results}
+    assert [r.path for r in results] == files
+    assert by_name["good"].ok and by_name["good"].models == ["BaseModel", "UserModel"]
+    assert by_name["noisy"].ok and by_name["noisy"].models == ["NoisyOutput"]
+    assert not by_name["broken"].ok and by_name["broken"].error_type == "ValueError"
+    assert not by_name["crash"].ok and "exited with code 3" in by_name["crash"].error
+    assert not by_name["hang"].ok and by_name["hang"].error_type == "TimeoutError"
+    assert not any(name.startswith("weavergen_generated_") for name in sys.modules)
+
+    again = generate_models.validate_model_files(files[:3], cache_file=cache)
+    assert all(r.cached for r in again)
+    assert [r.ok for r in again] == [True, True, False]
+
+    files[0].write_text("raise ImportError('changed')\n")
+    changed = generate_models.validate_model_files(files[:1], cache_file=cache)[0]
+    assert not changed.cached and changed.error_type == "ImportError"
+
+
+def test_validation_cache_tracks_sibling_modules(tmp_path):
+    models = _module(tmp_path, "models", "class LimitModel: pass\n")
+    helpers = _module(tmp_path, "helpers", "LIMIT = 1\n")
+    cache = tmp_path / "cache.json"
+
+    assert generate_models.validate_model_files([models], workers=1, cache_file=cache)[0].ok
+    assert generate_models.validate_model_files([models], cache_file=cache)[0].cached
+
+    helpers.write_text("LIMIT = 2\n")
+    again = generate_models.validate_model_files([models], workers=1, cache_file=cache)[0]
+    assert not again.cached and again.models == ["LimitModel"]
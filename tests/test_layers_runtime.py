@@ -0,0 +1,170 @@
+"""Tests for the layered WeaverRuntime: bounded generation, timeouts, cancellation, validation."""
+
+import asyncio
+import logging
+import threading
+import time
+
+from weavergen.layers import runtime as runtime_module
+from weavergen.layers.contracts import (
+    ExecutionContext, ExecutionStatus, GenerationRequest, SemanticConvention, SemanticGroup,
+    TargetLanguage, ValidationError, ValidationLevel, ValidationRequest, WeaverConfig,
+)
+from weavergen.layers.runtime import AbandonFlag, WeaverRuntime, find_weaver_binary
+
+
+class SlowCall:
+    """Template callable that sleeps and records peak concurrency"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return "done"
+
+
+def _runtime(tmp_path, templates=6, max_workers=4):
+    template_dir = tmp_path / "templates"
+    (template_dir / "go").mkdir(parents=True)
+    for i in range(templates):
+        (template_dir / f"python_unit{i}.j2").write_text("# {{ semantic.id | pascal_case }} {{ slow() }}\n")
+    (template_dir / "go" / "models.go.j2").write_text("package {{ semantic.id | snake_case }}\n")
+    return WeaverRuntime(WeaverConfig(template_directories=[template_dir], max_workers=max_workers))
+
+
+def _request(tmp_path, slow, languages=(TargetLanguage.PYTHON,)):
+    semantic = SemanticConvention(id="http.server", brief="HTTP", groups=[SemanticGroup(id="g", type="span", brief="b")])
+    return GenerationRequest(semantic_convention=semantic, target_languages=list(languages),
+                             output_directory=tmp_path / "out", variables={"slow": slow})
+
+
+def test_generation_renders_in_parallel_within_context_limit(tmp_path):
+    runtime = _runtime(tmp_path)
+    slow = SlowCall(0.1)
+    request = _request(tmp_path, slow, [TargetLanguage.PYTHON, TargetLanguage.GO])
+
+    async def scenario():
+        await runtime.startup()
+        result = await runtime.execute_generation(request, ExecutionContext(max_workers=2))
+        await runtime.shutdown()
+        return result
+
+    result = asyncio.run(scenario())
+
+    assert result.status == ExecutionStatus.SUCCESS and result.errors == []
+    assert slow.peak == 2
+    assert (tmp_path / "out" / "python" / "python_unit0.py").read_text() == "# HttpServer done\n"
+    assert (tmp_path / "out" / "go" / "models.go").read_text() == "package http_server\n"
+    assert len(result.generated_files) == 7 and len(result.templates_used) == 7
+
+
+def test_timeout_and_cancellation_stop_generation(tmp_path):
+    runtime = _runtime(tmp_path, templates=4, max_workers=1)
+
+    async def timed_out():
+        return await runtime.execute_generation(_request(tmp_path, SlowCall(0.2)),
+                                                ExecutionContext(timeout_seconds=0.3))
+
+    result = asyncio.run(timed_out())
+    time.sleep(0.3)
+    assert result.status == ExecutionStatus.FAILED
+    assert result.errors[-1] == "Generation timed out after 0.3s"
+    # Files finished before the deadline are reported; nothing is written after it
+    assert sorted(p.name for p in (tmp_path / "out" / "python").iterdir()) == \
+        sorted(f.path.name for f in result.generated_files)
+    assert len(result.generated_files) < 4
+
+    async def cancelled():
+        context = ExecutionContext()
+        task = asyncio.ensure_future(runtime.execute_generation(_request(tmp_path, SlowCall(0.2)), context))
+        await asyncio.sleep(0.1)
+        assert runtime.cancel(context.session_id)
+        return context, await task
+
+    context, result = asyncio.run(cancelled())
+    assert result.status == ExecutionStatus.CANCELLED
+    assert runtime.cancel(context.session_id) is False
+
+
+def test_validation_dispatches_by_target_and_runs_custom_rules(tmp_path):
+    runtime = WeaverRuntime()
+    (tmp_path / "conv.yaml").write_text(
+        "groups:\n  - id: http\n    type: span\n    brief: HTTP\n    attributes:\n      - id: http.method\n        type: string\n"
+    )
+    (tmp_path / "bad.py").write_text("def broken(:\n")
+    runtime.validation_engine.register_validator(
+        "no_http", lambda target, level: [ValidationError(code="custom", message="http!", severity="warning")]
+    )
+
+    async def validate(target, level=ValidationLevel.BASIC, rules=()):
+        request = ValidationRequest(target=target, validation_level=level, rules=list(rules))
+        return await runtime.execute_validation(request, ExecutionContext())
+
+    basic = asyncio.run(validate(tmp_path / "conv.yaml", rules=["no_http", "made_up"]))
+    assert basic.is_valid
+    assert [w.code for w in basic.warnings] == ["custom", "validation.rule.unknown"]
+
+    strict = asyncio.run(validate(tmp_path / "conv.yaml", ValidationLevel.STRICT))
+    pedantic = asyncio.run(validate(tmp_path / "conv.yaml", ValidationLevel.PEDANTIC))
+    assert strict.is_valid and {w.rule for w in strict.warnings} == {"attribute_brief", "attribute_requirement_level"}
+    assert not pedantic.is_valid and len(pedantic.errors) == 3
+
+    directory = asyncio.run(validate(tmp_path))
+    assert [(e.code, e.line) for e in directory.errors] == [("code.syntax", 1)]
+    assert directory.errors[0].message.startswith("bad.py: ")
+
+    convention = asyncio.run(validate(SemanticConvention(id="empty", brief="none")))
+    assert [e.code for e in convention.errors] == ["semantic.groups.missing"]
+
+
+def test_weaver_discovery_prefers_configured_binary_and_caches(tmp_path, monkeypatch):
+    binary = tmp_path / "weaver"
+    binary.write_text("#!/bin/sh\necho weaver 0.9\n")
+    binary.chmod(0o755)
+    assert find_weaver_binary(binary) == binary
+
+    monkeypatch.setenv("PATH", str(tmp_path))
+    runtime = WeaverRuntime()
+    assert runtime.discover_weaver_binary() == binary
+    binary.unlink()
+    # Cached for this PATH, and per process manager
+    assert find_weaver_binary() == binary
+    assert runtime.process_manager.weaver_binary == binary
+
+
+def test_weaver_discovery_does_not_cache_misses(tmp_path, monkeypatch):
+    monkeypatch.setattr(runtime_module, "WEAVER_SEARCH_PATHS", ())
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert find_weaver_binary() is None
+
+    binary = tmp_path / "weaver"
+    binary.write_text("#!/bin/sh\necho weaver 0.9\n")
+    binary.chmod(0o755)
+    assert find_weaver_binary() == binary
+
+
+def test_abandoned_requests_write_nothing_and_bad_manifests_are_logged(tmp_path, caplog):
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "python_models.j2").write_text("x = 1\n")
+    (template_dir / "python_models.yaml").write_text("version: [not, a, string]\n")
+    engine = WeaverRuntime(WeaverConfig(template_directories=[template_dir])).template_engine
+
+    with caplog.at_level(logging.WARNING, logger="weavergen.layers.runtime"):
+        written = engine.render_file("python_models.j2", {}, tmp_path / "out" / "a.py", abandoned=AbandonFlag())
+    assert written.path.read_text() == "x = 1\n"
+    assert "Ignoring invalid template manifest" in caplog.text
+
+    abandoned = AbandonFlag()
+    abandoned.set()
+    assert engine.render_file("python_models.j2", {}, tmp_path / "out" / "b.py", abandoned=abandoned) is None
+    assert not (tmp_path / "out" / "b.py").exists()
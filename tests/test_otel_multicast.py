@@ -0,0 +1,101 @@
+"""Tests for queued multicast delivery on OTelCommunicationBus."""
+
+import asyncio
+
+from weavergen.otel.communication import MessageType, OTelCommunicationBus
+
+
+def _collector(received, agent_id, delay=0.0):
+    async def handler(message):
+        await asyncio.sleep(delay)
+        received.append((agent_id, message))
+    return handler
+
+
+def test_multicast_shares_one_payload_and_skips_sender():
+    async def scenario():
+        bus = OTelCommunicationBus()
+        received = []
+        for agent_id in ("eat", "rte-a", "rte-b", "rte-c"):
+            bus.subscribe(agent_id, _collector(received, agent_id))
+
+        content = {"priority_items": ["epic-1"]}
+        messages = await bus.send_multicast("eat", ["all", "rte-a"], MessageType.NOTIFICATION, content)
+        await bus.drain()
+        await bus.close()
+        return messages, received, content
+
+    messages, received, content = asyncio.run(scenario())
+
+    assert [m.receiver_id for m in messages] == ["rte-a", "rte-b", "rte-c"]
+    assert sorted(agent for agent, _ in received) == ["rte-a", "rte-b", "rte-c"]
+    assert all(m.content is content for _, m in received)
+    assert len({m.id for m in messages}) == 1
+
+
+def test_bounded_queue_applies_backpressure_and_keeps_order():
+    async def scenario():
+        bus = OTelCommunicationBus(queue_size=1)
+        received = []
+        bus.subscribe("slow", _collector(received, "slow", delay=0.05))
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for i in range(4):
+            await bus.send_multicast("po", ["slow"], MessageType.NOTIFICATION, {"n": i})
+        send_time = loop.time() - started
+        await bus.drain()
+        await bus.close()
+        return send_time, received
+
+    send_time, received = asyncio.run(scenario())
+
+    # One in the handler, one waiting: later sends wait for the handler
+    assert send_time >= 0.08
+    assert [m.content["n"] for _, m in received] == [0, 1, 2, 3]
+
+
+def test_drain_waits_for_messages_sent_by_handlers():
+    async def scenario():
+        bus = OTelCommunicationBus()
+        received = []
+
+        async def relay(message):
+            await asyncio.sleep(0.01)
+            await bus.send_multicast("sm", ["team-1", "team-2"], MessageType.NOTIFICATION, message.content)
+
+        bus.subscribe("sm", relay)
+        bus.subscribe("team-1", _collector(received, "team-1", delay=0.02))
+        bus.subscribe("team-2", _collector(received, "team-2", delay=0.02))
+
+        await bus.send_multicast("po", ["sm"], MessageType.NOTIFICATION, {"story": 1})
+        await bus.drain()
+        delivered = sorted(agent for agent, _ in received)
+        await bus.close()
+        return delivered
+
+    assert asyncio.run(scenario()) == ["team-1", "team-2"]
+
+
+def test_multicast_span_names_the_resolved_recipients(monkeypatch):
+    from weavergen.otel import communication
+
+    receivers = []
+    original = communication.span_manager.communication_span
+
+    def recording_span(sender_id, receiver_id, message_type, attributes=None):
+        receivers.append(receiver_id)
+        return original(sender_id, receiver_id, message_type, attributes=attributes)
+
+    monkeypatch.setattr(communication.span_manager, "communication_span", recording_span)
+
+    async def scenario():
+        bus = OTelCommunicationBus()
+        for agent_id in ("eat", "rte-a", "rte-b"):
+            bus.subscribe(agent_id, _collector([], agent_id))
+        await bus.send_multicast("eat", ["all", "rte-a"], MessageType.NOTIFICATION, {})
+        await bus.drain()
+        await bus.close()
+
+    asyncio.run(scenario())
+    assert receivers == ["rte-a,rte-b"]
@@ -0,0 +1,174 @@
+"""Tests for the incremental multi-file semantic registry."""
+
+import json
+import os
+import shutil
+
+import yaml
+
+from weavergen.benchmark_suite import write_stub_weaver
+from weavergen.core import GenerationConfig, WeaverConfig, WeaverGen
+from weavergen.semantic_parser import SemanticConventionParser, SemanticRegistry
+
+
+def _write(path, groups):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump({"groups": groups}))
+
+
+def _registry(tmp_path):
+    root = tmp_path / "registry"
+    _write(root / "http.yaml", [{
+        "id": "registry.http",
+        "prefix": "http",
+        "type": "attribute_group",
+        "attributes": [
+            {"id": "method", "type": "string"},
+            {"id": "status_code", "type": "int"},
+        ],
+    }])
+    _write(root / "spans" / "server.yaml", [{
+        "id": "span.http.server",
+        "type": "span",
+        "attributes": [{"ref": "http.method"}, {"ref": "url.full"}],
+    }])
+    return root
+
+
+class CountingParser(SemanticConventionParser):
+    def __init__(self):
+        self.loads = 0
+
+    def load_document(self, content, suffix):
+        self.loads += 1
+        return super().load_document(content, suffix)
+
+
+def test_registry_indexes_groups_attributes_and_refs(tmp_path):
+    registry = SemanticRegistry(_registry(tmp_path))
+    delta = registry.refresh()
+
+    assert len(delta.added) == 2
+    assert set(registry.groups) == {"registry.http", "span.http.server"}
+    assert set(registry.attributes) == {"http.method", "http.status_code"}
+    assert registry.references["http.method"] == {"span.http.server"}
+    assert registry.unresolved_references() == {"url.full": {"span.http.server"}}
+    assert registry.validate() == ["Unresolved ref 'url.full' used by: span.http.server"]
+
+
+def test_refresh_reparses_only_changed_files(tmp_path):
+    root = _registry(tmp_path)
+    parser = CountingParser()
+    registry = SemanticRegistry(root, parser=parser)
+    registry.refresh()
+    assert parser.loads == 2
+
+    # Touching without changing content does not re-parse
+    os.utime(root / "http.yaml", ns=(1, 1))
+    delta = registry.refresh()
+    assert not delta.has_changes and parser.loads == 2
+
+    _write(root / "url.yaml", [{
+        "id": "registry.url", "prefix": "url", "type": "attribute_group",
+        "attributes": [{"id": "full", "type": "string"}],
+    }])
+    (root / "http.yaml").unlink()
+    delta = registry.refresh()
+
+    assert [p.name for p in delta.added] == ["url.yaml"]
+    assert [p.name for p in delta.removed] == ["http.yaml"]
+    assert parser.loads == 3
+    assert set(registry.attributes) == {"url.full"}
+    assert registry.unresolved_references() == {"http.method": {"span.http.server"}}
+
+
+def test_parse_cache_survives_new_registry_instance(tmp_path):
+    root = _registry(tmp_path)
+    cache = tmp_path / "cache.json"
+    SemanticRegistry(root, cache_file=cache).refresh()
+
+    parser = CountingParser()
+    registry = SemanticRegistry(root, parser=parser, cache_file=cache)
+    registry.refresh()
+
+    assert parser.loads == 0
+    assert set(registry.groups) == {"registry.http", "span.http.server"}
+
+    # Documents of removed or rewritten files are evicted
+    (root / "spans" / "server.yaml").unlink()
+    registry.refresh()
+    assert len(json.loads(cache.read_text())["documents"]) == 1
+
+
+def test_parse_cache_keeps_only_exact_json_documents(tmp_path):
+    root = tmp_path / "registry"
+    root.mkdir()
+    (root / "plain.yaml").write_text("groups:\n  - id: plain\n    type: span\n")
+    (root / "dated.yaml").write_text("groups:\n  - id: dated\n    type: span\n    since: 2024-01-31\n")
+    (root / "keys.yaml").write_text("groups:\n  - id: keys\n    type: span\n    codes: {200: ok}\n")
+    cache = tmp_path / "cache.json"
+    SemanticRegistry(root, cache_file=cache).refresh()
+
+    parser = CountingParser()
+    registry = SemanticRegistry(root, parser=parser, cache_file=cache)
+    registry.refresh()
+
+    assert len(json.loads(cache.read_text())["documents"]) == 1 and parser.loads == 2
+    assert registry.groups["dated"]["since"] == yaml.safe_load("d: 2024-01-31")["d"]
+    assert registry.groups["keys"]["codes"] == {200: "ok"}
+
+
+def test_generate_always_runs_weaver_and_caches_only_when_configured(tmp_path):
+    root = _registry(tmp_path)
+    weaver = tmp_path / "bin" / "weaver"
+    write_stub_weaver(weaver)
+    cache_dir = None
+
+    class StubWeaverGen(WeaverGen):
+        def _load_config(self):
+            return WeaverConfig(weaver_path=weaver, cache_dir=cache_dir)
+
+    config = GenerationConfig(registry_url=str(root), output_dir=tmp_path / "out")
+    gen = StubWeaverGen(config, auto_install=False)
+
+    first = gen.generate()
+    (tmp_path / "out" / first.files[0].path.name).write_text("edited")
+    second = gen.generate()
+    assert first.success and second.success and not second.warnings
+    assert (tmp_path / "out" / first.files[0].path.name).read_text() != "edited"
+    assert [p.name for p in (tmp_path / "out").iterdir()] == [f.path.name for f in second.files]
+
+    # The parsed model is reused in-process; disk caching is opt-in
+    assert gen.load_registry(root) is gen.load_registry(root)
+    assert gen.load_registry(root).cache_file is None
+    cache_dir = tmp_path / "cache"
+    gen = StubWeaverGen(config, auto_install=False)
+    gen.load_registry(root)
+    [cache_file] = (cache_dir / "registries").iterdir()
+    assert len(json.loads(cache_file.read_text())["documents"]) == 2
+
+
+def test_generate_reuses_registry_parses_and_fails_fast_on_broken_files(tmp_path):
+    root = _registry(tmp_path)
+    weaver = tmp_path / "bin" / "weaver"
+    write_stub_weaver(weaver)
+
+    class StubWeaverGen(WeaverGen):
+        def _load_config(self):
+            return WeaverConfig(weaver_path=weaver)
+
+    gen = StubWeaverGen(GenerationConfig(registry_url=str(root), output_dir=tmp_path / "out"),
+                        auto_install=False)
+    assert gen.generate().success
+    parser = CountingParser()
+    gen.load_registry(root).parser = parser
+
+    assert gen.generate().success
+    assert parser.loads == 0
+
+    (root / "broken.yaml").write_text("groups: [unclosed\n")
+    shutil.rmtree(tmp_path / "out")
+    result = gen.generate()
+    assert not result.success and "broken.yaml" in result.error
+    assert parser.loads == 1
+    assert not (tmp_path / "out").exists()
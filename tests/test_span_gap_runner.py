@@ -0,0 +1,92 @@
+"""Tests for pooled gap scenarios: concurrency, resource deltas and span-timestamp violations."""
+
+import asyncio
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+
+from weavergen.layers.span_gap_validation import (
+    GAP_SUITES, GapScenarioRunner, SpanGapValidator, SpanTiming, find_timing_violations,
+)
+
+
+def _validator():
+    return SpanGapValidator(TracerProvider().get_tracer("gap-test"))
+
+
+def test_violations_come_from_span_timestamps():
+    timings = [
+        SpanTiming("a#0", "modify_shared_config", 0, 10),
+        SpanTiming("a#0", "read_shared_config", 10, 20),
+        SpanTiming("a#0", "validate_shared_config", 15, 30),
+        # Same operations in another scenario never constrain each other
+        SpanTiming("b#0", "read_shared_config", 0, 40),
+        SpanTiming("a#0", "cache_fill", 0, 10, resource="cache:x"),
+        SpanTiming("b#0", "cache_fill", 5, 8, resource="cache:x"),
+        SpanTiming("b#0", "cache_fill", 9, 12, resource="cache:x"),
+        SpanTiming("b#0", "cache_fill", 12, 14, resource="cache:x"),
+        SpanTiming("b#0", "cache_fill", 5, 8, resource="cache:y"),
+    ]
+
+    violations = find_timing_violations(timings)
+
+    assert [(v.kind, v.first.operation, v.second.operation, v.overlap_ms * 1e6) for v in violations] == [
+        ("ordering", "read_shared_config", "validate_shared_config", 5),
+        ("overlap", "cache_fill", "cache_fill", 5),
+        ("overlap", "cache_fill", "cache_fill", 1),
+    ]
+
+
+def test_runner_executes_suites_concurrently_and_reports_races():
+    validator = _validator()
+    # Slow layer operations make the staggered dependency chain overlap
+    validator.operation_delay = 0.03
+    runner = GapScenarioRunner(validator, concurrency=4, iterations=2)
+
+    report = asyncio.run(runner.run())
+
+    assert report.failed == []
+    assert sorted(r.scenario for r in report.scenarios) == sorted(
+        f"{suite}#{i}" for suite in GAP_SUITES for i in range(2)
+    )
+    assert report.duration_ms < sum(r.duration_ms for r in report.scenarios)
+    ordering = {v.first.scenario for v in report.violations if v.kind == "ordering"}
+    assert ordering == {"timing_dependencies#0", "timing_dependencies#1"}
+    # Concurrent loads of the shared cache key race; later scenarios may join in
+    fills = [v for v in report.violations if v.kind == "overlap"]
+    assert len(fills) >= 4
+    assert {v.second.resource for v in fills} == {"request_cache:shared_semantic_convention"}
+
+    # SDK spans supplied the timestamps, and nested gap spans stay inside their parents
+    timings = {t.operation: t for t in validator.span_timings if t.scenario == "timing_dependencies#0"}
+    assert timings["timing_dependencies"].start_ns <= timings["layer_dependency_race"].start_ns
+    assert timings["layer_dependency_race"].end_ns <= timings["timing_dependencies"].end_ns
+
+
+def test_scenarios_measure_real_descriptor_deltas(tmp_path):
+    validator = _validator()
+    leaked = []
+
+    async def leaky():
+        leaked.append(open(tmp_path / "leak.txt", "w"))
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    validator.validate_security_boundaries = leaky
+    validator.validate_state_consistency = broken
+    runner = GapScenarioRunner(validator, concurrency=1,
+                               suites=["security_boundaries", "state_consistency"])
+    try:
+        report = asyncio.run(runner.run())
+    finally:
+        for handle in leaked:
+            handle.close()
+
+    leak, failure = report.scenarios
+    assert leak.fd_delta == 1 and leak.error is None
+    assert failure.error == "RuntimeError: boom"
+    assert report.fd_delta >= 1
+
+    with pytest.raises(ValueError, match="Unknown gap suites: nope"):
+        GapScenarioRunner(validator, suites=["nope"])
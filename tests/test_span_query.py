@@ -0,0 +1,125 @@
+"""Tests for the indexed span query engine behind `weavergen debug spans`."""
+
+import json
+
+import pytest
+
+from weavergen import span_query
+from weavergen.span_query import (
+    SpanIndex,
+    SpanQueryError,
+    compile_filter,
+    format_duration,
+    iter_span_file,
+    parse_duration,
+)
+
+
+def _write_spans(path, spans):
+    path.write_text(json.dumps(spans, indent=2))
+    return path
+
+
+@pytest.fixture
+def span_file(tmp_path):
+    spans = []
+    for i in range(30):
+        spans.append({
+            "name": "bpmn.task.generate" if i % 2 else "weaver.validate",
+            "trace_id": f"0x{i // 10:032x}",
+            "span_id": f"0x{i:016x}",
+            "start_time": 1_700_000_000_000_000_000 + i * 1_000,
+            "end_time": 1_700_000_000_000_000_000 + i * 1_000 + i * 1_000_000,
+            "attributes": {"bpmn.task.type": "service" if i < 20 else "user", "retry.count": i % 3},
+            "status": {"status_code": "ERROR" if i == 7 else "OK"},
+        })
+    return _write_spans(tmp_path / "captured_spans.json", spans)
+
+
+def test_streaming_reader_matches_json_load(span_file):
+    assert list(iter_span_file(span_file)) == json.loads(span_file.read_text())
+
+
+def test_streaming_reader_handles_json_lines_and_wrapped_documents(span_file, tmp_path, monkeypatch):
+    spans = json.loads(span_file.read_text())
+    lines = tmp_path / "spans.jsonl"
+    lines.write_text("\n".join(json.dumps(span) for span in spans) + "\n\n")
+    wrapped = tmp_path / "wrapped.json"
+    wrapped.write_text(json.dumps({"spans": spans}, indent=2))
+    single = tmp_path / "single.json"
+    single.write_text(json.dumps(spans[0]))
+
+    # A small read chunk makes the first buffer end mid-line
+    monkeypatch.setattr(span_query, "_READ_CHUNK", 100)
+    assert list(iter_span_file(lines)) == spans
+    assert list(iter_span_file(wrapped)) == spans
+    assert list(iter_span_file(single)) == spans[:1]
+
+
+def test_durations_are_computed_from_timestamps(span_file):
+    with SpanIndex(span_file) as index:
+        result = index.top(3)
+        assert [span.duration_ns for span in result.spans] == [29_000_000, 28_000_000, 27_000_000]
+        assert result.spans[0].duration == "29.00ms"
+
+
+def test_filter_expression_combines_columns_and_attributes(span_file):
+    with SpanIndex(span_file) as index:
+        result = index.query('name ~ bpmn and bpmn.task.type = service and duration >= 10ms', limit=100)
+        assert result.total == 5
+        assert all(span.name == "bpmn.task.generate" for span in result.spans)
+
+        assert index.count("status = error") == 1
+        assert index.count("retry.count > 1") == 10
+        assert index.count("not has retry.count") == 0
+
+
+def test_paging(span_file):
+    with SpanIndex(span_file) as index:
+        first = index.query(limit=10)
+        last = index.query(limit=10, offset=20)
+        assert first.total == last.total == 30
+        assert first.has_more and not last.has_more
+        assert last.spans[-1].span_id == f"0x{29:016x}"
+
+
+def test_trace_binds_the_trace_id(span_file):
+    with SpanIndex(span_file) as index:
+        spans = index.trace(f"0x{1:032x}")
+        assert [span.span_id for span in spans] == [f"0x{i:016x}" for i in range(10, 20)]
+        # Quotes and filter syntax in the id are matched literally
+        assert index.trace('x" or name ~ "') == []
+
+
+def test_index_is_rebuilt_when_span_file_changes(span_file):
+    with SpanIndex(span_file) as index:
+        assert index.count() == 30
+
+    _write_spans(span_file, [{"name": "only", "duration_ns": 5}])
+    index = SpanIndex(span_file)
+    assert not index.is_fresh()
+    with index:
+        assert index.count() == 1
+
+
+def test_iso_timestamps_and_duration_units(tmp_path):
+    path = _write_spans(tmp_path / "spans.json", [{
+        "name": "iso",
+        "start_time": "2025-06-30T20:40:03.500000",
+        "end_time": "2025-06-30T20:40:04.750000",
+    }])
+    with SpanIndex(path) as index:
+        assert index.query().spans[0].duration_ns == 1_250_000_000
+
+    assert parse_duration("250us") == 250_000
+    assert parse_duration("2") == 2_000_000
+    assert format_duration(1_500) == "1.5µs"
+
+
+def test_invalid_expressions_raise():
+    with pytest.raises(SpanQueryError):
+        compile_filter("name =")
+    with pytest.raises(SpanQueryError):
+        compile_filter("(name = a")
+    with pytest.raises(SpanQueryError):
+        compile_filter("retry.count > many")
@@ -0,0 +1,152 @@
+"""Tests for the persistent ring-buffer span exporter."""
+
+import subprocess
+import sys
+import textwrap
+import threading
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+from weavergen.span_ring import RingBufferSpanExporter, SpanRingReader, _segments
+
+
+def _tracer(exporter):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer(__name__)
+
+
+def _emit(tracer, start, count):
+    for i in range(start, start + count):
+        with tracer.start_as_current_span(f"span.{i}") as span:
+            span.set_attribute("index", i)
+
+
+def _indexes(spans):
+    return [span["attributes"]["index"] for span in spans]
+
+
+def test_full_ring_spills_to_segments_in_order(tmp_path):
+    exporter = RingBufferSpanExporter(tmp_path / "cap", ring_bytes=4096)
+    tracer = _tracer(exporter)
+    _emit(tracer, 0, 50)
+
+    assert exporter.stats["spilled"] > 0
+    assert (tmp_path / "cap" / "ring.bin").stat().st_size == 64 + 4096
+    assert _indexes(SpanRingReader(tmp_path / "cap").snapshot()) == list(range(50))
+
+    exporter.clear()
+    _emit(tracer, 50, 3)
+    assert _indexes(exporter.get_finished_spans()) == [50, 51, 52]
+    assert exporter.get_finished_spans()[0]["name"] == "span.50"
+    exporter.shutdown()
+
+
+def test_segment_limit_drops_oldest_spans_only(tmp_path):
+    exporter = RingBufferSpanExporter(tmp_path, ring_bytes=2048, segment_bytes=2048, max_segments=2)
+    _emit(_tracer(exporter), 0, 100)
+    exporter.shutdown()
+
+    assert len(_segments(tmp_path)) <= 2
+    kept = _indexes(SpanRingReader(tmp_path).snapshot())
+    assert kept and kept[-1] == 99
+    assert kept == list(range(kept[0], 100))
+
+
+def test_spans_survive_a_crashed_writer_and_resume(tmp_path):
+    script = textwrap.dedent(f"""
+        import os
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from weavergen.span_ring import RingBufferSpanExporter
+
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(
+            RingBufferSpanExporter({str(tmp_path)!r}, ring_bytes=4096)))
+        tracer = provider.get_tracer("crash")
+        for i in range(30):
+            with tracer.start_as_current_span(f"span.{{i}}") as span:
+                span.set_attribute("index", i)
+        os._exit(1)
+    """)
+    subprocess.run([sys.executable, "-c", script], check=False)
+
+    assert _indexes(SpanRingReader(tmp_path).snapshot()) == list(range(30))
+
+    exporter = RingBufferSpanExporter(tmp_path, ring_bytes=4096)
+    _emit(_tracer(exporter), 30, 5)
+    assert _indexes(exporter.get_finished_spans()) == list(range(30, 35))
+    exporter.shutdown()
+    assert _indexes(SpanRingReader(tmp_path).snapshot()) == list(range(35))
+
+
+def test_reader_sees_consistent_prefix_while_writing(tmp_path):
+    exporter = RingBufferSpanExporter(tmp_path, ring_bytes=4096, max_segments=1000)
+    tracer = _tracer(exporter)
+    writer = threading.Thread(target=_emit, args=(tracer, 0, 400))
+    writer.start()
+    reader = SpanRingReader(tmp_path)
+    snapshots = []
+    while writer.is_alive():
+        snapshots.append(_indexes(reader.snapshot()))
+    writer.join()
+    snapshots.append(_indexes(reader.snapshot()))
+    exporter.shutdown()
+
+    for seen in snapshots:
+        assert seen == list(range(len(seen)))
+    assert snapshots[-1] == list(range(400))
+
+
+def test_second_writer_gets_its_own_capture(tmp_path):
+    first = RingBufferSpanExporter(tmp_path / "cli")
+    second = RingBufferSpanExporter(tmp_path / "cli")
+    _emit(_tracer(first), 0, 1)
+    _emit(_tracer(second), 1, 1)
+
+    assert first.directory == tmp_path / "cli"
+    assert second.directory != first.directory
+    assert _indexes(second.get_finished_spans()) == [1]
+    first.shutdown()
+    second.shutdown()
+
+
+def test_reader_never_sees_overwritten_records_from_another_process(tmp_path):
+    script = textwrap.dedent(f"""
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from weavergen.span_ring import RingBufferSpanExporter
+
+        provider = TracerProvider()
+        provider.add_span_processor(BatchSpanProcessor(
+            RingBufferSpanExporter({str(tmp_path)!r}, ring_bytes=8192, max_segments=10000)))
+        tracer = provider.get_tracer("writer")
+        for i in range(5000):
+            with tracer.start_as_current_span(f"span.{{i}}") as span:
+                span.set_attribute("index", i)
+        provider.shutdown()
+    """)
+    writer = subprocess.Popen([sys.executable, "-c", script])
+    reader = SpanRingReader(tmp_path)
+    while writer.poll() is None:
+        if SpanRingReader.is_capture(tmp_path):
+            seen = _indexes(reader.snapshot())
+            assert seen == list(range(len(seen)))
+    assert writer.returncode == 0
+    assert _indexes(reader.snapshot()) == list(range(5000))
+
+
+def test_stale_per_process_captures_are_reused(tmp_path):
+    # Left behind by a writer process that has exited
+    (tmp_path / "cli-1").mkdir()
+    (tmp_path / "cli-1" / "ring.lock").touch()
+    holder = RingBufferSpanExporter(tmp_path / "cli")
+    exporter = RingBufferSpanExporter(tmp_path / "cli")
+    _emit(_tracer(holder), 0, 1)
+    _emit(_tracer(exporter), 1, 1)
+    holder.shutdown()
+    exporter.shutdown()
+
+    assert exporter.directory == tmp_path / "cli-1"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cli", "cli-1"]
@@ -0,0 +1,113 @@
+"""Tests for cached, parallel pattern mining in TemplateExtractor."""
+
+import os
+
+from weavergen import template_learner
+from weavergen.template_learner import TemplateExtractor
+
+MODEL = '''
+class {name}Model(BaseModel):
+    {field}: str
+    count: int = 0
+
+    def describe(self) -> str:
+        return f"{{self.{field}}}: {{self.count}}"
+'''
+
+AGENT = '''
+class {name}Agent(BaseModel):
+    role: str
+
+    async def run(self, prompt: str, retries: int) -> dict:
+        for attempt in range(retries):
+            await self.step(prompt)
+        return {{"role": self.role}}
+'''
+
+
+def _write_tree(root, count):
+    root.mkdir(exist_ok=True)
+    for i in range(count):
+        (root / f"model_{i}.py").write_text(MODEL.format(name=f"N{i}", field=f"field_{i}"))
+    (root / "agent_a.py").write_text(AGENT.format(name="A"))
+    (root / "agent_b.py").write_text(AGENT.format(name="B"))
+    (root / "__init__.py").write_text("")
+
+
+def test_same_shape_definitions_cluster_regardless_of_names(tmp_path):
+    _write_tree(tmp_path / "gen", 3)
+    extractor = TemplateExtractor(tmp_path / "gen", cache_file=None)
+    patterns = extractor.analyze_directory()
+
+    # Models and agents share a base class but not a shape
+    assert sorted(p.frequency for p in patterns["class"]) == [2, 3]
+    assert sorted(p.frequency for p in patterns["function"]) == [2, 3]
+    assert any(f["is_async"] for f in extractor.function_signatures)
+
+    # Re-running starts from a clean slate
+    assert sorted(p.frequency for p in extractor.analyze_directory()["class"]) == [2, 3]
+
+
+def test_template_instances_with_different_field_counts_form_one_pattern(tmp_path):
+    root = tmp_path / "gen"
+    root.mkdir()
+    for i, fields in enumerate([1, 3, 6]):
+        body = "".join(f"    field_{j}: str\n" for j in range(fields))
+        statements = "".join(f"        self.field_{j} = value\n" for j in range(fields))
+        (root / f"model_{i}.py").write_text(
+            f"class Model{i}(BaseModel):\n{body}\n"
+            f"    def update(self, value):\n{statements}        return self\n"
+        )
+
+    patterns = TemplateExtractor(root, cache_file=None).analyze_directory()
+
+    assert [p.frequency for p in patterns["class"]] == [3]
+    assert [p.frequency for p in patterns["function"]] == [3]
+
+
+def test_cache_reuses_unchanged_files(tmp_path, monkeypatch):
+    _write_tree(tmp_path / "gen", 3)
+    cache_file = tmp_path / "features.json"
+    first = TemplateExtractor(tmp_path / "gen", cache_file=cache_file)
+    first.analyze_directory()
+    assert (first.cache_hits, first.cache_misses) == (0, 5)
+
+    extracted = []
+    original = template_learner.extract_file_features
+    monkeypatch.setattr(template_learner, "extract_file_features",
+                        lambda path: extracted.append(path) or original(path))
+
+    touched = tmp_path / "gen" / "model_0.py"
+    os.utime(touched, ns=(0, 0))
+    changed = tmp_path / "gen" / "model_1.py"
+    changed.write_text(MODEL.format(name="X", field="x") + "\ndef helper(a, b):\n    return a\n")
+
+    second = TemplateExtractor(tmp_path / "gen", cache_file=cache_file)
+    patterns = second.analyze_directory()
+    assert (second.cache_hits, second.cache_misses) == (4, 1)
+    assert extracted == [str(changed)]
+    assert sorted(p.frequency for p in patterns["class"]) == [2, 3]
+    assert any(f["name"] == "helper" for f in second.function_signatures)
+
+    # An all-hit run leaves the cache file alone; a deleted file is pruned
+    saved = []
+    monkeypatch.setattr(TemplateExtractor, "_save_cache", lambda self, cache: saved.append(set(cache)))
+    TemplateExtractor(tmp_path / "gen", cache_file=cache_file).analyze_directory()
+    assert saved == []
+    changed.unlink()
+    TemplateExtractor(tmp_path / "gen", cache_file=cache_file).analyze_directory()
+    assert len(saved) == 1 and str(changed.resolve()) not in saved[0]
+
+
+def test_process_pool_matches_inline_extraction(tmp_path):
+    _write_tree(tmp_path / "gen", 10)
+    inline = TemplateExtractor(tmp_path / "gen", cache_file=None, max_workers=1)
+    pooled = TemplateExtractor(tmp_path / "gen", cache_file=None, max_workers=2)
+
+    inline_patterns = inline.analyze_directory()
+    pooled_patterns = pooled.analyze_directory()
+
+    assert pooled.class_structures == inline.class_structures
+    assert pooled.function_signatures == inline.function_signatures
+    assert [p.template for p in pooled_patterns["class"]] == \
+        [p.template for p in inline_patterns["class"]]
@@ -0,0 +1,113 @@
+"""Tests for the v2 chunked context index and budget packer."""
+
+import io
+from pathlib import Path
+
+from v2_modules import load_v2
+
+context_index = load_v2("weavergen.context_index")
+
+TOKENIZER = context_index.Tokenizer("heuristic", context_index._heuristic_count)
+
+
+def _index(tmp_path, chunk_tokens=60):
+    return context_index.ContextIndex(tmp_path / "index.json", chunk_tokens=chunk_tokens,
+                                      tokenizer=TOKENIZER)
+
+
+def _module(name, body_lines):
+    return "".join(
+        f"def {name}_{i}(value):\n" + "".join(f"    value = value + {j}\n" for j in range(body_lines))
+        + "    return value\n\n"
+        for i in range(6)
+    )
+
+
+def test_chunks_cover_file_and_split_on_definitions(tmp_path):
+    source = tmp_path / "module.py"
+    source.write_text(_module("handler", 8))
+
+    chunks = _index(tmp_path, chunk_tokens=200).chunks_for(source)
+
+    assert len(chunks) > 1
+    text = "".join(context_index.ContextIndex.read_chunk(c) for c in chunks)
+    assert text == source.read_text()
+    assert all(context_index.ContextIndex.read_chunk(c).startswith("def ") for c in chunks)
+    assert chunks[0].start_line == 1 and chunks[-1].end_line == source.read_text().count("\n")
+
+
+def test_index_persists_and_rechunks_only_changed_files(tmp_path):
+    first, second = tmp_path / "a.py", tmp_path / "b.py"
+    first.write_text(_module("alpha", 4))
+    second.write_text(_module("beta", 4))
+    pairs = [(first, "a.py"), (second, "b.py")]
+
+    index = _index(tmp_path)
+    original = index.index_paths(pairs)
+    index.save()
+    assert index.indexed == 2
+
+    second.write_text(_module("gamma", 4))
+    reloaded = _index(tmp_path)
+    chunks = reloaded.index_paths(pairs)
+
+    assert (reloaded.indexed, reloaded.reused) == (1, 1)
+    assert [c.digest for c in chunks if c.label == "a.py"] == \
+        [c.digest for c in original if c.label == "a.py"]
+    assert any("gamma" in c.terms for c in chunks)
+
+
+def test_pack_fills_budget_by_relevance_in_source_order(tmp_path):
+    context = tmp_path / "context.txt"
+    context.write_text(
+        "--- notes.md ---\n" + "general notes about nothing in particular\n" * 20
+        + "--- exporter.py ---\n" + "span_exporter = SpanExporter(span_processor)\n" * 5
+        + "--- misc.py ---\n" + "x = 1\n" * 3
+    )
+    chunks = _index(tmp_path, chunk_tokens=400).chunks_for(context, sections=True)
+    assert [c.label for c in chunks] == ["notes.md", "exporter.py", "misc.py"]
+
+    result = context_index.pack(chunks, budget=120, query="span exporter", tokenizer=TOKENIZER)
+
+    assert result.tokens <= 120
+    assert [c.label for c in result.chunks] == ["exporter.py", "misc.py"]
+    assert result.dropped == 1
+
+    out = io.StringIO()
+    context_index.write_context(result.chunks, out)
+    assert out.getvalue().startswith("--- exporter.py ---\nspan_exporter")
+    assert "--- misc.py ---\nx = 1\n" in out.getvalue()
+
+
+def test_context_file_can_be_rewritten_from_itself(tmp_path):
+    context = tmp_path / "context.txt"
+    context.write_text("--- a.py ---\n" + "alpha = 1\n" * 200 + "--- b.py ---\n" + "beta = 2\n" * 200)
+    chunks = _index(tmp_path, chunk_tokens=50).chunks_for(context, sections=True)
+    assert len(chunks) > 2
+    expected = io.StringIO()
+    context_index.write_context(chunks, expected)
+
+    context_index.write_context_file(chunks, context)
+
+    assert context.read_text() == expected.getvalue()
+    assert "beta = 2\n" * 200 in expected.getvalue()
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_reused_chunks_read_the_indexed_file_from_any_directory(tmp_path, monkeypatch):
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "ctx.txt").write_text(f"--- {name} ---\n{name} content\n")
+
+    monkeypatch.chdir(tmp_path / "a")
+    index = _index(tmp_path)
+    index.chunks_for(Path("ctx.txt"), sections=True)
+    index.save()
+
+    monkeypatch.chdir(tmp_path / "b")
+    reloaded = _index(tmp_path)
+    chunks = reloaded.chunks_for(Path("../a/ctx.txt"), sections=True)
+    assert reloaded.reused == 1
+    out = io.StringIO()
+    context_index.write_context(chunks, out)
+    assert out.getvalue() == "--- a ---\na content\n"
@@ -0,0 +1,135 @@
+"""Tests for the v2 Forge filter implementations."""
+
+import pytest
+
+from v2_modules import load_v2
+
+filters = load_v2("weavergen.filters")
+
+REGISTRY = """
+groups:
+  - id: http
+    prefix: http
+    stability: stable
+    attributes:
+      - id: method
+        type:
+          members:
+            - {id: get, value: GET}
+            - {id: post, value: POST}
+        requirement_level: required
+        brief: HTTP method
+      - id: route
+        type: string
+        requirement_level: {conditionally_required: if routed}
+  - id: db
+    attributes:
+      - id: db.system
+        type: string
+        stability: development
+      - ref: http.method
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    filters.clear_caches()
+    yield
+    filters.clear_caches()
+
+
+def test_semconv_grouping_indexes(tmp_path):
+    registry = tmp_path / "registry.yaml"
+    registry.write_text(REGISTRY)
+    grouped = filters.FILTERS["semconv_grouped_attributes"]
+
+    namespaces = grouped(str(registry))
+
+    assert [ns["root_namespace"] for ns in namespaces] == ["http", "db"]
+    http = namespaces[0]
+    assert [a["name"] for a in http["attributes"]] == ["http.method", "http.route"]
+    assert http.enums[0].values == ["GET", "POST"]
+    assert http.attributes[0].required is True
+
+    by_level = filters.FILTERS["semconv_attributes_by_requirement_level"](str(registry))
+    assert {k: [a["name"] for a in v] for k, v in by_level.items()} == {
+        "required": ["http.method"],
+        "conditionally_required": ["http.route"],
+        "recommended": ["db.system"],
+    }
+    stable = filters.FILTERS["semconv_attributes_by_stability"](str(registry), "stable")
+    assert [a["name"] for a in stable] == ["http.method", "http.route"]
+
+
+def test_grouping_is_memoized_per_registry(tmp_path):
+    registry = tmp_path / "registry.yaml"
+    registry.write_text(REGISTRY)
+    module = filters.semconv_grouped_attributes
+
+    first = module.semconv_grouped_attributes(tmp_path)
+    for _ in range(10):
+        module.semconv_attributes_by_stability(tmp_path)
+        assert module.semconv_grouped_attributes(tmp_path) is first
+    assert module._cache.misses == 1
+
+    registry.write_text(REGISTRY.replace("HTTP method", "Request method") + "\n")
+    assert module.semconv_grouped_attributes(tmp_path) is not first
+
+    resolved = {"groups": [{"id": "x", "attributes": [{"name": "rpc.system", "type": "string"}]}]}
+    grouped = module.semconv_grouped_attributes(resolved)
+    assert module.semconv_grouped_attributes(resolved) is grouped
+
+    # In-place edits change the content key, so the stale grouping is not reused
+    resolved["groups"][0]["attributes"].append({"name": "rpc.service", "type": "string"})
+    regrouped = module.semconv_grouped_attributes(resolved)
+    assert [a["name"] for a in regrouped[0]["attributes"]] == ["rpc.system", "rpc.service"]
+
+
+def test_inputs_are_globbed_once_per_render(tmp_path, monkeypatch):
+    (tmp_path / "registry.yaml").write_text(REGISTRY)
+    memo = load_v2("weavergen.filters._memo")
+    calls = []
+    expand = memo.expand_paths
+    monkeypatch.setattr(memo, "expand_paths", lambda *a: calls.append(a) or expand(*a))
+    env = filters.create_environment()
+    template = env.from_string(
+        "{% for _ in range(5) %}{{ reg | semconv_grouped_attributes | length }}"
+        "{{ reg | semconv_attributes_by_stability('stable') | length }}{% endfor %}"
+    )
+
+    assert isinstance(template, filters.ForgeTemplate)
+    assert template.render(reg=str(tmp_path)) == "22" * 5
+    assert len(calls) == 1
+    template.render(reg=str(tmp_path))
+    assert len(calls) == 2
+
+
+def test_templates_render_with_filters(tmp_path):
+    jinja2 = pytest.importorskip("jinja2")
+    (tmp_path / "registry.yaml").write_text(REGISTRY)
+    (tmp_path / "cli_spec.yaml").write_text(
+        "commands:\n  - name: run\n    summary: Run it\n"
+        "    params:\n      - {name: target, type: string, required: true}\n"
+    )
+    (tmp_path / "flow.bpmn").write_text(
+        '<bpmn:definitions xmlns:bpmn="http://www.omg.org/spec/BPMN/20100524/MODEL" '
+        'xmlns:spiffworkflow="http://spiffworkflow.org/bpmn/schema/1.0/util">'
+        '<bpmn:process id="AIFlow" name="AI Flow"><bpmn:serviceTask id="T1" name="Train">'
+        '<bpmn:extensionElements><spiffworkflow:inputs><spiffworkflow:input id="d" source="dataSet"/>'
+        '</spiffworkflow:inputs><spiffworkflow:outputs><spiffworkflow:output id="m" target="model"/>'
+        '</spiffworkflow:outputs></bpmn:extensionElements></bpmn:serviceTask></bpmn:process>'
+        '</bpmn:definitions>'
+    )
+    env = jinja2.Environment()
+    filters.register_filters(env)
+
+    rendered = env.from_string(
+        "{% for ns in reg | semconv_grouped_attributes %}{{ ns.root_namespace | pascal_case }}:"
+        "{% for e in ns.enums %}{{ e.values | join(',') }}{% endfor %};{% endfor %}"
+        "{% for c in spec | cli_commands %}{{ c.name }}({{ c.params[0].python_type }});{% endfor %}"
+        "{% for p in bpmn | spiff_bpmn %}{{ p.process_id | snake_case }}:"
+        "{% for d in p.data_objects %}{{ d.name }}={{ d.required }},{% endfor %}{% endfor %}"
+    ).render(reg=str(tmp_path / "registry.yaml"), spec=str(tmp_path / "cli_spec.yaml"),
+             bpmn=str(tmp_path / "*.bpmn"))
+
+    assert rendered == "Http:GET,POST;Db:;run(str);ai_flow:dataSet=True,model=False,"
@@ -0,0 +1,73 @@
+"""Tests for the indexed, collapsing v2 span Mermaid renderers."""
+
+from datetime import datetime, timedelta
+
+from v2_modules import load_v2
+
+span_parser = load_v2("span_parser")
+mermaid = load_v2("visualizers.mermaid")
+
+START = datetime(2025, 1, 1)
+
+
+def _span(span_id, parent, operation, service, error=False, duration_ms=5.0):
+    return span_parser.ParsedSpan(
+        span_id=span_id, trace_id="t1", parent_span_id=parent,
+        operation_name=operation, service_name=service,
+        start_time=START, end_time=START + timedelta(milliseconds=duration_ms),
+        duration_ms=duration_ms, status="ok", error=error,
+        attributes={}, events=[], tags={},
+    )
+
+
+def _fan_out_trace(batches, queries):
+    spans = [_span("root", None, "handle", "api")]
+    for b in range(batches):
+        spans.append(_span(f"b{b}", "root", "batch", "worker"))
+        for q in range(queries):
+            spans.append(_span(f"b{b}q{q}", f"b{b}", "query", "db", error=(q == 0)))
+    return spans
+
+
+def test_trace_flow_collapses_repeated_siblings():
+    spans = _fan_out_trace(batches=50, queries=400)
+    diagram = span_parser.SpanToMermaidConverter(spans).to_trace_flow_diagram()
+
+    nodes = [line for line in diagram.splitlines() if '"]:::' in line]
+    assert len(nodes) == 3
+    assert "batch ×50" in nodes[1]
+    assert "query ×20000" in nodes[2] and "50 errors" in nodes[2]
+    assert nodes[2].endswith(":::error")
+    assert "S1 --> S2" in diagram
+
+
+def test_trace_flow_caps_nodes_and_summarises_hidden_subtrees():
+    spans = _fan_out_trace(batches=3, queries=10)
+    diagram = span_parser.SpanToMermaidConverter(spans).to_trace_flow_diagram(
+        max_nodes=4, collapse=False)
+
+    assert diagram.count('"]:::ok') + diagram.count('"]:::error') == 4
+    # Root and three batches fit; each batch's 10 queries are summarised
+    assert diagram.count("… 10 more spans in 10 nodes") == 3
+
+
+def test_sequence_diagram_uses_parent_index_and_collapses_runs():
+    spans = _fan_out_trace(batches=1, queries=5)
+    diagram = span_parser.SpanToMermaidConverter(spans).to_sequence_diagram()
+
+    assert "Client->>api: handle" in diagram
+    assert "api->>worker: batch" in diagram
+    assert "worker->>db: query ×5" in diagram
+
+
+def test_visualizer_renders_dict_spans_through_shared_index():
+    spans = [{"span_id": "a", "name": "run", "attributes": {"service.name": "engine"},
+              "start_time": 0, "end_time": 1_000_000}]
+    spans += [{"span_id": f"c{i}", "parent_id": "a", "name": "step",
+               "attributes": {"service.name": "task"}, "start_time": 0, "end_time": 2_000_000}
+              for i in range(3)]
+    visualizer = mermaid.MermaidVisualizer()
+
+    assert "engine->>task: step ×3" in visualizer.generate_span_trace_diagram(spans)
+    flow = visualizer.generate_span_flow_diagram(spans)
+    assert "step ×3<br/>task" in flow and "S0 --> S1" in flow
@@ -0,0 +1,87 @@
+"""Tests for streaming metrics aggregation in WorkflowSpanManager."""
+
+import random
+
+import pytest
+
+from weavergen.workflows.otel import LogHistogram, WorkflowSpanManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run_workflow(manager, workflow_id, name, tokens=10, fail_task=False):
+    with manager.workflow_span(workflow_id, name, "http", ["python"]):
+        with manager.task_span(workflow_id, "generate"):
+            pass
+        with manager.agent_span(workflow_id, "coder", "generate", tokens_used=tokens):
+            pass
+        if fail_task:
+            with pytest.raises(RuntimeError):
+                with manager.task_span(workflow_id, "validate"):
+                    raise RuntimeError("invalid")
+
+
+def test_sketch_percentiles_stay_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(3, 1.5) for _ in range(50_000)]
+    sketch = LogHistogram(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    values.sort()
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+    assert len(sketch.buckets) < 2048
+    assert sketch.count == len(values)
+
+    tiny = LogHistogram(max_buckets=16)
+    for value in range(1, 10_000):
+        tiny.add(value)
+    assert len(tiny.buckets) == 16
+    assert tiny.quantile(0.99) == pytest.approx(9900, rel=0.02)
+
+
+def test_retention_is_bounded_but_aggregates_cover_every_workflow():
+    manager = WorkflowSpanManager(max_retained_workflows=5)
+    for i in range(40):
+        _run_workflow(manager, f"wf-{i}", "generate", tokens=i, fail_task=i % 4 == 0)
+
+    assert [m.workflow_id for m in manager.get_all_workflow_metrics()] == [f"wf-{i}" for i in range(35, 40)]
+    assert manager.get_workflow_metrics("wf-0") is None
+
+    summary = manager.get_workflow_name_summary("generate")
+    assert summary["workflows"] == 40 and summary["failed_workflows"] == 10
+    assert summary["task_time_ms"]["count"] == 50
+    assert summary["tokens"]["p50"] == pytest.approx(19.5, rel=0.05)
+    assert manager.get_percentile("generate", "success_rate", 10) == pytest.approx(50, rel=0.02)
+    assert manager.get_percentile("generate", "success_rate", 90) == pytest.approx(100, rel=0.02)
+    assert manager.get_workflow_name_summary("other") is None
+    with pytest.raises(ValueError):
+        manager.get_percentile("generate", "latency", 50)
+
+
+def test_windowed_percentiles_only_see_recent_workflows():
+    clock = FakeClock()
+    manager = WorkflowSpanManager(window_seconds=60, windows=10, clock=clock)
+    for i in range(20):
+        _run_workflow(manager, f"old-{i}", "generate", tokens=1000)
+    clock.now += 300
+    for i in range(20):
+        _run_workflow(manager, f"new-{i}", "generate", tokens=10)
+
+    assert manager.get_percentile("generate", "tokens", 99, window_seconds=60) == pytest.approx(10, rel=0.02)
+    assert manager.get_percentile("generate", "tokens", 99) == pytest.approx(1000, rel=0.02)
+
+    # Windows older than the retained history drop out entirely
+    clock.now += 60 * 10
+    _run_workflow(manager, "latest", "generate", tokens=5)
+    histogram = manager.aggregates["generate"].histograms["tokens"]
+    assert len(histogram.windows) <= 10
+    assert manager.get_percentile("generate", "tokens", 50, window_seconds=3600) == pytest.approx(5, rel=0.02)
@@ -0,0 +1,140 @@
+"""Tests for the declarative, checkpointed workflow step graph."""
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+
+import pytest
+from SpiffWorkflow.bpmn.parser.BpmnParser import BpmnParser
+
+from weavergen.workflows.steps import (
+    StepCheckpointStore, StepSpec, execute_step_graph, resolve_dependencies, steps_from_bpmn_spec
+)
+
+PIPELINE_BPMN = (Path(__file__).resolve().parents[1] / "src" / "weavergen" / "workflows"
+                 / "bpmn" / "code_generation_pipeline.bpmn")
+
+PIPELINE = [
+    "validate_semantic", "initialize_environment", "multi_agent_generation",
+    "template_processing", "file_generation", "validation_qa", "finalization",
+]
+
+
+def _graph():
+    return [
+        StepSpec("load", "load", provides=["semantics"]),
+        StepSpec("agents", "agents", requires=["semantics"], provides=["agent_results"]),
+        StepSpec("templates", "templates", requires=["semantics"], provides=["templates"]),
+        StepSpec("files", "files", requires=["agent_results", "templates"], provides=["files"]),
+        StepSpec("validate", "validate", requires=["files"], provides=["report"]),
+    ]
+
+
+def _executor(data, results, calls, fail=(), delay=0.0):
+    async def execute(step):
+        calls.append(step.name)
+        await asyncio.sleep(delay)
+        if step.name in fail:
+            raise RuntimeError(f"{step.name} broke")
+        for key in step.provides:
+            data[key] = f"{key} from {step.name}"
+        results[step.name] = {"status": "success"}
+    return execute
+
+
+def test_bpmn_spec_drives_steps_and_dependencies():
+    parser = BpmnParser()
+    parser.add_bpmn_file(str(PIPELINE_BPMN))
+    known = {name: StepSpec(name, f"_{name}") for name in PIPELINE}
+
+    steps = steps_from_bpmn_spec(parser.get_spec("code_generation"), known)
+    by_name = {step.name: step for step in steps}
+    dependencies = resolve_dependencies(steps)
+
+    assert sorted(by_name) == sorted(PIPELINE)
+    assert by_name["file_generation"].requires == ["workspace", "agent_results", "templates"]
+    assert dependencies["multi_agent_generation"] == {"initialize_environment"}
+    assert dependencies["template_processing"] == {"initialize_environment"}
+    assert dependencies["file_generation"] == {
+        "initialize_environment", "multi_agent_generation", "template_processing"}
+    assert dependencies["finalization"] == {"file_generation", "validation_qa"}
+
+
+def test_independent_steps_run_concurrently():
+    data, results, calls = {}, {}, []
+    steps = _graph()
+
+    started = time.perf_counter()
+    outcome = asyncio.run(execute_step_graph(steps, _executor(data, results, calls, delay=0.2),
+                                             data, results))
+
+    # Four levels of 0.2s; agents and templates share one
+    assert time.perf_counter() - started < 0.95
+    assert set(calls[1:3]) == {"agents", "templates"}
+    assert outcome == {name: "ran" for name in ["load", "agents", "templates", "files", "validate"]}
+    assert data["report"] == "report from validate"
+
+
+def test_failed_run_resumes_from_checkpoints(tmp_path):
+    store = StepCheckpointStore(tmp_path / StepCheckpointStore.run_key("wf", "request"))
+    data, results, calls = {}, {}, []
+
+    with pytest.raises(RuntimeError, match="files broke"):
+        asyncio.run(execute_step_graph(_graph(), _executor(data, results, calls, fail={"files"}),
+                                       data, results, store))
+    assert results["validate"] == {"status": "not_run", "error": "Not run: files failed"}
+
+    data, results, calls = {}, {}, []
+    outcome = asyncio.run(execute_step_graph(_graph(), _executor(data, results, calls),
+                                             data, results, store))
+    assert calls == ["files", "validate"]
+    assert outcome["agents"] == "restored" and outcome["files"] == "ran"
+    assert data["templates"] == "templates from templates"
+
+    # Changing a step's declaration invalidates it and everything downstream
+    steps = _graph()
+    steps[2].provides.append("template_index")
+    data, results, calls = {}, {}, []
+    asyncio.run(execute_step_graph(steps, _executor(data, results, calls), data, results, store))
+    assert calls == ["templates", "files", "validate"]
+
+
+def test_checkpoints_are_json_and_runs_are_isolated(tmp_path, caplog):
+    first = StepCheckpointStore.claim(tmp_path, "key")
+    second = StepCheckpointStore.claim(tmp_path, "key")
+    assert first.directory != second.directory
+
+    step = StepSpec("load", "load", provides=["spec", "handle"])
+    first.save(StepSpec("load", "load", provides=["spec"]), {"spec": {"id": "x"}}, {"status": "success"})
+    assert json.loads((first.directory / "load.json").read_text())["data"] == {"spec": {"id": "x"}}
+
+    # Outputs JSON cannot represent exactly are not checkpointed; the step re-runs
+    async def execute(_):
+        data["handle"] = object()
+    data, results = {}, {}
+    with caplog.at_level(logging.WARNING, logger="weavergen.workflows.steps"):
+        asyncio.run(execute_step_graph([step], execute, data, results, second))
+    assert "Could not checkpoint step load" in caplog.text
+    assert second.load(step) is None
+
+    # A released run is resumed by the next claim; a fresh run discards it
+    first.release()
+    second.release()
+    resumed = StepCheckpointStore.claim(tmp_path, "key")
+    assert resumed.directory in (first.directory, second.directory)
+    resumed.release()
+    fresh = StepCheckpointStore.claim(tmp_path, "key", resume=False)
+    assert [p.name for p in (tmp_path / "key").iterdir()] == [fresh.directory.name]
+    fresh.clear()
+
+
+def test_conflicting_or_cyclic_declarations_are_rejected():
+    with pytest.raises(ValueError, match="provided by both"):
+        resolve_dependencies([StepSpec("a", "a", provides=["x"]), StepSpec("b", "b", provides=["x"])])
+    with pytest.raises(ValueError, match="cycle"):
+        resolve_dependencies([
+            StepSpec("a", "a", requires=["y"], provides=["x"]),
+            StepSpec("b", "b", requires=["x"], provides=["y"]),
+        ])
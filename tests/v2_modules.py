@@ -0,0 +1,21 @@
+"""Import helper for the tests that exercise the v2 sources."""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+V2_SRC = Path(__file__).resolve().parents[1] / "v2" / "weavergen" / "src"
+
+
+def load_v2(name):
+    """Import the dotted module ``name`` from v2's src directory.
+
+    v2 ships its own ``weavergen`` package, so its src directory is mounted
+    under the private ``v2_src`` package rather than shadowing the installed one.
+    """
+    if "v2_src" not in sys.modules:
+        package = types.ModuleType("v2_src")
+        package.__path__ = [str(V2_SRC)]
+        sys.modules["v2_src"] = package
+    return importlib.import_module(f"v2_src.{name}")
@@ -13,6 +13,8 @@ from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
 from typing import Dict, List, Any
 
+from weavergen.filters import create_environment
+
 def load_semantic_conventions(file_path: Path) -> Dict[str, Any]:
     """Load semantic conventions from YAML file."""
     with open(file_path) as f:
@@ -20,7 +22,7 @@ def load_semantic_conventions(file_path: Path) -> Dict[str, Any]:
 
 def setup_jinja_env() -> Environment:
     """Setup Jinja2 environment with filters."""
-    env = Environment(
+    env = create_environment(
         loader=FileSystemLoader("templates/cli"),
         trim_blocks=True,
         lstrip_blocks=True
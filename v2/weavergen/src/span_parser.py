@@ -5,12 +5,15 @@ Supports multiple span formats and generates rich mermaid visualizations
 
 import json
 import csv
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Callable, Iterator, Sequence, Tuple
 from pathlib import Path
 from datetime import datetime, timezone
 import re
-from dataclasses import dataclass
-from collections import defaultdict
+from dataclasses import dataclass, field
+from collections import defaultdict, deque
+
+# Default cap on rendered nodes; beyond this subtrees are summarised
+DEFAULT_MAX_NODES = 200
 
 @dataclass
 class ParsedSpan:
@@ -57,6 +60,7 @@ class SpanFileParser:
         self.spans: List[ParsedSpan] = []
         self.trace_tree: Dict[str, List[ParsedSpan]] = defaultdict(list)
         self.service_spans: Dict[str, List[ParsedSpan]] = defaultdict(list)
+        self.span_children: Dict[str, List[ParsedSpan]] = defaultdict(list)
         
     def parse_file(self, file_path: Path) -> List[ParsedSpan]:
         """Parse span file and return structured spans"""
@@ -320,10 +324,13 @@ class SpanFileParser:
         self.spans = spans
         self.trace_tree.clear()
         self.service_spans.clear()
+        self.span_children.clear()
         
         for span in spans:
             self.trace_tree[span.trace_id].append(span)
             self.service_spans[span.service_name].append(span)
+            if span.parent_span_id:
+                self.span_children[span.parent_span_id].append(span)
     
     def get_trace_tree(self, trace_id: str) -> List[ParsedSpan]:
         """Get all spans for a trace"""
@@ -339,7 +346,160 @@ class SpanFileParser:
     
     def get_span_children(self, parent_span_id: str) -> List[ParsedSpan]:
         """Get child spans of a parent"""
-        return [span for span in self.spans if span.parent_span_id == parent_span_id]
+        return self.span_children.get(parent_span_id, [])
+
+
+class SpanTreeIndex:
+    """Parent/child index over spans built in one pass
+    
+    Accessors let the same index serve ``ParsedSpan`` objects and raw span
+    dicts. Spans whose parent is not in the set are treated as roots.
+    """
+    
+    def __init__(self, spans: Sequence[Any],
+                 span_id: Callable[[Any], Optional[str]] = lambda s: s.span_id,
+                 parent_id: Callable[[Any], Optional[str]] = lambda s: s.parent_span_id):
+        self.spans = spans
+        self.position: Dict[str, int] = {}
+        self.children: Dict[int, List[int]] = defaultdict(list)
+        self.roots: List[int] = []
+        self.parent_of: Dict[int, int] = {}
+        
+        for i, span in enumerate(spans):
+            sid = span_id(span)
+            if sid:
+                self.position.setdefault(sid, i)
+        for i, span in enumerate(spans):
+            parent = self.position.get(parent_id(span) or "")
+            if parent is None or parent == i:
+                self.roots.append(i)
+            else:
+                self.parent_of[i] = parent
+                self.children[parent].append(i)
+    
+    def parent(self, span_index: int) -> Optional[Any]:
+        """Parent span of the span at ``span_index``"""
+        parent = self.parent_of.get(span_index)
+        return None if parent is None else self.spans[parent]
+
+
+@dataclass
+class FlowNode:
+    """One rendered node: a span, or repeated sibling spans collapsed together"""
+    operation: str
+    service: str
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    subtree_spans: int = 0
+    children: List["FlowNode"] = field(default_factory=list)
+    
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+def build_flow_tree(index: SpanTreeIndex,
+                    describe: Callable[[Any], Tuple[str, str, float, bool]],
+                    collapse: bool = True) -> List[FlowNode]:
+    """Aggregate the span forest into flow nodes in O(n)
+    
+    ``describe`` maps a span to ``(operation, service, duration_ms, error)``.
+    With ``collapse`` sibling spans sharing operation and service merge into
+    one node and their children are merged in turn, so a loop of 10k
+    identical calls renders as a single node.
+    """
+    spans = index.spans
+    roots: List[FlowNode] = []
+    order: List[FlowNode] = []
+    pending = deque([(roots, index.roots)])
+    
+    while pending:
+        siblings, members = pending.popleft()
+        groups: Dict[Any, Tuple[FlowNode, List[int]]] = {}
+        for i in members:
+            operation, service, duration, error = describe(spans[i])
+            key = (operation, service) if collapse else i
+            entry = groups.get(key)
+            if entry is None:
+                entry = groups[key] = (FlowNode(operation, service), [])
+                siblings.append(entry[0])
+                order.append(entry[0])
+            node = entry[0]
+            node.count += 1
+            node.errors += bool(error)
+            node.total_ms += duration
+            node.max_ms = max(node.max_ms, duration)
+            entry[1].extend(index.children.get(i, ()))
+        for node, child_members in groups.values():
+            if child_members:
+                pending.append((node.children, child_members))
+    
+    # Children are always created after their parents
+    for node in reversed(order):
+        node.subtree_spans = node.count + sum(child.subtree_spans for child in node.children)
+    return roots
+
+
+def _format_ms(duration_ms: float) -> str:
+    if duration_ms < 1:
+        return f"{duration_ms * 1000:.1f}μs"
+    if duration_ms < 1000:
+        return f"{duration_ms:.1f}ms"
+    return f"{duration_ms / 1000:.2f}s"
+
+
+def _mermaid_label(text: str) -> str:
+    return str(text).replace('"', "#quot;")
+
+
+def iter_flow_lines(roots: List[FlowNode], max_nodes: int = DEFAULT_MAX_NODES,
+                    title: Optional[str] = None) -> Iterator[str]:
+    """Stream ``graph TD`` lines for a flow tree, capped at ``max_nodes``
+    
+    Nodes are emitted breadth first; once the cap is reached the remaining
+    children of each emitted node are replaced by one summary node.
+    """
+    yield "graph TD"
+    if title:
+        yield f"    %% {title}"
+    yield "    classDef ok fill:#e8f5e9,stroke:#4caf50"
+    yield "    classDef error fill:#ffebee,stroke:#f44336"
+    yield "    classDef summary fill:#eceff1,stroke:#90a4ae,stroke-dasharray: 4 2"
+    
+    emitted = 0
+    summaries = 0
+    queue = deque([(None, roots)])
+    while queue:
+        parent_id, children = queue.popleft()
+        hidden_nodes = hidden_spans = 0
+        for node in children:
+            if emitted >= max_nodes:
+                hidden_nodes += 1
+                hidden_spans += node.subtree_spans
+                continue
+            node_id = f"S{emitted}"
+            emitted += 1
+            if node.count > 1:
+                label = (f"{node.operation} ×{node.count}<br/>{node.service}"
+                         f"<br/>avg {_format_ms(node.avg_ms)}, max {_format_ms(node.max_ms)}")
+            else:
+                label = f"{node.operation}<br/>{node.service}<br/>{_format_ms(node.total_ms)}"
+            if node.errors and node.count > 1:
+                label += f"<br/>{node.errors} errors"
+            css = "error" if node.errors else "ok"
+            yield f'    {node_id}["{_mermaid_label(label)}"]:::{css}'
+            if parent_id:
+                yield f"    {parent_id} --> {node_id}"
+            if node.children:
+                queue.append((node_id, node.children))
+        if hidden_nodes:
+            summary_id = f"M{summaries}"
+            summaries += 1
+            yield f'    {summary_id}["… {hidden_spans} more spans in {hidden_nodes} nodes"]:::summary'
+            if parent_id:
+                yield f"    {parent_id} -.-> {summary_id}"
 
 
 class SpanToMermaidConverter:
@@ -349,13 +509,18 @@ class SpanToMermaidConverter:
         self.spans = spans
         self.parser = SpanFileParser()
         self.parser._build_indexes(spans)
+        self.index = SpanTreeIndex(spans)
     
     def to_sequence_diagram(self, max_spans: int = 50, include_timing: bool = True) -> str:
-        """Convert spans to mermaid sequence diagram"""
+        """Convert spans to mermaid sequence diagram
+        
+        Consecutive identical calls are collapsed into one arrow with a count.
+        """
         lines = ["sequenceDiagram"]
+        window = self.spans[:max_spans]
         
         # Get unique services
-        services = sorted(set(span.service_name for span in self.spans[:max_spans]))
+        services = sorted(set(span.service_name for span in window))
         
         # Add participants
         for service in services:
@@ -363,54 +528,66 @@ class SpanToMermaidConverter:
             lines.append(f"    participant {sanitized}")
         
         # Add span interactions
-        for span in self.spans[:max_spans]:
-            service = self._sanitize_name(span.service_name)
-            
-            if span.parent_span_id:
-                # Find parent span
-                parent = next((s for s in self.spans if s.span_id == span.parent_span_id), None)
-                if parent:
-                    parent_service = self._sanitize_name(parent.service_name)
-                    lines.append(f"    {parent_service}->>{service}: {span.operation_name}")
-                else:
-                    lines.append(f"    Client->>{service}: {span.operation_name}")
+        run: List[ParsedSpan] = []
+        run_key = None
+        
+        def flush():
+            if not run:
+                return
+            caller, service, operation = run_key
+            if len(run) > 1:
+                lines.append(f"    {caller}->>{service}: {operation} ×{len(run)}")
             else:
-                lines.append(f"    Client->>{service}: {span.operation_name}")
-            
+                lines.append(f"    {caller}->>{service}: {operation}")
             if include_timing:
-                lines.append(f"    Note over {service}: {span.duration_display} {span.status_icon}")
+                errors = sum(1 for span in run if span.error)
+                if len(run) > 1:
+                    avg = sum(span.duration_ms for span in run) / len(run)
+                    status = f"{errors} ❌" if errors else "✅"
+                    lines.append(f"    Note over {service}: avg {_format_ms(avg)} {status}")
+                else:
+                    lines.append(f"    Note over {service}: {run[0].duration_display} {run[0].status_icon}")
+        
+        for i, span in enumerate(window):
+            service = self._sanitize_name(span.service_name)
+            parent = self.index.parent(i)
+            caller = self._sanitize_name(parent.service_name) if parent else "Client"
+            key = (caller, service, span.operation_name)
+            if key != run_key:
+                flush()
+                run, run_key = [], key
+            run.append(span)
+        flush()
         
         return "\n".join(lines)
     
-    def to_trace_flow_diagram(self, trace_id: Optional[str] = None) -> str:
+    def to_trace_flow_diagram(self, trace_id: Optional[str] = None,
+                              max_nodes: int = DEFAULT_MAX_NODES,
+                              collapse: bool = True) -> str:
         """Convert spans to trace flow diagram"""
+        return "\n".join(self.iter_trace_flow_lines(trace_id, max_nodes, collapse))
+    
+    def iter_trace_flow_lines(self, trace_id: Optional[str] = None,
+                              max_nodes: int = DEFAULT_MAX_NODES,
+                              collapse: bool = True) -> Iterator[str]:
+        """Stream the trace flow diagram line by line
+        
+        Repeated sibling spans are collapsed and at most ``max_nodes`` nodes
+        are drawn, with hidden subtrees summarised.
+        """
         if trace_id:
             spans = self.parser.get_trace_tree(trace_id)
+            index = SpanTreeIndex(spans)
         else:
             spans = self.spans
+            index = self.index
         
-        lines = ["graph TD"]
-        lines.append(f"    %% Trace Flow ({len(spans)} spans)")
-        
-        # Add nodes for each span
-        for i, span in enumerate(spans):
-            node_id = f"S{i}"
-            status_color = "fill:#ffebee,stroke:#f44336" if span.error else "fill:#e8f5e9,stroke:#4caf50"
-            
-            lines.append(f"    {node_id}[\"{span.operation_name}<br/>{span.service_name}<br/>{span.duration_display}\"]")
-            lines.append(f"    classDef span{i} {status_color}")
-            lines.append(f"    class {node_id} span{i}")
-        
-        # Add connections based on parent-child relationships
-        span_to_node = {span.span_id: f"S{i}" for i, span in enumerate(spans)}
-        
-        for i, span in enumerate(spans):
-            if span.parent_span_id and span.parent_span_id in span_to_node:
-                parent_node = span_to_node[span.parent_span_id]
-                child_node = f"S{i}"
-                lines.append(f"    {parent_node} --> {child_node}")
-        
-        return "\n".join(lines)
+        roots = build_flow_tree(
+            index,
+            lambda span: (span.operation_name, span.service_name, span.duration_ms, span.error),
+            collapse=collapse,
+        )
+        return iter_flow_lines(roots, max_nodes, title=f"Trace Flow ({len(spans)} spans)")
     
     def to_service_map_diagram(self) -> str:
         """Convert spans to service dependency map"""
@@ -420,19 +597,19 @@ class SpanToMermaidConverter:
         services = set()
         connections = set()
         
-        for span in self.spans:
+        for i, span in enumerate(self.spans):
             services.add(span.service_name)
             
-            if span.parent_span_id:
-                parent = next((s for s in self.spans if s.span_id == span.parent_span_id), None)
-                if parent and parent.service_name != span.service_name:
-                    connections.add((parent.service_name, span.service_name))
+            parent = self.index.parent(i)
+            if parent and parent.service_name != span.service_name:
+                connections.add((parent.service_name, span.service_name))
         
         # Add service nodes
         for service in sorted(services):
             sanitized = self._sanitize_name(service)
-            span_count = len(self.parser.get_service_spans(service))
-            error_count = len([s for s in self.parser.get_service_spans(service) if s.error])
+            service_spans = self.parser.get_service_spans(service)
+            span_count = len(service_spans)
+            error_count = sum(1 for s in service_spans if s.error)
             
             if error_count > 0:
                 lines.append(f"    {sanitized}[\"{service}<br/>{span_count} spans<br/>{error_count} errors\"]")
@@ -3,11 +3,13 @@ WeaverGen v2 Mermaid Visualization Module
 Comprehensive mermaid diagram generation for all system components
 """
 
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Iterator
 from datetime import datetime
 import json
 from pathlib import Path
 
+from ..span_parser import DEFAULT_MAX_NODES, SpanTreeIndex, build_flow_tree, iter_flow_lines
+
 
 class MermaidVisualizer:
     """Unified mermaid diagram generator for WeaverGen v2"""
@@ -61,37 +63,86 @@ class MermaidVisualizer:
     
     def generate_span_trace_diagram(self, spans: List[Dict[str, Any]], 
                                    max_spans: int = 50) -> str:
-        """Generate sequence diagram from OpenTelemetry spans"""
+        """Generate sequence diagram from OpenTelemetry spans
+        
+        Callers come from the parent span when spans carry ids, otherwise from
+        the previous span. Consecutive identical calls collapse into one arrow.
+        """
         lines = ["sequenceDiagram"]
         lines.append("    participant Client")
+        window = spans[:max_spans]
         
         # Extract unique services/components
         services = set()
-        for span in spans[:max_spans]:
-            service = span.get("attributes", {}).get("service.name", "Unknown")
-            services.add(service)
+        for span in window:
+            services.add(self._span_service(span))
         
         # Add participants
         for service in sorted(services):
             lines.append(f"    participant {self._sanitize_id(service)}")
         
+        index = SpanTreeIndex(spans, self._span_id, self._parent_id)
+        has_parents = bool(index.parent_of)
+        
         # Add span interactions
-        for i, span in enumerate(spans[:max_spans]):
-            service = span.get("attributes", {}).get("service.name", "Unknown")
-            operation = span.get("name", "unknown")
-            duration = self._calculate_duration(span)
-            status = "✅" if not span.get("error") else "❌"
-            
-            if i == 0:
-                lines.append(f"    Client->>{self._sanitize_id(service)}: {operation}")
+        run_key = None
+        durations: List[float] = []
+        errors = 0
+        
+        def flush():
+            if run_key is None:
+                return
+            caller, service, operation = run_key
+            if len(durations) > 1:
+                lines.append(f"    {caller}->>{service}: {operation} ×{len(durations)}")
+                status = f"{errors} ❌" if errors else "✅"
+                lines.append(f"    Note over {service}: avg {sum(durations) / len(durations):.1f}ms {status}")
             else:
-                prev_service = spans[i-1].get("attributes", {}).get("service.name", "Unknown")
-                lines.append(f"    {self._sanitize_id(prev_service)}->>{self._sanitize_id(service)}: {operation}")
-            
-            lines.append(f"    Note over {self._sanitize_id(service)}: {duration}ms {status}")
+                lines.append(f"    {caller}->>{service}: {operation}")
+                lines.append(f"    Note over {service}: {durations[0]}ms {'❌' if errors else '✅'}")
+        
+        for i, span in enumerate(window):
+            service = self._sanitize_id(self._span_service(span))
+            if has_parents:
+                parent = index.parent(i)
+                caller = self._sanitize_id(self._span_service(parent)) if parent else "Client"
+            elif i == 0:
+                caller = "Client"
+            else:
+                caller = self._sanitize_id(self._span_service(window[i - 1]))
+            key = (caller, service, span.get("name", "unknown"))
+            if key != run_key:
+                flush()
+                run_key, durations, errors = key, [], 0
+            durations.append(self._calculate_duration(span))
+            errors += bool(span.get("error"))
+        flush()
         
         return "\n".join(lines)
     
+    def generate_span_flow_diagram(self, spans: List[Dict[str, Any]],
+                                   max_nodes: int = DEFAULT_MAX_NODES,
+                                   collapse: bool = True) -> str:
+        """Generate a parent/child flow graph from OpenTelemetry spans
+        
+        Repeated sibling spans are collapsed and the graph is capped at
+        ``max_nodes`` nodes with hidden subtrees summarised.
+        """
+        return "\n".join(self.iter_span_flow_lines(spans, max_nodes, collapse))
+    
+    def iter_span_flow_lines(self, spans: List[Dict[str, Any]],
+                             max_nodes: int = DEFAULT_MAX_NODES,
+                             collapse: bool = True) -> Iterator[str]:
+        """Stream the span flow graph line by line"""
+        index = SpanTreeIndex(spans, self._span_id, self._parent_id)
+        roots = build_flow_tree(
+            index,
+            lambda span: (span.get("name", "unknown"), self._span_service(span),
+                          self._calculate_duration(span), bool(span.get("error"))),
+            collapse=collapse,
+        )
+        return iter_flow_lines(roots, max_nodes, title=f"Span Flow ({len(spans)} spans)")
+    
     def generate_workflow_visualization(self, workflow_data: Dict[str, Any]) -> str:
         """Generate BPMN-style workflow diagram"""
         lines = ["graph TD"]
@@ -305,6 +356,18 @@ class MermaidVisualizer:
         
         return "\n".join(lines)
     
+    @staticmethod
+    def _span_service(span: Dict[str, Any]) -> str:
+        return span.get("attributes", {}).get("service.name", "Unknown")
+    
+    @staticmethod
+    def _span_id(span: Dict[str, Any]) -> Optional[str]:
+        return span.get("span_id") or span.get("context", {}).get("span_id")
+    
+    @staticmethod
+    def _parent_id(span: Dict[str, Any]) -> Optional[str]:
+        return span.get("parent_span_id") or span.get("parent_id")
+    
     def _sanitize_id(self, text: str) -> str:
         """Sanitize text for use as mermaid ID"""
         return text.replace(" ", "_").replace("-", "_").replace(".", "_")
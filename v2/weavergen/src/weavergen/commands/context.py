@@ -7,6 +7,14 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from ..context_index import (
+    DEFAULT_INDEX_FILE,
+    ContextIndex,
+    find_project_root,
+    pack,
+    write_context,
+    write_context_file,
+)
 from ..enhanced_instrumentation import cli_command_span
 
 console = Console()
@@ -14,6 +22,22 @@ error_console = Console(stderr=True)
 
 context_app = typer.Typer()
 
+BUDGET_HELP = "Token budget for the packed context (0 = no limit)."
+QUERY_HELP = "Terms used to rank chunks by relevance when packing to a budget."
+
+
+def _open_index(index_file: Optional[Path], root: Optional[Path] = None) -> ContextIndex:
+    """Context index at ``index_file`` or under the project root"""
+    return ContextIndex(index_file or (root or find_project_root()) / DEFAULT_INDEX_FILE)
+
+
+def _report_pack(index: ContextIndex, result, destination) -> None:
+    error_console.print(
+        f"[green]Context written to {destination}[/green] "
+        f"({len(result.chunks)} chunks, ~{result.tokens} tokens, "
+        f"{result.dropped} dropped; {index.indexed} files indexed, {index.reused} reused)"
+    )
+
 
 @context_app.command()
 def generate(
@@ -31,11 +55,18 @@ def generate(
         "--src-weavergen",
         help="Include all .py files in src/weavergen in the context.",
     ),
+    root: Optional[Path] = typer.Option(
+        None, "--root", help="Project root (defaults to the nearest directory with a pyproject.toml)."
+    ),
+    budget: int = typer.Option(0, "--budget", "-b", help=BUDGET_HELP),
+    query: Optional[str] = typer.Option(None, "--query", "-q", help=QUERY_HELP),
+    index_file: Optional[Path] = typer.Option(None, "--index", help="Context index file."),
 ):
     """
     Generates a context file for WeaverGen v2.
     This command gathers the source of pertinent files and pyproject.toml
-    to fill the context window for AI models.
+    to fill the context window for AI models. Files are chunked into a
+    persistent index so unchanged files are not re-read on later runs.
     """
     with cli_command_span(
         "context.generate",
@@ -43,36 +74,37 @@ def generate(
             "output_file": str(output_file),
             "include_pyproject": include_pyproject,
             "include_src_weavergen": include_src_weavergen,
+            "budget": budget,
+            "query": query,
         },
     ):
-        context_content = []
+        root = (root or find_project_root()).resolve()
+        sources = []
 
         if include_pyproject:
-            pyproject_path = Path("/Users/sac/dev/weavergen/v2/weavergen/pyproject.toml")
+            pyproject_path = root / "pyproject.toml"
             if pyproject_path.exists():
-                context_content.append(f"--- {pyproject_path.name} ---")
-                context_content.append(pyproject_path.read_text())
-                context_content.append("")
+                sources.append((pyproject_path, pyproject_path.name))
             else:
                 error_console.print(f"[yellow]Warning: {pyproject_path} not found.[/yellow]")
 
         if include_src_weavergen:
-            src_weavergen_dir = Path("/Users/sac/dev/weavergen/v2/weavergen/src/weavergen")
+            src_weavergen_dir = root / "src" / "weavergen"
             if src_weavergen_dir.exists() and src_weavergen_dir.is_dir():
                 for file_path in sorted(src_weavergen_dir.rglob("*.py")):
-                    context_content.append(
-                        f"--- {file_path.relative_to(src_weavergen_dir.parent)} ---"
-                    )
-                    context_content.append(file_path.read_text())
-                    context_content.append("")
+                    sources.append((file_path, str(file_path.relative_to(src_weavergen_dir.parent))))
             else:
                 error_console.print(
                     f"[yellow]Warning: {src_weavergen_dir} not found or is not a directory.[/yellow]"
                 )
 
+        index = _open_index(index_file, root)
+        result = pack(index.index_paths(sources), budget, query, index.tokenizer)
+        index.save()
+
         try:
-            output_file.write_text("\n".join(context_content))
-            error_console.print(f"[green]Context written to {output_file}[/green]")
+            write_context_file(result.chunks, output_file)
+            _report_pack(index, result, output_file)
         except Exception as e:
             error_console.print(f"[red]Error writing context to file: {e}[/red]")
             raise
@@ -88,15 +120,26 @@ def load_context(
         readable=True,
         help="Path to the context file to load.",
     ),
+    budget: int = typer.Option(0, "--budget", "-b", help=BUDGET_HELP),
+    query: Optional[str] = typer.Option(None, "--query", "-q", help=QUERY_HELP),
+    index_file: Optional[Path] = typer.Option(None, "--index", help="Context index file."),
 ):
     """
     Loads and displays the content of a specified context file.
     """
-    with cli_command_span("context.load", {"input_file": str(input_file)}):
+    with cli_command_span("context.load", {"input_file": str(input_file), "budget": budget}):
         try:
-            content = input_file.read_text()
             console.print(f"[bold green]Content of {input_file}:[/bold green]")
-            console.print(content, markup=False)
+            if budget:
+                index = _open_index(index_file)
+                result = pack(index.chunks_for(input_file, sections=True), budget, query,
+                              index.tokenizer)
+                index.save()
+                write_context(result.chunks, console.file)
+            else:
+                with input_file.open(errors="replace") as handle:
+                    for line in handle:
+                        console.file.write(line)
         except Exception as e:
             console.print(f"[red]Error reading context file {input_file}: {e}[/red]", markup=False)
 
@@ -127,19 +170,20 @@ def filter_context(
         {"input_file": str(input_file), "pattern": pattern, "output_file": str(output_file) if output_file else None},
     ):
         try:
-            content = input_file.read_text()
-            filtered_lines = []
-            for line in content.splitlines():
-                if re.search(pattern, line):
-                    filtered_lines.append(line)
-            filtered_content = "\n".join(filtered_lines)
-
+            regex = re.compile(pattern)
+            if output_file is None:
+                console.print(f"[bold green]Filtered content from {input_file}:[/bold green]")
+            out = output_file.open("w") if output_file else console.file
+            try:
+                with input_file.open(errors="replace") as handle:
+                    for line in handle:
+                        if regex.search(line):
+                            out.write(line if line.endswith("\n") else line + "\n")
+            finally:
+                if output_file:
+                    out.close()
             if output_file:
-                output_file.write_text(filtered_content)
                 error_console.print(f"[green]Filtered context written to {output_file}[/green]")
-            else:
-                console.print(f"[bold green]Filtered content from {input_file}:[/bold green]")
-                console.print(filtered_content)
         except Exception as e:
             console.print(f"[red]Error filtering context file {input_file}: {e}[/red]")
 
@@ -154,21 +198,28 @@ def summarize_context(
         readable=True,
         help="Path to the context file to summarize.",
     ),
+    index_file: Optional[Path] = typer.Option(None, "--index", help="Context index file."),
 ):
     """
-    Provides a summary of the context file, including file counts, total lines, and total characters.
+    Provides a summary of the context file, including file counts, total lines,
+    total characters and token counts.
     """
     with cli_command_span("context.summarize", {"input_file": str(input_file)}):
         try:
-            content = input_file.read_text()
-            lines = content.splitlines()
-            total_lines = len(lines)
-            total_characters = len(content)
-            
+            index = _open_index(index_file)
+            chunks = index.chunks_for(input_file, sections=True)
+            index.save()
+
+            total_lines = 0
+            total_characters = 0
             file_count = 0
-            for line in lines:
-                if line.startswith("--- ") and line.endswith(" ---"):
-                    file_count += 1
+            with input_file.open(errors="replace") as handle:
+                for line in handle:
+                    total_lines += 1
+                    total_characters += len(line)
+                    stripped = line.rstrip("\n")
+                    if stripped.startswith("--- ") and stripped.endswith(" ---"):
+                        file_count += 1
 
             table = Table(title=f"Summary of {input_file.name}")
             table.add_column("Metric", style="cyan")
@@ -176,6 +227,8 @@ def summarize_context(
             table.add_row("Number of Files", str(file_count))
             table.add_row("Total Lines", str(total_lines))
             table.add_row("Total Characters", str(total_characters))
+            table.add_row("Chunks", str(len(chunks)))
+            table.add_row(f"Tokens ({index.tokenizer.name})", str(sum(c.tokens for c in chunks)))
             
             console.print(table)
 
@@ -234,26 +287,33 @@ def combine_contexts(
         "-o",
         help="Output file to write the combined context to.",
     ),
+    budget: int = typer.Option(0, "--budget", "-b", help=BUDGET_HELP),
+    query: Optional[str] = typer.Option(None, "--query", "-q", help=QUERY_HELP),
+    index_file: Optional[Path] = typer.Option(None, "--index", help="Context index file."),
 ):
     """
     Combines multiple context files into a single output file.
+    Sections keep their own headers; input files without headers are
+    labelled with their file name.
     """
     with cli_command_span(
         "context.combine",
-        {"input_files": [str(f) for f in input_files], "output_file": str(output_file)},
+        {"input_files": [str(f) for f in input_files], "output_file": str(output_file),
+         "budget": budget, "query": query},
     ):
-        combined_content = []
+        index = _open_index(index_file)
+        chunks = []
         for input_file in input_files:
             try:
-                combined_content.append(f"--- {input_file.name} ---")
-                combined_content.append(input_file.read_text())
-                combined_content.append("")
+                chunks.extend(index.chunks_for(input_file, sections=True))
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not read {input_file}: {e}[/yellow]")
+        result = pack(chunks, budget, query, index.tokenizer)
+        index.save()
         
         try:
-            output_file.write_text("\n".join(combined_content))
-            console.print(f"[green]Combined context written to {output_file}[/green]")
+            write_context_file(result.chunks, output_file)
+            _report_pack(index, result, output_file)
         except Exception as e:
             console.print(f"[red]Error writing combined context to file: {e}[/red]")
 
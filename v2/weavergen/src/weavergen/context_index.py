@@ -0,0 +1,351 @@
+"""Persistent chunked context index and token-budget packer for WeaverGen v2.
+
+Files are split into chunks of roughly ``chunk_tokens`` tokens, preferring
+top-level ``def``/``class`` boundaries. Each chunk records its byte range,
+token count, content hash and a handful of identifier terms, so later runs
+only re-chunk files whose mtime or size changed, and packing a context never
+needs file contents until the selected chunks are streamed to the output.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+INDEX_VERSION = 2
+DEFAULT_INDEX_FILE = Path(".weavergen") / "context_index.json"
+DEFAULT_CHUNK_TOKENS = 400
+MAX_TERMS = 32
+
+SECTION_HEADER = re.compile(r"^--- (.+) ---$")
+_BOUNDARY = re.compile(r"^(?:async\s+def|def|class)\s")
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]{2,}")
+_WORD = re.compile(r"\w+|[^\w\s]")
+
+
+# ============================================================================
+# Token counting
+# ============================================================================
+
+@dataclass(frozen=True)
+class Tokenizer:
+    """Named token counter; the name is stored in the index."""
+    name: str
+    count: Callable[[str], int]
+
+
+def _heuristic_count(text: str) -> int:
+    """Approximate BPE token count: ~4 characters per word piece"""
+    return sum((len(piece) + 3) // 4 for piece in _WORD.findall(text))
+
+
+@lru_cache(maxsize=1)
+def get_tokenizer() -> Tokenizer:
+    """tiktoken's cl100k_base when available, otherwise a heuristic counter"""
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return Tokenizer("cl100k_base", lambda text: len(encoding.encode(text, disallowed_special=())))
+    except Exception:
+        return Tokenizer("heuristic", _heuristic_count)
+
+
+# ============================================================================
+# Chunking
+# ============================================================================
+
+@dataclass
+class ContextChunk:
+    """A contiguous byte range of one file."""
+    path: str
+    label: str
+    start_line: int
+    end_line: int
+    offset: int
+    length: int
+    tokens: int
+    digest: str
+    terms: Dict[str, int] = field(default_factory=dict)
+
+
+def _terms(text: str) -> Dict[str, int]:
+    """Most frequent identifiers (and their snake_case parts) in ``text``"""
+    counts = Counter()
+    for identifier in _IDENTIFIER.findall(text):
+        lowered = identifier.lower()
+        counts[lowered] += 1
+        if "_" in lowered:
+            counts.update(part for part in lowered.split("_") if len(part) > 2)
+    return dict(counts.most_common(MAX_TERMS))
+
+
+def iter_chunks(path: Path, label: str, tokenizer: Tokenizer,
+                chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+                sections: bool = False) -> Iterator[ContextChunk]:
+    """Stream ``path`` line by line and yield its chunks.
+
+    With ``sections`` the file is treated as a context file: each
+    ``--- name ---`` header starts a new section labelled ``name`` and the
+    header itself is not part of any chunk.
+    """
+    lines: List[str] = []
+    tokens = 0
+    start_offset = offset = 0
+    start_line = line_no = 1
+
+    def flush() -> Optional[ContextChunk]:
+        if not lines:
+            return None
+        text = "".join(lines)
+        data = text.encode("utf-8")
+        return ContextChunk(
+            path=str(path), label=label,
+            start_line=start_line, end_line=line_no - 1,
+            offset=start_offset, length=offset - start_offset,
+            tokens=tokens, digest=hashlib.blake2b(data, digest_size=8).hexdigest(),
+            terms=_terms(text),
+        )
+
+    with open(path, "rb") as handle:
+        for raw in handle:
+            line = raw.decode("utf-8", errors="replace")
+            header = SECTION_HEADER.match(line.rstrip("\r\n")) if sections else None
+            line_tokens = 0 if header else tokenizer.count(line)
+
+            at_boundary = bool(_BOUNDARY.match(line)) and tokens >= chunk_tokens // 4
+            if header or (lines and (tokens + line_tokens > chunk_tokens or at_boundary)):
+                chunk = flush()
+                if chunk:
+                    yield chunk
+                lines, tokens = [], 0
+                start_offset, start_line = offset, line_no
+
+            offset += len(raw)
+            line_no += 1
+            if header:
+                label = header.group(1).strip()
+                start_offset, start_line = offset, line_no
+                continue
+            lines.append(line)
+            tokens += line_tokens
+
+    chunk = flush()
+    if chunk:
+        yield chunk
+
+
+# ============================================================================
+# Persistent index
+# ============================================================================
+
+class ContextIndex:
+    """Chunk index persisted as JSON and refreshed by file mtime and size."""
+
+    def __init__(self, index_file: Path = DEFAULT_INDEX_FILE,
+                 chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+                 tokenizer: Optional[Tokenizer] = None):
+        self.index_file = Path(index_file)
+        self.chunk_tokens = chunk_tokens
+        self.tokenizer = tokenizer or get_tokenizer()
+        self.files: Dict[str, Dict] = {}
+        self.reused = 0
+        self.indexed = 0
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Read the index, discarding it if it was built differently"""
+        try:
+            data = json.loads(self.index_file.read_text())
+        except (OSError, ValueError):
+            return
+        if (data.get("version") == INDEX_VERSION
+                and data.get("tokenizer") == self.tokenizer.name
+                and data.get("chunk_tokens") == self.chunk_tokens):
+            self.files = data.get("files", {})
+
+    def save(self) -> None:
+        """Atomically write the index if anything changed"""
+        if not self._dirty:
+            return
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": INDEX_VERSION,
+            "tokenizer": self.tokenizer.name,
+            "chunk_tokens": self.chunk_tokens,
+            "files": self.files,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.index_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp, self.index_file)
+        self._dirty = False
+
+    def chunks_for(self, path: Path, label: Optional[str] = None,
+                   sections: bool = False) -> List[ContextChunk]:
+        """Chunks of ``path``, re-chunking only if the file changed
+
+        Chunks store the resolved path, so an entry reused from another
+        working directory still reads the file it was built from.
+        """
+        path = Path(path).resolve()
+        key = str(path)
+        stat = path.stat()
+        label = label or path.name
+        entry = self.files.get(key)
+        if (entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+                and entry["sections"] == sections and entry["label"] == label):
+            self.reused += 1
+            return [ContextChunk(**chunk) for chunk in entry["chunks"]]
+
+        chunks = list(iter_chunks(path, label, self.tokenizer, self.chunk_tokens, sections))
+        self.files[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sections": sections,
+            "label": label,
+            "chunks": [asdict(chunk) for chunk in chunks],
+        }
+        self.indexed += 1
+        self._dirty = True
+        return chunks
+
+    def index_paths(self, paths: Iterable[Tuple[Path, str]],
+                    sections: bool = False) -> List[ContextChunk]:
+        """Chunks of every ``(path, label)`` pair in order"""
+        chunks: List[ContextChunk] = []
+        for path, label in paths:
+            chunks.extend(self.chunks_for(path, label, sections))
+        return chunks
+
+    @staticmethod
+    def read_chunk(chunk: ContextChunk) -> str:
+        """Read one chunk's bytes straight from its file"""
+        with open(chunk.path, "rb") as handle:
+            handle.seek(chunk.offset)
+            return handle.read(chunk.length).decode("utf-8", errors="replace")
+
+
+# ============================================================================
+# Budget packing
+# ============================================================================
+
+@dataclass
+class PackResult:
+    """Chunks selected for a context, in source order."""
+    chunks: List[ContextChunk]
+    tokens: int
+    dropped: int
+
+
+def query_terms(query: Optional[str]) -> List[str]:
+    """Lowercased identifier terms of a relevance query"""
+    return [term.lower() for term in _IDENTIFIER.findall(query or "")]
+
+
+def relevance(chunk: ContextChunk, terms: List[str]) -> float:
+    """Term overlap between a chunk and the query; path matches weigh more"""
+    label = chunk.label.lower()
+    score = 0.0
+    for term in terms:
+        score += min(chunk.terms.get(term, 0), 5)
+        if term in label:
+            score += 3
+    return score
+
+
+def header_line(label: str) -> str:
+    return f"--- {label} ---\n"
+
+
+def pack(chunks: List[ContextChunk], budget: Optional[int] = None,
+         query: Optional[str] = None,
+         tokenizer: Optional[Tokenizer] = None) -> PackResult:
+    """Greedily fill ``budget`` tokens with the most relevant chunks.
+
+    Chunks are considered in descending relevance (source order breaks ties);
+    section headers count against the budget. The selection is returned in
+    source order so every file reads top to bottom.
+    """
+    if not budget:
+        return PackResult(list(chunks), sum(c.tokens for c in chunks), 0)
+
+    tokenizer = tokenizer or get_tokenizer()
+    terms = query_terms(query)
+    order = sorted(range(len(chunks)), key=lambda i: (-relevance(chunks[i], terms), i))
+    header_cost: Dict[str, int] = {}
+    labelled = set()
+    selected = set()
+    used = 0
+
+    for i in order:
+        chunk = chunks[i]
+        cost = chunk.tokens
+        if chunk.label not in labelled:
+            if chunk.label not in header_cost:
+                header_cost[chunk.label] = tokenizer.count(header_line(chunk.label))
+            cost += header_cost[chunk.label]
+        if used + cost > budget:
+            continue
+        used += cost
+        selected.add(i)
+        labelled.add(chunk.label)
+
+    kept = [chunks[i] for i in sorted(selected)]
+    return PackResult(kept, used, len(chunks) - len(kept))
+
+
+def write_context(chunks: Iterable[ContextChunk], out: TextIO) -> int:
+    """Stream chunks to ``out`` under ``--- label ---`` headers; returns bytes read"""
+    previous: Optional[ContextChunk] = None
+    written = 0
+    for chunk in chunks:
+        contiguous = (previous is not None and previous.path == chunk.path
+                      and previous.label == chunk.label
+                      and previous.offset + previous.length == chunk.offset)
+        if not contiguous:
+            if previous is not None:
+                out.write("\n")
+            out.write(header_line(chunk.label))
+        text = ContextIndex.read_chunk(chunk)
+        out.write(text)
+        written += chunk.length
+        previous = chunk
+    if previous is not None and not text.endswith("\n"):
+        out.write("\n")
+    return written
+
+
+def write_context_file(chunks: Iterable[ContextChunk], path: Path) -> int:
+    """Write chunks to ``path`` atomically; returns bytes read
+
+    Chunks are read lazily from their source files, so the output goes to a
+    temporary file next to ``path`` and replaces it only once complete. This
+    keeps ``path`` intact while it is still being read as an input.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as out:
+            written = write_context(chunks, out)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return written
+
+
+def find_project_root(start: Optional[Path] = None) -> Path:
+    """Nearest directory at or above ``start`` that has a pyproject.toml"""
+    start = Path(start or Path.cwd()).resolve()
+    for directory in (start, *start.parents):
+        if (directory / "pyproject.toml").exists():
+            return directory
+    return start
@@ -0,0 +1,64 @@
+"""Python implementations of the Forge filters declared in default-forge.yaml."""
+
+import re
+from typing import Any, Callable, Dict
+
+from jinja2 import Environment, Template
+
+from . import cli_commands, semconv_grouped_attributes, spiff_bpmn
+from ._memo import render_scope
+
+
+def snake_case(value: str) -> str:
+    """Convert ``some.name`` / ``SomeName`` to ``some_name``"""
+    value = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", str(value))
+    value = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", value)
+    return re.sub(r"[^0-9a-zA-Z]+", "_", value).strip("_").lower()
+
+
+def pascal_case(value: str) -> str:
+    """Convert ``some.name`` / ``some_name`` to ``SomeName``"""
+    return "".join(part[:1].upper() + part[1:] for part in snake_case(value).split("_"))
+
+
+FILTERS: Dict[str, Callable[..., Any]] = {
+    **semconv_grouped_attributes.FILTERS,
+    **cli_commands.FILTERS,
+    **spiff_bpmn.FILTERS,
+    "snake_case": snake_case,
+    "pascal_case": pascal_case,
+}
+
+
+class ForgeTemplate(Template):
+    """Template whose renders share one set of filter input keys"""
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        with render_scope():
+            return super().render(*args, **kwargs)
+
+
+def register_filters(env: Environment) -> None:
+    """Install all Forge filters on a Jinja2 environment"""
+    env.filters.update(FILTERS)
+    env.template_class = ForgeTemplate
+
+
+def create_environment(**options: Any) -> Environment:
+    """Jinja2 environment for Forge templates with the filters installed"""
+    env = Environment(**options)
+    register_filters(env)
+    return env
+
+
+def clear_caches() -> None:
+    """Drop every memoized filter result"""
+    semconv_grouped_attributes.clear_cache()
+    cli_commands.clear_cache()
+    spiff_bpmn.clear_cache()
+
+
+__all__ = [
+    "FILTERS", "ForgeTemplate", "create_environment", "register_filters", "render_scope",
+    "clear_caches", "snake_case", "pascal_case",
+]
@@ -0,0 +1,149 @@
+"""Memoization helpers shared by the Forge filters.
+
+Filters are called from template loops, so each one caches its parsed and
+grouped result per input: per file state (path, mtime, size) for inputs read
+from disk, and per content digest for registries that are already loaded.
+Inside a ``render_scope()`` the glob, stat and digest work is done once per
+input for the whole render.
+"""
+
+import glob
+import hashlib
+import json
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+PathInput = Union[str, Path, Iterable[Union[str, Path]]]
+
+MAX_CACHED_INPUTS = 32
+
+# Per-render memo of input keys; None outside a render_scope()
+_render_keys: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar("forge_render_keys", default=None)
+
+
+class Context(dict):
+    """Template context whose keys win over dict methods in attribute lookups.
+
+    Jinja resolves ``enum.values`` via ``getattr`` first, which would return
+    ``dict.values`` for a plain dict.
+    """
+
+    def __getattribute__(self, name):
+        if not name.startswith("_") and dict.__contains__(self, name):
+            return dict.__getitem__(self, name)
+        return super().__getattribute__(name)
+
+
+def expand_paths(source: PathInput, suffixes: Tuple[str, ...]) -> List[Path]:
+    """Expand a file, directory, glob or list of them into sorted files"""
+    if isinstance(source, (str, Path)):
+        sources = [source]
+    else:
+        sources = list(source)
+
+    files = set()
+    for item in sources:
+        text = str(item)
+        if glob.has_magic(text):
+            files.update(Path(p) for p in glob.glob(text, recursive=True))
+            continue
+        path = Path(item)
+        if path.is_dir():
+            files.update(p for p in path.rglob("*") if p.suffix in suffixes)
+        else:
+            files.add(path)
+    return sorted(p for p in files if p.suffix in suffixes and p.is_file())
+
+
+def file_state(paths: List[Path]) -> Tuple[Tuple[str, int, int], ...]:
+    """Cheap fingerprint of a set of files: path, mtime and size"""
+    state = []
+    for path in paths:
+        stat = path.stat()
+        state.append((str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+    return tuple(state)
+
+
+def content_digest(data: Any) -> str:
+    """Digest of an in-memory input, so in-place edits change its cache key"""
+    try:
+        encoded = json.dumps(data, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        encoded = repr(data)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@contextmanager
+def render_scope() -> Iterator[None]:
+    """Reuse input keys (globs, file stats, digests) until the render ends"""
+    if _render_keys.get() is not None:
+        yield
+        return
+    token = _render_keys.set({})
+    try:
+        yield
+    finally:
+        _render_keys.reset(token)
+
+
+def _scoped(key: Hashable, compute: Callable[[], Any]) -> Any:
+    keys = _render_keys.get()
+    if keys is None:
+        return compute()
+    if key not in keys:
+        keys[key] = compute()
+    return keys[key]
+
+
+class InputCache:
+    """Small LRU cache for filter results.
+
+    Keys are either file states or ``("data", digest)`` for in-memory inputs.
+    """
+
+    def __init__(self, maxsize: int = MAX_CACHED_INPUTS):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+def memoized(cache: InputCache, source: Any, suffixes: Tuple[str, ...],
+             from_files: Callable[[List[Path]], Any],
+             from_data: Callable[[Any], Any]) -> Any:
+    """Resolve ``source`` through ``cache`` whether it is data or file paths"""
+    if isinstance(source, (str, Path)) or (
+        isinstance(source, (list, tuple)) and all(isinstance(s, (str, Path)) for s in source)
+    ):
+        sources = (str(source),) if isinstance(source, (str, Path)) else tuple(map(str, source))
+
+        def resolve() -> Tuple[List[Path], Hashable]:
+            paths = expand_paths(source, suffixes)
+            return paths, file_state(paths)
+
+        paths, key = _scoped(("paths", sources, suffixes), resolve)
+        return cache.get_or_compute(key, lambda: from_files(paths))
+
+    # The source is pinned in the scope so its id cannot be reused mid-render
+    _, digest = _scoped(("data", id(source)), lambda: (source, content_digest(source)))
+    return cache.get_or_compute(("data", digest), lambda: from_data(source))
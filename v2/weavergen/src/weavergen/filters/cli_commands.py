@@ -1,3 +1,83 @@
-# Placeholder for cli_commands filter implementation.
-# This filter will parse cli_spec.yaml and extract command definitions.
-# It should output a JSON structure suitable for Jinja2 templates, including command names, summaries, parameters, types, defaults, and enums.
+"""cli_commands Forge filter.
+
+Parses a ``cli_spec.yaml`` into one context per command with its summary and
+typed parameters. Results are memoized per spec file state.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+from ._memo import Context, InputCache, memoized
+
+SPEC_SUFFIXES = (".yaml", ".yml")
+
+PYTHON_TYPES = {
+    "string": "str",
+    "boolean": "bool",
+    "bool": "bool",
+    "int": "int",
+    "int64": "int",
+    "double": "float",
+    "float": "float",
+    "string[]": "List[str]",
+    "path": "Path",
+}
+
+_cache = InputCache()
+
+
+def _param(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the template context for one command parameter"""
+    param_type = raw.get("type", "string")
+    enum = raw.get("enum")
+    python_type = PYTHON_TYPES.get(param_type, "str")
+    if enum:
+        python_type = "Literal[{}]".format(", ".join(repr(v) for v in enum))
+    default = raw.get("default")
+    return Context(
+        name=raw["name"],
+        type=param_type,
+        python_type=python_type,
+        help=raw.get("help", ""),
+        required=bool(raw.get("required", False)) and default is None,
+        default=default,
+        enum=enum,
+    )
+
+
+def parse_cli_spec(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Command contexts for a loaded CLI spec"""
+    commands = []
+    for raw in spec.get("commands") or []:
+        commands.append(Context(
+            name=raw["name"],
+            summary=raw.get("summary", ""),
+            params=[_param(p) for p in raw.get("params") or []],
+        ))
+    return commands
+
+
+def load_cli_spec(paths: List[Path]) -> Dict[str, Any]:
+    """Concatenate the commands of one or more spec files"""
+    commands = []
+    for path in paths:
+        data = yaml.safe_load(path.read_text()) or {}
+        commands.extend(data.get("commands") or [])
+    return {"commands": commands}
+
+
+def cli_commands(spec: Any) -> List[Dict[str, Any]]:
+    """Jinja filter: command contexts for a spec dict or spec file"""
+    return memoized(_cache, spec, SPEC_SUFFIXES,
+                    lambda paths: parse_cli_spec(load_cli_spec(paths)),
+                    parse_cli_spec)
+
+
+def clear_cache() -> None:
+    """Drop memoized specs"""
+    _cache.clear()
+
+
+FILTERS = {"cli_commands": cli_commands}
@@ -1,3 +1,155 @@
-# Placeholder for semconv_grouped_attributes filter implementation.
-# This filter will process OpenTelemetry semantic conventions and group attributes by root namespace.
-# It should output a JSON structure suitable for Jinja2 templates.
+"""semconv_grouped_attributes Forge filter.
+
+Flattens a semantic convention registry into attributes and groups them by
+root namespace, stability and requirement level. The grouping is computed once
+per resolved registry and memoized, so templates that loop over the result do
+not regroup the registry on every render.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from ._memo import Context, InputCache, memoized
+
+SEMCONV_SUFFIXES = (".yaml", ".yml")
+DEFAULT_STABILITY = "development"
+DEFAULT_REQUIREMENT_LEVEL = "recommended"
+
+_cache = InputCache()
+
+
+@dataclass
+class GroupedRegistry:
+    """Precomputed attribute indexes for one resolved registry."""
+    attributes: List[Dict[str, Any]] = field(default_factory=list)
+    namespaces: List[Dict[str, Any]] = field(default_factory=list)
+    by_namespace: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    by_stability: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    by_requirement_level: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+
+def _requirement_level(value: Any) -> str:
+    """Normalize ``required`` / ``{conditionally_required: ...}`` forms"""
+    if isinstance(value, dict):
+        value = next(iter(value), DEFAULT_REQUIREMENT_LEVEL)
+    return str(value or DEFAULT_REQUIREMENT_LEVEL)
+
+
+def _attribute(group: Dict[str, Any], raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build the template context for one registry attribute"""
+    if "name" in raw:
+        name = raw["name"]
+    elif "id" in raw:
+        prefix = group.get("prefix")
+        name = f"{prefix}.{raw['id']}" if prefix else raw["id"]
+    else:
+        # Unresolved ``ref:`` entries point at attributes defined elsewhere
+        return None
+
+    attr_type = raw.get("type", "string")
+    enum = None
+    if isinstance(attr_type, dict):
+        members = attr_type.get("members", [])
+        values = [m.get("value", m.get("id")) for m in members]
+        enum = Context(name=name.replace(".", "_"), values=values)
+        attr_type = "int" if values and all(isinstance(v, int) for v in values) else "string"
+
+    requirement_level = _requirement_level(raw.get("requirement_level"))
+    return Context(
+        name=name,
+        type=attr_type,
+        brief=str(raw.get("brief", "")).strip(),
+        examples=raw.get("examples"),
+        stability=raw.get("stability") or group.get("stability") or DEFAULT_STABILITY,
+        requirement_level=requirement_level,
+        required=requirement_level == "required",
+        enum=enum,
+        group_id=group.get("id"),
+        root_namespace=name.split(".", 1)[0],
+    )
+
+
+def group_registry(registry: Dict[str, Any]) -> GroupedRegistry:
+    """Build every attribute index of ``registry`` in a single pass"""
+    grouped = GroupedRegistry()
+    seen = set()
+    by_stability = defaultdict(list)
+    by_requirement = defaultdict(list)
+
+    for group in registry.get("groups") or []:
+        for raw in group.get("attributes") or []:
+            attr = _attribute(group, raw)
+            if attr is None or attr["name"] in seen:
+                continue
+            seen.add(attr["name"])
+            grouped.attributes.append(attr)
+
+            namespace = grouped.by_namespace.get(attr["root_namespace"])
+            if namespace is None:
+                namespace = Context(root_namespace=attr["root_namespace"],
+                                    attributes=[], enums=[])
+                grouped.by_namespace[attr["root_namespace"]] = namespace
+                grouped.namespaces.append(namespace)
+            namespace["attributes"].append(attr)
+            if attr["enum"]:
+                namespace["enums"].append(attr["enum"])
+
+            by_stability[attr["stability"]].append(attr)
+            by_requirement[attr["requirement_level"]].append(attr)
+
+    grouped.by_stability = dict(by_stability)
+    grouped.by_requirement_level = dict(by_requirement)
+    return grouped
+
+
+def load_registry(paths: List[Path]) -> Dict[str, Any]:
+    """Merge the groups of several registry files into one registry"""
+    groups = []
+    for path in paths:
+        data = yaml.safe_load(path.read_text()) or {}
+        groups.extend(data.get("groups") or [])
+    return {"groups": groups}
+
+
+def grouped_registry(registry: Any) -> GroupedRegistry:
+    """Memoized :func:`group_registry` for a registry dict, file, directory or glob"""
+    return memoized(_cache, registry, SEMCONV_SUFFIXES,
+                    lambda paths: group_registry(load_registry(paths)),
+                    group_registry)
+
+
+# ============================================================================
+# Jinja filters
+# ============================================================================
+
+def semconv_grouped_attributes(registry: Any) -> List[Dict[str, Any]]:
+    """One ``{root_namespace, attributes, enums}`` context per root namespace"""
+    return grouped_registry(registry).namespaces
+
+
+def semconv_attributes_by_stability(registry: Any, stability: Optional[str] = None):
+    """Attributes keyed by stability, or the attributes of one stability level"""
+    index = grouped_registry(registry).by_stability
+    return index if stability is None else index.get(stability, [])
+
+
+def semconv_attributes_by_requirement_level(registry: Any, level: Optional[str] = None):
+    """Attributes keyed by requirement level, or the attributes of one level"""
+    index = grouped_registry(registry).by_requirement_level
+    return index if level is None else index.get(level, [])
+
+
+def clear_cache() -> None:
+    """Drop memoized groupings"""
+    _cache.clear()
+
+
+FILTERS = {
+    "semconv_grouped_attributes": semconv_grouped_attributes,
+    "semconv_attributes_by_stability": semconv_attributes_by_stability,
+    "semconv_attributes_by_requirement_level": semconv_attributes_by_requirement_level,
+}
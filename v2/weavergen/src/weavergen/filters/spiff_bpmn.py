@@ -1,3 +1,98 @@
-# Placeholder for spiff_bpmn filter implementation.
-# This filter will load BPMN XML files and extract process IDs, data objects (I/O), and service task names.
-# It should output a JSON structure suitable for Jinja2 templates.
+"""spiff_bpmn Forge filter.
+
+Loads BPMN XML files and extracts, per executable process, its id, name, data
+objects (the process I/O) and service task names. Results are memoized per
+file state so templates applied once per process reuse a single parse.
+"""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ._memo import Context, InputCache, memoized
+
+BPMN_SUFFIXES = (".bpmn",)
+BPMN_NS = "http://www.omg.org/spec/BPMN/20100524/MODEL"
+SPIFF_NS = "http://spiffworkflow.org/bpmn/schema/1.0/util"
+
+_cache = InputCache()
+
+
+def _data_object(name: str, required: bool) -> Dict[str, Any]:
+    return Context(name=name, type="string", required=required, default=None)
+
+
+def parse_process(process: ET.Element, filename: str) -> Dict[str, Any]:
+    """Template context for one ``bpmn:process`` element"""
+    process_id = process.get("id", "")
+    task_names = []
+    inputs: List[str] = []
+    outputs: List[str] = []
+
+    for task in process.iter(f"{{{BPMN_NS}}}serviceTask"):
+        task_names.append(task.get("name") or task.get("id"))
+        for item in task.iter(f"{{{SPIFF_NS}}}input"):
+            source = item.get("source") or item.get("id")
+            if source and source not in inputs:
+                inputs.append(source)
+        for item in task.iter(f"{{{SPIFF_NS}}}output"):
+            target = item.get("target") or item.get("id")
+            if target and target not in outputs:
+                outputs.append(target)
+
+    # Inputs no task produces must be supplied by the caller
+    data_objects = [_data_object(name, True) for name in inputs if name not in outputs]
+    declared = {d["name"] for d in data_objects}
+    for element in process.iter(f"{{{BPMN_NS}}}dataObject"):
+        name = element.get("name") or element.get("id")
+        if name and name not in declared:
+            declared.add(name)
+            data_objects.append(_data_object(name, False))
+    for name in outputs:
+        if name not in declared:
+            declared.add(name)
+            data_objects.append(_data_object(name, False))
+
+    return Context(
+        process_id=process_id,
+        process_name=process.get("name") or process_id,
+        filename=filename,
+        data_objects=data_objects,
+        task_names=task_names,
+    )
+
+
+def parse_bpmn_files(paths: List[Path]) -> List[Dict[str, Any]]:
+    """Process contexts for every process in ``paths``"""
+    processes = []
+    for path in paths:
+        root = ET.parse(path).getroot()
+        for process in root.iter(f"{{{BPMN_NS}}}process"):
+            processes.append(parse_process(process, path.name))
+    return processes
+
+
+def spiff_bpmn(source: Any) -> List[Dict[str, Any]]:
+    """Jinja filter: one context per BPMN process in a file, directory or glob"""
+    return memoized(_cache, source, BPMN_SUFFIXES, parse_bpmn_files,
+                    lambda processes: list(processes))
+
+
+def spiff_service_tasks(source: Any) -> List[Dict[str, Any]]:
+    """Jinja filter: one ``{task_name, process_id}`` context per service task"""
+    return [
+        Context(task_name=name, process_id=process["process_id"])
+        for process in spiff_bpmn(source)
+        for name in process["task_names"]
+    ]
+
+
+def clear_cache() -> None:
+    """Drop memoized BPMN parses"""
+    _cache.clear()
+
+
+FILTERS = {
+    "spiff_bpmn": spiff_bpmn,
+    "spiff_service_tasks": spiff_service_tasks,
+}
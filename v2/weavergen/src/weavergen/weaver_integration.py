@@ -2,10 +2,9 @@
 
 import json
 import logging
-import subprocess
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -13,6 +12,7 @@ from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 from pydantic import BaseModel, Field
 
+from .async_process import AsyncProcessRunner, ProcessResult, get_process_runner, run_sync
 from .enhanced_instrumentation import semantic_span, add_span_event
 
 logger = logging.getLogger(__name__)
@@ -51,6 +51,10 @@ class WeaverConfig:
     future_validation: bool = True
     debug_level: int = 0
     quiet: bool = False
+    check_timeout: float = 300
+    generate_timeout: float = 600
+    stats_timeout: float = 60
+    resolve_timeout: float = 120
 
 
 class WeaverValidationResult(BaseModel):
@@ -89,11 +93,62 @@ class WeaverRegistryInfo(BaseModel):
     resources_count: int = 0
 
 
+def _parse_diagnostic_line(line: str) -> Optional[Dict[str, Any]]:
+    """Parse one stripped line of Weaver stderr into a diagnostic, if it is one."""
+    # Try to parse as JSON diagnostic
+    if line.startswith('{') and line.endswith('}'):
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            return None
+    
+    # Parse ANSI diagnostic format
+    if 'error' in line.lower() or 'warning' in line.lower():
+        return {
+            "type": "error" if "error" in line.lower() else "warning",
+            "message": line,
+            "raw": line
+        }
+    return None
+
+
+class DiagnosticStream:
+    """Collects diagnostics, errors and warnings from stderr as lines arrive."""
+    
+    def __init__(self, on_diagnostic: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.on_diagnostic = on_diagnostic
+        self.diagnostics: List[Dict[str, Any]] = []
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+    
+    def feed(self, line: str) -> None:
+        line = line.strip()
+        if not line:
+            return
+        diagnostic = _parse_diagnostic_line(line)
+        if diagnostic is not None:
+            self.diagnostics.append(diagnostic)
+            if self.on_diagnostic:
+                self.on_diagnostic(diagnostic)
+        lowered = line.lower()
+        if 'error' in lowered or 'failed' in lowered:
+            self.errors.append(line)
+        elif 'warning' in lowered:
+            self.warnings.append(line)
+
+
 class WeaverIntegration:
-    """Real Weaver Forge binary integration."""
+    """Real Weaver Forge binary integration.
     
-    def __init__(self, config: Optional[WeaverConfig] = None):
+    Every command runs through an AsyncProcessRunner: the ``*_async``
+    methods let BPMN service tasks overlap Weaver runs on one event loop,
+    and the synchronous methods wrap them for CLI use.
+    """
+    
+    def __init__(self, config: Optional[WeaverConfig] = None,
+                 runner: Optional[AsyncProcessRunner] = None):
         self.config = config or WeaverConfig()
+        self.runner = runner or get_process_runner()
         self._validate_weaver_installation()
     
     def _validate_weaver_installation(self) -> None:
@@ -102,17 +157,14 @@ class WeaverIntegration:
             span.set_attribute("component", "weaver")
             span.set_attribute("operation", "validate_installation")
             try:
-                result = subprocess.run(
-                    [str(self.config.weaver_path), "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
+                result = run_sync(self.runner.run([self.config.weaver_path, "--version"], timeout=30))
+                if not result.success:
+                    raise RuntimeError(f"weaver --version exited with {result.return_code}")
                 version = result.stdout.strip()
                 span.set_attribute("weaver.version", version)
                 logger.info(f"Weaver {version} found and working")
                 
-            except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            except (RuntimeError, OSError) as e:
                 span.record_exception(e)
                 span.set_status(Status(StatusCode.ERROR, "Weaver not found"))
                 raise RuntimeError(
@@ -120,6 +172,18 @@ class WeaverIntegration:
                     "Install with: cargo install weaver-forge"
                 ) from e
     
+    async def _run(self, span, cmd: List[str], timeout: float,
+                   stream: Optional[DiagnosticStream] = None) -> ProcessResult:
+        """Run a Weaver command, streaming stderr into ``stream``."""
+        add_span_event("weaver.command.start", {"command": " ".join(cmd)})
+        result = await self.runner.run(cmd, timeout=timeout,
+                                       on_stderr=stream.feed if stream else None)
+        span.set_attribute("return_code", result.return_code)
+        span.set_attribute("stdout_length", len(result.stdout))
+        span.set_attribute("stderr_length", len(result.stderr))
+        span.set_attribute("duration_seconds", result.duration_seconds)
+        return result
+    
     @semantic_span("weaver", "registry.check")
     def check_registry(
         self, 
@@ -127,6 +191,16 @@ class WeaverIntegration:
         strict: bool = False
     ) -> WeaverValidationResult:
         """Validate a semantic convention registry using Weaver."""
+        return run_sync(self.check_registry_async(registry_path, strict))
+    
+    @semantic_span("weaver", "registry.check")
+    async def check_registry_async(
+        self,
+        registry_path: Union[str, Path],
+        strict: bool = False,
+        on_diagnostic: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> WeaverValidationResult:
+        """Validate a registry without blocking the event loop."""
         registry_path = Path(registry_path)
         
         with tracer.start_as_current_span("weaver.registry.check") as span:
@@ -148,82 +222,59 @@ class WeaverIntegration:
             if self.config.quiet:
                 cmd.append("--quiet")
             
-            add_span_event("weaver.command.start", {"command": " ".join(cmd)})
-            
+            stream = DiagnosticStream(on_diagnostic)
             try:
-                # Execute Weaver command
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout
-                )
-                
-                span.set_attribute("return_code", result.returncode)
-                span.set_attribute("stdout_length", len(result.stdout))
-                span.set_attribute("stderr_length", len(result.stderr))
-                
-                # Parse diagnostics if available
-                diagnostics = self._parse_diagnostics(result.stderr)
-                
-                # Determine validation result
-                valid = result.returncode == 0
-                errors = []
-                warnings = []
-                
-                if not valid:
-                    # Parse errors from stderr
-                    for line in result.stderr.split('\n'):
-                        line = line.strip()
-                        if line and ('error' in line.lower() or 'failed' in line.lower()):
-                            errors.append(line)
-                        elif line and 'warning' in line.lower():
-                            warnings.append(line)
-                
-                # If no explicit errors found but return code is non-zero
-                if not valid and not errors:
-                    errors = [f"Weaver validation failed with return code {result.returncode}"]
-                
-                add_span_event("weaver.command.complete", {
-                    "valid": valid,
-                    "error_count": len(errors),
-                    "warning_count": len(warnings)
-                })
-                
-                if valid:
-                    span.set_status(Status(StatusCode.OK))
-                else:
-                    span.set_status(Status(StatusCode.ERROR, f"Validation failed: {len(errors)} errors"))
-                
-                return WeaverValidationResult(
-                    valid=valid,
-                    errors=errors,
-                    warnings=warnings,
-                    diagnostics=diagnostics,
-                    return_code=result.returncode,
-                    stdout=result.stdout,
-                    stderr=result.stderr
-                )
-                
-            except subprocess.TimeoutExpired as e:
+                result = await self._run(span, cmd, self.config.check_timeout, stream)
+            except Exception as e:
                 span.record_exception(e)
-                span.set_status(Status(StatusCode.ERROR, "Command timed out"))
+                span.set_status(Status(StatusCode.ERROR, str(e)))
                 return WeaverValidationResult(
                     valid=False,
-                    errors=[f"Weaver command timed out after 300 seconds"],
+                    errors=[f"Weaver command failed: {e}"],
                     return_code=-1,
-                    stderr="Command timed out"
+                    stderr=str(e)
                 )
             
-            except Exception as e:
-                span.record_exception(e)
-                span.set_status(Status(StatusCode.ERROR, str(e)))
+            if result.timed_out:
+                span.set_status(Status(StatusCode.ERROR, "Command timed out"))
                 return WeaverValidationResult(
                     valid=False,
-                    errors=[f"Weaver command failed: {e}"],
+                    errors=[f"Weaver command timed out after {self.config.check_timeout:g} seconds"],
+                    diagnostics=stream.diagnostics,
                     return_code=-1,
-                    stderr=str(e)
+                    stdout=result.stdout,
+                    stderr=result.stderr or "Command timed out"
                 )
+            
+            # Errors and warnings only count when validation failed
+            valid = result.return_code == 0
+            errors = [] if valid else stream.errors
+            warnings = [] if valid else stream.warnings
+            
+            # If no explicit errors found but return code is non-zero
+            if not valid and not errors:
+                errors = [f"Weaver validation failed with return code {result.return_code}"]
+            
+            add_span_event("weaver.command.complete", {
+                "valid": valid,
+                "error_count": len(errors),
+                "warning_count": len(warnings)
+            })
+            
+            if valid:
+                span.set_status(Status(StatusCode.OK))
+            else:
+                span.set_status(Status(StatusCode.ERROR, f"Validation failed: {len(errors)} errors"))
+            
+            return WeaverValidationResult(
+                valid=valid,
+                errors=errors,
+                warnings=warnings,
+                diagnostics=stream.diagnostics,
+                return_code=result.return_code,
+                stdout=result.stdout,
+                stderr=result.stderr
+            )
     
     @semantic_span("weaver", "registry.generate")
     def generate_code(
@@ -237,6 +288,23 @@ class WeaverIntegration:
         skip_policies: bool = False
     ) -> WeaverGenerationResult:
         """Generate code from semantic conventions using Weaver."""
+        return run_sync(self.generate_code_async(
+            registry_path, target, output_dir, templates_dir, parameters, policies, skip_policies
+        ))
+    
+    @semantic_span("weaver", "registry.generate")
+    async def generate_code_async(
+        self,
+        registry_path: Union[str, Path],
+        target: WeaverTarget,
+        output_dir: Optional[Path] = None,
+        templates_dir: Optional[Path] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        policies: Optional[List[Path]] = None,
+        skip_policies: bool = False,
+        on_diagnostic: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> WeaverGenerationResult:
+        """Generate code without blocking the event loop."""
         registry_path = Path(registry_path)
         output_dir = output_dir or self.config.output_dir
         templates_dir = templates_dir or self.config.templates_dir
@@ -287,85 +355,76 @@ class WeaverIntegration:
             if self.config.quiet:
                 cmd.append("--quiet")
             
-            add_span_event("weaver.command.start", {"command": " ".join(cmd)})
-            
+            stream = DiagnosticStream(on_diagnostic)
             try:
-                # Execute Weaver command
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=600  # 10 minute timeout for generation
-                )
-                
-                span.set_attribute("return_code", result.returncode)
-                span.set_attribute("stdout_length", len(result.stdout))
-                span.set_attribute("stderr_length", len(result.stderr))
-                
-                # Parse diagnostics
-                diagnostics = self._parse_diagnostics(result.stderr)
-                
-                # Determine success
-                success = result.returncode == 0
-                
-                # Get generated files
-                generated_files = []
-                if success and output_dir.exists():
-                    generated_files = [
-                        str(f.relative_to(output_dir))
-                        for f in output_dir.rglob("*")
-                        if f.is_file()
-                    ]
-                
-                add_span_event("weaver.command.complete", {
-                    "success": success,
-                    "files_generated": len(generated_files)
-                })
-                
-                if success:
-                    span.set_status(Status(StatusCode.OK))
-                else:
-                    span.set_status(Status(StatusCode.ERROR, f"Generation failed: {result.returncode}"))
-                
-                return WeaverGenerationResult(
-                    success=success,
-                    output_dir=output_dir,
-                    generated_files=generated_files,
-                    template_used=target.value,
-                    parameters=parameters,
-                    return_code=result.returncode,
-                    stdout=result.stdout,
-                    stderr=result.stderr,
-                    diagnostics=diagnostics
-                )
-                
-            except subprocess.TimeoutExpired as e:
+                result = await self._run(span, cmd, self.config.generate_timeout, stream)
+            except Exception as e:
                 span.record_exception(e)
-                span.set_status(Status(StatusCode.ERROR, "Command timed out"))
+                span.set_status(Status(StatusCode.ERROR, str(e)))
                 return WeaverGenerationResult(
                     success=False,
                     output_dir=output_dir,
                     template_used=target.value,
                     parameters=parameters,
                     return_code=-1,
-                    stderr="Command timed out"
+                    stderr=str(e)
                 )
             
-            except Exception as e:
-                span.record_exception(e)
-                span.set_status(Status(StatusCode.ERROR, str(e)))
+            if result.timed_out:
+                span.set_status(Status(StatusCode.ERROR, "Command timed out"))
                 return WeaverGenerationResult(
                     success=False,
                     output_dir=output_dir,
                     template_used=target.value,
                     parameters=parameters,
                     return_code=-1,
-                    stderr=str(e)
+                    stdout=result.stdout,
+                    stderr=result.stderr or "Command timed out",
+                    diagnostics=stream.diagnostics
                 )
+            
+            # Determine success
+            success = result.return_code == 0
+            
+            # Get generated files
+            generated_files = []
+            if success and output_dir.exists():
+                generated_files = [
+                    str(f.relative_to(output_dir))
+                    for f in output_dir.rglob("*")
+                    if f.is_file()
+                ]
+            
+            add_span_event("weaver.command.complete", {
+                "success": success,
+                "files_generated": len(generated_files)
+            })
+            
+            if success:
+                span.set_status(Status(StatusCode.OK))
+            else:
+                span.set_status(Status(StatusCode.ERROR, f"Generation failed: {result.return_code}"))
+            
+            return WeaverGenerationResult(
+                success=success,
+                output_dir=output_dir,
+                generated_files=generated_files,
+                template_used=target.value,
+                parameters=parameters,
+                return_code=result.return_code,
+                stdout=result.stdout,
+                stderr=result.stderr,
+                diagnostics=stream.diagnostics
+            )
     
     @semantic_span("weaver", "registry.stats")
     def get_registry_stats(self, registry_path: Union[str, Path]) -> WeaverRegistryInfo:
         """Get statistics about a semantic convention registry."""
+        return run_sync(self.get_registry_stats_async(registry_path))
+    
+    @semantic_span("weaver", "registry.stats")
+    async def get_registry_stats_async(self, registry_path: Union[str, Path]) -> WeaverRegistryInfo:
+        """Get registry statistics without blocking the event loop."""
         registry_path = Path(registry_path)
         
         with tracer.start_as_current_span("weaver.registry.stats") as span:
@@ -384,42 +443,7 @@ class WeaverIntegration:
                 cmd.extend(["--debug"] * self.config.debug_level)
             
             try:
-                # Execute Weaver command
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                span.set_attribute("return_code", result.returncode)
-                
-                if result.returncode == 0:
-                    # Parse JSON output
-                    try:
-                        stats = json.loads(result.stdout)
-                        span.set_status(Status(StatusCode.OK))
-                        
-                        return WeaverRegistryInfo(
-                            registry_path=registry_path,
-                            valid=True,
-                            stats=stats,
-                            groups_count=stats.get("groups", 0),
-                            attributes_count=stats.get("attributes", 0),
-                            metrics_count=stats.get("metrics", 0),
-                            spans_count=stats.get("spans", 0),
-                            resources_count=stats.get("resources", 0)
-                        )
-                    except json.JSONDecodeError:
-                        # Fallback to parsing text output
-                        return self._parse_stats_text(result.stdout, registry_path)
-                else:
-                    span.set_status(Status(StatusCode.ERROR, f"Stats failed: {result.returncode}"))
-                    return WeaverRegistryInfo(
-                        registry_path=registry_path,
-                        valid=False
-                    )
-                    
+                result = await self._run(span, cmd, self.config.stats_timeout)
             except Exception as e:
                 span.record_exception(e)
                 span.set_status(Status(StatusCode.ERROR, str(e)))
@@ -427,6 +451,32 @@ class WeaverIntegration:
                     registry_path=registry_path,
                     valid=False
                 )
+            
+            if not result.success:
+                span.set_status(Status(StatusCode.ERROR, f"Stats failed: {result.return_code}"))
+                return WeaverRegistryInfo(
+                    registry_path=registry_path,
+                    valid=False
+                )
+            
+            # Parse JSON output
+            try:
+                stats = json.loads(result.stdout)
+            except json.JSONDecodeError:
+                # Fallback to parsing text output
+                return self._parse_stats_text(result.stdout, registry_path)
+            
+            span.set_status(Status(StatusCode.OK))
+            return WeaverRegistryInfo(
+                registry_path=registry_path,
+                valid=True,
+                stats=stats,
+                groups_count=stats.get("groups", 0),
+                attributes_count=stats.get("attributes", 0),
+                metrics_count=stats.get("metrics", 0),
+                spans_count=stats.get("spans", 0),
+                resources_count=stats.get("resources", 0)
+            )
     
     @semantic_span("weaver", "registry.resolve")
     def resolve_registry(
@@ -435,6 +485,15 @@ class WeaverIntegration:
         output_file: Optional[Path] = None
     ) -> Path:
         """Resolve a semantic convention registry to a single file."""
+        return run_sync(self.resolve_registry_async(registry_path, output_file))
+    
+    @semantic_span("weaver", "registry.resolve")
+    async def resolve_registry_async(
+        self,
+        registry_path: Union[str, Path],
+        output_file: Optional[Path] = None
+    ) -> Path:
+        """Resolve a registry without blocking the event loop."""
         registry_path = Path(registry_path)
         
         with tracer.start_as_current_span("weaver.registry.resolve") as span:
@@ -456,21 +515,13 @@ class WeaverIntegration:
                 cmd.append("--future")
             
             try:
-                # Execute Weaver command
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
+                result = await self._run(span, cmd, self.config.resolve_timeout)
                 
-                span.set_attribute("return_code", result.returncode)
-                
-                if result.returncode == 0:
+                if result.success:
                     span.set_status(Status(StatusCode.OK))
                     return output_file
                 else:
-                    span.set_status(Status(StatusCode.ERROR, f"Resolve failed: {result.returncode}"))
+                    span.set_status(Status(StatusCode.ERROR, f"Resolve failed: {result.return_code}"))
                     raise RuntimeError(f"Failed to resolve registry: {result.stderr}")
                     
             except Exception as e:
@@ -480,30 +531,10 @@ class WeaverIntegration:
     
     def _parse_diagnostics(self, stderr: str) -> List[Dict[str, Any]]:
         """Parse diagnostic messages from Weaver stderr output."""
-        diagnostics = []
-        
+        stream = DiagnosticStream()
         for line in stderr.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Try to parse as JSON diagnostic
-            if line.startswith('{') and line.endswith('}'):
-                try:
-                    diagnostic = json.loads(line)
-                    diagnostics.append(diagnostic)
-                except json.JSONDecodeError:
-                    pass
-            
-            # Parse ANSI diagnostic format
-            elif 'error' in line.lower() or 'warning' in line.lower():
-                diagnostics.append({
-                    "type": "error" if "error" in line.lower() else "warning",
-                    "message": line,
-                    "raw": line
-                })
-        
-        return diagnostics
+            stream.feed(line)
+        return stream.diagnostics
     
     def _parse_stats_text(self, stdout: str, registry_path: Path) -> WeaverRegistryInfo:
         """Parse statistics from text output when JSON is not available."""
@@ -560,12 +591,7 @@ class WeaverIntegration:
     def get_weaver_version(self) -> str:
         """Get Weaver version."""
         try:
-            result = subprocess.run(
-                [str(self.config.weaver_path), "--version"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout.strip()
+            result = run_sync(self.runner.run([self.config.weaver_path, "--version"], timeout=30))
+            return result.stdout.strip() if result.success else "unknown"
         except Exception:
-            return "unknown" 
\ No newline at end of file
+            return "unknown"